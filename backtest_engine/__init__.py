@@ -0,0 +1,33 @@
+"""Event-driven backtesting for LPHedgeBot."""
+
+from .backtest_engine import (
+    BacktestEngine,
+    BacktestResult,
+    BacktestSettings,
+    implied_prices,
+)
+from .simulated_exchange import SimulatedExchange
+from .sweep import (
+    ParameterSweep,
+    SweepRow,
+    grid_points,
+    random_points,
+    write_csv,
+    write_parquet,
+)
+from .virtual_clock import VirtualClock
+
+__all__ = [
+    "BacktestEngine",
+    "BacktestResult",
+    "BacktestSettings",
+    "ParameterSweep",
+    "SimulatedExchange",
+    "SweepRow",
+    "VirtualClock",
+    "grid_points",
+    "implied_prices",
+    "random_points",
+    "write_csv",
+    "write_parquet",
+]
@@ -0,0 +1,247 @@
+"""Simulated perpetual exchange for backtests."""
+
+import asyncio
+import bisect
+import itertools
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+from exchange_manager import IExchange
+from models import Trade
+from models.trade import OrderSide, OrderStatus, OrderType
+from .virtual_clock import VirtualClock
+
+
+class SimulatedExchange(IExchange):
+    """
+    In-memory perpetual venue on a virtual clock.
+
+    Market orders take ``latency_ms`` of simulated time and fill at the
+    price at the end of that latency, moved against the order by
+    ``slippage_bps``, paying ``taker_fee_percent`` on the notional.
+    Limit orders and order streams are not simulated.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        price_times: Sequence[float],
+        prices: Sequence[Decimal],
+        taker_fee_percent: Decimal = Decimal("0.05"),
+        latency_ms: float = 50.0,
+        slippage_bps: Decimal = Decimal("1"),
+        initial_balance: Decimal = Decimal("10000"),
+    ):
+        """
+        Initialize the simulated exchange.
+
+        Args:
+            clock: Virtual clock of the backtest
+            price_times: Clock times (seconds, ascending) of the price series
+            prices: Mark prices at those times
+            taker_fee_percent: Fee charged on each fill's notional
+            latency_ms: Simulated time from order to fill
+            slippage_bps: Adverse price move applied to each fill
+            initial_balance: Starting USDT balance
+        """
+        self.clock = clock
+        self.price_times = price_times
+        self.prices = prices
+        self.taker_fee_percent = taker_fee_percent
+        self.latency_ms = latency_ms
+        self.slippage_bps = slippage_bps
+        self.initial_balance = initial_balance
+
+        self.short_size = Decimal("0")
+        self.entry_price = Decimal("0")
+        self.realized_pnl = Decimal("0")
+        self.fees_paid = Decimal("0")
+        self.fills: List[Trade] = []
+        self._by_client_id: Dict[str, Trade] = {}
+        self._order_ids = itertools.count(1)
+
+    def price_now(self) -> Decimal:
+        """Last price at or before the current simulated time."""
+        index = bisect.bisect_right(self.price_times, self.clock.monotonic()) - 1
+        return self.prices[max(index, 0)]
+
+    def unrealized_pnl(self) -> Decimal:
+        """Mark-to-market P&L of the open short."""
+        return (self.entry_price - self.price_now()) * self.short_size
+
+    async def connect(self) -> None:
+        """Nothing to connect."""
+
+    async def disconnect(self) -> None:
+        """Nothing to disconnect."""
+
+    async def get_mark_price(self, symbol: str) -> Decimal:
+        """Get the simulated mark price."""
+        return self.price_now()
+
+    async def get_funding_rate(self, symbol: str) -> Decimal:
+        """Funding is not simulated."""
+        return Decimal("0")
+
+    def _fill(
+        self,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """Fill a market order after the simulated latency."""
+        if self.latency_ms:
+            self.clock.advance(self.latency_ms / 1000)
+
+        move = self.slippage_bps / 10000
+        price = self.price_now() * (1 - move if side == OrderSide.SELL else 1 + move)
+        fee = size * price * self.taker_fee_percent / 100
+        self.fees_paid += fee
+
+        trade = Trade(
+            symbol=symbol,
+            side=side,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=price,
+            timestamp=self.clock.utcnow(),
+            order_id=f"sim-{next(self._order_ids)}",
+            status=OrderStatus.FILLED,
+            fee=fee,
+            fee_currency="USDT",
+            exchange="simulated",
+        )
+        self.fills.append(trade)
+        if client_order_id:
+            self._by_client_id[client_order_id] = trade
+        return trade
+
+    async def open_short_position(
+        self,
+        symbol: str,
+        size: Decimal,
+        leverage: Decimal = Decimal("1"),
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """Sell to open or increase the short."""
+        trade = self._fill(symbol, OrderSide.SELL, size, client_order_id)
+        total = self.short_size + size
+        self.entry_price = (
+            self.entry_price * self.short_size + trade.price * size
+        ) / total
+        self.short_size = total
+        return trade
+
+    async def close_short_position(
+        self,
+        symbol: str,
+        size: Decimal,
+        client_order_id: Optional[str] = None,
+        reduce_only: bool = False,
+    ) -> Trade:
+        """Buy to reduce the short (never beyond flat, so always reduce-only)."""
+        size = min(size, self.short_size)
+        trade = self._fill(symbol, OrderSide.BUY, size, client_order_id)
+        self.realized_pnl += (self.entry_price - trade.price) * size
+        self.short_size -= size
+        if self.short_size == 0:
+            self.entry_price = Decimal("0")
+        return trade
+
+    async def get_current_perpetual_position(self, symbol: str) -> Dict[str, Any]:
+        """Get the simulated position."""
+        return {
+            "symbol": symbol,
+            "size": self.short_size,
+            "side": "short" if self.short_size else None,
+            "entry_price": self.entry_price if self.short_size else None,
+            "mark_price": self.price_now(),
+            "unrealized_pnl": self.unrealized_pnl(),
+            "realized_pnl": self.realized_pnl,
+            "margin": Decimal("0"),
+            "leverage": Decimal("1"),
+        }
+
+    async def set_leverage(self, symbol: str, leverage: Decimal) -> bool:
+        """Leverage is not simulated."""
+        return True
+
+    async def get_balance(self, currency: str = "USDT") -> Decimal:
+        """Initial balance plus realized P&L, less fees."""
+        return self.initial_balance + self.realized_pnl - self.fees_paid
+
+    async def get_order_book(self, symbol: str, limit: int = 20) -> Dict[str, Any]:
+        """A deep one-level book around the simulated price."""
+        price = self.price_now()
+        move = self.slippage_bps / 10000
+        depth = Decimal("1000000")
+        return {
+            "symbol": symbol,
+            "bids": [(price * (1 - move), depth)],
+            "asks": [(price * (1 + move), depth)],
+            "timestamp": None,
+            "datetime": self.clock.utcnow().isoformat(),
+        }
+
+    async def get_recent_trades(self, symbol: str, limit: int = 100) -> list:
+        """Public trades are not simulated."""
+        return []
+
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
+        """Market orders fill immediately; nothing to cancel."""
+        return False
+
+    async def get_order_status(self, order_id: str, symbol: str) -> Dict[str, Any]:
+        """Order lookups are not simulated."""
+        raise NotImplementedError("Order status is not simulated")
+
+    async def get_order_by_client_id(
+        self, client_order_id: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a simulated fill by client order ID."""
+        trade = self._by_client_id.get(client_order_id)
+        if trade is None:
+            return None
+        return {
+            "id": trade.order_id,
+            "symbol": symbol,
+            "type": "market",
+            "side": trade.side.value,
+            "price": trade.price,
+            "amount": trade.size,
+            "filled": trade.size,
+            "remaining": Decimal("0"),
+            "status": "closed",
+            "timestamp": None,
+            "datetime": trade.timestamp.isoformat(),
+            "average": trade.price,
+            "fee": trade.fee,
+            "fee_currency": trade.fee_currency,
+            "client_order_id": client_order_id,
+        }
+
+    async def place_limit_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+        price: Decimal,
+        post_only: bool = True,
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """Limit orders are not simulated."""
+        raise NotImplementedError("Limit orders are not simulated")
+
+    async def watch_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        """Order streams are not simulated."""
+        raise NotImplementedError("Order streams are not simulated")
+
+    async def watch_mark_price(self, symbol: str) -> Decimal:
+        """Wait in simulated time for the next price of the series."""
+        index = bisect.bisect_right(self.price_times, self.clock.monotonic())
+        if index >= len(self.price_times):
+            # The series is over: no more ticks
+            await asyncio.get_running_loop().create_future()
+        await self.clock.sleep(self.price_times[index] - self.clock.monotonic())
+        return self.prices[index]
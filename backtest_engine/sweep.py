@@ -0,0 +1,312 @@
+"""Parallel parameter sweep of the hedge settings over recorded history."""
+
+import asyncio
+import csv
+import dataclasses
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from config_manager import Config
+from database_manager import DatabaseManager
+from logger_manager import LoggerManager, LogTag
+from .backtest_engine import BacktestEngine, BacktestSettings, implied_prices
+
+# Config fields a sweep may vary
+SWEEP_PARAMETERS = (
+    "hedge_threshold_eth",
+    "min_hedge_size_eth",
+    "min_hedge_interval_seconds",
+    "default_leverage",
+)
+
+# History loaded once per worker process
+_HISTORY: Optional[Tuple[list, list]] = None
+
+
+def grid_points(space: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Every combination of the given parameter values.
+
+    Args:
+        space: Values to try per parameter
+
+    Returns:
+        Parameter sets
+    """
+    _check_names(space)
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+
+def random_points(
+    bounds: Dict[str, Tuple[Any, Any]], n_points: int, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Parameter sets drawn uniformly within bounds.
+
+    Integer bounds draw integers; anything else draws Decimals.
+
+    Args:
+        bounds: (low, high) per parameter
+        n_points: Number of sets to draw
+        seed: Random seed
+
+    Returns:
+        Parameter sets
+    """
+    _check_names(bounds)
+    rng = random.Random(seed)
+    points = []
+    for _ in range(n_points):
+        point = {}
+        for name, (low, high) in bounds.items():
+            if isinstance(low, int) and isinstance(high, int):
+                point[name] = rng.randint(low, high)
+            else:
+                value = rng.uniform(float(low), float(high))
+                point[name] = Decimal(f"{value:.6f}")
+        points.append(point)
+    return points
+
+
+def _check_names(space: Dict[str, Any]) -> None:
+    """Reject parameters the sweep does not support."""
+    unknown = set(space) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unsupported sweep parameters: {sorted(unknown)}")
+
+
+@dataclass
+class SweepRow:
+    """
+    Backtest outcome of one parameter set.
+
+    Attributes:
+        params: Parameter set
+        hedges: Hedges executed
+        volume_eth: Total size traded
+        fees: Taker fees paid
+        total_pnl: LP plus hedge P&L, net of fees
+        cost: Hedging cost (fees plus hedge P&L shortfall against the LP)
+        rms_error: RMS delta-tracking error in ETH
+        max_error: Maximum absolute delta in ETH
+        within_threshold: Fraction of snapshots within the hedge threshold
+        score: cost + error_weight * rms_error (lower is better)
+        pareto: Whether no other set has both lower cost and lower error
+    """
+
+    params: Dict[str, Any]
+    hedges: int
+    volume_eth: Decimal
+    fees: Decimal
+    total_pnl: Decimal
+    cost: Decimal
+    rms_error: float
+    max_error: float
+    within_threshold: float
+    score: float = 0.0
+    pareto: bool = False
+
+    def to_dict(self) -> dict:
+        """Flat dictionary for export."""
+        return {
+            **{name: str(value) for name, value in self.params.items()},
+            "hedges": self.hedges,
+            "volume_eth": str(self.volume_eth),
+            "fees": f"{self.fees:.2f}",
+            "total_pnl": f"{self.total_pnl:.2f}",
+            "cost": f"{self.cost:.2f}",
+            "rms_error": round(self.rms_error, 6),
+            "max_error": round(self.max_error, 6),
+            "within_threshold": round(self.within_threshold, 4),
+            "score": round(self.score, 4),
+            "pareto": self.pareto,
+        }
+
+
+def _init_worker(
+    database_url: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    initial_price: Decimal,
+) -> None:
+    """Quiet logging and load the history once per worker."""
+    LoggerManager().setup_logger(log_level="ERROR", console_output=False)
+    _load_history(database_url, start, end, initial_price)
+
+
+def _load_history(
+    database_url: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    initial_price: Decimal,
+) -> None:
+    """Load snapshots and their implied prices into this process."""
+    global _HISTORY
+    snapshots = list(DatabaseManager(database_url).iter_position_snapshots(start, end))
+    _HISTORY = (snapshots, implied_prices(snapshots, initial_price))
+
+
+def _run_point(task: Tuple[Config, BacktestSettings, Dict[str, Any]]) -> SweepRow:
+    """Backtest one parameter set on the worker's history."""
+    config, settings, params = task
+    snapshots, prices = _HISTORY
+    result = asyncio.run(
+        BacktestEngine(dataclasses.replace(config, **params), settings).run(
+            snapshots, prices
+        )
+    )
+    summary = result.summary()["delta_error_eth"]
+    return SweepRow(
+        params=params,
+        hedges=result.hedges,
+        volume_eth=sum((trade.size for trade in result.fills), Decimal("0")),
+        fees=result.fees,
+        total_pnl=result.total_pnl,
+        cost=-result.total_pnl,
+        rms_error=summary["rms"],
+        max_error=summary["max_abs"],
+        within_threshold=summary["within_threshold"],
+    )
+
+
+def rank(rows: List[SweepRow], error_weight: float) -> List[SweepRow]:
+    """
+    Score, mark the Pareto front and sort best first.
+
+    Args:
+        rows: Sweep outcomes
+        error_weight: USDT of cost one ETH of RMS tracking error is worth
+
+    Returns:
+        Rows sorted by score
+    """
+    for row in rows:
+        row.score = float(row.cost) + error_weight * row.rms_error
+
+    # Sweep by cost: a row is on the front if its error beats every cheaper row
+    best_error = float("inf")
+    for row in sorted(rows, key=lambda r: (r.cost, r.rms_error)):
+        row.pareto = row.rms_error < best_error
+        best_error = min(best_error, row.rms_error)
+
+    return sorted(rows, key=lambda r: r.score)
+
+
+class ParameterSweep:
+    """
+    Backtests many hedge parameter sets on recorded history in parallel.
+
+    Each worker process loads the history from the database once and then
+    runs its share of parameter sets through the BacktestEngine.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        database_url: str,
+        settings: Optional[BacktestSettings] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        error_weight: float = 1000.0,
+    ):
+        """
+        Initialize the sweep.
+
+        Args:
+            config: Base configuration; swept fields are overridden per run
+            database_url: Database holding the position snapshots
+            settings: Simulated market settings
+            start: Start of the history
+            end: End of the history
+            error_weight: USDT of cost one ETH of RMS tracking error is worth
+        """
+        self.config = config
+        self.database_url = database_url
+        self.settings = settings or BacktestSettings()
+        self.start = start
+        self.end = end
+        self.error_weight = error_weight
+        self.logger = LoggerManager()
+
+    def run(
+        self, points: List[Dict[str, Any]], n_workers: Optional[int] = None
+    ) -> List[SweepRow]:
+        """
+        Run the sweep.
+
+        Args:
+            points: Parameter sets (see grid_points / random_points)
+            n_workers: Worker processes (default: CPU count)
+
+        Returns:
+            Rows ranked best first
+        """
+        started = time.perf_counter()
+        n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(points)))
+        init_args = (
+            self.database_url,
+            self.start,
+            self.end,
+            self.settings.initial_price,
+        )
+        tasks = [(self.config, self.settings, params) for params in points]
+
+        self.logger.log_info(
+            f"Sweep: {len(points)} parameter sets on {n_workers} worker(s)",
+            LogTag.STRATEGY,
+        )
+
+        if n_workers == 1:
+            _load_history(*init_args)
+            rows = [_run_point(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers, initializer=_init_worker, initargs=init_args
+            ) as executor:
+                chunksize = max(1, len(tasks) // (n_workers * 4))
+                rows = list(executor.map(_run_point, tasks, chunksize=chunksize))
+
+        self.logger.log_info(
+            f"Sweep finished in {time.perf_counter() - started:.1f}s",
+            LogTag.STRATEGY,
+        )
+        return rank(rows, self.error_weight)
+
+
+def write_csv(rows: List[SweepRow], path: str) -> None:
+    """
+    Export sweep rows to CSV.
+
+    Args:
+        rows: Ranked sweep rows
+        path: Output file
+    """
+    records = [row.to_dict() for row in rows]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0]) if records else [])
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def write_parquet(rows: List[SweepRow], path: str) -> None:
+    """
+    Export sweep rows to Parquet (requires pandas with pyarrow).
+
+    Args:
+        rows: Ranked sweep rows
+        path: Output file
+    """
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError("Parquet export requires pandas and pyarrow") from e
+
+    pd.DataFrame([row.to_dict() for row in rows]).to_parquet(path, index=False)
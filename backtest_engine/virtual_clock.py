@@ -0,0 +1,94 @@
+"""Virtual clock for backtests."""
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from models import Clock
+
+
+class VirtualClock(Clock):
+    """
+    Clock that only moves when the backtest moves it.
+
+    ``sleep`` parks the caller until the backtest advances past its wake
+    time, so timers (coalescing windows, TWAP slices) fire in simulated time
+    with no real sleeps.
+    """
+
+    def __init__(self, start: datetime, settle_rounds: int = 20):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial simulated time
+            settle_rounds: Event loop passes given to woken tasks
+        """
+        self._start = start
+        self._elapsed = 0.0
+        self._settle_rounds = settle_rounds
+        self._sleepers: List[Tuple[float, int, asyncio.Future]] = []
+        self._sequence = 0
+
+    def utcnow(self) -> datetime:
+        """Current simulated UTC time."""
+        return self._start + timedelta(seconds=self._elapsed)
+
+    def monotonic(self) -> float:
+        """Simulated seconds since the start."""
+        return self._elapsed
+
+    async def sleep(self, seconds: float) -> None:
+        """
+        Wait until simulated time has advanced by ``seconds``.
+
+        Args:
+            seconds: Simulated time to sleep
+        """
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        heapq.heappush(
+            self._sleepers, (self._elapsed + seconds, self._sequence, future)
+        )
+        await future
+
+    @property
+    def pending(self) -> int:
+        """Number of parked sleepers."""
+        return len(self._sleepers)
+
+    def advance(self, seconds: float) -> None:
+        """
+        Move time forward without waking sleepers (e.g. order latency).
+
+        Args:
+            seconds: Simulated time to add
+        """
+        self._elapsed += seconds
+
+    async def advance_to(self, when: datetime) -> None:
+        """
+        Move time forward to ``when``, waking sleepers in time order.
+
+        Each woken task gets a few event loop passes to run to its next
+        wait before time moves on. Time never moves backwards.
+
+        Args:
+            when: Target simulated time
+        """
+        target = (when - self._start).total_seconds()
+        while self._sleepers and self._sleepers[0][0] <= target:
+            wake_at, _, future = heapq.heappop(self._sleepers)
+            if future.done():
+                continue  # Sleeper was cancelled
+            self._elapsed = max(self._elapsed, wake_at)
+            future.set_result(None)
+            for _ in range(self._settle_rounds):
+                await asyncio.sleep(0)
+
+        self._elapsed = max(self._elapsed, target)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the per-snapshot math on the snapshot -> risk -> strategy path.
+
+Compares the previous all-Decimal path (reserves divided by Decimal(10**18),
+Decimal delta and Decimal threshold comparisons) against the integer
+fixed-point path used by SwapMonitor and RiskManager.should_hedge.
+
+Usage:
+    python benchmarks/bench_snapshot_math.py [iterations]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from config_manager import Config
+from models import PositionSnapshot
+from models.fixed_point import from_units, to_units
+from risk_manager import RiskManager
+
+
+def build_inputs(count: int, seed: int = 7) -> list:
+    """Build raw (reserve0, reserve1, short) inputs close to delta-neutral."""
+    rng = random.Random(seed)
+    inputs = []
+    for _ in range(count):
+        reserve1 = rng.randint(400 * 10**18, 600 * 10**18)
+        short = reserve1 + rng.randint(-5 * 10**15, 5 * 10**15)  # Within threshold
+        reserve0 = rng.randint(900_000 * 10**6, 1_100_000 * 10**6)
+        inputs.append((reserve0, reserve1, Decimal(short) / Decimal(10**18)))
+    return inputs
+
+
+def legacy_should_hedge(snapshot: PositionSnapshot, config: Config) -> tuple:
+    """Previous RiskManager.should_hedge threshold logic, all in Decimal."""
+    delta = snapshot.delta
+    if abs(delta) <= config.hedge_threshold_eth:
+        return False, Decimal("0")
+    if abs(delta) < config.min_hedge_size_eth:
+        return False, Decimal("0")
+    return True, delta
+
+
+def decimal_path(inputs: list, config: Config) -> int:
+    """Previous implementation: reserves scaled and checked in Decimal."""
+    hedges = 0
+    now = datetime.utcnow()
+    for reserve0_raw, reserve1_raw, short in inputs:
+        snapshot = PositionSnapshot(
+            reserve_token0=Decimal(reserve0_raw) / Decimal(10**6),
+            reserve_token1=Decimal(reserve1_raw) / Decimal(10**18),
+            short_position_size=short,
+            timestamp=now,
+        )
+        if legacy_should_hedge(snapshot, config)[0]:
+            hedges += 1
+    return hedges
+
+
+def fixed_point_path(inputs: list, risk_manager: RiskManager) -> int:
+    """Current implementation: raw units through RiskManager.should_hedge."""
+    hedges = 0
+    now = datetime.utcnow()
+    for reserve0_raw, reserve1_raw, short in inputs:
+        snapshot = PositionSnapshot(
+            reserve_token0=from_units(reserve0_raw, 6),
+            reserve_token1=from_units(reserve1_raw),
+            short_position_size=short,
+            timestamp=now,
+            reserve_token1_units=reserve1_raw,
+            short_position_units=to_units(short),
+        )
+        if risk_manager.should_hedge(snapshot)[0]:
+            hedges += 1
+    return hedges
+
+
+def risk_only_decimal(snapshots: list, config: Config) -> None:
+    """Decimal threshold checks on prebuilt snapshots."""
+    for snapshot in snapshots:
+        legacy_should_hedge(snapshot, config)
+
+
+def risk_only_fixed(snapshots: list, risk_manager: RiskManager) -> None:
+    """Integer threshold checks on prebuilt snapshots."""
+    for snapshot in snapshots:
+        risk_manager.should_hedge(snapshot)
+
+
+def main() -> None:
+    """Run the benchmark and print per-snapshot timings."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    config = Config(
+        rpc_url="http://localhost:8545",
+        eulerswap_pool="0x" + "0" * 40,
+        binance_api_key="",
+        binance_api_secret="",
+    )
+    risk_manager = RiskManager(config)
+    risk_manager.max_trades_per_hour = 10**9
+    risk_manager.logger.setup_logger(log_level="ERROR", console_output=False)
+
+    inputs = build_inputs(iterations)
+    now = datetime.utcnow()
+    fixed_snapshots = [
+        PositionSnapshot.from_units(r0, r1, to_units(short), now)
+        for r0, r1, short in inputs
+    ]
+
+    results = {
+        "decimal (full path)": timeit.timeit(
+            lambda: decimal_path(inputs, config), number=3
+        ),
+        "fixed-point (full path)": timeit.timeit(
+            lambda: fixed_point_path(inputs, risk_manager), number=3
+        ),
+        "decimal (risk check)": timeit.timeit(
+            lambda: risk_only_decimal(fixed_snapshots, config), number=3
+        ),
+        "fixed-point (risk check)": timeit.timeit(
+            lambda: risk_only_fixed(fixed_snapshots, risk_manager), number=3
+        ),
+    }
+
+    print(f"Snapshots per run: {iterations}")
+    for name, seconds in results.items():
+        per_snapshot_us = seconds / (3 * iterations) * 1e6
+        print(f"  {name:<26} {per_snapshot_us:8.3f} us/snapshot")
+
+    speedup = results["decimal (risk check)"] / results["fixed-point (risk check)"]
+    print(f"Risk check speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
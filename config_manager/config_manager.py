@@ -3,12 +3,14 @@
 import os
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
 
+from models import AssetPair
+
 
 @dataclass
 class Config:
@@ -24,20 +26,61 @@ class Config:
     binance_api_key: str
     binance_api_secret: str
     binance_testnet: bool = False
+    eulerswap_pools: str = ""  # Extra pools, "address" or "address=SYMBOL"
+    # Per-perp asset settings: "SYMBOL:key=value,key=value;SYMBOL:..."
+    asset_specs: str = ""
+    exchange_venues: str = "binance"  # Comma-separated venue names
+    venue_latency_penalty_bps: Decimal = Decimal("0.5")  # Per 100ms of latency
+    position_reconcile_interval_seconds: int = 60
+    position_drift_tolerance_eth: Decimal = Decimal("0.001")
 
     # Hedge Strategy Configuration
     min_hedge_size_eth: Decimal = Decimal("0.005")
     hedge_threshold_eth: Decimal = Decimal("0.01")
     max_slippage_percent: Decimal = Decimal("0.5")
     default_leverage: Decimal = Decimal("1")
+    min_hedge_interval_seconds: int = 30
+    hedge_coalesce_window_seconds: float = 0.25  # Nets a burst, not a block
+    hedge_urgency_threshold_eth: Decimal = Decimal("1")
+    hedge_latency_budget_ms: int = 2000  # Observation to order; 0 disables
+    hedge_band_enabled: bool = False  # Optimal band replaces the fixed threshold
+    hedge_band_risk_aversion: Decimal = Decimal("1")
+    hedge_band_refresh_seconds: int = 60
+
+    # Hedge part of the forecast delta change ahead of time
+    forecast_hedging_enabled: bool = False
+    forecast_horizon_seconds: int = 30
+    forecast_hedge_fraction: Decimal = Decimal("0.5")
+
+    # Kill switch on mark-price ticks
+    kill_switch_enabled: bool = True
+    kill_switch_max_move_percent: Decimal = Decimal("10")
+    kill_switch_window_seconds: int = 60
+    kill_switch_max_loss_usdt: Decimal = Decimal("1000")
+
+    # Execution Configuration
+    sliced_execution_threshold_eth: Decimal = Decimal("5")
+    execution_style: str = "twap"  # "twap", "depth" or "maker"
+    twap_slices: int = 5
+    twap_duration_seconds: int = 60
+    depth_participation: Decimal = Decimal("0.2")
+    maker_chase_interval_ms: int = 500
+    maker_deadline_seconds: int = 20
+    order_ack_timeout_seconds: int = 10
+
+    # Shadow strategies on the live feed: "name:key=value,key=value;name:..."
+    shadow_strategies: str = ""
 
     # Monitoring Configuration
     polling_interval_seconds: int = 5
+    swap_event_trigger: bool = True
+    swap_event_poll_interval_ms: int = 250
     max_retries: int = 3
     retry_delay_seconds: int = 2
 
     # Database Configuration
     database_url: str = "sqlite:///lphedgebot.db"
+    state_checkpoint_file: str = "lphedgebot_state.json"
 
     # Logging Configuration
     log_level: str = "INFO"
@@ -51,21 +94,79 @@ class Config:
         return {
             "rpc_url": self.rpc_url,
             "eulerswap_pool": self.eulerswap_pool,
+            "eulerswap_pools": self.eulerswap_pools,
+            "asset_specs": self.asset_specs,
             "binance_testnet": self.binance_testnet,
+            "exchange_venues": self.exchange_venues,
+            "venue_latency_penalty_bps": str(self.venue_latency_penalty_bps),
+            "position_reconcile_interval_seconds": (
+                self.position_reconcile_interval_seconds
+            ),
+            "position_drift_tolerance_eth": str(self.position_drift_tolerance_eth),
             "min_hedge_size_eth": str(self.min_hedge_size_eth),
             "hedge_threshold_eth": str(self.hedge_threshold_eth),
             "max_slippage_percent": str(self.max_slippage_percent),
             "default_leverage": str(self.default_leverage),
+            "min_hedge_interval_seconds": self.min_hedge_interval_seconds,
+            "hedge_coalesce_window_seconds": self.hedge_coalesce_window_seconds,
+            "hedge_urgency_threshold_eth": str(self.hedge_urgency_threshold_eth),
+            "hedge_latency_budget_ms": self.hedge_latency_budget_ms,
+            "hedge_band_enabled": self.hedge_band_enabled,
+            "hedge_band_risk_aversion": str(self.hedge_band_risk_aversion),
+            "hedge_band_refresh_seconds": self.hedge_band_refresh_seconds,
+            "forecast_hedging_enabled": self.forecast_hedging_enabled,
+            "forecast_horizon_seconds": self.forecast_horizon_seconds,
+            "forecast_hedge_fraction": str(self.forecast_hedge_fraction),
+            "kill_switch_enabled": self.kill_switch_enabled,
+            "kill_switch_max_move_percent": str(self.kill_switch_max_move_percent),
+            "kill_switch_window_seconds": self.kill_switch_window_seconds,
+            "kill_switch_max_loss_usdt": str(self.kill_switch_max_loss_usdt),
+            "sliced_execution_threshold_eth": str(self.sliced_execution_threshold_eth),
+            "execution_style": self.execution_style,
+            "twap_slices": self.twap_slices,
+            "twap_duration_seconds": self.twap_duration_seconds,
+            "depth_participation": str(self.depth_participation),
+            "maker_chase_interval_ms": self.maker_chase_interval_ms,
+            "maker_deadline_seconds": self.maker_deadline_seconds,
+            "order_ack_timeout_seconds": self.order_ack_timeout_seconds,
+            "shadow_strategies": self.shadow_strategies,
             "polling_interval_seconds": self.polling_interval_seconds,
+            "swap_event_trigger": self.swap_event_trigger,
+            "swap_event_poll_interval_ms": self.swap_event_poll_interval_ms,
             "max_retries": self.max_retries,
             "retry_delay_seconds": self.retry_delay_seconds,
             "database_url": self.database_url,
+            "state_checkpoint_file": self.state_checkpoint_file,
             "log_level": self.log_level,
             "log_file": self.log_file,
             "symbol_perpetual": self.symbol_perpetual,
         }
 
 
+_FIELD_NAMES = {field.name for field in fields(Config)}
+
+# ASSET_SPECS keys that describe the asset pair rather than the strategy
+_ASSET_INT_FIELDS = ("token0_decimals", "token1_decimals")
+_ASSET_DECIMAL_FIELDS = ("contract_size", "amount_step")
+
+# Deployment-wide settings an asset spec may not override
+_NON_ASSET_FIELDS = (
+    "rpc_url",
+    "eulerswap_pool",
+    "eulerswap_pools",
+    "asset_specs",
+    "symbol_perpetual",
+    "binance_api_key",
+    "binance_api_secret",
+    "binance_testnet",
+    "exchange_venues",
+    "database_url",
+    "state_checkpoint_file",
+    "log_level",
+    "log_file",
+)
+
+
 class ConfigManager:
     """
     Manages configuration loading and access.
@@ -101,20 +202,92 @@ class ConfigManager:
                 # Required configurations
                 rpc_url=self._get_required_env("RPC_URL"),
                 eulerswap_pool=self._get_required_env("EULERSWAP_POOL"),
+                eulerswap_pools=os.getenv("EULERSWAP_POOLS", ""),
+                asset_specs=os.getenv("ASSET_SPECS", ""),
                 binance_api_key=self._get_required_env("BINANCE_API_KEY"),
                 binance_api_secret=self._get_required_env("BINANCE_API_SECRET"),
                 # Optional configurations with defaults
                 binance_testnet=self._get_bool_env("BINANCE_TESTNET", False),
+                exchange_venues=os.getenv("EXCHANGE_VENUES", "binance"),
+                venue_latency_penalty_bps=Decimal(
+                    os.getenv("VENUE_LATENCY_PENALTY_BPS", "0.5")
+                ),
+                position_reconcile_interval_seconds=int(
+                    os.getenv("POSITION_RECONCILE_INTERVAL_SECONDS", "60")
+                ),
+                position_drift_tolerance_eth=Decimal(
+                    os.getenv("POSITION_DRIFT_TOLERANCE_ETH", "0.001")
+                ),
                 min_hedge_size_eth=Decimal(os.getenv("MIN_HEDGE_SIZE_ETH", "0.005")),
                 hedge_threshold_eth=Decimal(os.getenv("HEDGE_THRESHOLD_ETH", "0.01")),
                 max_slippage_percent=Decimal(os.getenv("MAX_SLIPPAGE_PERCENT", "0.5")),
                 default_leverage=Decimal(os.getenv("DEFAULT_LEVERAGE", "1")),
+                min_hedge_interval_seconds=int(
+                    os.getenv("MIN_HEDGE_INTERVAL_SECONDS", "30")
+                ),
+                hedge_coalesce_window_seconds=float(
+                    os.getenv("HEDGE_COALESCE_WINDOW_SECONDS", "0.25")
+                ),
+                hedge_urgency_threshold_eth=Decimal(
+                    os.getenv("HEDGE_URGENCY_THRESHOLD_ETH", "1")
+                ),
+                hedge_latency_budget_ms=int(
+                    os.getenv("HEDGE_LATENCY_BUDGET_MS", "2000")
+                ),
+                hedge_band_enabled=self._get_bool_env("HEDGE_BAND_ENABLED", False),
+                hedge_band_risk_aversion=Decimal(
+                    os.getenv("HEDGE_BAND_RISK_AVERSION", "1")
+                ),
+                hedge_band_refresh_seconds=int(
+                    os.getenv("HEDGE_BAND_REFRESH_SECONDS", "60")
+                ),
+                forecast_hedging_enabled=self._get_bool_env(
+                    "FORECAST_HEDGING_ENABLED", False
+                ),
+                forecast_horizon_seconds=int(
+                    os.getenv("FORECAST_HORIZON_SECONDS", "30")
+                ),
+                forecast_hedge_fraction=Decimal(
+                    os.getenv("FORECAST_HEDGE_FRACTION", "0.5")
+                ),
+                kill_switch_enabled=self._get_bool_env("KILL_SWITCH_ENABLED", True),
+                kill_switch_max_move_percent=Decimal(
+                    os.getenv("KILL_SWITCH_MAX_MOVE_PERCENT", "10")
+                ),
+                kill_switch_window_seconds=int(
+                    os.getenv("KILL_SWITCH_WINDOW_SECONDS", "60")
+                ),
+                kill_switch_max_loss_usdt=Decimal(
+                    os.getenv("KILL_SWITCH_MAX_LOSS_USDT", "1000")
+                ),
+                sliced_execution_threshold_eth=Decimal(
+                    os.getenv("SLICED_EXECUTION_THRESHOLD_ETH", "5")
+                ),
+                execution_style=os.getenv("EXECUTION_STYLE", "twap"),
+                twap_slices=int(os.getenv("TWAP_SLICES", "5")),
+                twap_duration_seconds=int(os.getenv("TWAP_DURATION_SECONDS", "60")),
+                depth_participation=Decimal(os.getenv("DEPTH_PARTICIPATION", "0.2")),
+                maker_chase_interval_ms=int(
+                    os.getenv("MAKER_CHASE_INTERVAL_MS", "500")
+                ),
+                maker_deadline_seconds=int(os.getenv("MAKER_DEADLINE_SECONDS", "20")),
+                order_ack_timeout_seconds=int(
+                    os.getenv("ORDER_ACK_TIMEOUT_SECONDS", "10")
+                ),
+                shadow_strategies=os.getenv("SHADOW_STRATEGIES", ""),
                 polling_interval_seconds=int(
                     os.getenv("POLLING_INTERVAL_SECONDS", "5")
                 ),
+                swap_event_trigger=self._get_bool_env("SWAP_EVENT_TRIGGER", True),
+                swap_event_poll_interval_ms=int(
+                    os.getenv("SWAP_EVENT_POLL_INTERVAL_MS", "250")
+                ),
                 max_retries=int(os.getenv("MAX_RETRIES", "3")),
                 retry_delay_seconds=int(os.getenv("RETRY_DELAY_SECONDS", "2")),
                 database_url=os.getenv("DATABASE_URL", "sqlite:///lphedgebot.db"),
+                state_checkpoint_file=os.getenv(
+                    "STATE_CHECKPOINT_FILE", "lphedgebot_state.json"
+                ),
                 log_level=os.getenv("LOG_LEVEL", "INFO"),
                 log_file=os.getenv("LOG_FILE", "lphedgebot.log"),
             )
@@ -175,6 +348,20 @@ class ConfigManager:
         if len(self._config.eulerswap_pool) != 42:
             raise ValueError("Invalid EulerSwap pool address length")
 
+        for pool, _ in self.get_pools()[1:]:
+            if not pool.startswith("0x") or len(pool) != 42:
+                raise ValueError(f"Invalid EulerSwap pool address: {pool}")
+
+        for pair in self.get_asset_pairs():
+            config = self.get_asset_config(pair.symbol)
+            if pair.amount_step < 0 or pair.contract_size <= 0:
+                raise ValueError(f"Invalid order size increment for {pair.symbol}")
+            if config.min_hedge_size_eth < pair.size_increment:
+                raise ValueError(
+                    f"Minimum hedge size for {pair.symbol} is below its "
+                    f"order size increment {pair.size_increment}"
+                )
+
         # Validate numeric ranges
         if self._config.min_hedge_size_eth <= 0:
             raise ValueError("Minimum hedge size must be positive")
@@ -191,9 +378,70 @@ class ConfigManager:
         if self._config.default_leverage < 1 or self._config.default_leverage > 100:
             raise ValueError("Leverage must be between 1 and 100")
 
+        if self._config.hedge_coalesce_window_seconds < 0:
+            raise ValueError("Coalescing window cannot be negative")
+
+        if self._config.hedge_urgency_threshold_eth <= 0:
+            raise ValueError("Urgency threshold must be positive")
+
+        if self._config.hedge_latency_budget_ms < 0:
+            raise ValueError("Hedge latency budget cannot be negative")
+
+        if self._config.hedge_band_risk_aversion <= 0:
+            raise ValueError("Hedge band risk aversion must be positive")
+
+        if self._config.hedge_band_refresh_seconds < 1:
+            raise ValueError("Hedge band refresh must be at least 1 second")
+
+        if self._config.forecast_horizon_seconds < 1:
+            raise ValueError("Forecast horizon must be at least 1 second")
+
+        if not 0 <= self._config.forecast_hedge_fraction <= 1:
+            raise ValueError("Forecast hedge fraction must be between 0 and 1")
+
+        if not 0 < self._config.kill_switch_max_move_percent < 100:
+            raise ValueError("Kill switch price move must be between 0 and 100")
+
+        if self._config.kill_switch_window_seconds < 1:
+            raise ValueError("Kill switch window must be at least 1 second")
+
+        if self._config.kill_switch_max_loss_usdt <= 0:
+            raise ValueError("Kill switch loss limit must be positive")
+
+        if self._config.execution_style not in ("twap", "depth", "maker"):
+            raise ValueError("Execution style must be 'twap', 'depth' or 'maker'")
+
+        if self._config.twap_slices < 1:
+            raise ValueError("TWAP slices must be at least 1")
+
+        if not 0 < self._config.depth_participation <= 1:
+            raise ValueError("Depth participation must be between 0 and 1")
+
+        if self._config.maker_chase_interval_ms < 1:
+            raise ValueError("Maker chase interval must be positive")
+
+        if self._config.maker_deadline_seconds < 0:
+            raise ValueError("Maker deadline cannot be negative")
+
+        if self._config.order_ack_timeout_seconds < 1:
+            raise ValueError("Order acknowledgement timeout must be at least 1 second")
+
+        if self._config.position_reconcile_interval_seconds < 1:
+            raise ValueError("Position reconcile interval must be at least 1 second")
+
+        if self._config.position_drift_tolerance_eth < 0:
+            raise ValueError("Position drift tolerance cannot be negative")
+
         if self._config.polling_interval_seconds < 1:
             raise ValueError("Polling interval must be at least 1 second")
 
+        # Shadow strategies must parse to valid settings
+        for name, shadow in self.get_shadow_configs().items():
+            if shadow.hedge_threshold_eth <= 0 or shadow.min_hedge_size_eth <= 0:
+                raise ValueError(f"Shadow strategy {name}: sizes must be positive")
+            if shadow.execution_style not in ("twap", "depth", "maker"):
+                raise ValueError(f"Shadow strategy {name}: invalid execution style")
+
         self.logger.info("Configuration validation passed")
 
     @property
@@ -211,21 +459,209 @@ class ConfigManager:
             raise RuntimeError("Configuration not loaded")
         return self._config
 
+    def get_venue_names(self) -> List[str]:
+        """
+        Get the configured exchange venue names.
+
+        Returns:
+            Venue names in order of preference
+        """
+        names = [
+            name.strip().lower()
+            for name in self.config.exchange_venues.split(",")
+            if name.strip()
+        ]
+        return names or ["binance"]
+
+    def get_pools(self) -> List[Tuple[str, str]]:
+        """
+        Get the monitored pools and the perp each is hedged on.
+
+        ``EULERSWAP_POOLS`` lists extra pools as ``address`` or
+        ``address=SYMBOL``; without a symbol the pool is hedged on
+        ``SYMBOL_PERPETUAL`` and nets against the main pool.
+
+        Returns:
+            (pool address, perp symbol) pairs, main pool first
+        """
+        pools = [(self.config.eulerswap_pool, self.config.symbol_perpetual)]
+        for entry in self.config.eulerswap_pools.split(","):
+            if not entry.strip():
+                continue
+            address, _, symbol = entry.partition("=")
+            pools.append(
+                (address.strip(), symbol.strip() or self.config.symbol_perpetual)
+            )
+        return pools
+
+    def _get_asset_specs(self) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Parse ``ASSET_SPECS`` into asset pair and configuration settings.
+
+        Returns:
+            (asset pair fields, config overrides) per perp symbol
+
+        Raises:
+            ValueError: If an entry is malformed or names an unknown field
+        """
+        specs = {}
+        for entry in self.config.asset_specs.split(";"):
+            if not entry.strip():
+                continue
+            # Perp symbols contain ":" themselves (e.g. "BTC/USDT:USDT")
+            symbol, _, settings = entry.rpartition(":")
+            symbol = symbol.strip()
+            if not symbol or symbol in specs:
+                raise ValueError(f"Invalid asset symbol in '{entry}'")
+
+            pair_fields, overrides = {}, {}
+            for setting in settings.split(","):
+                if not setting.strip():
+                    continue
+                key, sep, value = setting.partition("=")
+                key, value = key.strip(), value.strip()
+                if not sep:
+                    raise ValueError(f"Invalid asset setting '{setting}' for {symbol}")
+                if key in _ASSET_INT_FIELDS:
+                    pair_fields[key] = int(value)
+                elif key in _ASSET_DECIMAL_FIELDS:
+                    pair_fields[key] = Decimal(value)
+                elif key in _FIELD_NAMES and key not in _NON_ASSET_FIELDS:
+                    overrides[key] = self._convert_value(key, value)
+                else:
+                    raise ValueError(f"Invalid asset setting '{setting}' for {symbol}")
+            specs[symbol] = (pair_fields, overrides)
+        return specs
+
+    def get_asset_pairs(self) -> List[AssetPair]:
+        """
+        Get the monitored pools with the perp and token settings of each.
+
+        Pools and perps come from ``get_pools``; ``ASSET_SPECS`` sets a
+        perp's token decimals, contract size and order size step (e.g.
+        ``BTC/USDT:USDT:token1_decimals=8,amount_step=0.001``).
+
+        Returns:
+            Asset pair per pool, main pool first
+
+        Raises:
+            ValueError: If ``ASSET_SPECS`` is malformed
+        """
+        specs = self._get_asset_specs()
+        return [
+            AssetPair(pool, symbol, **specs.get(symbol, ({}, {}))[0])
+            for pool, symbol in self.get_pools()
+        ]
+
+    def get_asset_config(self, symbol: str) -> Config:
+        """
+        Get the configuration of one perp's strategy.
+
+        ``ASSET_SPECS`` entries may also override strategy settings per
+        perp, e.g. ``hedge_threshold_eth=0.002`` for BTC; thresholds and
+        sizes are in units of the perp's underlying.
+
+        Args:
+            symbol: Perp symbol
+
+        Returns:
+            The configuration with the perp's symbol and overrides
+
+        Raises:
+            ValueError: If ``ASSET_SPECS`` is malformed
+        """
+        overrides = self._get_asset_specs().get(symbol, ({}, {}))[1]
+        return replace(self.config, symbol_perpetual=symbol, **overrides)
+
+    def get_shadow_configs(self) -> Dict[str, Config]:
+        """
+        Get the configurations of the shadow strategies.
+
+        ``SHADOW_STRATEGIES`` lists ``name:key=value,key=value`` entries
+        separated by ``;``; each is the live configuration with the given
+        fields overridden.
+
+        Returns:
+            Configuration per shadow strategy name
+
+        Raises:
+            ValueError: If an entry is malformed or names an unknown field
+        """
+        shadows = {}
+        for entry in self.config.shadow_strategies.split(";"):
+            if not entry.strip():
+                continue
+            name, _, settings = entry.partition(":")
+            name = name.strip()
+            if not name or name in shadows:
+                raise ValueError(f"Invalid shadow strategy name in '{entry}'")
+
+            overrides = {}
+            for setting in settings.split(","):
+                if not setting.strip():
+                    continue
+                key, sep, value = setting.partition("=")
+                key = key.strip()
+                if not sep or key not in _FIELD_NAMES:
+                    raise ValueError(f"Invalid shadow setting '{setting}' for {name}")
+                overrides[key] = self._convert_value(key, value.strip())
+            shadows[name] = replace(self.config, **overrides)
+        return shadows
+
+    def get_taker_fees(self) -> Dict[str, Decimal]:
+        """
+        Get the taker fee of each venue (``<NAME>_TAKER_FEE_PERCENT``).
+
+        Returns:
+            Taker fee percent per venue name
+        """
+        return {
+            name: Decimal(os.getenv(f"{name.upper()}_TAKER_FEE_PERCENT", "0.05"))
+            for name in self.get_venue_names()
+        }
+
     def get_exchange(self):
         """
         Get or create exchange instance.
 
+        With a single venue this is the BinanceExchange itself. With several,
+        each extra venue is a Binance account configured through
+        ``<NAME>_API_KEY``, ``<NAME>_API_SECRET`` and ``<NAME>_TESTNET``, and
+        the venues are wrapped in an ExchangeRouter. ``<NAME>_TAKER_FEE_PERCENT``
+        sets each venue's taker fee.
+
         Returns:
-            Exchange instance (BinanceExchange)
+            Exchange instance (BinanceExchange or ExchangeRouter)
         """
         if not self._exchange_instance:
-            from exchange_manager import BinanceExchange
-
-            self._exchange_instance = BinanceExchange(
-                api_key=self.config.binance_api_key,
-                api_secret=self.config.binance_api_secret,
-                testnet=self.config.binance_testnet,
-            )
+            from exchange_manager import BinanceExchange, ExchangeRouter
+
+            venues = {}
+            for name in self.get_venue_names():
+                prefix = name.upper()
+                if name == "binance":
+                    venues[name] = BinanceExchange(
+                        api_key=self.config.binance_api_key,
+                        api_secret=self.config.binance_api_secret,
+                        testnet=self.config.binance_testnet,
+                    )
+                else:
+                    venues[name] = BinanceExchange(
+                        api_key=self._get_required_env(f"{prefix}_API_KEY"),
+                        api_secret=self._get_required_env(f"{prefix}_API_SECRET"),
+                        testnet=self._get_bool_env(f"{prefix}_TESTNET", False),
+                        name=name,
+                    )
+
+            if len(venues) == 1:
+                self._exchange_instance = next(iter(venues.values()))
+            else:
+                self._exchange_instance = ExchangeRouter(
+                    venues,
+                    taker_fees=self.get_taker_fees(),
+                    max_slippage_percent=self.config.max_slippage_percent,
+                    latency_penalty_bps=self.config.venue_latency_penalty_bps,
+                )
         return self._exchange_instance
 
     def get_abi_path(self) -> str:
@@ -259,6 +695,55 @@ class ConfigManager:
 
         return str(abi_path)
 
+    @staticmethod
+    def _convert_value(key: str, value: Any) -> Any:
+        """Convert a configuration value to the type of its field."""
+        if key in [
+            "min_hedge_size_eth",
+            "hedge_threshold_eth",
+            "max_slippage_percent",
+            "default_leverage",
+            "hedge_urgency_threshold_eth",
+            "sliced_execution_threshold_eth",
+            "depth_participation",
+            "venue_latency_penalty_bps",
+            "position_drift_tolerance_eth",
+            "hedge_band_risk_aversion",
+            "forecast_hedge_fraction",
+            "kill_switch_max_move_percent",
+            "kill_switch_max_loss_usdt",
+        ]:
+            value = Decimal(str(value))
+        elif key in ["hedge_coalesce_window_seconds"]:
+            value = float(value)
+        elif key in [
+            "min_hedge_interval_seconds",
+            "hedge_latency_budget_ms",
+            "hedge_band_refresh_seconds",
+            "forecast_horizon_seconds",
+            "kill_switch_window_seconds",
+            "twap_slices",
+            "twap_duration_seconds",
+            "maker_chase_interval_ms",
+            "maker_deadline_seconds",
+            "order_ack_timeout_seconds",
+            "position_reconcile_interval_seconds",
+            "polling_interval_seconds",
+            "swap_event_poll_interval_ms",
+            "max_retries",
+            "retry_delay_seconds",
+        ]:
+            value = int(value)
+        elif key in [
+            "binance_testnet",
+            "swap_event_trigger",
+            "hedge_band_enabled",
+            "forecast_hedging_enabled",
+            "kill_switch_enabled",
+        ]:
+            value = str(value).lower() in ("true", "1", "yes", "on")
+        return value
+
     def update_config(self, **kwargs) -> None:
         """
         Update configuration values at runtime.
@@ -271,23 +756,7 @@ class ConfigManager:
 
         for key, value in kwargs.items():
             if hasattr(self._config, key):
-                # Convert to appropriate type
-                if key in [
-                    "min_hedge_size_eth",
-                    "hedge_threshold_eth",
-                    "max_slippage_percent",
-                    "default_leverage",
-                ]:
-                    value = Decimal(str(value))
-                elif key in [
-                    "polling_interval_seconds",
-                    "max_retries",
-                    "retry_delay_seconds",
-                ]:
-                    value = int(value)
-                elif key == "binance_testnet":
-                    value = bool(value)
-
+                value = self._convert_value(key, value)
                 setattr(self._config, key, value)
                 self.logger.info(f"Updated config: {key} = {value}")
             else:
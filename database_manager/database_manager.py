@@ -4,14 +4,23 @@ import logging
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional, Generator, Any
-from sqlalchemy import create_engine, desc
+from typing import Dict, List, Optional, Generator, Any, Iterator
+from sqlalchemy import case, create_engine, desc, func, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
-from models import PositionSnapshot, HedgeSnapshot, Trade
+from models import PositionSnapshot, HedgeSnapshot, HedgeIntent, Trade
+from models.hedge_intent import UNRESOLVED_STATES
 from models.trade import OrderStatus
-from .models import Base, PositionSnapshotDB, HedgeSnapshotDB, TradeDB
+from .models import (
+    ADDED_COLUMNS,
+    Base,
+    PositionSnapshotDB,
+    HedgeSnapshotDB,
+    HedgeIntentDB,
+    ShadowHedgeDB,
+    TradeDB,
+)
 
 
 class DatabaseManager:
@@ -46,14 +55,40 @@ class DatabaseManager:
         self.create_tables()
 
     def create_tables(self) -> None:
-        """Create all database tables."""
+        """Create all database tables and add columns missing from older ones."""
         try:
             Base.metadata.create_all(bind=self.engine)
+            self._add_missing_columns()
             self.logger.info("Database tables created successfully")
         except SQLAlchemyError as e:
             self.logger.error(f"Error creating database tables: {e}")
             raise
 
+    def _add_missing_columns(self) -> None:
+        """Add columns introduced after a table was created (idempotent)."""
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table_name, column_name in ADDED_COLUMNS:
+                existing = {
+                    column["name"] for column in inspector.get_columns(table_name)
+                }
+                if column_name in existing:
+                    continue
+
+                table = Base.metadata.tables[table_name]
+                column = table.c[column_name]
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {table_name} "
+                        f"ADD COLUMN {column_name} {column_type}"
+                    )
+                )
+                for index in table.indexes:
+                    if column_name in index.columns:
+                        index.create(connection, checkfirst=True)
+                self.logger.info(f"Added column {table_name}.{column_name}")
+
     @contextmanager
     def get_session(self) -> Generator[Session, Any, None]:
         """
@@ -97,19 +132,23 @@ class DatabaseManager:
             session.flush()
             return db_snapshot.id
 
-    def get_latest_position_snapshot(self) -> Optional[PositionSnapshot]:
+    def get_latest_position_snapshot(
+        self, pool_address: Optional[str] = None
+    ) -> Optional[PositionSnapshot]:
         """
         Get the most recent position snapshot.
 
+        Args:
+            pool_address: Only consider snapshots of this pool
+
         Returns:
             Latest PositionSnapshot or None if no snapshots exist
         """
         with self.get_session() as session:
-            db_snapshot = (
-                session.query(PositionSnapshotDB)
-                .order_by(desc(PositionSnapshotDB.timestamp))
-                .first()
-            )
+            query = session.query(PositionSnapshotDB)
+            if pool_address:
+                query = query.filter(PositionSnapshotDB.pool_address == pool_address)
+            db_snapshot = query.order_by(desc(PositionSnapshotDB.timestamp)).first()
 
             if db_snapshot:
                 return PositionSnapshot(
@@ -163,6 +202,53 @@ class DatabaseManager:
                 for snap in db_snapshots
             ]
 
+    def iter_position_snapshots(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        batch_size: int = 10000,
+    ) -> Iterator[PositionSnapshot]:
+        """
+        Stream position snapshots in time order (oldest first).
+
+        Rows are read in batches, so long histories are not loaded into
+        ORM objects all at once.
+
+        Args:
+            start_time: Start of time range
+            end_time: End of time range
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            PositionSnapshots in ascending timestamp order
+        """
+        with self.get_session() as session:
+            query = session.query(
+                PositionSnapshotDB.reserve_token0,
+                PositionSnapshotDB.reserve_token1,
+                PositionSnapshotDB.short_position_size,
+                PositionSnapshotDB.timestamp,
+                PositionSnapshotDB.block_number,
+                PositionSnapshotDB.pool_address,
+            )
+
+            if start_time:
+                query = query.filter(PositionSnapshotDB.timestamp >= start_time)
+            if end_time:
+                query = query.filter(PositionSnapshotDB.timestamp <= end_time)
+
+            for row in query.order_by(PositionSnapshotDB.timestamp).yield_per(
+                batch_size
+            ):
+                yield PositionSnapshot(
+                    reserve_token0=Decimal(str(row.reserve_token0)),
+                    reserve_token1=Decimal(str(row.reserve_token1)),
+                    short_position_size=Decimal(str(row.short_position_size)),
+                    timestamp=row.timestamp,
+                    block_number=row.block_number,
+                    pool_address=row.pool_address,
+                )
+
     def save_hedge_snapshot(self, hedge: HedgeSnapshot) -> int:
         """
         Save a hedge snapshot to the database.
@@ -175,6 +261,7 @@ class DatabaseManager:
         """
         with self.get_session() as session:
             db_hedge = HedgeSnapshotDB(
+                symbol=hedge.symbol,
                 action=hedge.action,
                 size=hedge.size,
                 price=hedge.price,
@@ -197,6 +284,7 @@ class DatabaseManager:
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         limit: int = 100,
+        symbol: Optional[str] = None,
     ) -> List[HedgeSnapshot]:
         """
         Get hedge snapshots within a time range.
@@ -205,6 +293,7 @@ class DatabaseManager:
             start_time: Start of time range
             end_time: End of time range
             limit: Maximum number of hedges to return
+            symbol: Only hedges of this perpetual (default: all)
 
         Returns:
             List of HedgeSnapshots
@@ -216,6 +305,8 @@ class DatabaseManager:
                 query = query.filter(HedgeSnapshotDB.timestamp >= start_time)
             if end_time:
                 query = query.filter(HedgeSnapshotDB.timestamp <= end_time)
+            if symbol:
+                query = query.filter(HedgeSnapshotDB.symbol == symbol)
 
             db_hedges = (
                 query.order_by(desc(HedgeSnapshotDB.timestamp)).limit(limit).all()
@@ -235,6 +326,108 @@ class DatabaseManager:
                     gas_cost=Decimal(str(hedge.gas_cost)) if hedge.gas_cost else None,
                     success=hedge.success,
                     error_message=hedge.error_message,
+                    symbol=hedge.symbol,
+                )
+                for hedge in db_hedges
+            ]
+
+    def get_hedge_stats(
+        self, start_time: Optional[datetime] = None, symbol: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Count hedges and find the last successful one, in SQL.
+
+        Args:
+            start_time: Only count hedges after this time
+            symbol: Only count hedges of this perpetual (default: all)
+
+        Returns:
+            Dictionary with total, successful and last_hedge_time
+        """
+        with self.get_session() as session:
+            query = session.query(
+                func.count(HedgeSnapshotDB.id),
+                func.sum(case((HedgeSnapshotDB.success.is_(True), 1), else_=0)),
+                func.max(
+                    case((HedgeSnapshotDB.success.is_(True), HedgeSnapshotDB.timestamp))
+                ),
+            )
+            if start_time:
+                query = query.filter(HedgeSnapshotDB.timestamp > start_time)
+            if symbol:
+                query = query.filter(HedgeSnapshotDB.symbol == symbol)
+            total, successful, last_hedge_time = query.one()
+
+            return {
+                "total": total or 0,
+                "successful": int(successful or 0),
+                "last_hedge_time": last_hedge_time,
+            }
+
+    def save_shadow_hedge(self, strategy: str, hedge: HedgeSnapshot) -> int:
+        """
+        Save a hedge decision of a shadow strategy.
+
+        Args:
+            strategy: Name of the shadow strategy
+            hedge: HedgeSnapshot of its simulated hedge
+
+        Returns:
+            ID of the saved decision
+        """
+        with self.get_session() as session:
+            db_hedge = ShadowHedgeDB(
+                strategy=strategy,
+                action=hedge.action,
+                size=hedge.size,
+                price=hedge.price,
+                timestamp=hedge.timestamp,
+                delta_before=hedge.delta_before,
+                delta_after=hedge.delta_after,
+                success=hedge.success,
+                error_message=hedge.error_message,
+            )
+            session.add(db_hedge)
+            session.flush()
+            return db_hedge.id
+
+    def get_shadow_hedges(
+        self,
+        strategy: str,
+        start_time: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[HedgeSnapshot]:
+        """
+        Get the hedge decisions of a shadow strategy.
+
+        Args:
+            strategy: Name of the shadow strategy
+            start_time: Start of time range
+            limit: Maximum number of decisions to return
+
+        Returns:
+            List of HedgeSnapshots, newest first
+        """
+        with self.get_session() as session:
+            query = session.query(ShadowHedgeDB).filter(
+                ShadowHedgeDB.strategy == strategy
+            )
+            if start_time:
+                query = query.filter(ShadowHedgeDB.timestamp >= start_time)
+
+            db_hedges = query.order_by(desc(ShadowHedgeDB.timestamp)).limit(limit).all()
+
+            return [
+                HedgeSnapshot(
+                    action=hedge.action,
+                    size=Decimal(str(hedge.size)),
+                    price=Decimal(str(hedge.price)),
+                    timestamp=hedge.timestamp,
+                    delta_before=Decimal(str(hedge.delta_before)),
+                    delta_after=Decimal(str(hedge.delta_after)),
+                    exchange="shadow",
+                    success=hedge.success,
+                    error_message=hedge.error_message,
                 )
                 for hedge in db_hedges
             ]
@@ -262,6 +455,7 @@ class DatabaseManager:
                 fee=trade.fee,
                 fee_currency=trade.fee_currency,
                 exchange=trade.exchange,
+                parent_order_id=trade.parent_order_id,
             )
             session.add(db_trade)
             session.flush()
@@ -308,21 +502,106 @@ class DatabaseManager:
                 .all()
             )
 
+            return [self._trade_from_db(trade) for trade in db_trades]
+
+    def get_child_trades(self, parent_order_id: str) -> List[Trade]:
+        """
+        Get the child trades of a sliced hedge.
+
+        Args:
+            parent_order_id: Order ID of the parent hedge
+
+        Returns:
+            List of child Trades in execution order
+        """
+        with self.get_session() as session:
+            db_trades = (
+                session.query(TradeDB)
+                .filter(TradeDB.parent_order_id == parent_order_id)
+                .order_by(TradeDB.timestamp)
+                .all()
+            )
+
+            return [self._trade_from_db(trade) for trade in db_trades]
+
+    @staticmethod
+    def _trade_from_db(trade: TradeDB) -> Trade:
+        """Convert a TradeDB row to a Trade."""
+        return Trade(
+            symbol=trade.symbol,
+            side=trade.side,
+            order_type=trade.order_type,
+            size=Decimal(str(trade.size)),
+            price=Decimal(str(trade.price)),
+            timestamp=trade.timestamp,
+            order_id=trade.order_id,
+            status=trade.status,
+            fee=Decimal(str(trade.fee)) if trade.fee else None,
+            fee_currency=trade.fee_currency,
+            exchange=trade.exchange,
+            parent_order_id=trade.parent_order_id,
+        )
+
+    def save_hedge_intent(self, intent: HedgeIntent) -> None:
+        """
+        Insert or update a hedge intent, keyed by client order ID.
+
+        Args:
+            intent: Hedge intent in its current state
+        """
+        with self.get_session() as session:
+            db_intent = (
+                session.query(HedgeIntentDB)
+                .filter(HedgeIntentDB.client_order_id == intent.client_order_id)
+                .first()
+            )
+            if db_intent is None:
+                db_intent = HedgeIntentDB(client_order_id=intent.client_order_id)
+                session.add(db_intent)
+
+            db_intent.symbol = intent.symbol
+            db_intent.action = intent.action
+            db_intent.size = intent.size
+            db_intent.leverage = intent.leverage
+            db_intent.state = intent.state
+            db_intent.order_id = intent.order_id
+            db_intent.filled_size = intent.filled_size
+            db_intent.price = intent.price
+            db_intent.error_message = (intent.error_message or "")[:500] or None
+            db_intent.created_at = intent.created_at
+            db_intent.updated_at = intent.updated_at
+
+    def get_unresolved_hedge_intents(self) -> List[HedgeIntent]:
+        """
+        Get hedge intents whose outcome on the exchange is not settled.
+
+        Returns:
+            Unresolved HedgeIntents, oldest first
+        """
+        with self.get_session() as session:
+            db_intents = (
+                session.query(HedgeIntentDB)
+                .filter(HedgeIntentDB.state.in_(UNRESOLVED_STATES))
+                .order_by(HedgeIntentDB.created_at)
+                .all()
+            )
+
             return [
-                Trade(
-                    symbol=trade.symbol,
-                    side=trade.side,
-                    order_type=trade.order_type,
-                    size=Decimal(str(trade.size)),
-                    price=Decimal(str(trade.price)),
-                    timestamp=trade.timestamp,
-                    order_id=trade.order_id,
-                    status=trade.status,
-                    fee=Decimal(str(trade.fee)) if trade.fee else None,
-                    fee_currency=trade.fee_currency,
-                    exchange=trade.exchange,
+                HedgeIntent(
+                    client_order_id=intent.client_order_id,
+                    symbol=intent.symbol,
+                    action=intent.action,
+                    size=Decimal(str(intent.size)),
+                    leverage=Decimal(str(intent.leverage)),
+                    state=intent.state,
+                    order_id=intent.order_id,
+                    filled_size=Decimal(str(intent.filled_size or 0)),
+                    price=Decimal(str(intent.price)) if intent.price else None,
+                    error_message=intent.error_message,
+                    created_at=intent.created_at,
+                    updated_at=intent.updated_at,
                 )
-                for trade in db_trades
+                for intent in db_intents
             ]
 
     def cleanup_old_data(self, days: int = 30) -> int:
@@ -355,11 +634,30 @@ class DatabaseManager:
             )
             deleted_count += deleted
 
+            # Delete old shadow decisions
+            deleted = (
+                session.query(ShadowHedgeDB)
+                .filter(ShadowHedgeDB.timestamp < cutoff_time)
+                .delete()
+            )
+            deleted_count += deleted
+
             # Delete old trades
             deleted = (
                 session.query(TradeDB).filter(TradeDB.timestamp < cutoff_time).delete()
             )
             deleted_count += deleted
 
+            # Delete old resolved hedge intents (unresolved ones are kept)
+            deleted = (
+                session.query(HedgeIntentDB)
+                .filter(
+                    HedgeIntentDB.updated_at < cutoff_time,
+                    HedgeIntentDB.state.notin_(UNRESOLVED_STATES),
+                )
+                .delete()
+            )
+            deleted_count += deleted
+
         self.logger.info(f"Cleaned up {deleted_count} old records")
         return deleted_count
@@ -16,10 +16,18 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from models.hedge_snapshot import HedgeAction
+from models.hedge_intent import HedgeState
 from models.trade import OrderType, OrderSide, OrderStatus
 
 Base = declarative_base()
 
+# Columns added to a table after its first release, as (table, column).
+# create_all() leaves existing tables alone, so these are added in place.
+ADDED_COLUMNS = [
+    ("trades", "parent_order_id"),
+    ("hedge_snapshots", "symbol"),
+]
+
 
 class PositionSnapshotDB(Base):
     """Database model for position snapshots."""
@@ -43,6 +51,7 @@ class HedgeSnapshotDB(Base):
     __tablename__ = "hedge_snapshots"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
+    symbol = Column(String(20), nullable=True, index=True)
     action = Column(SQLEnum(HedgeAction), nullable=False)
     size = Column(Numeric(precision=30, scale=18), nullable=False)
     price = Column(Numeric(precision=30, scale=8), nullable=False)
@@ -58,6 +67,24 @@ class HedgeSnapshotDB(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+class ShadowHedgeDB(Base):
+    """Database model for hedge decisions of shadow strategies."""
+
+    __tablename__ = "shadow_hedges"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    strategy = Column(String(50), nullable=False, index=True)
+    action = Column(SQLEnum(HedgeAction), nullable=False)
+    size = Column(Numeric(precision=30, scale=18), nullable=False)
+    price = Column(Numeric(precision=30, scale=8), nullable=False)
+    timestamp = Column(DateTime, nullable=False)
+    delta_before = Column(Numeric(precision=30, scale=18), nullable=False)
+    delta_after = Column(Numeric(precision=30, scale=18), nullable=False)
+    success = Column(Boolean, default=True)
+    error_message = Column(String(500), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class TradeDB(Base):
     """Database model for trades."""
 
@@ -75,4 +102,25 @@ class TradeDB(Base):
     fee = Column(Numeric(precision=30, scale=18), nullable=True)
     fee_currency = Column(String(10), nullable=True)
     exchange = Column(String(50), default="binance")
+    parent_order_id = Column(String(100), nullable=True, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class HedgeIntentDB(Base):
+    """Database model for hedge order lifecycle state."""
+
+    __tablename__ = "hedge_intents"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    client_order_id = Column(String(36), nullable=False, unique=True)
+    symbol = Column(String(20), nullable=False)
+    action = Column(SQLEnum(HedgeAction), nullable=False)
+    size = Column(Numeric(precision=30, scale=18), nullable=False)
+    leverage = Column(Numeric(precision=10, scale=2), default=1.0)
+    state = Column(SQLEnum(HedgeState), nullable=False, index=True)
+    order_id = Column(String(100), nullable=True)
+    filled_size = Column(Numeric(precision=30, scale=18), default=0)
+    price = Column(Numeric(precision=30, scale=8), nullable=True)
+    error_message = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
@@ -1,6 +1,16 @@
 """EulerSwap specific functionality."""
 
+from .block_cache import BlockCache
 from .euler_pool_manager import EulerPoolManager
+from .limits import VaultState
 from .pool_params import PoolParams
+from .price_impact import PriceImpactPoint, PriceImpactSurface
 
-__all__ = ["EulerPoolManager", "PoolParams"]
+__all__ = [
+    "BlockCache",
+    "EulerPoolManager",
+    "PoolParams",
+    "PriceImpactPoint",
+    "PriceImpactSurface",
+    "VaultState",
+]
@@ -0,0 +1,116 @@
+"""Block-scoped memoization for EulerSwap contract reads."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class BlockCache:
+    """
+    Memoizes view-call results for the lifetime of a single block.
+
+    Contract view calls are deterministic within a block, so any number of
+    consumers asking the same question in the same block can share one RPC.
+    Entries are dropped as soon as a newer block is observed, and concurrent
+    identical requests are merged into a single in-flight call.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self.block_number: Optional[int] = None
+        self._entries: Dict[Tuple[int, Hashable], Any] = {}
+        self._inflight: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def advance(self, block_number: int) -> None:
+        """
+        Move the cache to a new block, dropping entries from older blocks.
+
+        Args:
+            block_number: Latest observed block number
+        """
+        if self.block_number is not None and block_number <= self.block_number:
+            return
+
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+        self.block_number = block_number
+
+    async def get_or_fetch(
+        self,
+        block_number: int,
+        key: Hashable,
+        fetcher: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached value for key in block, fetching it at most once.
+
+        Args:
+            block_number: Block the answer is valid for
+            key: Hashable description of the question (method name and args)
+            fetcher: Coroutine factory performing the actual RPC
+
+        Returns:
+            Cached or freshly fetched value
+
+        Raises:
+            Exception: Whatever the fetcher raised; failures are never cached
+        """
+        self.advance(block_number)
+        scoped_key = (block_number, key)
+
+        if scoped_key in self._entries:
+            self.hits += 1
+            return self._entries[scoped_key]
+
+        pending = self._inflight.get(scoped_key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        task = asyncio.ensure_future(fetcher())
+        self._inflight[scoped_key] = task
+        try:
+            value = await asyncio.shield(task)
+        finally:
+            if self._inflight.get(scoped_key) is task:
+                del self._inflight[scoped_key]
+
+        # Only keep the answer if no newer block arrived while we waited
+        if self.block_number == block_number:
+            self._entries[scoped_key] = value
+
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached entries without touching the counters."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters
+        """
+        lookups = self.hits + self.misses + self.coalesced
+        hit_rate = 0.0
+        if lookups > 0:
+            hit_rate = ((self.hits + self.coalesced) / lookups) * 100
+
+        return {
+            "block_number": self.block_number,
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hit_rate": f"{hit_rate:.1f}%",
+        }
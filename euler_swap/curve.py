@@ -0,0 +1,308 @@
+"""Local integer reproduction of the EulerSwap curve (CurveLib / QuoteLib).
+
+All functions operate on raw on-chain integers and round exactly like the
+Solidity implementation, so results can be compared bit-for-bit with
+``computeQuote`` without an RPC round-trip.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from math import isqrt
+
+from .pool_params import PoolParams
+
+WAD = 10**18
+MAX_UINT112 = 2**112 - 1
+MAX_UINT248 = 2**248 - 1
+
+
+class CurveError(Exception):
+    """Raised where the on-chain curve math would revert."""
+
+
+@dataclass(frozen=True)
+class CurveParams:
+    """
+    Integer curve parameters exactly as stored on-chain.
+
+    Attributes:
+        equilibrium_reserve0: x0
+        equilibrium_reserve1: y0
+        price_x: px
+        price_y: py
+        concentration_x: cx (1e18 scale)
+        concentration_y: cy (1e18 scale)
+        fee: Swap fee (1e18 scale)
+    """
+
+    equilibrium_reserve0: int
+    equilibrium_reserve1: int
+    price_x: int
+    price_y: int
+    concentration_x: int
+    concentration_y: int
+    fee: int
+
+    @classmethod
+    def from_pool_params(cls, params: PoolParams) -> "CurveParams":
+        """
+        Create CurveParams from a PoolParams instance.
+
+        Args:
+            params: Pool parameters as fetched from getParams()
+
+        Returns:
+            CurveParams instance
+        """
+        return cls(
+            equilibrium_reserve0=int(params.equilibrium_reserve0),
+            equilibrium_reserve1=int(params.equilibrium_reserve1),
+            price_x=int(params.price_x),
+            price_y=int(params.price_y),
+            concentration_x=int(params.concentration_x),
+            concentration_y=int(params.concentration_y),
+            fee=int(params.fee * WAD),
+        )
+
+
+def _mul_div_ceil(a: int, b: int, denominator: int) -> int:
+    """OpenZeppelin Math.mulDiv with Rounding.Ceil."""
+    return -((-a * b) // denominator)
+
+
+def _ceil_div(a: int, b: int) -> int:
+    """OpenZeppelin Math.ceilDiv."""
+    return -(-a // b)
+
+
+def _sqrt_ceil(value: int) -> int:
+    """OpenZeppelin Math.sqrt with Rounding.Ceil."""
+    root = isqrt(value)
+    return root if root * root == value else root + 1
+
+
+def _compute_scale(value: int) -> int:
+    """CurveLib.computeScale: power of two keeping value**2 within 256 bits."""
+    bits = value.bit_length()
+    return 1 << (bits - 128) if bits > 128 else 1
+
+
+def verify(p: CurveParams, new_reserve0: int, new_reserve1: int) -> bool:
+    """
+    CurveLib.verify: True if the reserves are on or above the curve.
+
+    Args:
+        p: Curve parameters
+        new_reserve0: Candidate reserve of asset0
+        new_reserve1: Candidate reserve of asset1
+
+    Returns:
+        True if the point is acceptable
+    """
+    if new_reserve0 > MAX_UINT112 or new_reserve1 > MAX_UINT112:
+        return False
+
+    x0, y0 = p.equilibrium_reserve0, p.equilibrium_reserve1
+    if new_reserve0 >= x0:
+        if new_reserve1 >= y0:
+            return True
+        return new_reserve0 >= f(
+            new_reserve1, p.price_y, p.price_x, y0, x0, p.concentration_y
+        )
+
+    if new_reserve1 < y0:
+        return False
+    return new_reserve1 >= f(
+        new_reserve0, p.price_x, p.price_y, x0, y0, p.concentration_x
+    )
+
+
+def f(x: int, px: int, py: int, x0: int, y0: int, c: int) -> int:
+    """
+    EulerSwap curve: reserve y for reserve x on the x <= x0 side.
+
+    Args:
+        x: Input reserve (1 <= x <= x0)
+        px: Price of x
+        py: Price of y
+        x0: Equilibrium reserve of x
+        y0: Equilibrium reserve of y
+        c: Concentration (1e18 scale)
+
+    Returns:
+        Reserve y satisfying y0 <= y
+    """
+    v = _mul_div_ceil(px * (x0 - x), c * x + (WAD - c) * x0, x * WAD)
+    if v > MAX_UINT248:
+        raise CurveError("Overflow")
+    return y0 + (v + (py - 1)) // py
+
+
+def f_inverse(y: int, px: int, py: int, x0: int, y0: int, c: int) -> int:
+    """
+    EulerSwap inverse curve: reserve x for reserve y on the y >= y0 side.
+
+    Args:
+        y: Input reserve (y0 <= y)
+        px: Price of x
+        py: Price of y
+        x0: Equilibrium reserve of x
+        y0: Equilibrium reserve of y
+        c: Concentration (1e18 scale)
+
+    Returns:
+        Reserve x satisfying 1 <= x <= x0
+    """
+    term1 = _mul_div_ceil(py * WAD, y - y0, px)  # scale: 1e36
+    term2 = (2 * c - WAD) * x0  # scale: 1e36
+    numerator = term1 - term2
+    # Solidity signed division truncates toward zero
+    b = abs(numerator) // WAD * (1 if numerator >= 0 else -1)
+    c_term = _mul_div_ceil(WAD - c, x0 * x0, WAD)  # scale: 1e36
+    four_ac = _mul_div_ceil(4 * c, c_term, WAD)  # scale: 1e36
+
+    abs_b = abs(b)
+    if abs_b < 10**36:
+        sqrt = _sqrt_ceil(abs_b * abs_b + four_ac)
+    else:
+        scale = _compute_scale(abs_b)
+        squared_b = _mul_div_ceil(abs_b // scale, abs_b, scale)
+        sqrt = _sqrt_ceil(squared_b + four_ac // (scale * scale)) * scale
+
+    if b <= 0:
+        x = _mul_div_ceil(abs_b + sqrt, WAD, 2 * c) + 1
+    else:
+        x = _ceil_div(2 * c_term, abs_b + sqrt) + 1
+
+    return x0 if x >= x0 else x
+
+
+def find_curve_point(
+    p: CurveParams,
+    reserve0: int,
+    reserve1: int,
+    amount: int,
+    exact_in: bool,
+    asset0_is_input: bool,
+) -> int:
+    """
+    QuoteLib.findCurvePoint: amount on the other side of a swap.
+
+    Args:
+        p: Curve parameters
+        reserve0: Current reserve of asset0
+        reserve1: Current reserve of asset1
+        amount: Input amount if exact_in, output amount otherwise (after fees)
+        exact_in: True for exact input
+        asset0_is_input: Swap direction
+
+    Returns:
+        Output amount if exact_in, required input amount otherwise
+    """
+    px, py = p.price_x, p.price_y
+    x0, y0 = p.equilibrium_reserve0, p.equilibrium_reserve1
+    cx, cy = p.concentration_x, p.concentration_y
+
+    if exact_in:
+        if asset0_is_input:
+            x_new = reserve0 + amount
+            if x_new <= x0:
+                y_new = f(x_new, px, py, x0, y0, cx)
+            else:
+                y_new = f_inverse(x_new, py, px, y0, x0, cy)
+            return reserve1 - y_new if reserve1 > y_new else 0
+
+        y_new = reserve1 + amount
+        if y_new <= y0:
+            x_new = f(y_new, py, px, y0, x0, cy)
+        else:
+            x_new = f_inverse(y_new, px, py, x0, y0, cx)
+        return reserve0 - x_new if reserve0 > x_new else 0
+
+    if asset0_is_input:
+        if reserve1 <= amount:
+            raise CurveError("SwapLimitExceeded")
+        y_new = reserve1 - amount
+        if y_new <= y0:
+            x_new = f(y_new, py, px, y0, x0, cy)
+        else:
+            x_new = f_inverse(y_new, px, py, x0, y0, cx)
+        return x_new - reserve0 if x_new > reserve0 else 0
+
+    if reserve0 <= amount:
+        raise CurveError("SwapLimitExceeded")
+    x_new = reserve0 - amount
+    if x_new <= x0:
+        y_new = f(x_new, px, py, x0, y0, cx)
+    else:
+        y_new = f_inverse(x_new, py, px, y0, x0, cy)
+    return y_new - reserve1 if y_new > reserve1 else 0
+
+
+def compute_quote(
+    p: CurveParams,
+    reserve0: int,
+    reserve1: int,
+    amount: int,
+    exact_in: bool,
+    asset0_is_input: bool,
+) -> int:
+    """
+    Curve part of QuoteLib.computeQuote (fees applied, vault limits not checked).
+
+    Args:
+        p: Curve parameters
+        reserve0: Current reserve of asset0
+        reserve1: Current reserve of asset1
+        amount: Input amount if exact_in, output amount otherwise
+        exact_in: True for exact input
+        asset0_is_input: Swap direction
+
+    Returns:
+        Quoted output amount if exact_in, required input amount otherwise
+    """
+    if amount == 0:
+        return 0
+    if amount > MAX_UINT112:
+        raise CurveError("SwapLimitExceeded")
+
+    if exact_in:
+        amount = amount - (amount * p.fee // WAD)
+
+    quote = find_curve_point(p, reserve0, reserve1, amount, exact_in, asset0_is_input)
+
+    if not exact_in:
+        quote = (quote * WAD) // (WAD - p.fee)
+
+    return quote
+
+
+def marginal_price(p: CurveParams, reserve0: int, reserve1: int) -> Decimal:
+    """
+    Instantaneous price of asset0 in asset1 raw units (-dy/dx) at the reserves.
+
+    Args:
+        p: Curve parameters
+        reserve0: Current reserve of asset0
+        reserve1: Current reserve of asset1
+
+    Returns:
+        Marginal price as Decimal (asset1 units per asset0 unit)
+    """
+    px, py = Decimal(p.price_x), Decimal(p.price_y)
+    wad = Decimal(WAD)
+
+    if reserve0 <= p.equilibrium_reserve0:
+        # On f(): y = f(x), dy/dx = -(px/py) * (cx + (1 - cx) * (x0/x)^2)
+        if reserve0 == 0:
+            raise CurveError("Reserve0 is empty")
+        cx = Decimal(p.concentration_x) / wad
+        ratio = Decimal(p.equilibrium_reserve0) / Decimal(reserve0)
+        return (px / py) * (cx + (1 - cx) * ratio * ratio)
+
+    # On g(): x = f(y), dx/dy = -(py/px) * (cy + (1 - cy) * (y0/y)^2)
+    if reserve1 == 0:
+        raise CurveError("Reserve1 is empty")
+    cy = Decimal(p.concentration_y) / wad
+    ratio = Decimal(p.equilibrium_reserve1) / Decimal(reserve1)
+    return 1 / ((py / px) * (cy + (1 - cy) * ratio * ratio))
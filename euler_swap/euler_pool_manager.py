@@ -1,12 +1,32 @@
 """Manager for EulerSwap pool interactions."""
 
 import asyncio
+import json
+import time
 from decimal import Decimal
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from web3 import Web3
 
 from logger_manager import LoggerManager, LogTag
+from models.fixed_point import from_units, to_units
+from .block_cache import BlockCache
+from .curve import CurveError, CurveParams
+from .limits import VaultState, calc_limits, compute_quote_with_limits
 from .pool_params import PoolParams
+from .price_impact import PriceImpactSurface, build_price_impact_surface
+
+VAULT_ABI_PATH = Path(__file__).parent.parent / "abi" / "euler_vault.json"
 
 
 class EulerPoolManager:
@@ -14,9 +34,19 @@ class EulerPoolManager:
     Manages interactions with EulerSwap pools.
 
     Handles pool parameter fetching, quote calculations, and limit checks.
+    Quote and limit reads are memoized per block so that every consumer
+    asking the same question in the same block shares a single RPC.
     """
 
-    def __init__(self, w3: Web3, pool_address: str, contract):
+    def __init__(
+        self,
+        w3: Web3,
+        pool_address: str,
+        contract,
+        block_cache: Optional[BlockCache] = None,
+        token_decimals: Optional[Tuple[int, int]] = None,
+        block_ttl_seconds: float = 0.5,
+    ):
         """
         Initialize the EulerPoolManager.
 
@@ -24,14 +54,102 @@ class EulerPoolManager:
             w3: Web3 instance
             pool_address: Address of the EulerSwap pool
             contract: Pool contract instance
+            block_cache: Optional cache shared with other pools on the same chain
+            token_decimals: Known (token0, token1) decimals of the pool
+            block_ttl_seconds: Reuse a known block number for this long
+                (keep it below the chain's block time)
         """
         self.w3 = w3
         self.pool_address = pool_address
         self.contract = contract
+        self.token_decimals = token_decimals
         self.logger = LoggerManager()
         self._pool_params: Optional[PoolParams] = None
         self._assets: Optional[Tuple[str, str]] = None
 
+        # Block-scoped memoization of view calls
+        self._block_cache = block_cache or BlockCache()
+        self._block_number: Optional[int] = None
+        self._block_seen_at = 0.0
+        self._block_lookup: Optional[asyncio.Future] = None
+        self.block_ttl_seconds = block_ttl_seconds
+        self._vault_contracts: Dict[str, Any] = {}
+        self._vault_abi: Optional[list] = None
+
+    def note_block(self, block_number: int) -> None:
+        """
+        Record the latest block number observed elsewhere (e.g. by the monitor).
+
+        Args:
+            block_number: Latest known block number
+        """
+        if self._block_number is None or block_number >= self._block_number:
+            self._block_number = block_number
+            self._block_seen_at = time.monotonic()
+            self._block_cache.advance(block_number)
+
+    async def _current_block(self) -> Optional[int]:
+        """
+        Get the current block number, reusing a recently observed one.
+
+        Returns:
+            Block number, or None if it cannot be determined
+        """
+        if (
+            self._block_number is not None
+            and time.monotonic() - self._block_seen_at < self.block_ttl_seconds
+        ):
+            return self._block_number
+
+        # Merge concurrent lookups into a single eth_blockNumber call
+        if self._block_lookup is None or self._block_lookup.done():
+
+            async def lookup() -> int:
+                return await self.w3.eth.block_number
+
+            self._block_lookup = asyncio.ensure_future(lookup())
+
+        try:
+            block_number = await asyncio.shield(self._block_lookup)
+        except Exception as e:
+            self.logger.log_debug(
+                f"Block number unavailable, bypassing cache: {e}", LogTag.RPC
+            )
+            return None
+
+        self.note_block(block_number)
+        return block_number
+
+    async def _cached_call(
+        self,
+        key: Hashable,
+        fetcher: Callable[[Optional[int]], Awaitable[Any]],
+        block_number: Optional[int] = None,
+    ) -> Any:
+        """
+        Run a contract view call through the per-block cache.
+
+        The fetcher reads at the block the answer is cached under, so a
+        memoized block number lagging the chain never files a newer block's
+        answer under an older one.
+
+        Args:
+            key: Description of the call (method name and raw args)
+            fetcher: Coroutine factory performing the call at a block
+                (None reads at latest)
+            block_number: Block to read at (defaults to the current block)
+
+        Returns:
+            Raw contract result
+        """
+        if block_number is None:
+            block_number = await self._current_block()
+        if block_number is None:
+            return await fetcher(None)
+        return await self._block_cache.get_or_fetch(
+            block_number, key, lambda: fetcher(block_number)
+        )
+
     async def fetch_pool_params(self) -> PoolParams:
         """
         Fetch and cache pool parameters.
@@ -53,12 +171,18 @@ class EulerPoolManager:
 
             self._assets = (assets[0], assets[1])
 
-            # Determine token decimals based on common tokens
+            # Configured decimals win; otherwise guess from common tokens
             # USDT/USDC typically have 6 decimals, WETH has 18
-            if "USDT" in assets[0].upper() or "USDC" in assets[0].upper():
-                self._pool_params.token0_decimals = 6
-            if "USDT" in assets[1].upper() or "USDC" in assets[1].upper():
-                self._pool_params.token1_decimals = 6
+            if self.token_decimals is not None:
+                (
+                    self._pool_params.token0_decimals,
+                    self._pool_params.token1_decimals,
+                ) = self.token_decimals
+            else:
+                if "USDT" in assets[0].upper() or "USDC" in assets[0].upper():
+                    self._pool_params.token0_decimals = 6
+                if "USDT" in assets[1].upper() or "USDC" in assets[1].upper():
+                    self._pool_params.token1_decimals = 6
 
             self.logger.log_info(
                 f"Fetched pool params - Equilibrium: {self._pool_params.equilibrium_reserve0}/{self._pool_params.equilibrium_reserve1}, "
@@ -101,10 +225,13 @@ class EulerPoolManager:
             )
             amount_scaled = int(amount_in * Decimal(10**decimals_in))
 
-            # Get quote from contract
-            quote = await self.contract.functions.computeQuote(
-                token_in, token_out, amount_scaled, exact_in
-            ).call()
+            # Get quote from contract (memoized per block)
+            quote = await self._cached_call(
+                ("computeQuote", token_in, token_out, amount_scaled, exact_in),
+                lambda block: self.contract.functions.computeQuote(
+                    token_in, token_out, amount_scaled, exact_in
+                ).call(block_identifier=block),
+            )
 
             # Scale output based on decimals
             decimals_out = (
@@ -144,8 +271,13 @@ class EulerPoolManager:
             token_in = self._assets[0] if token_in_is_token0 else self._assets[1]
             token_out = self._assets[1] if token_in_is_token0 else self._assets[0]
 
-            # Get limits from contract
-            limits = await self.contract.functions.getLimits(token_in, token_out).call()
+            # Get limits from contract (memoized per block)
+            limits = await self._cached_call(
+                ("getLimits", token_in, token_out),
+                lambda block: self.contract.functions.getLimits(
+                    token_in, token_out
+                ).call(block_identifier=block),
+            )
 
             # Scale based on decimals
             decimals_in = (
@@ -172,6 +304,238 @@ class EulerPoolManager:
             self.logger.log_error("Failed to get swap limits", e)
             return Decimal("0"), Decimal("0")
 
+    async def fetch_reserves(
+        self, block_number: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Fetch current pool reserves in raw token units (memoized per block).
+
+        Args:
+            block_number: Block to read at (defaults to the current block)
+
+        Returns:
+            Tuple of (reserve0, reserve1)
+        """
+        reserves = await self._cached_call(
+            ("getReserves",),
+            lambda block: self.contract.functions.getReserves().call(
+                block_identifier=block
+            ),
+            block_number,
+        )
+        return int(reserves[0]), int(reserves[1])
+
+    async def get_price_impact_surface(
+        self, sizes_token0: Sequence[Decimal], sizes_token1: Sequence[Decimal]
+    ) -> PriceImpactSurface:
+        """
+        Get price impact versus size for both directions, computed locally.
+
+        Impact is measured against the live marginal price of the curve at the
+        current reserves. Only the reserves read hits the RPC, and the whole
+        surface is memoized per block so consumers share one computation.
+
+        Args:
+            sizes_token0: Input sizes for token0 -> token1 swaps (token0 units)
+            sizes_token1: Input sizes for token1 -> token0 swaps (token1 units)
+
+        Returns:
+            PriceImpactSurface for the current block
+        """
+        if not self._pool_params:
+            await self.fetch_pool_params()
+
+        key = ("priceImpactSurface", tuple(sizes_token0), tuple(sizes_token1))
+
+        async def compute(block: Optional[int]) -> PriceImpactSurface:
+            reserve0, reserve1 = await self.fetch_reserves(block)
+            return build_price_impact_surface(
+                self._pool_params,
+                reserve0,
+                reserve1,
+                sizes_token0,
+                sizes_token1,
+                block_number=block,
+            )
+
+        return await self._cached_call(key, compute)
+
+    def _vault_contract(self, vault_address: str):
+        """
+        Get (and memoize) a contract instance for an Euler vault.
+
+        Args:
+            vault_address: Address of the vault
+
+        Returns:
+            Vault contract instance
+        """
+        if vault_address not in self._vault_contracts:
+            if self._vault_abi is None:
+                with open(VAULT_ABI_PATH, "r") as f:
+                    self._vault_abi = json.load(f)
+            self._vault_contracts[vault_address] = self.w3.eth.contract(
+                address=vault_address, abi=self._vault_abi
+            )
+        return self._vault_contracts[vault_address]
+
+    async def fetch_vault_state(
+        self, vault_address: str, block_number: Optional[int] = None
+    ) -> VaultState:
+        """
+        Fetch the vault reads used by calcLimits (memoized per block).
+
+        The cache key only depends on the vault and the Euler account, so pools
+        sharing a BlockCache and a vault reuse the same reads.
+
+        Args:
+            vault_address: Address of the vault
+            block_number: Block to read at (defaults to the current block)
+
+        Returns:
+            VaultState for the pool's Euler account
+        """
+        if not self._pool_params:
+            await self.fetch_pool_params()
+
+        account = self._pool_params.euler_account
+
+        async def fetch(block: Optional[int]) -> VaultState:
+            functions = self._vault_contract(vault_address).functions
+            cash, total_borrows, caps, debt, max_deposit, shares = await asyncio.gather(
+                functions.cash().call(block_identifier=block),
+                functions.totalBorrows().call(block_identifier=block),
+                functions.caps().call(block_identifier=block),
+                functions.debtOf(account).call(block_identifier=block),
+                functions.maxDeposit(account).call(block_identifier=block),
+                functions.balanceOf(account).call(block_identifier=block),
+            )
+            assets = (
+                await functions.convertToAssets(shares).call(block_identifier=block)
+                if shares
+                else 0
+            )
+
+            return VaultState(
+                vault_address=vault_address,
+                cash=int(cash),
+                total_borrows=int(total_borrows),
+                borrow_cap=int(caps[1]),
+                account_debt=int(debt),
+                account_max_deposit=int(max_deposit),
+                account_assets=int(assets),
+            )
+
+        return await self._cached_call(
+            ("vaultState", vault_address, account), fetch, block_number
+        )
+
+    async def _fetch_limit_inputs(self) -> Tuple[VaultState, VaultState, int, int]:
+        """
+        Fetch both vault states and the reserves concurrently (all memoized),
+        pinned to one block.
+
+        Returns:
+            Tuple of (vault0_state, vault1_state, reserve0, reserve1)
+        """
+        if not self._pool_params:
+            await self.fetch_pool_params()
+
+        block_number = await self._current_block()
+        vault0, vault1, (reserve0, reserve1) = await asyncio.gather(
+            self.fetch_vault_state(self._pool_params.vault0, block_number),
+            self.fetch_vault_state(self._pool_params.vault1, block_number),
+            self.fetch_reserves(block_number),
+        )
+        return vault0, vault1, reserve0, reserve1
+
+    async def get_local_swap_limits(
+        self, token_in_is_token0: bool = True
+    ) -> Tuple[Decimal, Decimal]:
+        """
+        Compute swap limits locally, mirroring getLimits without calling it.
+
+        Args:
+            token_in_is_token0: True if checking limits for token0->token1 swap
+
+        Returns:
+            Tuple of (max_input, max_output) considering all constraints
+        """
+        try:
+            vault0, vault1, reserve0, reserve1 = await self._fetch_limit_inputs()
+            limit_in, limit_out = calc_limits(
+                vault0, vault1, reserve0, reserve1, token_in_is_token0
+            )
+
+            decimals_in, decimals_out = self._decimals(token_in_is_token0)
+            return from_units(limit_in, decimals_in), from_units(
+                limit_out, decimals_out
+            )
+
+        except Exception as e:
+            self.logger.log_error("Failed to compute local swap limits", e)
+            return Decimal("0"), Decimal("0")
+
+    async def get_local_quotes(
+        self,
+        amounts: Sequence[Decimal],
+        token_in_is_token0: bool = True,
+        exact_in: bool = True,
+    ) -> List[Optional[Decimal]]:
+        """
+        Quote many candidate trade sizes locally against curve and limits.
+
+        All sizes share one set of memoized reads, so evaluating a whole grid
+        costs no more RPC than evaluating a single size.
+
+        Args:
+            amounts: Candidate amounts (input if exact_in, output otherwise)
+            token_in_is_token0: True if swapping token0 for token1
+            exact_in: True for exact input, False for exact output
+
+        Returns:
+            Quote per amount, or None where the contract would revert
+        """
+        vault0, vault1, reserve0, reserve1 = await self._fetch_limit_inputs()
+        curve = CurveParams.from_pool_params(self._pool_params)
+        decimals_in, decimals_out = self._decimals(token_in_is_token0)
+        if not exact_in:
+            decimals_in, decimals_out = decimals_out, decimals_in
+
+        quotes: List[Optional[Decimal]] = []
+        for amount in amounts:
+            try:
+                quote = compute_quote_with_limits(
+                    curve,
+                    vault0,
+                    vault1,
+                    reserve0,
+                    reserve1,
+                    to_units(amount, decimals_in),
+                    exact_in,
+                    token_in_is_token0,
+                )
+                quotes.append(from_units(quote, decimals_out))
+            except CurveError:
+                quotes.append(None)
+
+        return quotes
+
+    def _decimals(self, token_in_is_token0: bool) -> Tuple[int, int]:
+        """Get (decimals_in, decimals_out) for a swap direction."""
+        if token_in_is_token0:
+            return self._pool_params.token0_decimals, self._pool_params.token1_decimals
+        return self._pool_params.token1_decimals, self._pool_params.token0_decimals
+
+    def get_cache_stats(self) -> dict:
+        """
+        Get per-block cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters
+        """
+        return self._block_cache.get_stats()
+
     def calculate_price_impact(
         self, amount_in: Decimal, amount_out: Decimal, token_in_is_token0: bool = True
     ) -> Decimal:
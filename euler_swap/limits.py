@@ -0,0 +1,175 @@
+"""Local reproduction of QuoteLib.calcLimits and QuoteLib.decodeCap."""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from .curve import MAX_UINT112, WAD, CurveError, CurveParams, find_curve_point
+
+MAX_UINT256 = 2**256 - 1
+
+
+@dataclass(frozen=True)
+class VaultState:
+    """
+    Snapshot of the Euler vault reads that calcLimits depends on.
+
+    All values are raw on-chain integers. Account-specific values refer to
+    the pool's Euler account.
+
+    Attributes:
+        vault_address: Address of the vault
+        cash: vault.cash()
+        total_borrows: vault.totalBorrows()
+        borrow_cap: Compact-encoded borrow cap from vault.caps()
+        account_debt: vault.debtOf(eulerAccount)
+        account_max_deposit: vault.maxDeposit(eulerAccount)
+        account_assets: vault.convertToAssets(vault.balanceOf(eulerAccount))
+    """
+
+    vault_address: str
+    cash: int
+    total_borrows: int
+    borrow_cap: int
+    account_debt: int
+    account_max_deposit: int
+    account_assets: int
+
+    def to_dict(self) -> dict:
+        """Convert vault state to dictionary."""
+        return {
+            "vault_address": self.vault_address,
+            "cash": str(self.cash),
+            "total_borrows": str(self.total_borrows),
+            "borrow_cap": self.borrow_cap,
+            "account_debt": str(self.account_debt),
+            "account_max_deposit": str(self.account_max_deposit),
+            "account_assets": str(self.account_assets),
+        }
+
+
+def decode_cap(amount_cap: int) -> int:
+    """
+    Decode a compact-format cap (QuoteLib.decodeCap).
+
+    The lower 6 bits hold a base-10 exponent and the upper bits a mantissa
+    scaled by 100. Zero means uncapped.
+
+    Args:
+        amount_cap: Compact-format cap value
+
+    Returns:
+        Cap in asset units (max uint256 if uncapped)
+    """
+    if amount_cap == 0:
+        return MAX_UINT256
+    return 10 ** (amount_cap & 63) * (amount_cap >> 6) // 100
+
+
+def calc_limits(
+    vault0: VaultState,
+    vault1: VaultState,
+    reserve0: int,
+    reserve1: int,
+    asset0_is_input: bool,
+) -> Tuple[int, int]:
+    """
+    Maximum input and output amounts for a swap (QuoteLib.calcLimits).
+
+    Args:
+        vault0: State of the vault for asset0
+        vault1: State of the vault for asset1
+        reserve0: Pool reserve of asset0
+        reserve1: Pool reserve of asset1
+        asset0_is_input: Swap direction
+
+    Returns:
+        Tuple of (in_limit, out_limit) in raw units
+    """
+    in_limit = MAX_UINT112
+    out_limit = MAX_UINT112
+
+    # Supply caps on input
+    vault_in = vault0 if asset0_is_input else vault1
+    max_deposit = vault_in.account_debt + vault_in.account_max_deposit
+    if max_deposit < in_limit:
+        in_limit = max_deposit
+
+    # Remaining reserves of output
+    reserve_limit = reserve1 if asset0_is_input else reserve0
+    if reserve_limit < out_limit:
+        out_limit = reserve_limit
+
+    # Remaining cash and borrow caps in output
+    vault_out = vault1 if asset0_is_input else vault0
+    if vault_out.cash < out_limit:
+        out_limit = vault_out.cash
+
+    max_withdraw = decode_cap(vault_out.borrow_cap)
+    if vault_out.total_borrows > max_withdraw:
+        max_withdraw = 0
+    else:
+        max_withdraw -= vault_out.total_borrows
+    if max_withdraw < out_limit:
+        max_withdraw += vault_out.account_assets
+        if max_withdraw < out_limit:
+            out_limit = max_withdraw
+
+    return in_limit, out_limit
+
+
+def compute_quote_with_limits(
+    p: CurveParams,
+    vault0: VaultState,
+    vault1: VaultState,
+    reserve0: int,
+    reserve1: int,
+    amount: int,
+    exact_in: bool,
+    asset0_is_input: bool,
+) -> int:
+    """
+    Full QuoteLib.computeQuote: curve quote checked against swap limits.
+
+    Operator installation is not checked; the caller is expected to know
+    the pool is live.
+
+    Args:
+        p: Curve parameters
+        vault0: State of the vault for asset0
+        vault1: State of the vault for asset1
+        reserve0: Pool reserve of asset0
+        reserve1: Pool reserve of asset1
+        amount: Input amount if exact_in, output amount otherwise
+        exact_in: True for exact input
+        asset0_is_input: Swap direction
+
+    Returns:
+        Quoted amount
+
+    Raises:
+        CurveError: If the swap would exceed the limits (contract reverts)
+    """
+    if amount == 0:
+        return 0
+    if amount > MAX_UINT112:
+        raise CurveError("SwapLimitExceeded")
+
+    if exact_in:
+        amount = amount - (amount * p.fee // WAD)
+
+    in_limit, out_limit = calc_limits(
+        vault0, vault1, reserve0, reserve1, asset0_is_input
+    )
+
+    quote = find_curve_point(p, reserve0, reserve1, amount, exact_in, asset0_is_input)
+
+    if exact_in:
+        if amount > in_limit or quote > out_limit:
+            raise CurveError("SwapLimitExceeded")
+    elif amount > out_limit or quote > in_limit:
+        raise CurveError("SwapLimitExceeded")
+
+    if not exact_in:
+        quote = (quote * WAD) // (WAD - p.fee)
+
+    return quote
@@ -0,0 +1,222 @@
+"""Price-impact surface computed locally from pool params and reserves."""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional, Sequence
+
+from models.fixed_point import from_units, to_units
+from .curve import CurveError, CurveParams, compute_quote, marginal_price
+from .pool_params import PoolParams
+
+
+@dataclass
+class PriceImpactPoint:
+    """
+    Price impact of a single exact-input swap size.
+
+    Attributes:
+        size_in: Input amount in token_in units
+        amount_out: Quoted output in token_out units (after fees)
+        execution_price: amount_out / size_in
+        price_impact: Percent below the live marginal price (fees included)
+        within_reserves: False if the pool cannot fill the size
+    """
+
+    size_in: Decimal
+    amount_out: Decimal
+    execution_price: Decimal
+    price_impact: Decimal
+    within_reserves: bool = True
+
+    def to_dict(self) -> dict:
+        """Convert point to dictionary."""
+        return {
+            "size_in": str(self.size_in),
+            "amount_out": str(self.amount_out),
+            "execution_price": str(self.execution_price),
+            "price_impact": str(self.price_impact),
+            "within_reserves": self.within_reserves,
+        }
+
+
+@dataclass
+class PriceImpactSurface:
+    """
+    Price impact versus size for both swap directions at one pool state.
+
+    Attributes:
+        reserve0: Pool reserve of token0
+        reserve1: Pool reserve of token1
+        marginal_price: Live price of token0 in token1 units
+        token0_to_token1: Points for token0 -> token1 swaps
+        token1_to_token0: Points for token1 -> token0 swaps
+        block_number: Block the surface was computed for
+    """
+
+    reserve0: Decimal
+    reserve1: Decimal
+    marginal_price: Decimal
+    token0_to_token1: List[PriceImpactPoint] = field(default_factory=list)
+    token1_to_token0: List[PriceImpactPoint] = field(default_factory=list)
+    block_number: Optional[int] = None
+
+    def points(self, token_in_is_token0: bool = True) -> List[PriceImpactPoint]:
+        """Get the points for one swap direction."""
+        return self.token0_to_token1 if token_in_is_token0 else self.token1_to_token0
+
+    def impact_for(
+        self, size_in: Decimal, token_in_is_token0: bool = True
+    ) -> Optional[Decimal]:
+        """
+        Estimate price impact for a size by linear interpolation on the grid.
+
+        Args:
+            size_in: Input amount in token_in units
+            token_in_is_token0: Swap direction
+
+        Returns:
+            Price impact percent, or None if size is beyond the grid or reserves
+        """
+        previous: Optional[PriceImpactPoint] = None
+        for point in self.points(token_in_is_token0):
+            if not point.within_reserves:
+                return None
+            if size_in <= point.size_in:
+                if previous is None or point.size_in == previous.size_in:
+                    return point.price_impact
+                weight = (size_in - previous.size_in) / (
+                    point.size_in - previous.size_in
+                )
+                return previous.price_impact + weight * (
+                    point.price_impact - previous.price_impact
+                )
+            previous = point
+        return None
+
+    def max_size_for_impact(
+        self, max_impact_percent: Decimal, token_in_is_token0: bool = True
+    ) -> Decimal:
+        """
+        Get the largest grid size whose impact stays within a bound.
+
+        Args:
+            max_impact_percent: Maximum acceptable impact (percent)
+            token_in_is_token0: Swap direction
+
+        Returns:
+            Largest acceptable size, or 0 if none qualifies
+        """
+        best = Decimal("0")
+        for point in self.points(token_in_is_token0):
+            if not point.within_reserves or point.price_impact > max_impact_percent:
+                break
+            best = point.size_in
+        return best
+
+    def to_dict(self) -> dict:
+        """Convert surface to dictionary."""
+        return {
+            "block_number": self.block_number,
+            "reserve0": str(self.reserve0),
+            "reserve1": str(self.reserve1),
+            "marginal_price": str(self.marginal_price),
+            "token0_to_token1": [p.to_dict() for p in self.token0_to_token1],
+            "token1_to_token0": [p.to_dict() for p in self.token1_to_token0],
+        }
+
+
+def _direction_points(
+    curve: CurveParams,
+    reserve0: int,
+    reserve1: int,
+    sizes: Sequence[Decimal],
+    token_in_is_token0: bool,
+    decimals_in: int,
+    decimals_out: int,
+    reference_price: Decimal,
+) -> List[PriceImpactPoint]:
+    """Compute the impact points of one direction in ascending size order."""
+    reserve_out = reserve1 if token_in_is_token0 else reserve0
+    points = []
+
+    for size in sorted(sizes):
+        amount_in = to_units(size, decimals_in)
+        if amount_in <= 0:
+            continue
+
+        try:
+            amount_out = compute_quote(
+                curve, reserve0, reserve1, amount_in, True, token_in_is_token0
+            )
+            within_reserves = amount_out < reserve_out
+        except CurveError:
+            amount_out, within_reserves = 0, False
+
+        out_decimal = from_units(amount_out, decimals_out)
+        execution_price = out_decimal / size
+        if reference_price > 0:
+            impact = (reference_price - execution_price) / reference_price * 100
+        else:
+            impact = Decimal("100")
+
+        points.append(
+            PriceImpactPoint(
+                size_in=size,
+                amount_out=out_decimal,
+                execution_price=execution_price,
+                price_impact=impact,
+                within_reserves=within_reserves,
+            )
+        )
+
+    return points
+
+
+def build_price_impact_surface(
+    params: PoolParams,
+    reserve0: int,
+    reserve1: int,
+    sizes_token0: Sequence[Decimal],
+    sizes_token1: Sequence[Decimal],
+    block_number: Optional[int] = None,
+) -> PriceImpactSurface:
+    """
+    Build a price-impact surface from pool params and raw reserves.
+
+    Args:
+        params: Pool parameters (with token decimals set)
+        reserve0: Raw reserve of token0
+        reserve1: Raw reserve of token1
+        sizes_token0: Input sizes for token0 -> token1 swaps (token0 units)
+        sizes_token1: Input sizes for token1 -> token0 swaps (token1 units)
+        block_number: Block the reserves were read at
+
+    Returns:
+        PriceImpactSurface for both directions
+    """
+    curve = CurveParams.from_pool_params(params)
+    decimals0, decimals1 = params.token0_decimals, params.token1_decimals
+
+    # Marginal price converted from raw units to token units (token1 per token0)
+    raw_price = marginal_price(curve, reserve0, reserve1)
+    price = raw_price.scaleb(decimals0 - decimals1)
+
+    return PriceImpactSurface(
+        reserve0=from_units(reserve0, decimals0),
+        reserve1=from_units(reserve1, decimals1),
+        marginal_price=price,
+        token0_to_token1=_direction_points(
+            curve, reserve0, reserve1, sizes_token0, True, decimals0, decimals1, price
+        ),
+        token1_to_token0=_direction_points(
+            curve,
+            reserve0,
+            reserve1,
+            sizes_token1,
+            False,
+            decimals1,
+            decimals0,
+            1 / price if price > 0 else Decimal("0"),
+        ),
+        block_number=block_number,
+    )
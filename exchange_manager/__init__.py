@@ -2,5 +2,13 @@
 
 from .iexchange import IExchange
 from .binance_exchange import BinanceExchange
+from .exchange_router import ExchangeRouter, VenueStats
+from .position_book import PositionBook
 
-__all__ = ["IExchange", "BinanceExchange"]
+__all__ = [
+    "IExchange",
+    "BinanceExchange",
+    "ExchangeRouter",
+    "VenueStats",
+    "PositionBook",
+]
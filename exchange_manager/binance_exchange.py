@@ -3,8 +3,9 @@
 import asyncio
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import ccxt.async_support as ccxt
+import ccxt.pro as ccxtpro
 
 from models import Trade
 from models.trade import OrderSide, OrderType, OrderStatus
@@ -19,7 +20,13 @@ class BinanceExchange(IExchange):
     Handles all interactions with Binance perpetual futures.
     """
 
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = False,
+        name: str = "binance",
+    ):
         """
         Initialize Binance exchange.
 
@@ -27,14 +34,20 @@ class BinanceExchange(IExchange):
             api_key: Binance API key
             api_secret: Binance API secret
             testnet: Whether to use testnet
+            name: Venue name recorded on trades (distinguishes accounts)
         """
+        self.name = name
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
         self.logger = LoggerManager()
         self.exchange: Optional[ccxt.binance] = None
+        self.stream: Optional[ccxtpro.binance] = None  # Websocket client
         self._connected = False
 
+        # Leverage last set per symbol, so repeated orders skip the call
+        self._leverage: Dict[str, int] = {}
+
     async def connect(self) -> None:
         """Connect to Binance exchange."""
         try:
@@ -53,6 +66,8 @@ class BinanceExchange(IExchange):
                 config["hostname"] = "testnet.binancefuture.com"
 
             self.exchange = ccxt.binance(config)
+            self.stream = ccxtpro.binance(config)
+            self._leverage.clear()
 
             # Load markets
             await self.exchange.load_markets()
@@ -69,6 +84,8 @@ class BinanceExchange(IExchange):
 
     async def disconnect(self) -> None:
         """Disconnect from Binance exchange."""
+        if self.stream:
+            await self.stream.close()
         if self.exchange:
             await self.exchange.close()
             self._connected = False
@@ -88,7 +105,7 @@ class BinanceExchange(IExchange):
 
         try:
             ticker = await self.exchange.fetch_ticker(symbol)
-            mark_price = Decimal(str(ticker["mark"] or ticker["last"]))
+            mark_price = self._ticker_mark_price(ticker)
 
             self.logger.log_debug(
                 f"Mark price for {symbol}: {mark_price}", LogTag.EXCHANGE
@@ -125,7 +142,11 @@ class BinanceExchange(IExchange):
             raise
 
     async def open_short_position(
-        self, symbol: str, size: Decimal, leverage: Decimal = Decimal("1")
+        self,
+        symbol: str,
+        size: Decimal,
+        leverage: Decimal = Decimal("1"),
+        client_order_id: Optional[str] = None,
     ) -> Trade:
         """
         Open a short position.
@@ -134,6 +155,7 @@ class BinanceExchange(IExchange):
             symbol: Trading pair symbol
             size: Position size in base currency
             leverage: Leverage to use
+            client_order_id: Client order ID to place the order with
 
         Returns:
             Executed trade details
@@ -146,7 +168,9 @@ class BinanceExchange(IExchange):
 
             # Place market sell order to open short
             order = await self.exchange.create_market_sell_order(
-                symbol=symbol, amount=float(size)
+                symbol=symbol,
+                amount=float(size),
+                params=self._client_id_params(client_order_id),
             )
 
             # Create trade object
@@ -165,7 +189,7 @@ class BinanceExchange(IExchange):
                 ),
                 fee=Decimal(str(order["fee"]["cost"])) if order.get("fee") else None,
                 fee_currency=order["fee"]["currency"] if order.get("fee") else None,
-                exchange="binance",
+                exchange=self.name,
             )
 
             self.logger.log_trade("Open Short", str(size), str(trade.price))
@@ -175,13 +199,21 @@ class BinanceExchange(IExchange):
             self.logger.log_error(f"Failed to open short position", e)
             raise
 
-    async def close_short_position(self, symbol: str, size: Decimal) -> Trade:
+    async def close_short_position(
+        self,
+        symbol: str,
+        size: Decimal,
+        client_order_id: Optional[str] = None,
+        reduce_only: bool = False,
+    ) -> Trade:
         """
         Close a short position.
 
         Args:
             symbol: Trading pair symbol
             size: Position size to close
+            client_order_id: Client order ID to place the order with
+            reduce_only: Place the order reduce-only
 
         Returns:
             Executed trade details
@@ -190,8 +222,11 @@ class BinanceExchange(IExchange):
 
         try:
             # Place market buy order to close short
+            params = self._client_id_params(client_order_id)
+            if reduce_only:
+                params["reduceOnly"] = True
             order = await self.exchange.create_market_buy_order(
-                symbol=symbol, amount=float(size)
+                symbol=symbol, amount=float(size), params=params
             )
 
             # Create trade object
@@ -210,7 +245,7 @@ class BinanceExchange(IExchange):
                 ),
                 fee=Decimal(str(order["fee"]["cost"])) if order.get("fee") else None,
                 fee_currency=order["fee"]["currency"] if order.get("fee") else None,
-                exchange="binance",
+                exchange=self.name,
             )
 
             self.logger.log_trade("Close Short", str(size), str(trade.price))
@@ -295,9 +330,13 @@ class BinanceExchange(IExchange):
             # Binance requires symbol without colon for leverage setting
             clean_symbol = symbol.replace(":", "")
 
+            if self._leverage.get(clean_symbol) == int(leverage):
+                return True
+
             result = await self.exchange.set_leverage(
                 leverage=int(leverage), symbol=clean_symbol
             )
+            self._leverage[clean_symbol] = int(leverage)
 
             self.logger.log_leverage(str(leverage))
             return True
@@ -435,25 +474,166 @@ class BinanceExchange(IExchange):
 
         try:
             order = await self.exchange.fetch_order(order_id, symbol)
-
-            return {
-                "id": order["id"],
-                "symbol": order["symbol"],
-                "type": order["type"],
-                "side": order["side"],
-                "price": Decimal(str(order["price"])) if order["price"] else None,
-                "amount": Decimal(str(order["amount"])),
-                "filled": Decimal(str(order["filled"])),
-                "remaining": Decimal(str(order["remaining"])),
-                "status": order["status"],
-                "timestamp": order["timestamp"],
-                "datetime": order["datetime"],
-            }
+            return self._order_to_dict(order)
 
         except Exception as e:
             self.logger.log_error(f"Failed to get order status for {order_id}", e)
             raise
 
+    async def get_order_by_client_id(
+        self, client_order_id: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up an order by its client order ID.
+
+        Args:
+            client_order_id: Client order ID the order was placed with
+            symbol: Trading pair symbol
+
+        Returns:
+            Order details, or None if Binance has no such order
+        """
+        self._ensure_connected()
+
+        try:
+            order = await self.exchange.fetch_order(
+                None, symbol, params={"origClientOrderId": client_order_id}
+            )
+            return self._order_to_dict(order)
+
+        except ccxt.OrderNotFound:
+            return None
+
+        except Exception as e:
+            self.logger.log_error(f"Failed to look up order {client_order_id}", e)
+            raise
+
+    async def place_limit_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+        price: Decimal,
+        post_only: bool = True,
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """
+        Place a limit order.
+
+        Args:
+            symbol: Trading pair symbol
+            side: Buy or sell
+            size: Order size in base currency
+            price: Limit price
+            post_only: Reject instead of taking liquidity
+            client_order_id: Optional ID to find the order by if the
+                response is lost
+
+        Returns:
+            Placed order (status OPEN unless it filled or was rejected at once)
+        """
+        self._ensure_connected()
+
+        try:
+            params = self._client_id_params(client_order_id)
+            if post_only:
+                params["timeInForce"] = "GTX"
+            order = await self.exchange.create_limit_order(
+                symbol=symbol,
+                side=side.value,
+                amount=float(size),
+                price=float(price),
+                params=params,
+            )
+
+            status = {
+                "closed": OrderStatus.FILLED,
+                "canceled": OrderStatus.CANCELLED,
+                "expired": OrderStatus.CANCELLED,
+                "rejected": OrderStatus.FAILED,
+            }.get(order["status"], OrderStatus.OPEN)
+
+            return Trade(
+                symbol=symbol,
+                side=side,
+                order_type=OrderType.LIMIT,
+                size=Decimal(str(order["amount"])),
+                price=Decimal(str(order["price"] or price)),
+                timestamp=datetime.fromtimestamp(
+                    (order["timestamp"] or datetime.utcnow().timestamp() * 1000) / 1000
+                ),
+                order_id=str(order["id"]),
+                status=status,
+                exchange=self.name,
+            )
+
+        except Exception as e:
+            self.logger.log_error(f"Failed to place limit order", e)
+            raise
+
+    async def watch_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        """
+        Wait for the next order updates pushed by the exchange.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Updated orders in the get_order_status format, plus
+            "average", "fee" and "fee_currency"
+        """
+        self._ensure_connected()
+
+        orders = await self.stream.watch_orders(symbol)
+        return [self._order_to_dict(order) for order in orders]
+
+    async def watch_mark_price(self, symbol: str) -> Decimal:
+        """
+        Wait for the next mark price pushed by the exchange.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            New mark price
+        """
+        self._ensure_connected()
+
+        ticker = await self.stream.watch_ticker(symbol)
+        return self._ticker_mark_price(ticker)
+
+    @staticmethod
+    def _ticker_mark_price(ticker: Dict[str, Any]) -> Decimal:
+        """Mark price of a CCXT ticker, or its last price if it has none."""
+        return Decimal(str(ticker.get("markPrice") or ticker["last"]))
+
+    @staticmethod
+    def _order_to_dict(order: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a CCXT order structure."""
+        fee = order.get("fee") or {}
+        return {
+            "id": str(order["id"]),
+            "symbol": order["symbol"],
+            "type": order["type"],
+            "side": order["side"],
+            "price": Decimal(str(order["price"])) if order["price"] else None,
+            "amount": Decimal(str(order["amount"])),
+            "filled": Decimal(str(order["filled"] or 0)),
+            "remaining": Decimal(str(order["remaining"] or 0)),
+            "status": order["status"],
+            "timestamp": order["timestamp"],
+            "datetime": order["datetime"],
+            "average": Decimal(str(order["average"])) if order.get("average") else None,
+            "fee": Decimal(str(fee["cost"])) if fee.get("cost") is not None else None,
+            "fee_currency": fee.get("currency"),
+            "client_order_id": order.get("clientOrderId"),
+        }
+
+    @staticmethod
+    def _client_id_params(client_order_id: Optional[str]) -> Dict[str, Any]:
+        """Order params carrying a client order ID, if given."""
+        return {"newClientOrderId": client_order_id} if client_order_id else {}
+
     def _ensure_connected(self) -> None:
         """Ensure exchange is connected."""
         if not self._connected or not self.exchange:
@@ -0,0 +1,705 @@
+"""Multi-venue hedge routing over several IExchange implementations."""
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from models import Trade
+from models.trade import OrderSide, OrderStatus, OrderType
+from logger_manager import LoggerManager, LogTag
+from .iexchange import IExchange
+
+
+@dataclass
+class VenueStats:
+    """
+    Per-venue routing state.
+
+    Attributes:
+        name: Venue name (also used as ``Trade.exchange``)
+        taker_fee_percent: Taker fee charged by the venue
+        latency_ms: Exponentially weighted request latency
+        requests: Number of requests sent
+        errors: Number of failed requests
+        consecutive_errors: Failures since the last success
+        disabled_until: Monotonic time until which the venue is skipped
+        best_bid: Last seen best bid
+        best_ask: Last seen best ask
+        filled: Total size routed to the venue
+    """
+
+    name: str
+    taker_fee_percent: Decimal
+    latency_ms: Optional[float] = None
+    requests: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    disabled_until: float = 0.0
+    best_bid: Optional[Decimal] = None
+    best_ask: Optional[Decimal] = None
+    filled: Decimal = Decimal("0")
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the venue is not in its failure cooldown."""
+        return time.monotonic() >= self.disabled_until
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "taker_fee_percent": str(self.taker_fee_percent),
+            "latency_ms": (
+                round(self.latency_ms, 1) if self.latency_ms is not None else None
+            ),
+            "requests": self.requests,
+            "errors": self.errors,
+            "best_bid": str(self.best_bid) if self.best_bid is not None else None,
+            "best_ask": str(self.best_ask) if self.best_ask is not None else None,
+            "filled": str(self.filled),
+        }
+
+
+class ExchangeRouter(IExchange):
+    """
+    Routes hedges across several venues and presents them as one exchange.
+
+    Each hedge is quoted on every healthy venue. Venues are ranked by
+    fee-adjusted top-of-book price plus a latency penalty, and the hedge is
+    split across them by the depth each shows within the slippage budget.
+    Failed child orders are retried on the next venue, and a venue that
+    keeps failing is skipped for a cooldown. Positions and balances are
+    aggregated across venues.
+    """
+
+    def __init__(
+        self,
+        venues: Dict[str, IExchange],
+        taker_fees: Optional[Dict[str, Decimal]] = None,
+        max_slippage_percent: Decimal = Decimal("0.5"),
+        latency_penalty_bps: Decimal = Decimal("0.5"),
+        max_consecutive_errors: int = 3,
+        cooldown_seconds: float = 60,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            venues: Exchanges by venue name, in order of preference
+            taker_fees: Taker fee percent per venue (default 0.05%)
+            max_slippage_percent: Depth counted for splitting, from the best price
+            latency_penalty_bps: Cost in bps charged per 100ms of venue latency
+            max_consecutive_errors: Failures before a venue is disabled
+            cooldown_seconds: How long a failing venue is skipped
+        """
+        if not venues:
+            raise ValueError("At least one venue is required")
+
+        self.venues = venues
+        self.max_slippage_percent = max_slippage_percent
+        self.latency_penalty_bps = latency_penalty_bps
+        self.max_consecutive_errors = max_consecutive_errors
+        self.cooldown_seconds = cooldown_seconds
+        self.logger = LoggerManager()
+
+        taker_fees = taker_fees or {}
+        self.stats: Dict[str, VenueStats] = {
+            name: VenueStats(name, taker_fees.get(name, Decimal("0.05")))
+            for name in venues
+        }
+
+        # Venue of each limit order placed through the router
+        self._order_venue: Dict[str, str] = {}
+        # Order update queue per consumer task, fed by one stream per venue
+        self._order_queues: "weakref.WeakKeyDictionary[asyncio.Task, asyncio.Queue]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._watch_tasks: List[asyncio.Task] = []
+
+    async def _call(
+        self, name: str, request: Callable[[IExchange], Awaitable[Any]]
+    ) -> Any:
+        """Send one request to a venue, recording latency and failures."""
+        stats = self.stats[name]
+        stats.requests += 1
+        start = time.perf_counter()
+        try:
+            result = await request(self.venues[name])
+        except Exception:
+            stats.errors += 1
+            stats.consecutive_errors += 1
+            if stats.consecutive_errors >= self.max_consecutive_errors:
+                stats.disabled_until = time.monotonic() + self.cooldown_seconds
+                self.logger.log_warning(
+                    f"Venue {name} disabled for {self.cooldown_seconds}s "
+                    f"after {stats.consecutive_errors} errors"
+                )
+            raise
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        stats.latency_ms = (
+            latency_ms
+            if stats.latency_ms is None
+            else 0.8 * stats.latency_ms + 0.2 * latency_ms
+        )
+        stats.consecutive_errors = 0
+        return result
+
+    def _ranked_names(self) -> List[str]:
+        """Healthy venues, fastest first (all venues if none are healthy)."""
+        names = [name for name, stats in self.stats.items() if stats.healthy]
+        return sorted(
+            names or list(self.venues),
+            key=lambda name: self.stats[name].latency_ms or 0.0,
+        )
+
+    async def _first(self, request: Callable[[IExchange], Awaitable[Any]]) -> Any:
+        """Send a request to the fastest healthy venue, failing over in turn."""
+        error: Optional[Exception] = None
+        for name in self._ranked_names():
+            try:
+                return await self._call(name, request)
+            except Exception as e:
+                error = e
+        raise error
+
+    async def _gather(
+        self, request: Callable[[IExchange], Awaitable[Any]], names: List[str]
+    ) -> Dict[str, Any]:
+        """Send a request to several venues concurrently; failures are dropped."""
+        results = await asyncio.gather(
+            *(self._call(name, request) for name in names), return_exceptions=True
+        )
+        return {
+            name: result
+            for name, result in zip(names, results)
+            if not isinstance(result, Exception)
+        }
+
+    async def connect(self) -> None:
+        """Connect to all venues; at least one must succeed."""
+        results = await asyncio.gather(
+            *(venue.connect() for venue in self.venues.values()),
+            return_exceptions=True,
+        )
+        failed = [
+            name
+            for name, result in zip(self.venues, results)
+            if isinstance(result, Exception)
+        ]
+        for name in failed:
+            self.stats[name].disabled_until = time.monotonic() + self.cooldown_seconds
+        if len(failed) == len(self.venues):
+            raise ConnectionError("Failed to connect to any venue")
+
+        self.logger.log_info(
+            f"Connected to {len(self.venues) - len(failed)}/{len(self.venues)} venues",
+            LogTag.EXCHANGE,
+        )
+
+    async def disconnect(self) -> None:
+        """Disconnect from all venues."""
+        for task in self._watch_tasks:
+            task.cancel()
+        self._watch_tasks = []
+        await asyncio.gather(
+            *(venue.disconnect() for venue in self.venues.values()),
+            return_exceptions=True,
+        )
+
+    async def get_mark_price(self, symbol: str) -> Decimal:
+        """Get the mark price from the fastest healthy venue."""
+        return await self._first(lambda venue: venue.get_mark_price(symbol))
+
+    async def get_funding_rate(self, symbol: str) -> Decimal:
+        """Get the funding rate from the fastest healthy venue."""
+        return await self._first(lambda venue: venue.get_funding_rate(symbol))
+
+    async def quote(
+        self, symbol: str, side: OrderSide
+    ) -> List[Tuple[str, Decimal, Decimal]]:
+        """
+        Quote a market order on every healthy venue.
+
+        Args:
+            symbol: Trading pair symbol
+            side: Side of the order
+
+        Returns:
+            (venue, effective price, size within slippage) from best to worst
+        """
+        books = await self._gather(
+            lambda venue: venue.get_order_book(symbol), self._ranked_names()
+        )
+
+        quotes = []
+        for name, book in books.items():
+            stats = self.stats[name]
+            stats.best_bid = book["bids"][0][0] if book["bids"] else None
+            stats.best_ask = book["asks"][0][0] if book["asks"] else None
+
+            # Selling hits bids; buying lifts asks
+            levels = book["bids"] if side == OrderSide.SELL else book["asks"]
+            if not levels:
+                continue
+
+            best = levels[0][0]
+            max_move = best * self.max_slippage_percent / 100
+            depth = sum(
+                (amount for price, amount in levels if abs(price - best) <= max_move),
+                Decimal("0"),
+            )
+            cost_bps = stats.taker_fee_percent * 100 + self.latency_penalty_bps * (
+                Decimal(str(stats.latency_ms or 0)) / 100
+            )
+            sign = -1 if side == OrderSide.SELL else 1
+            quotes.append((name, best * (1 + sign * cost_bps / 10000), depth))
+
+        # Highest effective price when selling, lowest when buying
+        quotes.sort(key=lambda quote: quote[1], reverse=side == OrderSide.SELL)
+        return quotes
+
+    def _allocate(
+        self,
+        quotes: List[Tuple[str, Decimal, Decimal]],
+        size: Decimal,
+        caps: Optional[Dict[str, Decimal]] = None,
+    ) -> Dict[str, Decimal]:
+        """Fill the best venues up to their depth (and cap); rest to the best."""
+        allocation: Dict[str, Decimal] = {}
+        remaining = size
+        for name, _, depth in quotes:
+            limit = depth if caps is None else min(depth, caps.get(name, Decimal("0")))
+            take = min(remaining, limit)
+            if take > 0:
+                allocation[name] = take
+                remaining -= take
+
+        # Deeper than every book: the rest goes where there is room, best first
+        for name, _, _ in quotes:
+            if remaining <= 0:
+                break
+            room = remaining
+            if caps is not None:
+                room = min(room, caps.get(name, Decimal("0")) - allocation.get(name, 0))
+            if room > 0:
+                allocation[name] = allocation.get(name, Decimal("0")) + room
+                remaining -= room
+        return allocation
+
+    async def _route(
+        self,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+        place: Callable[[IExchange, Decimal, Optional[str]], Awaitable[Trade]],
+        caps: Optional[Dict[str, Decimal]] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """Split a market order across venues, failing over on errors."""
+        quotes = await self.quote(symbol, side)
+        if not quotes:
+            # No book anywhere: fall back to the preferred venues' order
+            quotes = [
+                (name, Decimal("0"), Decimal("0")) for name in self._ranked_names()
+            ]
+        allocation = self._allocate(quotes, size, caps)
+        if not allocation:
+            held = " (no venue holds a short)" if caps is not None else ""
+            raise RuntimeError(f"No venue can take {size} {symbol}{held}")
+        unroutable = size - sum(allocation.values(), Decimal("0"))
+        if unroutable > 0:
+            self.logger.log_warning(
+                f"{unroutable} ETH could not be routed to any venue"
+            )
+
+        fills: List[Trade] = []
+        tried = set()
+        while allocation:
+            names = list(allocation)
+            results = await asyncio.gather(
+                *(
+                    self._call(
+                        name,
+                        lambda venue, n=name: place(
+                            venue, allocation[n], self._leg_id(client_order_id, n)
+                        ),
+                    )
+                    for name in names
+                ),
+                return_exceptions=True,
+            )
+            tried.update(names)
+
+            failed = Decimal("0")
+            for name, result in zip(names, results):
+                if isinstance(result, Exception) and client_order_id:
+                    # The order may have been accepted before the error
+                    result = await self._recover_leg(
+                        name, symbol, self._leg_id(client_order_id, name), result
+                    )
+                if isinstance(result, Exception):
+                    self.logger.log_error(f"Order on {name} failed", result)
+                    failed += allocation[name]
+                    continue
+                result.exchange = name
+                self.stats[name].filled += result.size
+                fills.append(result)
+
+            # Re-route what failed to venues not tried yet
+            fallback = [quote for quote in quotes if quote[0] not in tried]
+            allocation = self._allocate(fallback, failed, caps) if failed else {}
+            if failed and not allocation:
+                if not fills:
+                    raise RuntimeError(f"Order failed on all venues: {sorted(tried)}")
+                self.logger.log_warning(
+                    f"{failed} ETH could not be routed to any venue"
+                )
+
+        return self._combine(fills)
+
+    def _leg_id(self, client_order_id: Optional[str], name: str) -> Optional[str]:
+        """Client order ID of one venue's leg of a routed order."""
+        if client_order_id is None:
+            return None
+        return f"{client_order_id}-{list(self.venues).index(name)}"
+
+    async def _recover_leg(
+        self, name: str, symbol: str, leg_id: str, error: Exception
+    ) -> Any:
+        """Find a failed leg by client ID; its fill if it filled, else the error."""
+        try:
+            order = await self.venues[name].get_order_by_client_id(leg_id, symbol)
+        except Exception:
+            return error
+        if order is None or not order["filled"]:
+            return error
+        return Trade(
+            symbol=symbol,
+            side=OrderSide(order["side"]),
+            order_type=OrderType.MARKET,
+            size=order["filled"],
+            price=order["average"] or order["price"],
+            timestamp=datetime.utcnow(),
+            order_id=order["id"],
+            status=OrderStatus.FILLED,
+            fee=order["fee"],
+            fee_currency=order["fee_currency"],
+            exchange=name,
+        )
+
+    @staticmethod
+    def _combine(fills: List[Trade]) -> Trade:
+        """Merge per-venue fills into one trade."""
+        if len(fills) == 1:
+            return fills[0]
+
+        size = sum((trade.size for trade in fills), Decimal("0"))
+        fees = [trade.fee for trade in fills if trade.fee is not None]
+        first = fills[0]
+        return Trade(
+            symbol=first.symbol,
+            side=first.side,
+            order_type=first.order_type,
+            size=size,
+            price=sum(trade.size * trade.price for trade in fills) / size,
+            timestamp=max(trade.timestamp for trade in fills),
+            order_id=",".join(trade.order_id for trade in fills),
+            status=first.status,
+            fee=sum(fees, Decimal("0")) if fees else None,
+            fee_currency=first.fee_currency,
+            exchange="+".join(trade.exchange for trade in fills),
+        )
+
+    async def open_short_position(
+        self,
+        symbol: str,
+        size: Decimal,
+        leverage: Decimal = Decimal("1"),
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """Open a short, split across the best venues."""
+        return await self._route(
+            symbol,
+            OrderSide.SELL,
+            size,
+            lambda venue, part, leg_id: venue.open_short_position(
+                symbol, part, leverage, client_order_id=leg_id
+            ),
+            client_order_id=client_order_id,
+        )
+
+    async def close_short_position(
+        self,
+        symbol: str,
+        size: Decimal,
+        client_order_id: Optional[str] = None,
+        reduce_only: bool = False,
+    ) -> Trade:
+        """Close a short on the venues that hold it, best venues first."""
+        positions = await self._gather(
+            lambda venue: venue.get_current_perpetual_position(symbol),
+            list(self.venues),
+        )
+        caps = {
+            name: position["size"]
+            for name, position in positions.items()
+            if position["side"] == "short"
+        }
+        return await self._route(
+            symbol,
+            OrderSide.BUY,
+            size,
+            lambda venue, part, leg_id: venue.close_short_position(
+                symbol, part, client_order_id=leg_id, reduce_only=reduce_only
+            ),
+            caps,
+            client_order_id=client_order_id,
+        )
+
+    async def get_current_perpetual_position(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get the net position across all venues.
+
+        Returns:
+            Position in the single-venue format, with per-venue positions
+            under "venues"
+
+        Raises:
+            RuntimeError: If any venue cannot report its position
+        """
+        names = list(self.venues)
+        positions = await self._gather(
+            lambda venue: venue.get_current_perpetual_position(symbol), names
+        )
+        missing = [name for name in names if name not in positions]
+        if missing:
+            # A partial sum would misstate delta
+            raise RuntimeError(f"Position unavailable on {missing}")
+
+        net = Decimal("0")
+        notional = Decimal("0")
+        for position in positions.values():
+            signed = (
+                -position["size"] if position["side"] == "short" else position["size"]
+            )
+            net += signed
+            if position["entry_price"]:
+                notional += signed * position["entry_price"]
+
+        def total(key: str) -> Decimal:
+            return sum((p[key] for p in positions.values()), Decimal("0"))
+
+        marks = [p["mark_price"] for p in positions.values() if p["mark_price"]]
+        return {
+            "symbol": symbol,
+            "size": abs(net),
+            "side": "short" if net < 0 else "long" if net > 0 else None,
+            "entry_price": notional / net if net else None,
+            "mark_price": marks[0] if marks else None,
+            "unrealized_pnl": total("unrealized_pnl"),
+            "realized_pnl": total("realized_pnl"),
+            "margin": total("margin"),
+            "leverage": max(p["leverage"] for p in positions.values()),
+            "venues": positions,
+        }
+
+    async def set_leverage(self, symbol: str, leverage: Decimal) -> bool:
+        """Set leverage on every venue."""
+        results = await self._gather(
+            lambda venue: venue.set_leverage(symbol, leverage), list(self.venues)
+        )
+        return len(results) == len(self.venues) and all(results.values())
+
+    async def get_balance(self, currency: str = "USDT") -> Decimal:
+        """Get the available balance summed across healthy venues."""
+        balances = await self._gather(
+            lambda venue: venue.get_balance(currency), self._ranked_names()
+        )
+        return sum(balances.values(), Decimal("0"))
+
+    async def get_order_book(self, symbol: str, limit: int = 20) -> Dict[str, Any]:
+        """Get the consolidated order book of all healthy venues."""
+        books = await self._gather(
+            lambda venue: venue.get_order_book(symbol, limit), self._ranked_names()
+        )
+        if not books:
+            raise RuntimeError("No venue returned an order book")
+
+        bids = sorted(
+            (level for book in books.values() for level in book["bids"]),
+            key=lambda level: level[0],
+            reverse=True,
+        )
+        asks = sorted(
+            (level for book in books.values() for level in book["asks"]),
+            key=lambda level: level[0],
+        )
+        return {
+            "symbol": symbol,
+            "bids": bids[:limit],
+            "asks": asks[:limit],
+            "timestamp": int(time.time() * 1000),
+            "datetime": datetime.utcnow().isoformat(),
+        }
+
+    async def get_recent_trades(self, symbol: str, limit: int = 100) -> list:
+        """Get recent trades from the fastest healthy venue."""
+        return await self._first(lambda venue: venue.get_recent_trades(symbol, limit))
+
+    async def place_limit_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+        price: Decimal,
+        post_only: bool = True,
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """Place a limit order on the cheapest venue, failing over in turn."""
+        quotes = await self.quote(symbol, side)
+        names = [name for name, _, _ in quotes] or self._ranked_names()
+
+        error: Optional[Exception] = None
+        for name in names:
+            try:
+                trade = await self._call(
+                    name,
+                    lambda venue, n=name: venue.place_limit_order(
+                        symbol,
+                        side,
+                        size,
+                        price,
+                        post_only,
+                        client_order_id=self._leg_id(client_order_id, n),
+                    ),
+                )
+            except Exception as e:
+                error = e
+                continue
+            trade.exchange = name
+            self._order_venue[trade.order_id] = name
+            return trade
+        raise error
+
+    async def cancel_order(self, order_id: str, symbol: str) -> bool:
+        """Cancel an order on the venue it was placed on."""
+        name = self._order_venue.get(order_id)
+        if name is None:
+            return False
+        return await self._call(
+            name, lambda venue: venue.cancel_order(order_id, symbol)
+        )
+
+    async def get_order_status(self, order_id: str, symbol: str) -> Dict[str, Any]:
+        """Get status of an order from the venue it was placed on."""
+        name = self._order_venue.get(order_id)
+        if name is None:
+            raise KeyError(f"Unknown order {order_id}")
+        return await self._call(
+            name, lambda venue: venue.get_order_status(order_id, symbol)
+        )
+
+    async def get_order_by_client_id(
+        self, client_order_id: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a routed order by its client ID on every venue.
+
+        Returns:
+            The venue legs merged into one order, or None if no venue
+            accepted any leg
+
+        Raises:
+            Exception: If any venue cannot be asked (a missing leg would
+                be taken as never placed)
+        """
+        names = list(self.venues)
+        results = await asyncio.gather(
+            *(
+                self._call(
+                    name,
+                    lambda venue, n=name: venue.get_order_by_client_id(
+                        self._leg_id(client_order_id, n), symbol
+                    ),
+                )
+                for name in names
+            )
+        )
+        legs = [leg for leg in results if leg is not None]
+        if not legs:
+            return None
+
+        filled = sum((leg["filled"] for leg in legs), Decimal("0"))
+        fees = [leg["fee"] for leg in legs if leg["fee"] is not None]
+        statuses = {leg["status"] for leg in legs}
+        return {
+            **legs[0],
+            "id": ",".join(leg["id"] for leg in legs),
+            "amount": sum((leg["amount"] for leg in legs), Decimal("0")),
+            "filled": filled,
+            "remaining": sum((leg["remaining"] for leg in legs), Decimal("0")),
+            "status": next(
+                (status for status in ("open", "closed") if status in statuses),
+                legs[0]["status"],
+            ),
+            "average": (
+                sum(leg["filled"] * (leg["average"] or 0) for leg in legs) / filled
+                if filled
+                else None
+            ),
+            "fee": sum(fees, Decimal("0")) if fees else None,
+            "client_order_id": client_order_id,
+        }
+
+    async def watch_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        """
+        Wait for the next order updates from any venue.
+
+        Each calling task has its own queue, so several consumers (maker
+        execution, the position book) all see every update.
+        """
+        queue = self._order_queues.get(asyncio.current_task())
+        if queue is None:
+            queue = self._order_queues[asyncio.current_task()] = asyncio.Queue()
+        if not self._watch_tasks:
+            self._watch_tasks = [
+                asyncio.create_task(self._watch_venue(name, symbol))
+                for name in self.venues
+            ]
+
+        updates = [await queue.get()]
+        while not queue.empty():
+            updates.append(queue.get_nowait())
+        return updates
+
+    async def watch_mark_price(self, symbol: str) -> Decimal:
+        """Wait for the next mark price from the fastest healthy venue."""
+        return await self.venues[self._ranked_names()[0]].watch_mark_price(symbol)
+
+    async def _watch_venue(self, name: str, symbol: str) -> None:
+        """Forward one venue's order stream to every consumer's queue."""
+        while True:
+            try:
+                for update in await self.venues[name].watch_orders(symbol):
+                    for queue in list(self._order_queues.values()):
+                        queue.put_nowait({**update, "exchange": name})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.log_error(f"Order stream error on {name}", e)
+                await asyncio.sleep(1)
+
+    def get_stats(self) -> dict:
+        """
+        Get per-venue routing statistics.
+
+        Returns:
+            Dictionary of venue stats by name
+        """
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
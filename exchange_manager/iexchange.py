@@ -2,10 +2,11 @@
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from models import Trade
+from models.trade import OrderSide
 
 
 class IExchange(ABC):
@@ -53,7 +54,11 @@ class IExchange(ABC):
 
     @abstractmethod
     async def open_short_position(
-        self, symbol: str, size: Decimal, leverage: Decimal = Decimal("1")
+        self,
+        symbol: str,
+        size: Decimal,
+        leverage: Decimal = Decimal("1"),
+        client_order_id: Optional[str] = None,
     ) -> Trade:
         """
         Open a short position.
@@ -62,6 +67,8 @@ class IExchange(ABC):
             symbol: Trading pair symbol
             size: Position size in base currency
             leverage: Leverage to use
+            client_order_id: Our ID for the order, to look it up if the
+                response is lost
 
         Returns:
             Executed trade details
@@ -69,13 +76,22 @@ class IExchange(ABC):
         pass
 
     @abstractmethod
-    async def close_short_position(self, symbol: str, size: Decimal) -> Trade:
+    async def close_short_position(
+        self,
+        symbol: str,
+        size: Decimal,
+        client_order_id: Optional[str] = None,
+        reduce_only: bool = False,
+    ) -> Trade:
         """
         Close a short position.
 
         Args:
             symbol: Trading pair symbol
             size: Position size to close
+            client_order_id: Our ID for the order, to look it up if the
+                response is lost
+            reduce_only: Never trade beyond flat (size may exceed the short)
 
         Returns:
             Executed trade details
@@ -177,3 +193,74 @@ class IExchange(ABC):
             Order status details
         """
         pass
+
+    @abstractmethod
+    async def get_order_by_client_id(
+        self, client_order_id: str, symbol: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up an order by the client order ID it was placed with.
+
+        Args:
+            client_order_id: Client order ID given when placing the order
+            symbol: Trading pair symbol
+
+        Returns:
+            Order in the watch_orders format, or None if the exchange
+            never accepted it
+        """
+        pass
+
+    @abstractmethod
+    async def place_limit_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+        price: Decimal,
+        post_only: bool = True,
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """
+        Place a limit order.
+
+        Args:
+            symbol: Trading pair symbol
+            side: Buy or sell
+            size: Order size in base currency
+            price: Limit price
+            post_only: Reject instead of taking liquidity
+            client_order_id: Optional ID to find the order by if the
+                response is lost
+
+        Returns:
+            Placed order (status OPEN unless it filled or was rejected at once)
+        """
+        pass
+
+    @abstractmethod
+    async def watch_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        """
+        Wait for the next order updates pushed by the exchange.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Updated orders in the get_order_status format, plus
+            "average", "fee" and "fee_currency"
+        """
+        pass
+
+    @abstractmethod
+    async def watch_mark_price(self, symbol: str) -> Decimal:
+        """
+        Wait for the next mark price pushed by the exchange.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            New mark price
+        """
+        pass
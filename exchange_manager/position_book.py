@@ -0,0 +1,218 @@
+"""Local perpetual position book maintained from fills."""
+
+import asyncio
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from models import Clock, SYSTEM_CLOCK, Trade
+from models.trade import OrderSide
+from logger_manager import LoggerManager, LogTag
+from .iexchange import IExchange
+
+
+class PositionBook:
+    """
+    In-memory position of one perpetual, updated from fills.
+
+    Fills arrive from our own order responses (``apply_fill``) and from the
+    exchange's order stream (``apply_order_update``). Both are keyed by
+    order ID and cumulative filled size, so seeing the same fill on both
+    paths counts it once. REST is only used to seed the book and to
+    reconcile it periodically; drift beyond the tolerance is logged and
+    the exchange's figure is adopted.
+    """
+
+    def __init__(
+        self,
+        exchange: IExchange,
+        symbol: str,
+        reconcile_interval_seconds: float = 60.0,
+        drift_tolerance: Decimal = Decimal("0.001"),
+        settle_seconds: float = 2.0,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        """
+        Initialize the position book.
+
+        Args:
+            exchange: Exchange to reconcile against
+            symbol: Perpetual symbol
+            reconcile_interval_seconds: Time between REST reconciliations
+            drift_tolerance: Drift (base currency) tolerated without an alert
+            settle_seconds: Reconciliation waits this long after a fill
+            clock: Time source
+        """
+        self.exchange = exchange
+        self.symbol = symbol
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.drift_tolerance = drift_tolerance
+        self.settle_seconds = settle_seconds
+        self.clock = clock
+        self.logger = LoggerManager()
+
+        # Signed position: negative is short
+        self.position = Decimal("0")
+        self.ready = False
+
+        # Cumulative filled size per order, most recent orders only
+        self._filled: "OrderedDict[str, Decimal]" = OrderedDict()
+        self._max_orders = 1000
+        self._last_fill_at: Optional[float] = None
+        self._tasks: list = []
+
+        # Statistics
+        self.fills_applied = 0
+        self.reconciliations = 0
+        self.drift_alerts = 0
+        self.last_drift = Decimal("0")
+
+    @property
+    def short_size(self) -> Decimal:
+        """Current short position size (0 if flat or long)."""
+        return max(-self.position, Decimal("0"))
+
+    def apply_fill(self, trade: Trade) -> None:
+        """
+        Apply one of our fills.
+
+        Args:
+            trade: Filled trade (size is the order's cumulative fill)
+        """
+        # A fill merged across venues has no per-venue sizes; its legs
+        # arrive separately on the order stream
+        if "," in trade.order_id:
+            return
+        self._record(trade.order_id, trade.side, trade.size)
+
+    def apply_order_update(self, update: Dict[str, Any]) -> None:
+        """
+        Apply an order update from the exchange's order stream.
+
+        Args:
+            update: Order in the ``watch_orders`` format
+        """
+        if update.get("symbol") not in (None, self.symbol) or not update["filled"]:
+            return
+        self._record(str(update["id"]), OrderSide(update["side"]), update["filled"])
+
+    def _record(self, order_id: str, side: OrderSide, filled: Decimal) -> None:
+        """Apply the part of an order's cumulative fill not seen yet."""
+        increment = filled - self._filled.get(order_id, Decimal("0"))
+        if increment <= 0:
+            return
+
+        self._filled[order_id] = filled
+        self._filled.move_to_end(order_id)
+        if len(self._filled) > self._max_orders:
+            self._filled.popitem(last=False)
+
+        self.position += -increment if side == OrderSide.SELL else increment
+        self._last_fill_at = self.clock.monotonic()
+        self.fills_applied += 1
+
+    async def reconcile(self, force: bool = False) -> bool:
+        """
+        Compare the book with the exchange's position and correct drift.
+
+        Args:
+            force: Reconcile even if a fill was applied moments ago
+
+        Returns:
+            True if the book was compared with the exchange (False if a
+            fill landed since the last one, or while REST was asked)
+        """
+        # REST may not reflect a fill applied moments ago yet
+        if (
+            not force
+            and self._last_fill_at is not None
+            and self.clock.monotonic() - self._last_fill_at < self.settle_seconds
+        ):
+            return False
+
+        fills_before = self.fills_applied
+        position = await self.exchange.get_current_perpetual_position(self.symbol)
+        if self.fills_applied != fills_before:
+            # Whether REST includes that fill is unknown: keep the book
+            self.logger.log_debug(
+                "Fill applied during reconciliation - keeping the book",
+                LogTag.EXCHANGE,
+            )
+            return False
+        size = position["size"]
+        actual = -size if position["side"] == "short" else size
+        self.reconciliations += 1
+
+        drift = actual - self.position
+        self.last_drift = drift
+        if self.ready and abs(drift) > self.drift_tolerance:
+            self.drift_alerts += 1
+            self.logger.log_warning(
+                f"Position drift {drift:+f}: book {self.position}, "
+                f"exchange {actual} - adopting exchange position"
+            )
+
+        self.position = actual
+        self.ready = True
+        return True
+
+    async def start(self) -> None:
+        """Seed the book from REST and keep it updated in the background."""
+        await self.reconcile(force=True)
+        self._tasks = [
+            asyncio.create_task(self._watch()),
+            asyncio.create_task(self._reconcile_loop()),
+        ]
+        if self.ready:
+            self.logger.log_info(
+                f"Position book ready: {self.position} {self.symbol}",
+                LogTag.EXCHANGE,
+            )
+
+    async def stop(self) -> None:
+        """Stop background updates."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _watch(self) -> None:
+        """Apply fills from the exchange's order stream."""
+        while True:
+            try:
+                for update in await self.exchange.watch_orders(self.symbol):
+                    self.apply_order_update(update)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.log_error("Position book order stream error", e)
+                await self.clock.sleep(1)
+
+    async def _reconcile_loop(self) -> None:
+        """Reconcile with REST periodically."""
+        while True:
+            await self.clock.sleep(self.reconcile_interval_seconds)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                self.logger.log_error("Position reconciliation failed", e)
+
+    def get_stats(self) -> dict:
+        """
+        Get position book statistics.
+
+        Returns:
+            Dictionary with position, fill and reconciliation counts
+        """
+        return {
+            "position": str(self.position),
+            "ready": self.ready,
+            "fills_applied": self.fills_applied,
+            "reconciliations": self.reconciliations,
+            "drift_alerts": self.drift_alerts,
+            "last_drift": str(self.last_drift),
+        }
@@ -0,0 +1,19 @@
+"""Sliced hedge execution for LPHedgeBot."""
+
+from .execution_engine import (
+    ExecutionEngine,
+    ExecutionStatus,
+    ExecutionStyle,
+    SlicedOrder,
+)
+from .hedge_ledger import HedgeLedger
+from .maker import MakerExecutor
+
+__all__ = [
+    "ExecutionEngine",
+    "ExecutionStatus",
+    "ExecutionStyle",
+    "HedgeLedger",
+    "MakerExecutor",
+    "SlicedOrder",
+]
@@ -0,0 +1,387 @@
+"""Sliced (TWAP / depth-aware) execution of hedge orders."""
+
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Callable, List, Optional
+
+from config_manager import Config
+from exchange_manager import IExchange
+from logger_manager import LoggerManager, LogTag
+from models import AssetPair, Clock, HedgeSnapshot, SYSTEM_CLOCK, Trade
+from models.hedge_snapshot import HedgeAction
+from .hedge_ledger import HedgeLedger
+from .maker import MakerExecutor
+
+
+class ExecutionStyle(Enum):
+    """How a parent hedge is split into child orders."""
+
+    TWAP = "twap"  # Equal slices spread evenly over the duration
+    DEPTH = "depth"  # Slices sized to a fraction of the visible book
+    MAKER = "maker"  # Post-only orders chased at the top of the book
+
+
+class ExecutionStatus(Enum):
+    """Status of a sliced hedge."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+@dataclass
+class SlicedOrder:
+    """
+    A parent hedge executed as a series of child orders.
+
+    Attributes:
+        parent_id: ID shared by the parent hedge and its child trades
+        action: Open or close short
+        target_size: Total size to execute (positive, may be retargeted)
+        delta_before: Delta when the hedge started
+        leverage: Leverage for child orders
+        style: Slicing style
+        started_at: When the hedge started
+        children: Filled child trades
+        status: Execution status
+        error_message: Error if a child order failed
+        symbol: Perpetual the hedge is traded on
+    """
+
+    parent_id: str
+    action: HedgeAction
+    target_size: Decimal
+    delta_before: Decimal
+    leverage: Decimal
+    style: ExecutionStyle
+    started_at: datetime
+    children: List[Trade] = field(default_factory=list)
+    status: ExecutionStatus = ExecutionStatus.RUNNING
+    error_message: Optional[str] = None
+    symbol: Optional[str] = None
+
+    @property
+    def filled_size(self) -> Decimal:
+        """Total size filled by child orders."""
+        return sum((trade.size for trade in self.children), Decimal("0"))
+
+    @property
+    def remaining_size(self) -> Decimal:
+        """Size still to execute."""
+        return max(self.target_size - self.filled_size, Decimal("0"))
+
+    @property
+    def average_price(self) -> Decimal:
+        """Volume-weighted average fill price."""
+        filled = self.filled_size
+        if filled == 0:
+            return Decimal("0")
+        return sum(trade.size * trade.price for trade in self.children) / filled
+
+    @property
+    def delta_after(self) -> Decimal:
+        """Delta after the fills so far."""
+        if self.action == HedgeAction.OPEN_SHORT:
+            return self.delta_before - self.filled_size
+        return self.delta_before + self.filled_size
+
+    def to_hedge_snapshot(self, now: Optional[datetime] = None) -> HedgeSnapshot:
+        """
+        Build the parent HedgeSnapshot, linked to its child trades.
+
+        Args:
+            now: Time on the engine's clock, used if nothing filled
+                (default: when the hedge started)
+
+        Returns:
+            HedgeSnapshot for the parent hedge
+        """
+        last_fill = self.children[-1].timestamp if self.children else None
+        return HedgeSnapshot(
+            action=self.action,
+            size=self.filled_size,
+            price=self.average_price,
+            timestamp=last_fill or now or self.started_at,
+            delta_before=self.delta_before,
+            delta_after=self.delta_after,
+            leverage=self.leverage,
+            exchange=self.children[0].exchange if self.children else "binance",
+            order_id=self.parent_id,
+            success=self.status == ExecutionStatus.COMPLETED and bool(self.children),
+            error_message=self.error_message,
+            child_trades=list(self.children),
+            symbol=self.symbol,
+        )
+
+
+class ExecutionEngine:
+    """
+    Executes large hedges as child orders in a cancellable background task.
+
+    One parent hedge runs at a time. New snapshots retarget the running
+    hedge instead of starting another one.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        exchange: IExchange,
+        on_fill: Optional[Callable[[SlicedOrder, Trade], None]] = None,
+        on_complete: Optional[Callable[[SlicedOrder], None]] = None,
+        clock: Clock = SYSTEM_CLOCK,
+        ledger: Optional[HedgeLedger] = None,
+        asset: Optional[AssetPair] = None,
+    ):
+        """
+        Initialize the execution engine.
+
+        Args:
+            config: Configuration object
+            exchange: Exchange interface for trading
+            on_fill: Called after each child fill
+            on_complete: Called once when a parent hedge finishes
+            clock: Time source (virtual in backtests)
+            ledger: Hedge order lifecycle shared with single-order hedges
+            asset: Pool and perp traded, with the perp's order size increment
+        """
+        self.config = config
+        self.clock = clock
+        self.exchange = exchange
+        self.on_fill = on_fill
+        self.on_complete = on_complete
+        self.asset = asset or AssetPair(config.eulerswap_pool, config.symbol_perpetual)
+        self.logger = LoggerManager()
+
+        self.ledger = ledger or HedgeLedger(
+            exchange, ack_timeout_seconds=config.order_ack_timeout_seconds, clock=clock
+        )
+        self.maker = MakerExecutor(config, exchange, self.ledger, clock=clock)
+        self.active: Optional[SlicedOrder] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = asyncio.Event()
+
+    @property
+    def is_active(self) -> bool:
+        """Whether a parent hedge is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(
+        self, hedge_size: Decimal, delta_before: Decimal, leverage: Decimal
+    ) -> SlicedOrder:
+        """
+        Start executing a hedge in slices.
+
+        Args:
+            hedge_size: Hedge size (positive = open short, negative = close short)
+            delta_before: Delta before the hedge
+            leverage: Leverage for child orders
+
+        Returns:
+            The running SlicedOrder
+
+        Raises:
+            RuntimeError: If a hedge is already running
+        """
+        if self.is_active:
+            raise RuntimeError("A sliced hedge is already running")
+
+        order = SlicedOrder(
+            parent_id=uuid.uuid4().hex,
+            action=(
+                HedgeAction.OPEN_SHORT if hedge_size > 0 else HedgeAction.CLOSE_SHORT
+            ),
+            target_size=abs(hedge_size),
+            delta_before=delta_before,
+            leverage=leverage,
+            style=ExecutionStyle(self.config.execution_style),
+            started_at=self.clock.utcnow(),
+            symbol=self.asset.symbol,
+        )
+        self.active = order
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run(order))
+
+        self.logger.log_info(
+            f"Started {order.style.value} hedge {order.parent_id[:8]}: "
+            f"{order.action.value} {order.target_size} ETH",
+            LogTag.STRATEGY,
+        )
+        return order
+
+    def retarget(self, delta: Decimal) -> None:
+        """
+        Adjust the running hedge to the latest delta.
+
+        Args:
+            delta: Current delta (already reflects fills seen by the exchange)
+        """
+        order = self.active
+        if order is None or not self.is_active:
+            return
+
+        # Same sign as the original delta: keep hedging what is left
+        same_direction = (delta > 0) == (order.action == HedgeAction.OPEN_SHORT)
+        remaining = abs(delta) if same_direction else Decimal("0")
+        order.target_size = order.filled_size + remaining
+
+        self.logger.log_debug(
+            f"Retargeted hedge {order.parent_id[:8]}: {remaining} ETH remaining",
+            LogTag.STRATEGY,
+        )
+
+    async def cancel(self) -> Optional[SlicedOrder]:
+        """
+        Cancel the running hedge after any in-flight child order.
+
+        A child order already sent is allowed to complete so its fill is
+        recorded; no further slices are placed.
+
+        Returns:
+            The cancelled SlicedOrder, or None if nothing was running
+        """
+        if not self.is_active:
+            return None
+
+        self._stop.set()
+        await asyncio.shield(self._task)
+        return self.active
+
+    async def wait(self) -> Optional[SlicedOrder]:
+        """
+        Wait for the running hedge to finish.
+
+        Returns:
+            The finished SlicedOrder, or None if nothing was running
+        """
+        if self._task is not None:
+            await asyncio.shield(self._task)
+        return self.active
+
+    async def _run(self, order: SlicedOrder) -> None:
+        """Place child orders until the target is met, cancelled or failed."""
+        interval = self.config.twap_duration_seconds / self.config.twap_slices
+        try:
+            while (
+                not self._stop.is_set()
+                and order.remaining_size >= self.config.min_hedge_size_eth
+            ):
+                size = await self._next_slice_size(order)
+                if not size:
+                    break
+                for trade in await self._place_children(order, size):
+                    order.children.append(trade)
+                    if self.on_fill:
+                        self.on_fill(order, trade)
+
+                if (
+                    order.style != ExecutionStyle.MAKER
+                    and order.remaining_size >= self.config.min_hedge_size_eth
+                ):
+                    await self._sleep(interval)
+
+            order.status = (
+                ExecutionStatus.CANCELLED
+                if self._stop.is_set()
+                else ExecutionStatus.COMPLETED
+            )
+
+        except asyncio.CancelledError:
+            order.status = ExecutionStatus.CANCELLED
+            raise
+
+        except Exception as e:
+            self.logger.log_error(f"Sliced hedge {order.parent_id[:8]} failed", e)
+            order.status = ExecutionStatus.FAILED
+            order.error_message = str(e)
+
+        finally:
+            self.logger.log_info(
+                f"Hedge {order.parent_id[:8]} {order.status.value}: "
+                f"{order.filled_size}/{order.target_size} ETH in "
+                f"{len(order.children)} slice(s) @ {order.average_price:.2f}",
+                LogTag.STRATEGY,
+            )
+            if self.on_complete:
+                self.on_complete(order)
+
+    async def _sleep(self, seconds: float) -> None:
+        """Wait between slices, waking early on cancel."""
+        if seconds <= 0:
+            return
+        stop = asyncio.ensure_future(self._stop.wait())
+        sleep = asyncio.ensure_future(self.clock.sleep(seconds))
+        try:
+            await asyncio.wait({stop, sleep}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop.cancel()
+            sleep.cancel()
+
+    async def _next_slice_size(self, order: SlicedOrder) -> Decimal:
+        """Size of the next child order."""
+        remaining = order.remaining_size
+
+        if order.style == ExecutionStyle.MAKER:
+            # One resting order works the whole remainder
+            size = remaining
+        elif order.style == ExecutionStyle.DEPTH:
+            size = await self._depth_slice(order) or remaining
+        else:
+            slices_left = max(self.config.twap_slices - len(order.children), 1)
+            size = remaining / slices_left
+
+        # Never below the exchange minimum, never beyond what is left, and
+        # in whole order-size increments
+        size = min(max(size, self.config.min_hedge_size_eth), remaining)
+        return self.asset.round_size(size)
+
+    async def _depth_slice(self, order: SlicedOrder) -> Optional[Decimal]:
+        """Participation-limited size from the visible book within slippage."""
+        book = await self.exchange.get_order_book(self.config.symbol_perpetual)
+
+        # Selling to open a short hits bids; buying to close lifts asks
+        levels = (
+            book["bids"] if order.action == HedgeAction.OPEN_SHORT else book["asks"]
+        )
+        if not levels:
+            return None
+
+        best = levels[0][0]
+        max_move = best * self.config.max_slippage_percent / 100
+        visible = sum(
+            (amount for price, amount in levels if abs(price - best) <= max_move),
+            Decimal("0"),
+        )
+        return visible * self.config.depth_participation
+
+    async def _place_children(self, order: SlicedOrder, size: Decimal) -> List[Trade]:
+        """Execute one slice, as a market order or worked as maker."""
+        if order.style == ExecutionStyle.MAKER:
+            trades = await self.maker.execute(
+                order.action,
+                size,
+                order.leverage,
+                self._stop,
+                key=f"{order.parent_id}:{len(order.children)}",
+            )
+        else:
+            trades = [await self._place_child(order, size)]
+
+        for trade in trades:
+            trade.parent_order_id = order.parent_id
+        return trades
+
+    async def _place_child(self, order: SlicedOrder, size: Decimal) -> Trade:
+        """Place one child market order."""
+        intent = self.ledger.intent(
+            f"{order.parent_id}:{len(order.children)}",
+            self.config.symbol_perpetual,
+            order.action,
+            size,
+            order.leverage,
+        )
+        return await self.ledger.submit(intent)
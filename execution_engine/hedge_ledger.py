@@ -0,0 +1,457 @@
+"""Idempotent hedge order lifecycle with client order IDs."""
+
+import asyncio
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from models import Clock, HedgeIntent, SYSTEM_CLOCK, Trade
+from models.hedge_intent import HedgeState, client_order_id
+from models.hedge_snapshot import HedgeAction
+from models.trade import OrderStatus, OrderType
+from exchange_manager import IExchange
+from database_manager import DatabaseManager
+from logger_manager import LoggerManager, LogTag
+
+
+class HedgeLedger:
+    """
+    Drives hedge orders through intent → submitted → acked → filled/failed.
+
+    Every order carries a deterministic client order ID and is persisted as
+    SUBMITTED before it is sent. When the response is lost (timeout, network
+    error, restart) the order is looked up by client ID instead of being
+    sent again, so an order the exchange accepted is never doubled. Until
+    such an order is resolved, ``has_unresolved`` tells callers to hold off
+    new hedges.
+    """
+
+    def __init__(
+        self,
+        exchange: IExchange,
+        database_manager: Optional[DatabaseManager] = None,
+        ack_timeout_seconds: float = 10.0,
+        resolve_attempts: int = 3,
+        resolve_delay_seconds: float = 1.0,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        """
+        Initialize the hedge ledger.
+
+        Args:
+            exchange: Exchange to place and look up orders on
+            database_manager: Optional database for in-flight state
+            ack_timeout_seconds: Time to wait for an order response
+            resolve_attempts: Lookups by client ID before giving up
+            resolve_delay_seconds: Time between lookups
+            clock: Time source
+        """
+        self.exchange = exchange
+        self.database_manager = database_manager
+        self.ack_timeout_seconds = ack_timeout_seconds
+        self.resolve_attempts = resolve_attempts
+        self.resolve_delay_seconds = resolve_delay_seconds
+        self.clock = clock
+        self.logger = LoggerManager()
+
+        # Unresolved intents, and recently resolved ones to dedupe resubmits
+        self.pending: Dict[str, HedgeIntent] = {}
+        self._recent: "OrderedDict[str, HedgeIntent]" = OrderedDict()
+        self._max_recent = 500
+        # Resting orders settled by the caller working them, not by lookup
+        self._worked: set = set()
+
+        # Statistics
+        self.submitted = 0
+        self.filled = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.resolved_by_lookup = 0
+
+    @property
+    def has_unresolved(self) -> bool:
+        """Whether an order's outcome on the exchange is unknown."""
+        return bool(self.pending)
+
+    def intent(
+        self,
+        key: str,
+        symbol: str,
+        action: HedgeAction,
+        size: Decimal,
+        leverage: Decimal = Decimal("1"),
+    ) -> HedgeIntent:
+        """
+        Record the decision to hedge.
+
+        The same key gives the same intent back while it is in flight or
+        filled, so deciding the same hedge twice sends it once.
+
+        Args:
+            key: Identity of the hedge (the client order ID is derived from it)
+            symbol: Trading pair symbol
+            action: Open or close short
+            size: Order size
+            leverage: Leverage for opening orders
+
+        Returns:
+            The HedgeIntent
+        """
+        cid = client_order_id(key)
+        existing = self.pending.get(cid) or self._recent.get(cid)
+        if existing is not None and existing.state != HedgeState.FAILED:
+            return existing
+
+        now = self.clock.utcnow()
+        return HedgeIntent(
+            client_order_id=cid,
+            symbol=symbol,
+            action=action,
+            size=size,
+            leverage=leverage,
+            created_at=now,
+            updated_at=now,
+        )
+
+    async def submit(self, intent: HedgeIntent) -> Trade:
+        """
+        Send a hedge order, or resolve it if it was already sent.
+
+        Args:
+            intent: Intent from ``intent``
+
+        A fill is returned once, by the call that settles the intent: an
+        order accepted but not yet filled stays pending and its fill is
+        returned by ``resolve_pending`` instead.
+
+        Returns:
+            The fill
+
+        Raises:
+            Exception: If the order failed, was already filled, or its
+                outcome is still unknown (the intent then stays pending)
+        """
+        if intent.state == HedgeState.FILLED:
+            raise RuntimeError(f"Hedge {intent.client_order_id} is already filled")
+        if intent.state in (HedgeState.SUBMITTED, HedgeState.ACKED):
+            trade = await self.resolve(intent)
+            if trade is None:
+                raise RuntimeError(
+                    f"Hedge {intent.client_order_id} is {intent.state.value}"
+                )
+            return trade
+
+        # Persisted before sending: a crash from here on is resolved by lookup
+        intent.error_message = None
+        self._transition(intent, HedgeState.SUBMITTED)
+        self.submitted += 1
+
+        try:
+            trade = await asyncio.wait_for(
+                self._place(intent), self.ack_timeout_seconds
+            )
+        except Exception as e:
+            timed_out = isinstance(e, asyncio.TimeoutError)
+            if timed_out:
+                self.timeouts += 1
+            intent.error_message = str(e) or type(e).__name__
+            self.logger.log_warning(
+                f"Hedge {intent.client_order_id} outcome unknown "
+                f"({intent.error_message}) - resolving by client ID"
+            )
+            trade = await self.resolve(intent, wait_first=timed_out)
+            if trade is None:
+                raise
+            return trade
+
+        intent.order_id = trade.order_id
+        intent.filled_size = trade.size
+        intent.price = trade.price
+        if trade.status == OrderStatus.FILLED:
+            intent.state = HedgeState.ACKED
+            self._transition(intent, HedgeState.FILLED)
+            return trade
+
+        # Accepted but not filled yet: its fill is booked once it settles
+        self._transition(intent, HedgeState.ACKED)
+        trade = await self.resolve(intent, wait_first=True)
+        if trade is None:
+            raise RuntimeError(
+                f"Hedge {intent.client_order_id} is {intent.state.value}"
+            )
+        return trade
+
+    async def post(self, intent: HedgeIntent, price: Decimal) -> Dict[str, Any]:
+        """
+        Place the intent as a post-only limit order.
+
+        The order is worked by the caller, which settles it with ``settle``
+        once it is done; until then the intent stays pending.
+
+        Args:
+            intent: Intent from ``intent``
+            price: Limit price
+
+        Returns:
+            The resting order
+
+        Raises:
+            Exception: If the order was not placed, or its outcome is still
+                unknown (the intent then stays pending)
+        """
+        intent.error_message = None
+        self._transition(intent, HedgeState.SUBMITTED)
+        self.submitted += 1
+
+        try:
+            trade = await asyncio.wait_for(
+                self.exchange.place_limit_order(
+                    intent.symbol,
+                    intent.side,
+                    intent.size,
+                    price,
+                    post_only=True,
+                    client_order_id=intent.client_order_id,
+                ),
+                self.ack_timeout_seconds,
+            )
+        except Exception as e:
+            timed_out = isinstance(e, asyncio.TimeoutError)
+            if timed_out:
+                self.timeouts += 1
+            intent.error_message = str(e) or type(e).__name__
+            order = await self._lookup(intent, wait_first=timed_out)
+            if order is None:
+                raise
+        else:
+            order = {
+                "id": trade.order_id,
+                "type": "limit",
+                "status": "open",
+                "filled": Decimal("0"),
+                "price": price,
+            }
+
+        intent.order_id = order["id"]
+        intent.price = price
+        self._transition(intent, HedgeState.ACKED)
+        self._worked.add(intent.client_order_id)
+        return order
+
+    def settle(self, intent: HedgeIntent, order: Dict[str, Any]) -> Optional[Trade]:
+        """
+        Settle a worked order from its final state on the exchange.
+
+        Args:
+            intent: Intent the order was placed for
+            order: The order, filled, canceled or rejected
+
+        An order still open is handed to ``resolve_pending``.
+
+        Returns:
+            The fill, or None if nothing filled (or it was already settled)
+        """
+        self.release(intent)
+        return self._apply_order(intent, order)
+
+    def release(self, intent: HedgeIntent) -> None:
+        """
+        Stop working a posted order; lookups settle it from now on.
+
+        Args:
+            intent: Intent the order was placed for
+        """
+        self._worked.discard(intent.client_order_id)
+
+    async def _place(self, intent: HedgeIntent) -> Trade:
+        """Send the intent's market order with its client ID."""
+        if intent.action == HedgeAction.OPEN_SHORT:
+            return await self.exchange.open_short_position(
+                symbol=intent.symbol,
+                size=intent.size,
+                leverage=intent.leverage,
+                client_order_id=intent.client_order_id,
+            )
+        return await self.exchange.close_short_position(
+            symbol=intent.symbol,
+            size=intent.size,
+            client_order_id=intent.client_order_id,
+        )
+
+    async def resolve(
+        self, intent: HedgeIntent, wait_first: bool = False
+    ) -> Optional[Trade]:
+        """
+        Settle an intent's outcome by looking its order up by client ID.
+
+        Args:
+            intent: Intent that was (or may have been) sent
+            wait_first: Give an order still in transit time to land first
+
+        Returns:
+            The fill if the order filled, None if it failed or is unresolved
+        """
+        order = await self._lookup(intent, wait_first)
+        if order is None:
+            return None
+        return self._apply_order(intent, order)
+
+    async def _lookup(
+        self, intent: HedgeIntent, wait_first: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Find an intent's order by client ID, failing it if there is none."""
+        for attempt in range(self.resolve_attempts):
+            if attempt or wait_first:
+                await self.clock.sleep(self.resolve_delay_seconds)
+            if intent.is_resolved:
+                # Settled by another caller while waiting
+                return None
+            try:
+                order = await self.exchange.get_order_by_client_id(
+                    intent.client_order_id, intent.symbol
+                )
+            except Exception as e:
+                self.logger.log_error(
+                    f"Lookup of hedge {intent.client_order_id} failed", e
+                )
+                continue
+
+            if order is None:
+                # The exchange has no such order: it was never placed
+                intent.error_message = intent.error_message or "Order not found"
+                self._transition(intent, HedgeState.FAILED)
+                return None
+
+            self.resolved_by_lookup += 1
+            return order
+
+        self.logger.log_warning(
+            f"Hedge {intent.client_order_id} still unresolved - "
+            "new hedges wait for it"
+        )
+        return None
+
+    def _apply_order(
+        self, intent: HedgeIntent, order: Dict[str, Any]
+    ) -> Optional[Trade]:
+        """Move an intent to the state of its order on the exchange."""
+        if intent.is_resolved:
+            # Its fill was already returned once
+            return None
+        intent.order_id = order["id"]
+        intent.filled_size = order["filled"]
+        intent.price = order.get("average") or order.get("price")
+
+        if order["status"] == "open":
+            self._transition(intent, HedgeState.ACKED)
+            return None
+        if not intent.filled_size:
+            self._transition(intent, HedgeState.FAILED)
+            return None
+
+        self._transition(intent, HedgeState.FILLED)
+        self.logger.log_info(
+            f"Hedge {intent.client_order_id} found filled: "
+            f"{intent.filled_size} @ {intent.price}",
+            LogTag.STRATEGY,
+        )
+        return self._trade(intent, order)
+
+    def _trade(self, intent: HedgeIntent, order: Dict[str, Any]) -> Trade:
+        """Trade for a filled intent."""
+        trade = Trade(
+            symbol=intent.symbol,
+            side=intent.side,
+            order_type=(
+                OrderType.LIMIT if order.get("type") == "limit" else OrderType.MARKET
+            ),
+            size=intent.filled_size,
+            price=intent.price or Decimal("0"),
+            timestamp=intent.updated_at,
+            order_id=intent.order_id or intent.client_order_id,
+            status=OrderStatus.FILLED,
+            fee=order.get("fee"),
+            fee_currency=order.get("fee_currency"),
+        )
+        if order.get("exchange"):
+            trade.exchange = order["exchange"]
+        return trade
+
+    def _transition(self, intent: HedgeIntent, state: HedgeState) -> None:
+        """Change an intent's state and persist it."""
+        intent.state = state
+        intent.updated_at = self.clock.utcnow()
+
+        if intent.is_resolved:
+            self.pending.pop(intent.client_order_id, None)
+            self._recent[intent.client_order_id] = intent
+            self._recent.move_to_end(intent.client_order_id)
+            if len(self._recent) > self._max_recent:
+                self._recent.popitem(last=False)
+            if state == HedgeState.FILLED:
+                self.filled += 1
+            else:
+                self.failed += 1
+        else:
+            self.pending[intent.client_order_id] = intent
+
+        if self.database_manager:
+            try:
+                self.database_manager.save_hedge_intent(intent)
+            except Exception as e:
+                self.logger.log_error(
+                    f"Failed to persist hedge {intent.client_order_id}", e
+                )
+
+    async def resolve_pending(self) -> List[Trade]:
+        """
+        Try to settle every unresolved intent.
+
+        Returns:
+            Fills found for them
+        """
+        trades = []
+        for intent in list(self.pending.values()):
+            if intent.client_order_id in self._worked:
+                continue
+            trade = await self.resolve(intent)
+            if trade is not None:
+                trades.append(trade)
+        return trades
+
+    async def recover(self) -> List[Trade]:
+        """
+        Load in-flight intents persisted before a restart and settle them.
+
+        Returns:
+            Fills found for them
+        """
+        if self.database_manager is None:
+            return []
+
+        for intent in self.database_manager.get_unresolved_hedge_intents():
+            self.pending[intent.client_order_id] = intent
+        if not self.pending:
+            return []
+
+        self.logger.log_info(
+            f"Resolving {len(self.pending)} hedge(s) in flight before restart",
+            LogTag.STRATEGY,
+        )
+        return await self.resolve_pending()
+
+    def get_stats(self) -> dict:
+        """
+        Get hedge lifecycle statistics.
+
+        Returns:
+            Dictionary of order counts by outcome
+        """
+        return {
+            "submitted": self.submitted,
+            "filled": self.filled,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "resolved_by_lookup": self.resolved_by_lookup,
+            "unresolved": sorted(self.pending),
+        }
@@ -0,0 +1,347 @@
+"""Post-only maker execution with order chasing."""
+
+import asyncio
+import itertools
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from config_manager import Config
+from exchange_manager import IExchange
+from logger_manager import LoggerManager, LogTag
+from models import Clock, HedgeIntent, SYSTEM_CLOCK, Trade
+from models.hedge_snapshot import HedgeAction
+from models.trade import OrderSide
+from .hedge_ledger import HedgeLedger
+
+# Order states after which no further fills arrive
+TERMINAL_STATUSES = ("closed", "canceled", "expired", "rejected")
+
+# Order status polls confirming a cancel the order stream did not report
+CANCEL_CONFIRM_ATTEMPTS = 10
+
+
+class MakerExecutor:
+    """
+    Works a hedge as a post-only limit order at the top of the book.
+
+    The order rests at the best price on its own side of the book and is
+    repriced ("chased") when the book moves, but never beyond the slippage
+    budget measured from the first quote. Whatever is unfilled at the
+    deadline is sent as a market order.
+
+    Order state comes from the exchange's order stream; the REST order
+    endpoints are only used to place and cancel, and to confirm a cancel
+    the stream has not reported within a chase interval. Every order, the
+    market fallback included, goes through the hedge ledger with a client
+    order ID, so a lost response is looked up instead of leaving an
+    unknown order on the book.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        exchange: IExchange,
+        ledger: Optional[HedgeLedger] = None,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        """
+        Initialize the maker executor.
+
+        Args:
+            config: Configuration object
+            exchange: Exchange interface for trading
+            ledger: Hedge order lifecycle (shared with the other executors)
+            clock: Time source
+        """
+        self.config = config
+        self.exchange = exchange
+        self.clock = clock
+        self.ledger = ledger or HedgeLedger(
+            exchange, ack_timeout_seconds=config.order_ack_timeout_seconds, clock=clock
+        )
+        self.symbol = config.symbol_perpetual
+        self.logger = LoggerManager()
+
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._intents: Dict[str, HedgeIntent] = {}
+        self._sequence = itertools.count()
+        self._updated = asyncio.Condition()
+        self._watch_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.orders_placed = 0
+        self.reprices = 0
+        self.maker_filled = Decimal("0")
+        self.taker_filled = Decimal("0")
+
+    async def execute(
+        self,
+        action: HedgeAction,
+        size: Decimal,
+        leverage: Decimal,
+        stop: Optional[asyncio.Event] = None,
+        key: Optional[str] = None,
+    ) -> List[Trade]:
+        """
+        Execute a hedge as maker, falling back to market at the deadline.
+
+        Args:
+            action: Open or close short
+            size: Size to execute (positive)
+            leverage: Leverage for opening shorts
+            stop: When set, the resting order is cancelled and no market
+                fallback is sent
+            key: Identity of the hedge its orders' client IDs derive from
+
+        Returns:
+            Filled trades, maker fills first
+        """
+        self._start_watcher()
+        stop = stop or asyncio.Event()
+        key = key or uuid.uuid4().hex
+        side = OrderSide.SELL if action == HedgeAction.OPEN_SHORT else OrderSide.BUY
+        if action == HedgeAction.OPEN_SHORT:
+            await self.exchange.set_leverage(self.symbol, leverage)
+
+        try:
+            trades = await self._work(action, side, size, leverage, stop, key)
+        finally:
+            # Orders an error left resting are settled by lookup from now on
+            for order_id in list(self._intents):
+                self.ledger.release(self._intents.pop(order_id))
+                self._orders.pop(order_id, None)
+
+        self.maker_filled += self._filled(trades, None)
+        remaining = size - self._filled(trades, None)
+        if not stop.is_set() and remaining >= self.config.min_hedge_size_eth:
+            self.logger.log_info(
+                f"Maker deadline reached, sending {remaining} ETH at market",
+                LogTag.EXCHANGE,
+            )
+            intent = self.ledger.intent(
+                f"{key}:{next(self._sequence)}",
+                self.symbol,
+                action,
+                remaining,
+                leverage,
+            )
+            trade = await self.ledger.submit(intent)
+            self.taker_filled += trade.size
+            trades.append(trade)
+
+        return trades
+
+    async def _work(
+        self,
+        action: HedgeAction,
+        side: OrderSide,
+        size: Decimal,
+        leverage: Decimal,
+        stop: asyncio.Event,
+        key: str,
+    ) -> List[Trade]:
+        """Rest and chase post-only orders until filled, stopped or the deadline."""
+        chase_interval = self.config.maker_chase_interval_ms / 1000
+        deadline = self.clock.monotonic() + self.config.maker_deadline_seconds
+        trades: List[Trade] = []
+        anchor: Optional[Decimal] = None
+        order_id: Optional[str] = None
+        quoted: Optional[Decimal] = None
+
+        while not stop.is_set() and self.clock.monotonic() < deadline:
+            remaining = size - self._filled(trades, order_id)
+            if remaining < self.config.min_hedge_size_eth:
+                break
+
+            price = await self._quote(side)
+            if price is None:
+                await self._wait(order_id, chase_interval)
+                continue
+            anchor = anchor or price
+            price = self._clamp(side, price, anchor)
+
+            if order_id is None or price != quoted:
+                if order_id is not None:
+                    self.reprices += 1
+                    trades += await self._retire(order_id)
+                    remaining = size - self._filled(trades, None)
+                    if remaining < self.config.min_hedge_size_eth:
+                        order_id = None
+                        break
+                order_id = await self._post(action, key, remaining, price, leverage)
+                quoted = price
+
+            await self._wait(
+                order_id,
+                min(chase_interval, max(deadline - self.clock.monotonic(), 0)),
+            )
+            if self._status(order_id) in TERMINAL_STATUSES:
+                # Filled, or rejected for crossing the book: post again
+                trades += self._collect(order_id)
+                order_id = None
+
+        if order_id is not None:
+            trades += await self._retire(order_id)
+        return trades
+
+    async def close(self) -> None:
+        """Stop consuming the order stream."""
+        if self._watch_task is None:
+            return
+        self._watch_task.cancel()
+        try:
+            await self._watch_task
+        except asyncio.CancelledError:
+            pass
+        self._watch_task = None
+
+    def _start_watcher(self) -> None:
+        """Start consuming order events if not already running."""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch())
+
+    async def _watch(self) -> None:
+        """Route order events to the orders being worked."""
+        while True:
+            try:
+                updates = await self.exchange.watch_orders(self.symbol)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.log_error("Order stream error", e)
+                await self.clock.sleep(1)
+                continue
+
+            async with self._updated:
+                for update in updates:
+                    self._orders[update["id"]] = update
+                self._updated.notify_all()
+
+    async def _wait(self, order_id: Optional[str], timeout: float) -> None:
+        """Wait until the order reaches a terminal state or the timeout."""
+        if order_id is None:
+            await self.clock.sleep(timeout)
+            return
+        if self._status(order_id) in TERMINAL_STATUSES:
+            return
+
+        async def terminal() -> None:
+            async with self._updated:
+                await self._updated.wait_for(
+                    lambda: self._status(order_id) in TERMINAL_STATUSES
+                )
+
+        done = asyncio.ensure_future(terminal())
+        sleep = asyncio.ensure_future(self.clock.sleep(timeout))
+        try:
+            await asyncio.wait({done, sleep}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            done.cancel()
+            sleep.cancel()
+
+    async def _quote(self, side: OrderSide) -> Optional[Decimal]:
+        """Best price on our own side of the book."""
+        book = await self.exchange.get_order_book(self.symbol, limit=5)
+        levels = book["asks"] if side == OrderSide.SELL else book["bids"]
+        return levels[0][0] if levels else None
+
+    def _clamp(self, side: OrderSide, price: Decimal, anchor: Decimal) -> Decimal:
+        """Keep the chase within the slippage budget from the first quote."""
+        budget = anchor * self.config.max_slippage_percent / 100
+        if side == OrderSide.SELL:
+            return max(price, anchor - budget)
+        return min(price, anchor + budget)
+
+    async def _post(
+        self,
+        action: HedgeAction,
+        key: str,
+        size: Decimal,
+        price: Decimal,
+        leverage: Decimal,
+    ) -> str:
+        """Place a post-only order through the ledger and return its ID."""
+        intent = self.ledger.intent(
+            f"{key}:{next(self._sequence)}", self.symbol, action, size, leverage
+        )
+        order = await self.ledger.post(intent, price)
+        order_id = order["id"]
+        self.orders_placed += 1
+        self._orders.setdefault(order_id, order)
+        self._intents[order_id] = intent
+        self.logger.log_debug(
+            f"Posted {intent.side.value} {size} @ {price} ({order_id})",
+            LogTag.EXCHANGE,
+        )
+        return order_id
+
+    async def _retire(self, order_id: str) -> List[Trade]:
+        """Cancel a resting order and collect what it filled."""
+        if self._status(order_id) not in TERMINAL_STATUSES:
+            await self.exchange.cancel_order(order_id, self.symbol)
+            await self._wait(order_id, self.config.maker_chase_interval_ms / 1000)
+        if self._status(order_id) not in TERMINAL_STATUSES:
+            await self._confirm_cancel(order_id)
+        return self._collect(order_id)
+
+    async def _confirm_cancel(self, order_id: str) -> None:
+        """
+        Poll a cancelled order until it is final.
+
+        Fills can still arrive between the cancel and its acknowledgement,
+        so what is left to hedge is only known once the order is done.
+
+        Raises:
+            RuntimeError: If the order is still not final (it is then
+                settled by the ledger's lookups)
+        """
+        interval = self.config.maker_chase_interval_ms / 1000
+        for attempt in range(CANCEL_CONFIRM_ATTEMPTS):
+            if attempt:
+                await self.clock.sleep(interval)
+            try:
+                order = await self.exchange.get_order_status(order_id, self.symbol)
+            except Exception as e:
+                self.logger.log_error(f"Status of order {order_id} failed", e)
+                continue
+            # Keep stream fields the REST response lacks
+            self._orders[order_id] = {**self._orders.get(order_id, {}), **order}
+            if order["status"] in TERMINAL_STATUSES:
+                return
+        raise RuntimeError(f"Cancel of order {order_id} not confirmed")
+
+    def _collect(self, order_id: str) -> List[Trade]:
+        """Settle an order's fills in the ledger and forget the order."""
+        order = self._orders.pop(order_id, None)
+        intent = self._intents.pop(order_id, None)
+        if order is None or intent is None:
+            return []
+        trade = self.ledger.settle(intent, order)
+        return [trade] if trade is not None else []
+
+    def _status(self, order_id: str) -> Optional[str]:
+        """Latest known status of an order."""
+        order = self._orders.get(order_id)
+        return order["status"] if order else None
+
+    def _filled(self, trades: List[Trade], order_id: Optional[str]) -> Decimal:
+        """Size filled by collected trades plus the resting order."""
+        filled = sum((trade.size for trade in trades), Decimal("0"))
+        if order_id is not None:
+            filled += self._orders.get(order_id, {}).get("filled", Decimal("0"))
+        return filled
+
+    def get_stats(self) -> dict:
+        """
+        Get maker execution statistics.
+
+        Returns:
+            Dictionary with order counts and maker/taker volume
+        """
+        return {
+            "orders_placed": self.orders_placed,
+            "reprices": self.reprices,
+            "maker_filled": str(self.maker_filled),
+            "taker_filled": str(self.taker_filled),
+        }
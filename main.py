@@ -2,18 +2,32 @@
 """Main entry point for LPHedgeBot."""
 
 import asyncio
+import functools
 import signal
 import sys
+import time
+from decimal import Decimal
+from typing import Coroutine, Optional, Set
 from pathlib import Path
 
 from config_manager import ConfigManager
 from database_manager import DatabaseManager
-from exchange_manager import BinanceExchange
+from exchange_manager import PositionBook
 from logger_manager import LoggerManager, LogTag
-from risk_manager import RiskManager
-from strategy_engine import StrategyEngine
+from risk_manager import KillSwitch, RiskManager
+from shadow_engine import ShadowRunner
+from stress_engine import HedgeBand, PoolCurve
+from strategy_engine import (
+    PortfolioHedger,
+    StrategyEngine,
+    load_checkpoint,
+    save_checkpoint,
+)
 from swap_monitor import SwapMonitor
 
+CHECKPOINT_INTERVAL_SECONDS = 60
+PIPELINE_REPORT_INTERVAL_SECONDS = 60
+
 
 class LPHedgeBot:
     """Main bot orchestrator."""
@@ -27,29 +41,168 @@ class LPHedgeBot:
         self.config_manager = ConfigManager()
         self.config = self.config_manager.config
         self.database_manager = DatabaseManager(self.config.database_url)
-        self.exchange = BinanceExchange(
-            api_key=self.config.binance_api_key,
-            api_secret=self.config.binance_api_secret,
-            testnet=self.config.binance_testnet,
-        )
-        self.risk_manager = RiskManager(self.config)
-        self.strategy_engine = StrategyEngine(
-            config=self.config,
-            exchange=self.exchange,
-            risk_manager=self.risk_manager,
-            database_manager=self.database_manager,
-        )
-        self.swap_monitor = SwapMonitor(
-            rpc_url=self.config.rpc_url,
-            pool_address=self.config.eulerswap_pool,
-            abi_path=self.config_manager.get_abi_path(),
-            exchange=self.exchange,
-            symbol_perpetual=self.config.symbol_perpetual,
-            database_manager=self.database_manager,
-        )
+        self.exchange = self.config_manager.get_exchange()
+        self.asset_pairs = self.config_manager.get_asset_pairs()
+        self.pools = [(pair.pool_address, pair.symbol) for pair in self.asset_pairs]
+
+        # One position book and strategy engine per perp, all on the shared
+        # exchange connection; pools hedged on the same perp are netted
+        # before either sees a snapshot
+        self.position_books = {}
+        self.strategy_engines = {}
+        for pair in self.asset_pairs:
+            symbol = pair.symbol
+            if symbol in self.strategy_engines:
+                continue
+            config = self.config_manager.get_asset_config(symbol)
+            self.position_books[symbol] = PositionBook(
+                self.exchange,
+                symbol,
+                reconcile_interval_seconds=config.position_reconcile_interval_seconds,
+                drift_tolerance=config.position_drift_tolerance_eth,
+            )
+            self.strategy_engines[symbol] = StrategyEngine(
+                config=config,
+                exchange=self.exchange,
+                risk_manager=RiskManager(config),
+                database_manager=self.database_manager,
+                position_book=self.position_books[symbol],
+                asset=pair,
+            )
+
+        self.swap_monitors = {
+            pair.pool_address: SwapMonitor(
+                rpc_url=self.config.rpc_url,
+                pool_address=pair.pool_address,
+                abi_path=self.config_manager.get_abi_path(),
+                exchange=self.exchange,
+                symbol_perpetual=pair.symbol,
+                database_manager=self.database_manager,
+                position_book=self.position_books[pair.symbol],
+                token0_decimals=pair.token0_decimals,
+                token1_decimals=pair.token1_decimals,
+                pipeline_stats=self.strategy_engines[pair.symbol].pipeline,
+            )
+            for pair in self.asset_pairs
+        }
+
+        self.portfolio = None
+        if len(self.pools) > 1:
+            self.portfolio = PortfolioHedger(self.strategy_engines)
+            for pool, symbol in self.pools:
+                self.portfolio.add_pool(
+                    pool, symbol, reader=self.swap_monitors[pool].read_snapshot
+                )
+        else:
+            monitor = self.swap_monitors[self.config.eulerswap_pool]
+            self.strategy_engine.snapshot_source = monitor.read_snapshot
+
+        self.hedge_bands = []
+
+        # Flatten each perp's short on a crash, from mark-price ticks
+        self.kill_switches = {}
+        if self.config.kill_switch_enabled:
+            for symbol, engine in self.strategy_engines.items():
+                switch = KillSwitch(
+                    self.exchange,
+                    symbol,
+                    engine.risk_manager,
+                    max_move_percent=engine.config.kill_switch_max_move_percent,
+                    window_seconds=engine.config.kill_switch_window_seconds,
+                    max_loss=engine.config.kill_switch_max_loss_usdt,
+                    position_book=self.position_books[symbol],
+                )
+                engine.fill_listeners.append(switch.on_fill)
+                switch.trip_listeners.append(engine.halt)
+                self.kill_switches[symbol] = switch
+
+        # Alternative strategies on the main perp's feed, against simulated fills
+        self.shadow_runner = None
+        shadow_configs = self.config_manager.get_shadow_configs()
+        if shadow_configs:
+            self.shadow_runner = ShadowRunner(
+                self.strategy_engine, shadow_configs, self.database_manager
+            )
 
         self._running = False
 
+        # Work started from signal handlers, kept so it is not collected mid-run
+        self._signal_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def strategy_engine(self) -> StrategyEngine:
+        """Strategy engine of the main pool's perp."""
+        return self.strategy_engines[self.config.symbol_perpetual]
+
+    @property
+    def swap_monitor(self) -> SwapMonitor:
+        """Monitor of the main pool."""
+        return self.swap_monitors[self.config.eulerswap_pool]
+
+    async def _start_hedge_bands(self) -> None:
+        """Replace each perp's fixed threshold with an optimal hedging band."""
+        fee_percent = min(self.config_manager.get_taker_fees().values())
+        for symbol, engine in self.strategy_engines.items():
+            curves = []
+            for pool, pool_symbol in self.pools:
+                if pool_symbol == symbol:
+                    monitor = self.swap_monitors[pool]
+                    params = await monitor.pool_manager.fetch_pool_params()
+                    curves.append(PoolCurve.from_pool_params(params))
+
+            band = HedgeBand(
+                curves,
+                fee_percent,
+                risk_aversion=float(engine.config.hedge_band_risk_aversion),
+                min_band=engine.config.min_hedge_size_eth,
+                max_band=engine.config.hedge_urgency_threshold_eth,
+            )
+            engine.risk_manager.hedge_band = band
+            await band.start(
+                functools.partial(self.exchange.get_mark_price, symbol),
+                refresh_seconds=self.config.hedge_band_refresh_seconds,
+            )
+            self.hedge_bands.append(band)
+
+    async def _warm_start(self) -> None:
+        """Resume each perp's strategy and risk state from the last run."""
+        states = load_checkpoint(self.config.state_checkpoint_file)
+        for symbol, engine in self.strategy_engines.items():
+            main_pool = next(pool for pool, s in self.pools if s == symbol)
+            await engine.warm_start(states.get(symbol), pool_address=main_pool)
+
+    def _save_checkpoint(self) -> None:
+        """Save each perp's strategy and risk state."""
+        try:
+            save_checkpoint(
+                self.config.state_checkpoint_file,
+                {
+                    symbol: engine.export_state()
+                    for symbol, engine in self.strategy_engines.items()
+                },
+            )
+        except Exception as e:
+            self.logger.log_error("Failed to save state checkpoint", e)
+
+    def _report_pipeline(self) -> None:
+        """Log each perp's pipeline stage latencies to the log and TUI."""
+        for symbol, engine in self.strategy_engines.items():
+            summary = engine.pipeline.format_summary()
+            if summary:
+                self.logger.log_info(f"Pipeline {symbol}: {summary}", LogTag.TUI)
+
+    def _snapshot_callback(self, pool: str):
+        """Snapshot handler for a pool."""
+        if self.portfolio:
+            return functools.partial(self.portfolio.process_pool_snapshot, pool)
+        return self.strategy_engine.process_position_snapshot
+
+    def _swap_event_callback(self, pool: str):
+        """Swap event handler for a pool."""
+        if self.portfolio:
+            return functools.partial(self.portfolio.process_swap_event, pool)
+        return self.strategy_engine.process_swap_event
+
     async def start(self):
         """Start the bot."""
         try:
@@ -58,26 +211,67 @@ class LPHedgeBot:
             # Connect to exchange
             await self.exchange.connect()
 
-            # Set up snapshot callback
-            self.swap_monitor.set_snapshot_callback(
-                self.strategy_engine.process_position_snapshot
-            )
+            # Settle hedge orders a previous run left in flight
+            for symbol, engine in self.strategy_engines.items():
+                if not await engine.recover_hedges():
+                    self.logger.log_warning(
+                        f"{symbol} hedge orders from the last run are "
+                        "unresolved - hedging waits until they are"
+                    )
 
-            # Start monitoring
-            await self.swap_monitor.start_monitoring(
-                polling_interval=self.config.polling_interval_seconds
-            )
+            # Resume counters, the rate-limit window and the last snapshot
+            await self._warm_start()
+
+            # Track the position from fills; REST only reconciles
+            for book in self.position_books.values():
+                await book.start()
+            for switch in self.kill_switches.values():
+                await switch.start()
+
+            if self.config.hedge_band_enabled:
+                await self._start_hedge_bands()
+
+            for pool, monitor in self.swap_monitors.items():
+                # Set up snapshot callback
+                monitor.set_snapshot_callback(self._snapshot_callback(pool))
+
+                # Start monitoring
+                await monitor.start_monitoring(
+                    polling_interval=self.config.polling_interval_seconds
+                )
+
+                # Hedge from Swap events as they land; snapshots reconcile
+                if self.config.swap_event_trigger:
+                    monitor.start_event_listener(
+                        self._swap_event_callback(pool),
+                        poll_interval=self.config.swap_event_poll_interval_ms / 1000,
+                    )
+
+            if self.shadow_runner:
+                await self.shadow_runner.start()
 
             self._running = True
             self.logger.log_info("LPHedgeBot started successfully", LogTag.INFO)
 
             # Keep running
+            last_checkpoint = last_report = time.monotonic()
             while self._running:
                 await asyncio.sleep(1)
 
+                if time.monotonic() - last_checkpoint >= CHECKPOINT_INTERVAL_SECONDS:
+                    self._save_checkpoint()
+                    last_checkpoint = time.monotonic()
+
+                if time.monotonic() - last_report >= PIPELINE_REPORT_INTERVAL_SECONDS:
+                    self._report_pipeline()
+                    last_report = time.monotonic()
+
                 # Periodic health check
-                if not await self.swap_monitor.check_connection():
-                    self.logger.log_warning("Connection issues detected")
+                for pool, monitor in self.swap_monitors.items():
+                    if not await monitor.check_connection():
+                        self.logger.log_warning(
+                            f"Connection issues detected for pool {pool}"
+                        )
 
         except Exception as e:
             self.logger.log_error("Failed to start bot", e)
@@ -91,40 +285,105 @@ class LPHedgeBot:
         self._running = False
 
         # Stop monitoring
-        await self.swap_monitor.stop_monitoring()
+        for monitor in self.swap_monitors.values():
+            await monitor.stop_monitoring()
+        for engine in self.strategy_engines.values():
+            await engine.stop()
+        if self.shadow_runner:
+            await self.shadow_runner.stop()
+        for band in self.hedge_bands:
+            await band.stop()
+        for switch in self.kill_switches.values():
+            await switch.stop()
+        for book in self.position_books.values():
+            await book.stop()
+        self._save_checkpoint()
 
         # Disconnect from exchange
         await self.exchange.disconnect()
 
         # Log final stats
-        stats = self.strategy_engine.get_strategy_stats()
-        self.logger.log_info(f"Final stats: {stats}", LogTag.INFO)
+        for symbol, engine in self.strategy_engines.items():
+            stats = engine.get_strategy_stats()
+            self.logger.log_info(f"Final stats {symbol}: {stats}", LogTag.INFO)
+        if self.portfolio:
+            self.logger.log_info(
+                f"Pool allocations: {self.portfolio.get_stats()}", LogTag.INFO
+            )
+        if self.shadow_runner:
+            self.logger.log_info(
+                f"Live vs shadow: {self.shadow_runner.report()}", LogTag.INFO
+            )
 
         self.logger.log_info("LPHedgeBot stopped", LogTag.INFO)
 
-    def handle_signal(self, signum, frame):
+    async def rebalance(
+        self, target_delta: Decimal = Decimal("0"), symbol: Optional[str] = None
+    ) -> bool:
+        """
+        Rebalance perps to a target delta on demand.
+
+        Args:
+            target_delta: Target delta exposure (default 0 for neutral)
+            symbol: Perp to rebalance (default all)
+
+        Returns:
+            True if every rebalanced perp reached its target
+        """
+        symbols = [symbol] if symbol else list(self.strategy_engines)
+        results = [
+            await self.strategy_engines[s].rebalance_position(target_delta)
+            for s in symbols
+        ]
+        return all(results)
+
+    def _spawn_signal_task(self, coro: Coroutine) -> None:
+        """Run a signal's work as a task that is kept and checked for errors."""
+        task = asyncio.create_task(coro)
+        self._signal_tasks.add(task)
+        task.add_done_callback(self._signal_task_done)
+
+    def _signal_task_done(self, task: asyncio.Task) -> None:
+        """Drop a finished signal task and log its failure."""
+        self._signal_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.log_error("Signal handler task failed", task.exception())
+
+    async def wait_signal_tasks(self) -> None:
+        """Wait for work started by signals (e.g. a shutdown) to finish."""
+        while self._signal_tasks:
+            await asyncio.gather(*self._signal_tasks, return_exceptions=True)
+
+    def handle_rebalance_signal(self, signum: int) -> None:
+        """Rebalance every perp to delta neutral."""
+        self.logger.log_info(f"Received signal {signum}, rebalancing...", LogTag.INFO)
+        self._spawn_signal_task(self.rebalance())
+
+    def handle_signal(self, signum: int) -> None:
         """Handle shutdown signals."""
         self.logger.log_info(f"Received signal {signum}, shutting down...", LogTag.INFO)
-        asyncio.create_task(self.stop())
-        sys.exit(0)
+        self._spawn_signal_task(self.stop())
 
 
 async def main():
     """Main function."""
     bot = LPHedgeBot()
 
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, bot.handle_signal)
-    signal.signal(signal.SIGTERM, bot.handle_signal)
+    # Set up signal handlers on the loop, so their work runs as tasks
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, bot.handle_signal, signum)
+    loop.add_signal_handler(signal.SIGUSR1, bot.handle_rebalance_signal, signal.SIGUSR1)
 
     try:
         await bot.start()
-    except KeyboardInterrupt:
-        await bot.stop()
     except Exception as e:
         print(f"Fatal error: {e}")
         await bot.stop()
         sys.exit(1)
+    finally:
+        # A signalled shutdown ends start(); let stop() finish before exiting
+        await bot.wait_signal_tasks()
 
 
 if __name__ == "__main__":
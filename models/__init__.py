@@ -1,7 +1,21 @@
 """Data models for LPHedgeBot."""
 
+from .asset_pair import AssetPair
 from .position_snapshot import PositionSnapshot
 from .hedge_snapshot import HedgeSnapshot
 from .trade import Trade
+from .hedge_intent import HedgeIntent
+from .clock import Clock, SYSTEM_CLOCK
+from .pipeline_timing import PipelineStats, PipelineTrace
 
-__all__ = ["PositionSnapshot", "HedgeSnapshot", "Trade"]
+__all__ = [
+    "AssetPair",
+    "PositionSnapshot",
+    "HedgeSnapshot",
+    "Trade",
+    "HedgeIntent",
+    "Clock",
+    "SYSTEM_CLOCK",
+    "PipelineStats",
+    "PipelineTrace",
+]
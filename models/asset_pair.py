@@ -0,0 +1,63 @@
+"""Asset pair model mapping a pool's hedged token to its perpetual."""
+
+from dataclasses import dataclass
+from decimal import ROUND_DOWN, Decimal
+
+from .fixed_point import WAD_DECIMALS
+
+
+@dataclass(frozen=True)
+class AssetPair:
+    """
+    An EulerSwap pool and the perpetual its token1 is hedged on.
+
+    Token0 is the quote token (USDT, USDC) and token1 the hedged asset
+    (WETH, WBTC, stETH, ...). Hedge sizes are in units of the underlying
+    and are rounded toward zero to whole order-size increments.
+
+    Attributes:
+        pool_address: EulerSwap pool
+        symbol: Perpetual the pool's token1 is hedged on
+        token0_decimals: Decimals of the pool's token0
+        token1_decimals: Decimals of the pool's token1
+        contract_size: Underlying per perp contract
+        amount_step: Order size increment in contracts (0 for any size)
+    """
+
+    pool_address: str
+    symbol: str
+    token0_decimals: int = 6
+    token1_decimals: int = WAD_DECIMALS
+    contract_size: Decimal = Decimal("1")
+    amount_step: Decimal = Decimal("0")
+
+    @property
+    def size_increment(self) -> Decimal:
+        """Smallest tradable change of the short, in the underlying."""
+        return self.contract_size * self.amount_step
+
+    def round_size(self, size: Decimal) -> Decimal:
+        """
+        Round a hedge size toward zero to whole order-size increments.
+
+        Args:
+            size: Hedge size in the underlying (signed)
+
+        Returns:
+            Tradable hedge size
+        """
+        increment = self.size_increment
+        if not increment:
+            return size
+        return (size / increment).to_integral_value(rounding=ROUND_DOWN) * increment
+
+    def to_dict(self) -> dict:
+        """Convert the asset pair to a dictionary."""
+        return {
+            "pool_address": self.pool_address,
+            "symbol": self.symbol,
+            "token0_decimals": self.token0_decimals,
+            "token1_decimals": self.token1_decimals,
+            "contract_size": str(self.contract_size),
+            "amount_step": str(self.amount_step),
+        }
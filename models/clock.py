@@ -0,0 +1,33 @@
+"""Time source shared by the strategy components.
+
+Components read wall time, monotonic time and sleep through a ``Clock`` so the
+backtester can run them on a virtual clock with no real sleeps.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+
+
+class Clock:
+    """System clock."""
+
+    def utcnow(self) -> datetime:
+        """Current UTC time."""
+        return datetime.utcnow()
+
+    def monotonic(self) -> float:
+        """Monotonic time in seconds."""
+        return time.monotonic()
+
+    async def sleep(self, seconds: float) -> None:
+        """
+        Sleep for a number of seconds.
+
+        Args:
+            seconds: Time to sleep
+        """
+        await asyncio.sleep(seconds)
+
+
+SYSTEM_CLOCK = Clock()
@@ -0,0 +1,79 @@
+"""Integer fixed-point helpers for the snapshot -> risk -> strategy hot path.
+
+Amounts on the hot path are carried as raw token units (plain ``int``) together
+with their decimal scale, exactly as the chain reports them. ``Decimal`` is only
+produced at the edges: logging, persistence and exchange API calls.
+"""
+
+from decimal import Decimal
+from typing import Union
+
+WAD_DECIMALS = 18  # Scale used for ETH-denominated amounts (WETH, perp size)
+
+_POW10 = [10**i for i in range(78)]
+
+
+def pow10(decimals: int) -> int:
+    """
+    Get 10**decimals from a precomputed table.
+
+    Args:
+        decimals: Exponent
+
+    Returns:
+        Power of ten as int
+    """
+    return _POW10[decimals]
+
+
+def to_units(value: Union[Decimal, int, str], decimals: int = WAD_DECIMALS) -> int:
+    """
+    Convert a human-readable amount into raw integer units.
+
+    Args:
+        value: Amount as Decimal, int or numeric string
+        decimals: Number of decimals of the target scale
+
+    Returns:
+        Amount in raw units, truncated toward zero
+    """
+    if type(value) is not Decimal:
+        if isinstance(value, int):
+            return value * _POW10[decimals]
+        value = Decimal(value)
+    # int() truncates toward zero
+    return int(value.scaleb(decimals))
+
+
+def from_units(units: int, decimals: int = WAD_DECIMALS) -> Decimal:
+    """
+    Convert raw integer units into a Decimal amount.
+
+    Args:
+        units: Amount in raw units
+        decimals: Number of decimals of the source scale
+
+    Returns:
+        Amount as Decimal
+    """
+    return Decimal(units).scaleb(-decimals)
+
+
+def rescale(units: int, from_decimals: int, to_decimals: int) -> int:
+    """
+    Move raw units from one decimal scale to another.
+
+    Args:
+        units: Amount in raw units
+        from_decimals: Current scale
+        to_decimals: Target scale
+
+    Returns:
+        Amount in the target scale, truncated toward zero when narrowing
+    """
+    if to_decimals >= from_decimals:
+        return units * _POW10[to_decimals - from_decimals]
+    factor = _POW10[from_decimals - to_decimals]
+    if units < 0:
+        return -(-units // factor)
+    return units // factor
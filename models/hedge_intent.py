@@ -0,0 +1,88 @@
+"""Hedge intent model for tracking a hedge order through its lifecycle."""
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+
+from .hedge_snapshot import HedgeAction
+from .trade import OrderSide
+
+
+class HedgeState(Enum):
+    """Lifecycle states of a hedge order."""
+
+    INTENT = "intent"  # Decided, not yet sent
+    SUBMITTED = "submitted"  # Sent, no response yet
+    ACKED = "acked"  # Accepted by the exchange, not (fully) filled
+    FILLED = "filled"
+    FAILED = "failed"  # Never accepted, or finished with nothing filled
+
+
+# States whose outcome on the exchange is not settled yet
+UNRESOLVED_STATES = (HedgeState.INTENT, HedgeState.SUBMITTED, HedgeState.ACKED)
+
+
+def client_order_id(key: str, prefix: str = "lph") -> str:
+    """
+    Deterministic client order ID for a hedge.
+
+    The same key always gives the same ID, so a hedge can be found on the
+    exchange after a lost response or a restart.
+
+    Args:
+        key: Identity of the hedge (e.g. snapshot, side and size)
+        prefix: ID prefix
+
+    Returns:
+        Client order ID (at most 32 characters)
+    """
+    return f"{prefix}{hashlib.sha1(key.encode()).hexdigest()[:24]}"
+
+
+@dataclass
+class HedgeIntent:
+    """
+    A hedge order and what is known about it on the exchange.
+
+    Attributes:
+        client_order_id: Our ID for the order
+        symbol: Trading pair symbol
+        action: Open or close short
+        size: Order size in base currency
+        leverage: Leverage for opening orders
+        state: Lifecycle state
+        order_id: Exchange order ID once known
+        filled_size: Size filled
+        price: Average fill price
+        error_message: Why the hedge failed or is unresolved
+        created_at: When the hedge was decided
+        updated_at: Last state change
+    """
+
+    client_order_id: str
+    symbol: str
+    action: HedgeAction
+    size: Decimal
+    leverage: Decimal = Decimal("1")
+    state: HedgeState = HedgeState.INTENT
+    order_id: Optional[str] = None
+    filled_size: Decimal = Decimal("0")
+    price: Optional[Decimal] = None
+    error_message: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def side(self) -> OrderSide:
+        """Order side of the hedge."""
+        return (
+            OrderSide.SELL if self.action == HedgeAction.OPEN_SHORT else OrderSide.BUY
+        )
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the outcome on the exchange is settled."""
+        return self.state not in UNRESOLVED_STATES
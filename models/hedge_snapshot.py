@@ -1,10 +1,12 @@
 """Hedge snapshot model for tracking executed hedging operations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
+
+from .trade import Trade
 
 
 class HedgeAction(Enum):
@@ -33,6 +35,9 @@ class HedgeSnapshot:
         gas_cost: Optional gas cost for on-chain operations
         success: Whether the hedge was successful
         error_message: Error message if hedge failed
+        time_to_order_ms: Time from hedge decision to order submission
+        child_trades: Child orders if the hedge was executed in slices
+        symbol: Perpetual the hedge was traded on
     """
 
     action: HedgeAction
@@ -47,6 +52,9 @@ class HedgeSnapshot:
     gas_cost: Optional[Decimal] = None
     success: bool = True
     error_message: Optional[str] = None
+    time_to_order_ms: Optional[float] = None
+    child_trades: List[Trade] = field(default_factory=list)
+    symbol: Optional[str] = None
 
     @property
     def delta_reduction(self) -> Decimal:
@@ -73,6 +81,9 @@ class HedgeSnapshot:
             "gas_cost": str(self.gas_cost) if self.gas_cost else None,
             "success": self.success,
             "error_message": self.error_message,
+            "time_to_order_ms": self.time_to_order_ms,
+            "child_trades": [trade.to_dict() for trade in self.child_trades],
+            "symbol": self.symbol,
             "delta_reduction": str(self.delta_reduction),
             "notional_value": str(self.notional_value),
         }
@@ -93,4 +104,9 @@ class HedgeSnapshot:
             gas_cost=Decimal(data["gas_cost"]) if data.get("gas_cost") else None,
             success=data.get("success", True),
             error_message=data.get("error_message"),
+            time_to_order_ms=data.get("time_to_order_ms"),
+            child_trades=[
+                Trade.from_dict(trade) for trade in data.get("child_trades", [])
+            ],
+            symbol=data.get("symbol"),
         )
@@ -0,0 +1,170 @@
+"""Stage timing of the snapshot -> decision -> order pipeline."""
+
+import bisect
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open
+HISTOGRAM_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+# Pipeline stages in the order a snapshot passes through them
+STAGES = (
+    "rpc",
+    "exchange",
+    "risk_check",
+    "pre_trade",
+    "order",
+    "db_write",
+    "total",
+)
+
+
+class PipelineStats:
+    """
+    Rolling per-stage latency samples of recent snapshots.
+
+    Recording appends one float to a bounded deque, so it stays on in
+    production; percentiles and histograms are only computed when read.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize the stats.
+
+        Args:
+            window: Samples kept per stage
+        """
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """
+        Record the duration of one stage.
+
+        Args:
+            stage: Stage name
+            seconds: Duration in seconds
+        """
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=self.window)
+        samples.append(seconds * 1000)
+
+    def histogram(self, stage: str) -> Dict[str, int]:
+        """
+        Bucket counts of a stage's recent durations.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            Count per bucket, keyed by its upper bound in ms ("+inf" last)
+        """
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for value in self._samples.get(stage, ()):
+            counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, value)] += 1
+        keys = [f"{bound:g}" for bound in HISTOGRAM_BUCKETS_MS] + ["+inf"]
+        return dict(zip(keys, counts))
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Summarize every stage seen.
+
+        Returns:
+            Count, mean, percentiles, max (ms) and histogram per stage,
+            in pipeline order
+        """
+        stages = sorted(
+            self._samples,
+            key=lambda s: STAGES.index(s) if s in STAGES else len(STAGES),
+        )
+        result = {}
+        for stage in stages:
+            ordered = sorted(self._samples[stage])
+            if not ordered:
+                continue
+            count = len(ordered)
+            result[stage] = {
+                "count": count,
+                "mean_ms": round(sum(ordered) / count, 3),
+                "p50_ms": round(ordered[count // 2], 3),
+                "p95_ms": round(ordered[min(int(count * 0.95), count - 1)], 3),
+                "p99_ms": round(ordered[min(int(count * 0.99), count - 1)], 3),
+                "max_ms": round(ordered[-1], 3),
+                "histogram": self.histogram(stage),
+            }
+        return result
+
+    def format_summary(self) -> str:
+        """
+        One-line p50/p95 summary of every stage, for logs and the TUI.
+
+        Returns:
+            Summary line (empty before the first sample)
+        """
+        return " | ".join(
+            f"{stage} p50 {s['p50_ms']:.1f}ms p95 {s['p95_ms']:.1f}ms"
+            for stage, s in self.summary().items()
+        )
+
+
+class PipelineTrace:
+    """
+    Stage timestamps of one snapshot on its way to an order.
+
+    Carried on the snapshot; each stage stores its perf_counter() start
+    and end and feeds its duration to the stats as it is recorded.
+    """
+
+    __slots__ = ("stats", "origin", "last", "stages")
+
+    def __init__(
+        self, stats: Optional[PipelineStats] = None, origin: Optional[float] = None
+    ):
+        """
+        Initialize the trace.
+
+        Args:
+            stats: Stats to feed stage durations to
+            origin: perf_counter() time the pipeline started (default now)
+        """
+        self.stats = stats
+        self.origin = time.perf_counter() if origin is None else origin
+        self.last = self.origin
+        self.stages: Dict[str, Tuple[float, float]] = {}
+
+    def record(
+        self, stage: str, started: float, ended: Optional[float] = None
+    ) -> float:
+        """
+        Record a stage.
+
+        Args:
+            stage: Stage name
+            started: perf_counter() time the stage started
+            ended: perf_counter() time the stage ended (default now)
+
+        Returns:
+            The end time
+        """
+        if ended is None:
+            ended = time.perf_counter()
+        self.stages[stage] = (started, ended)
+        if ended > self.last:
+            self.last = ended
+        if self.stats is not None:
+            self.stats.observe(stage, ended - started)
+        return ended
+
+    def durations_ms(self) -> Dict[str, float]:
+        """
+        Duration of each recorded stage.
+
+        Returns:
+            Milliseconds per stage, in recording order
+        """
+        return {
+            stage: (ended - started) * 1000
+            for stage, (started, ended) in self.stages.items()
+        }
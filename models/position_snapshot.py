@@ -1,10 +1,13 @@
 """Position snapshot model representing the current state of reserves and positions."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
+from .fixed_point import WAD_DECIMALS, from_units, to_units
+from .pipeline_timing import PipelineTrace
+
 
 @dataclass
 class PositionSnapshot:
@@ -12,26 +15,55 @@ class PositionSnapshot:
     Represents a snapshot of pool reserves and short positions at a specific time.
 
     Attributes:
-        reserve_token0: USDT reserve amount in the pool
-        reserve_token1: WETH reserve amount in the pool
+        reserve_token0: Quote token (token0, e.g. USDT) reserve in the pool
+        reserve_token1: Hedged token (token1, e.g. WETH) reserve in the pool
         short_position_size: Current short position size on CEX
         timestamp: Time when the snapshot was taken
         block_number: Optional Ethereum block number for the snapshot
         pool_address: Address of the EulerSwap pool
+        reserve_token1_units: Optional raw token1 reserve in token units
+        short_position_units: Optional raw short position in token1 units
+        token1_decimals: Decimal scale of the raw token1 amounts
+        source: What produced the snapshot ("poll" or "swap_event")
+        observed_at: perf_counter() time the on-chain data was observed
+        trace: Stage timestamps of the snapshot's way to an order
     """
 
-    reserve_token0: Decimal  # USDT
-    reserve_token1: Decimal  # WETH
+    reserve_token0: Decimal  # Quote token
+    reserve_token1: Decimal  # Hedged token
     short_position_size: Decimal
     timestamp: datetime
     block_number: Optional[int] = None
     pool_address: Optional[str] = None
 
+    # Raw integer amounts for the hot path (Decimal fields are for the edges)
+    reserve_token1_units: Optional[int] = field(default=None, compare=False)
+    short_position_units: Optional[int] = field(default=None, compare=False)
+    token1_decimals: int = field(default=WAD_DECIMALS, compare=False)
+
+    # Provenance, used for trigger-to-order latency
+    source: str = field(default="poll", compare=False)
+    observed_at: Optional[float] = field(default=None, compare=False)
+    trace: Optional[PipelineTrace] = field(default=None, compare=False, repr=False)
+
     @property
     def delta(self) -> Decimal:
-        """Calculate the delta exposure (WETH reserves - short position)."""
+        """Calculate the delta exposure (token1 reserves - short position)."""
         return self.reserve_token1 - self.short_position_size
 
+    @property
+    def delta_units(self) -> int:
+        """Delta exposure in raw token1 units, computed with integer math."""
+        if self.reserve_token1_units is None:
+            self.reserve_token1_units = to_units(
+                self.reserve_token1, self.token1_decimals
+            )
+        if self.short_position_units is None:
+            self.short_position_units = to_units(
+                self.short_position_size, self.token1_decimals
+            )
+        return self.reserve_token1_units - self.short_position_units
+
     @property
     def is_delta_neutral(self, threshold: Decimal = Decimal("0.005")) -> bool:
         """Check if position is within delta-neutral threshold."""
@@ -49,6 +81,35 @@ class PositionSnapshot:
             "delta": str(self.delta),
         }
 
+    @classmethod
+    def from_units(
+        cls,
+        reserve_token0_units: int,
+        reserve_token1_units: int,
+        short_position_units: int,
+        timestamp: datetime,
+        token0_decimals: int = 6,
+        token1_decimals: int = WAD_DECIMALS,
+        block_number: Optional[int] = None,
+        pool_address: Optional[str] = None,
+        source: str = "poll",
+        observed_at: Optional[float] = None,
+    ) -> "PositionSnapshot":
+        """Create PositionSnapshot from raw integer token amounts."""
+        return cls(
+            reserve_token0=from_units(reserve_token0_units, token0_decimals),
+            reserve_token1=from_units(reserve_token1_units, token1_decimals),
+            short_position_size=from_units(short_position_units, token1_decimals),
+            timestamp=timestamp,
+            block_number=block_number,
+            pool_address=pool_address,
+            reserve_token1_units=reserve_token1_units,
+            short_position_units=short_position_units,
+            token1_decimals=token1_decimals,
+            source=source,
+            observed_at=observed_at,
+        )
+
     @classmethod
     def from_dict(cls, data: dict) -> "PositionSnapshot":
         """Create PositionSnapshot from dictionary."""
@@ -50,6 +50,7 @@ class Trade:
         fee: Trading fee
         fee_currency: Currency of the fee
         exchange: Exchange where trade was executed
+        parent_order_id: ID of the parent hedge if this is a child order
     """
 
     symbol: str
@@ -63,6 +64,7 @@ class Trade:
     fee: Optional[Decimal] = None
     fee_currency: Optional[str] = None
     exchange: str = "binance"
+    parent_order_id: Optional[str] = None
 
     @property
     def notional(self) -> Decimal:
@@ -91,6 +93,7 @@ class Trade:
             "fee": str(self.fee) if self.fee else None,
             "fee_currency": self.fee_currency,
             "exchange": self.exchange,
+            "parent_order_id": self.parent_order_id,
             "notional": str(self.notional),
             "total_cost": str(self.total_cost),
         }
@@ -110,4 +113,5 @@ class Trade:
             fee=Decimal(data["fee"]) if data.get("fee") else None,
             fee_currency=data.get("fee_currency"),
             exchange=data.get("exchange", "binance"),
+            parent_order_id=data.get("parent_order_id"),
         )
@@ -1,5 +1,6 @@
 """Risk management for LPHedgeBot."""
 
 from .risk_manager import RiskManager
+from .kill_switch import KillSwitch
 
-__all__ = ["RiskManager"]
+__all__ = ["KillSwitch", "RiskManager"]
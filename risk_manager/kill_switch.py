@@ -0,0 +1,303 @@
+"""Kill switch checking stop conditions on every mark-price tick."""
+
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Callable, List, Optional
+
+from exchange_manager import IExchange, PositionBook
+from logger_manager import LoggerManager, LogTag
+from models import Clock, SYSTEM_CLOCK, Trade
+from models.hedge_intent import client_order_id
+from models.hedge_snapshot import HedgeAction
+from .risk_manager import RiskManager
+
+
+class KillSwitch:
+    """
+    Flattens the short when the market moves too far or it loses too much.
+
+    Every mark-price tick from the exchange's stream is checked against
+    in-memory state only: the move from the window's high or low and the
+    short's loss from its entry price, in floats, with a sliding min/max so
+    a check is a few comparisons. The reduce-only close order is kept armed
+    with the current short size and a client order ID, updated from our
+    fills, so flattening is one request with no position fetch. Once
+    tripped, the trip listeners are told (e.g. to halt hedging) and the
+    exit is sent, and resent on later ticks until it fills.
+    """
+
+    def __init__(
+        self,
+        exchange: IExchange,
+        symbol: str,
+        risk_manager: RiskManager,
+        max_move_percent: Decimal = Decimal("10"),
+        window_seconds: float = 60.0,
+        max_loss: Decimal = Decimal("1000"),
+        position_book: Optional[PositionBook] = None,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        """
+        Initialize the kill switch.
+
+        Args:
+            exchange: Exchange streaming mark prices and holding the short
+            symbol: Perpetual symbol
+            risk_manager: Risk manager applying the loss limit
+            max_move_percent: Price move within the window that trips it
+            window_seconds: Window of the price move
+            max_loss: Loss of the short (quote currency) that trips it
+            position_book: Optional position book for the exit size
+            clock: Time source
+        """
+        self.exchange = exchange
+        self.symbol = symbol
+        self.risk_manager = risk_manager
+        self.max_loss = max_loss
+        self.window_seconds = window_seconds
+        self.position_book = position_book
+        self.clock = clock
+        self.logger = LoggerManager()
+
+        # Floats for the per-tick check
+        self._max_move = float(max_move_percent) / 100
+        self._max_loss = float(max_loss)
+        self._short = 0.0
+        self._entry = 0.0
+
+        # (time, price) candidates for the window's high and low
+        self._highs: deque = deque()
+        self._lows: deque = deque()
+
+        # The armed exit: arguments of the close order
+        self.short_size = Decimal("0")
+        self.entry_price = Decimal("0")
+        self.exit_order: Optional[dict] = None
+        self._arms = 0
+
+        # Called with the reason when the switch trips
+        self.trip_listeners: List[Callable[[str], None]] = []
+
+        self.tripped: Optional[str] = None
+        self.exit_trade: Optional[Trade] = None
+        self._exit_task: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.ticks = 0
+        self.exit_attempts = 0
+        self.check_ns_total = 0
+        self.check_ns_max = 0
+
+    def arm(self, short_size: Decimal, entry_price: Decimal) -> None:
+        """
+        Prepare the exit for a short position.
+
+        Args:
+            short_size: Current short size
+            entry_price: Average entry price of the short
+        """
+        self.short_size = short_size
+        self.entry_price = entry_price
+        self._short = float(short_size)
+        self._entry = float(entry_price)
+
+        self._arms += 1
+        self.exit_order = None
+        if short_size > 0:
+            self.exit_order = {
+                "symbol": self.symbol,
+                "size": short_size,
+                "client_order_id": client_order_id(
+                    f"{self.symbol}:kill:{self._arms}:{short_size}", prefix="lpk"
+                ),
+                "reduce_only": True,
+            }
+
+    async def arm_from_exchange(self) -> None:
+        """Arm the exit from the exchange's position."""
+        position = await self.exchange.get_current_perpetual_position(self.symbol)
+        if position["side"] == "short":
+            self.arm(position["size"], position["entry_price"] or Decimal("0"))
+        else:
+            self.arm(Decimal("0"), Decimal("0"))
+
+    def on_fill(self, action: HedgeAction, trade: Trade) -> None:
+        """
+        Re-arm the exit after one of our fills.
+
+        Args:
+            action: Open or close short
+            trade: Filled trade
+        """
+        if action == HedgeAction.OPEN_SHORT:
+            size = self.short_size + trade.size
+            entry = (
+                self.entry_price * self.short_size + trade.price * trade.size
+            ) / size
+        else:
+            size = max(self.short_size - trade.size, Decimal("0"))
+            entry = self.entry_price if size else Decimal("0")
+        self.arm(size, entry)
+
+    def on_tick(self, price: float) -> bool:
+        """
+        Check the stop conditions at a new mark price.
+
+        Args:
+            price: Mark price
+
+        Returns:
+            True if the switch is tripped
+        """
+        started = time.perf_counter_ns()
+        now = self.clock.monotonic()
+        self.ticks += 1
+
+        # Sliding window high and low
+        highs, lows = self._highs, self._lows
+        while highs and highs[-1][1] <= price:
+            highs.pop()
+        highs.append((now, price))
+        while lows and lows[-1][1] >= price:
+            lows.pop()
+        lows.append((now, price))
+        cutoff = now - self.window_seconds
+        while highs[0][0] < cutoff:
+            highs.popleft()
+        while lows[0][0] < cutoff:
+            lows.popleft()
+
+        if self.tripped is None:
+            high, low = highs[0][1], lows[0][1]
+            move = max((high - price) / high, (price - low) / low)
+            loss = (price - self._entry) * self._short
+            if move >= self._max_move:
+                self.trip(
+                    f"price moved {move * 100:.1f}% within {self.window_seconds:g}s"
+                )
+            elif loss > self._max_loss and self.risk_manager.emergency_stop_check(
+                Decimal(f"{loss:.2f}"), self.max_loss
+            ):
+                self.trip(f"short loss {loss:.2f} over {self.max_loss}")
+        elif self.exit_order is not None and (
+            self._exit_task is None or self._exit_task.done()
+        ):
+            # The last exit failed or filled partly: send it again
+            self._exit_task = asyncio.create_task(self.flatten())
+
+        elapsed = time.perf_counter_ns() - started
+        self.check_ns_total += elapsed
+        self.check_ns_max = max(self.check_ns_max, elapsed)
+        return self.tripped is not None
+
+    def trip(self, reason: str) -> None:
+        """
+        Trip the switch: notify listeners and send the armed exit.
+
+        Args:
+            reason: Why the switch tripped
+        """
+        if self.tripped is not None:
+            return
+        self.tripped = reason
+        self.logger.log_warning(f"KILL SWITCH: {reason} - flattening {self.symbol}")
+
+        for listener in self.trip_listeners:
+            try:
+                listener(reason)
+            except Exception as e:
+                self.logger.log_error("Kill switch listener failed", e)
+
+        self._exit_task = asyncio.create_task(self.flatten())
+
+    async def flatten(self) -> Optional[Trade]:
+        """
+        Send the armed reduce-only exit.
+
+        Returns:
+            The exit trade, or None if there was nothing to close or it failed
+        """
+        order = self.exit_order
+        if order is None:
+            return None
+
+        # The book may know of fills the exit was not re-armed for
+        if self.position_book is not None and self.position_book.ready:
+            order = {**order, "size": self.position_book.short_size}
+            if order["size"] <= 0:
+                self.arm(Decimal("0"), Decimal("0"))
+                return None
+
+        self.exit_attempts += 1
+        try:
+            trade = await self.exchange.close_short_position(**order)
+        except Exception as e:
+            self.logger.log_error("Kill switch exit failed", e)
+            return None
+
+        self.exit_trade = trade
+        if self.position_book is not None:
+            self.position_book.apply_fill(trade)
+        self.arm(max(self.short_size - trade.size, Decimal("0")), self.entry_price)
+        self.logger.log_info(
+            f"Kill switch closed {trade.size} {self.symbol} at {trade.price}",
+            LogTag.RISK,
+        )
+        return trade
+
+    async def start(self) -> None:
+        """Arm the exit and check every tick of the mark-price stream."""
+        await self.arm_from_exchange()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        """Stop watching ticks and wait for an exit in flight."""
+        for task in (self._task, self._exit_task):
+            if task is not None and not task.done():
+                if task is self._task:
+                    task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+
+    async def _watch(self) -> None:
+        """Check each mark price pushed by the exchange."""
+        while True:
+            try:
+                price = await self.exchange.watch_mark_price(self.symbol)
+                self.on_tick(float(price))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.log_error("Mark price stream error", e)
+                await self.clock.sleep(1)
+
+    def get_stats(self) -> dict:
+        """
+        Get kill switch statistics.
+
+        Returns:
+            Dictionary with the armed exit, trip state and check timing
+        """
+        return {
+            "armed_size": str(self.short_size),
+            "entry_price": str(self.entry_price),
+            "tripped": self.tripped,
+            "exit_attempts": self.exit_attempts,
+            "exit_order_id": self.exit_trade.order_id if self.exit_trade else None,
+            "ticks": self.ticks,
+            "check_us": {
+                "mean": (
+                    round(self.check_ns_total / self.ticks / 1000, 2)
+                    if self.ticks
+                    else None
+                ),
+                "max": round(self.check_ns_max / 1000, 2),
+            },
+        }
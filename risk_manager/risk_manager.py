@@ -4,10 +4,13 @@ from decimal import Decimal
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
-from models import PositionSnapshot
+from models import Clock, PositionSnapshot, SYSTEM_CLOCK
+from models.fixed_point import WAD_DECIMALS, from_units, to_units
 from logger_manager import LoggerManager, LogTag
 from config_manager import Config
 
+_ZERO = Decimal("0")
+
 
 class RiskManager:
     """
@@ -17,14 +20,19 @@ class RiskManager:
     for all hedging operations.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, clock: Clock = SYSTEM_CLOCK, hedge_band=None):
         """
         Initialize risk manager.
 
         Args:
             config: Configuration object
+            clock: Time source (virtual in backtests)
+            hedge_band: Optional HedgeBand replacing the fixed hedge
+                threshold once it has a band
         """
         self.config = config
+        self.clock = clock
+        self.hedge_band = hedge_band
         self.logger = LoggerManager()
 
         # Risk parameters
@@ -35,7 +43,30 @@ class RiskManager:
         # Tracking
         self.recent_trades: list = []
         self.max_trades_per_hour = 20
-        self.last_risk_check = datetime.utcnow()
+        self.last_risk_check = self.clock.utcnow()
+
+        # Integer copies of Decimal limits: name -> (value, decimals, units)
+        self._unit_limits: Dict[str, tuple] = {}
+
+    def _limit_units(self, name: str, value: Decimal, decimals: int) -> int:
+        """
+        Get a Decimal limit as raw units, converting only when it changes.
+
+        Args:
+            name: Name of the limit (cache key)
+            value: Current Decimal value of the limit
+            decimals: Scale to convert to
+
+        Returns:
+            Limit in raw units
+        """
+        cached = self._unit_limits.get(name)
+        if cached is not None and cached[0] is value and cached[1] == decimals:
+            return cached[2]
+
+        units = to_units(value, decimals)
+        self._unit_limits[name] = (value, decimals, units)
+        return units
 
     def calculate_leverage(
         self, position_size: Decimal, account_balance: Decimal, current_price: Decimal
@@ -80,18 +111,41 @@ class RiskManager:
         Returns:
             True if hedge size is valid
         """
+        return self._validate_hedge_units(to_units(hedge_size), WAD_DECIMALS)
+
+    def _validate_hedge_units(self, hedge_units: int, decimals: int) -> bool:
+        """
+        Validate a hedge size given in raw units.
+
+        Args:
+            hedge_units: Proposed hedge size in raw units
+            decimals: Scale of hedge_units
+
+        Returns:
+            True if hedge size is valid
+        """
+        size_units = abs(hedge_units)
+
         # Check minimum size
-        if abs(hedge_size) < self.config.min_hedge_size_eth:
+        min_units = self._limit_units(
+            "min_hedge_size_eth", self.config.min_hedge_size_eth, decimals
+        )
+        if size_units < min_units:
             self.logger.log_debug(
-                f"Hedge size {hedge_size} below minimum {self.config.min_hedge_size_eth}",
+                f"Hedge size {from_units(hedge_units, decimals)} below minimum "
+                f"{self.config.min_hedge_size_eth}",
                 LogTag.RISK,
             )
             return False
 
         # Check maximum size
-        if abs(hedge_size) > self.max_position_size:
+        max_units = self._limit_units(
+            "max_position_size", self.max_position_size, decimals
+        )
+        if size_units > max_units:
             self.logger.log_warning(
-                f"Hedge size {hedge_size} exceeds maximum {self.max_position_size}"
+                f"Hedge size {from_units(hedge_units, decimals)} exceeds maximum "
+                f"{self.max_position_size}"
             )
             return False
 
@@ -129,7 +183,7 @@ class RiskManager:
             True if within rate limits
         """
         # Clean up old trades
-        cutoff_time = datetime.utcnow() - timedelta(hours=1)
+        cutoff_time = self.clock.utcnow() - timedelta(hours=1)
         self.recent_trades = [
             trade for trade in self.recent_trades if trade["timestamp"] > cutoff_time
         ]
@@ -201,7 +255,7 @@ class RiskManager:
                 self.config.hedge_threshold_eth
             ),
             "hedge_required": abs(snapshot.delta) > self.config.hedge_threshold_eth,
-            "timestamp": datetime.utcnow(),
+            "timestamp": self.clock.utcnow(),
         }
 
         # Add risk score (0-100, lower is better)
@@ -226,24 +280,39 @@ class RiskManager:
         Returns:
             Tuple of (should_hedge, hedge_size)
         """
-        delta = snapshot.delta
-
-        # Check if delta exceeds threshold
-        if not force and abs(delta) <= self.config.hedge_threshold_eth:
-            return False, Decimal("0")
+        # Threshold checks run on raw integer units
+        decimals = snapshot.token1_decimals
+        delta_units = snapshot.delta_units
+        abs_delta_units = abs(delta_units)
+
+        # Check if delta exceeds threshold (the optimal band when there is one)
+        band = self.hedge_band.current() if self.hedge_band is not None else None
+        if band is not None:
+            threshold_units = self._limit_units("hedge_band", band, decimals)
+        else:
+            threshold_units = self._limit_units(
+                "hedge_threshold_eth", self.config.hedge_threshold_eth, decimals
+            )
+        if not force and abs_delta_units <= threshold_units:
+            return False, _ZERO
 
         # Check if hedge size meets minimum
-        if abs(delta) < self.config.min_hedge_size_eth:
-            return False, Decimal("0")
+        min_units = self._limit_units(
+            "min_hedge_size_eth", self.config.min_hedge_size_eth, decimals
+        )
+        if abs_delta_units < min_units:
+            return False, _ZERO
 
         # Validate hedge size
-        if not self.validate_hedge_size(delta):
-            return False, Decimal("0")
+        if not self._validate_hedge_units(delta_units, decimals):
+            return False, _ZERO
 
         # Check rate limits
         if not self.check_rate_limits():
-            return False, Decimal("0")
+            return False, _ZERO
 
+        # Convert to Decimal only for the exchange-facing hedge size
+        delta = snapshot.delta
         self.logger.log_info(f"Hedge required: Delta = {delta} ETH", LogTag.RISK)
 
         return True, delta
@@ -255,9 +324,45 @@ class RiskManager:
         Args:
             trade_data: Trade information
         """
-        trade_data["timestamp"] = datetime.utcnow()
+        trade_data["timestamp"] = self.clock.utcnow()
         self.recent_trades.append(trade_data)
 
+    def export_state(self) -> Dict[str, Any]:
+        """
+        Export the rate-limit window for a checkpoint.
+
+        Returns:
+            Dictionary of the trades of the past hour
+        """
+        cutoff_time = self.clock.utcnow() - timedelta(hours=1)
+        return {
+            "recent_trades": [
+                {
+                    **{key: str(value) for key, value in trade.items()},
+                    "timestamp": trade["timestamp"].isoformat(),
+                }
+                for trade in self.recent_trades
+                if trade["timestamp"] > cutoff_time
+            ]
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the rate-limit window from a checkpoint.
+
+        Args:
+            state: Dictionary from ``export_state``
+        """
+        self.recent_trades = [
+            {
+                **trade,
+                "size": Decimal(trade["size"]),
+                "price": Decimal(trade["price"]),
+                "timestamp": datetime.fromisoformat(trade["timestamp"]),
+            }
+            for trade in state.get("recent_trades", [])
+        ]
+
     def get_risk_summary(self) -> Dict[str, Any]:
         """
         Get current risk parameter summary.
@@ -273,6 +378,9 @@ class RiskManager:
             "recent_trade_count": len(self.recent_trades),
             "min_hedge_size": str(self.config.min_hedge_size_eth),
             "hedge_threshold": str(self.config.hedge_threshold_eth),
+            "hedge_band": (
+                self.hedge_band.get_stats() if self.hedge_band is not None else None
+            ),
             "max_slippage": str(self.config.max_slippage_percent),
             "default_leverage": str(self.config.default_leverage),
         }
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Differential check of the local limits engine against the live contract.
+
+Reads getLimits/computeQuote from the EulerSwap pool and compares them with
+the values computed locally from cached vault state and PoolParams. Reads
+are issued back-to-back; if a new block lands in between, rerun the check.
+
+With ``--record``, the raw inputs and on-chain outputs at the current block
+are appended to the test fixture the local engine is checked against.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import os
+import sys
+from decimal import Decimal
+from pathlib import Path
+from dotenv import load_dotenv
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from euler_swap import EulerPoolManager
+from euler_swap.curve import CurveParams
+
+# Candidate exact-in sizes per direction (token units)
+SIZES_TOKEN0 = [Decimal("10"), Decimal("1000"), Decimal("100000")]
+SIZES_TOKEN1 = [Decimal("0.01"), Decimal("1"), Decimal("50")]
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "quote_lib_vectors.json"
+
+
+async def compare(manager: EulerPoolManager) -> bool:
+    """Compare local and on-chain limits and quotes for both directions."""
+    await manager.fetch_pool_params()
+    all_match = True
+
+    for token_in_is_token0, sizes in ((True, SIZES_TOKEN0), (False, SIZES_TOKEN1)):
+        direction = "token0 -> token1" if token_in_is_token0 else "token1 -> token0"
+        print(f"\n🔍 {direction}")
+
+        onchain_in, onchain_out = await manager.get_swap_limits(token_in_is_token0)
+        local_in, local_out = await manager.get_local_swap_limits(token_in_is_token0)
+        limits_match = (onchain_in, onchain_out) == (local_in, local_out)
+        all_match &= limits_match
+        print(f"   {'✅' if limits_match else '❌'} limits")
+        print(f"      on-chain: in={onchain_in} out={onchain_out}")
+        print(f"      local:    in={local_in} out={local_out}")
+
+        local_quotes = await manager.get_local_quotes(sizes, token_in_is_token0)
+        for size, local_quote in zip(sizes, local_quotes):
+            # get_quote returns 0 when the contract reverts
+            onchain_quote = await manager.get_quote(size, token_in_is_token0)
+            quote_match = onchain_quote == (local_quote or Decimal("0"))
+            all_match &= quote_match
+            print(
+                f"   {'✅' if quote_match else '❌'} quote {size}: "
+                f"on-chain={onchain_quote} local={local_quote}"
+            )
+
+    return all_match
+
+
+async def record(manager: EulerPoolManager, path: Path) -> None:
+    """Append the raw inputs and contract outputs at the current block."""
+    await manager.fetch_pool_params()
+    block = manager._block_number
+    vault0, vault1, reserve0, reserve1 = await manager._fetch_limit_inputs()
+    functions = manager.contract.functions
+    asset0, asset1 = manager._assets
+
+    data = json.loads(path.read_text())
+    for asset0_is_input, sizes in ((True, SIZES_TOKEN0), (False, SIZES_TOKEN1)):
+        token_in, token_out = (asset0, asset1) if asset0_is_input else (asset1, asset0)
+        decimals_in = manager._decimals(asset0_is_input)[0]
+        limits = await functions.getLimits(token_in, token_out).call(
+            block_identifier=block
+        )
+
+        quotes = []
+        for size in sizes:
+            amount = int(size * Decimal(10**decimals_in))
+            try:
+                quote = await functions.computeQuote(
+                    token_in, token_out, amount, True
+                ).call(block_identifier=block)
+            except Exception:
+                quote = None  # Reverted
+            quotes.append({"amount": amount, "exact_in": True, "quote": quote})
+
+        data["vectors"].append(
+            {
+                "name": f"{manager.pool_address}@{block}",
+                "source": f"mainnet pool {manager.pool_address}",
+                "block": block,
+                "curve": dataclasses.asdict(
+                    CurveParams.from_pool_params(manager._pool_params)
+                ),
+                "reserve0": reserve0,
+                "reserve1": reserve1,
+                "vault0": dataclasses.asdict(vault0),
+                "vault1": dataclasses.asdict(vault1),
+                "asset0_is_input": asset0_is_input,
+                "limits": [int(limits[0]), int(limits[1])],
+                "quotes": quotes,
+            }
+        )
+
+    path.write_text(json.dumps(data, indent=2) + "\n")
+    print(f"📝 Recorded block {block} vectors to {path}")
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Append this block's contract vectors to the test fixture",
+    )
+    args = parser.parse_args()
+
+    load_dotenv()
+    rpc_url = os.getenv("RPC_URL")
+    pool_address = os.getenv(
+        "EULERSWAP_POOL", "0x55dcf9455eee8fd3f5eed17606291272cde428a8"
+    )
+    if not rpc_url:
+        print("❌ RPC_URL not found in .env")
+        return 1
+
+    w3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
+    with open(Path(__file__).parent.parent / "abi" / "eulerswap_pool.json") as f:
+        abi = json.load(f)
+    pool_address = w3.to_checksum_address(pool_address)
+    contract = w3.eth.contract(address=pool_address, abi=abi)
+
+    manager = EulerPoolManager(w3, pool_address, contract)
+    manager.note_block(await w3.eth.block_number)
+
+    print("\n" + "=" * 50)
+    print(f"Local vs on-chain limits @ block {manager._block_number}")
+    print("=" * 50)
+
+    if args.record:
+        await record(manager, FIXTURE)
+
+    ok = await compare(manager)
+    print("\n" + ("✅ Local limits engine matches" if ok else "❌ Mismatch detected"))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Backtest the hedging strategy on recorded position snapshots.
+
+Replays ``position_snapshots`` from the database through the real risk
+manager and strategy engine against a simulated exchange on a virtual
+clock, and prints P&L, hedge count and delta-error statistics.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backtest_engine import BacktestEngine, BacktestSettings
+from config_manager import Config
+from database_manager import DatabaseManager
+from logger_manager import LoggerManager
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default="sqlite:///lphedgebot.db")
+    parser.add_argument("--start", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--end", type=datetime.fromisoformat, default=None)
+    # Simulated market
+    parser.add_argument("--taker-fee", type=str, default="0.05")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--slippage-bps", type=str, default="1")
+    parser.add_argument("--balance", type=str, default="10000")
+    parser.add_argument("--initial-price", type=str, default=None)
+    # Hedge settings
+    parser.add_argument("--threshold", type=str, default="0.01")
+    parser.add_argument("--min-size", type=str, default="0.005")
+    parser.add_argument("--leverage", type=str, default="1")
+    parser.add_argument("--interval", type=int, default=30)
+    parser.add_argument("--window", type=float, default=0.25)
+    # Compare reactive hedging with forecast (anticipatory) hedging
+    parser.add_argument("--forecast", action="store_true")
+    parser.add_argument("--forecast-horizon", type=int, default=30)
+    parser.add_argument("--forecast-fraction", type=str, default="0.5")
+    return parser.parse_args()
+
+
+async def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+    LoggerManager().setup_logger(log_level="WARNING")
+
+    database_manager = DatabaseManager(args.database_url)
+    snapshots = list(database_manager.iter_position_snapshots(args.start, args.end))
+    if not snapshots:
+        print("❌ No position snapshots in range")
+        return 1
+
+    # Start from the last hedge price before the history unless given
+    initial_price = args.initial_price
+    if initial_price is None:
+        hedges = database_manager.get_hedge_snapshots(
+            end_time=snapshots[0].timestamp, limit=1
+        )
+        initial_price = hedges[0].price if hedges else "2000"
+
+    config = Config(
+        rpc_url="",
+        eulerswap_pool="",
+        binance_api_key="",
+        binance_api_secret="",
+        hedge_threshold_eth=Decimal(args.threshold),
+        min_hedge_size_eth=Decimal(args.min_size),
+        default_leverage=Decimal(args.leverage),
+        min_hedge_interval_seconds=args.interval,
+        hedge_coalesce_window_seconds=args.window,
+    )
+    settings = BacktestSettings(
+        taker_fee_percent=Decimal(args.taker_fee),
+        latency_ms=args.latency_ms,
+        slippage_bps=Decimal(args.slippage_bps),
+        initial_balance=Decimal(args.balance),
+        initial_price=Decimal(str(initial_price)),
+    )
+
+    print("\n" + "=" * 50)
+    print(
+        f"Backtest: {len(snapshots)} snapshots, "
+        f"{snapshots[0].timestamp} -> {snapshots[-1].timestamp}"
+    )
+    print("=" * 50)
+
+    result = await BacktestEngine(config, settings).run(snapshots)
+    if not args.forecast:
+        print(json.dumps(result.summary(), indent=2))
+        print(f"\n✅ Completed in {result.wall_seconds:.2f}s")
+        return 0
+
+    forecast_config = dataclasses.replace(
+        config,
+        forecast_hedging_enabled=True,
+        forecast_horizon_seconds=args.forecast_horizon,
+        forecast_hedge_fraction=Decimal(args.forecast_fraction),
+    )
+    forecast = await BacktestEngine(forecast_config, settings).run(snapshots)
+    print(
+        json.dumps(
+            {"reactive": result.summary(), "forecast": forecast.summary()}, indent=2
+        )
+    )
+    print(f"\n✅ Completed in {result.wall_seconds + forecast.wall_seconds:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
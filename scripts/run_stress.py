@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo stress test of the LP position plus perp hedge.
+
+Simulates thousands of price paths against the EulerSwap curve and the
+bot's hedge rules (thresholds, size limits, rate limit, hedge interval)
+and prints P&L, hedge cost and margin usage distributions.
+"""
+
+import argparse
+import json
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from config_manager import Config
+from risk_manager import RiskManager
+from stress_engine import HedgePolicy, PoolCurve, StressConfig, StressEngine
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=10000)
+    parser.add_argument("--hours", type=float, default=24.0)
+    parser.add_argument("--step-seconds", type=float, default=60.0)
+    parser.add_argument("--model", choices=["gbm", "jump"], default="jump")
+    parser.add_argument("--volatility", type=float, default=0.8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    # Pool (USDT / WETH, token units)
+    parser.add_argument("--reserve0", type=float, default=1_000_000.0)
+    parser.add_argument("--reserve1", type=float, default=500.0)
+    parser.add_argument("--price", type=float, default=2000.0)
+    parser.add_argument("--concentration", type=float, default=0.9)
+    parser.add_argument("--pool-fee", type=float, default=0.0005)
+    # Hedge settings
+    parser.add_argument("--threshold", type=str, default="0.01")
+    parser.add_argument("--min-size", type=str, default="0.005")
+    parser.add_argument("--leverage", type=str, default="1")
+    parser.add_argument("--collateral", type=float, default=2_000_000.0)
+    parser.add_argument("--interval", type=float, default=30.0)
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    config = Config(
+        rpc_url="",
+        eulerswap_pool="",
+        binance_api_key="",
+        binance_api_secret="",
+        hedge_threshold_eth=Decimal(args.threshold),
+        min_hedge_size_eth=Decimal(args.min_size),
+        default_leverage=Decimal(args.leverage),
+    )
+    curve = PoolCurve(
+        x0=args.reserve0,
+        y0=args.reserve1,
+        price0=args.price,
+        cx=args.concentration,
+        cy=args.concentration,
+        fee=args.pool_fee,
+    )
+    engine = StressEngine(
+        curve, HedgePolicy.from_risk_manager(RiskManager(config), args.interval)
+    )
+    stress_config = StressConfig(
+        n_paths=args.paths,
+        horizon_hours=args.hours,
+        step_seconds=args.step_seconds,
+        model=args.model,
+        annual_volatility=args.volatility,
+        collateral_usdt=args.collateral,
+        leverage=float(args.leverage),
+        seed=args.seed,
+        n_workers=args.workers,
+    )
+
+    print("\n" + "=" * 50)
+    print(
+        f"Stress test: {args.paths} {args.model} paths, "
+        f"{stress_config.n_steps} steps of {args.step_seconds:g}s"
+    )
+    print("=" * 50)
+
+    result = engine.run(stress_config)
+    print(json.dumps(result.summary(), indent=2))
+    print(f"\n✅ Completed in {result.elapsed_seconds:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
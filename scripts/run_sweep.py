@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Sweep hedge parameters over recorded position snapshots.
+
+Backtests a grid or a random sample of hedge threshold, minimum hedge
+size, hedge interval and leverage settings in parallel, ranks them by
+hedging cost against delta-tracking error and writes the table to CSV or
+Parquet.
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from backtest_engine import (
+    BacktestSettings,
+    ParameterSweep,
+    grid_points,
+    random_points,
+    write_csv,
+    write_parquet,
+)
+from config_manager import Config
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default="sqlite:///lphedgebot.db")
+    parser.add_argument("--start", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--end", type=datetime.fromisoformat, default=None)
+    parser.add_argument("--random", type=int, default=None, help="Random points")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--error-weight", type=float, default=1000.0)
+    parser.add_argument("--out", default="sweep.csv", help=".csv or .parquet")
+    # Simulated market
+    parser.add_argument("--taker-fee", type=str, default="0.05")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--slippage-bps", type=str, default="1")
+    parser.add_argument("--initial-price", type=str, default="2000")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    if args.random:
+        points = random_points(
+            {
+                "hedge_threshold_eth": ("0.005", "0.5"),
+                "min_hedge_size_eth": ("0.001", "0.05"),
+                "min_hedge_interval_seconds": (0, 300),
+                "default_leverage": ("1", "5"),
+            },
+            args.random,
+            seed=args.seed,
+        )
+    else:
+        points = grid_points(
+            {
+                "hedge_threshold_eth": [
+                    Decimal(v) for v in ("0.01", "0.05", "0.1", "0.25", "0.5")
+                ],
+                "min_hedge_size_eth": [Decimal(v) for v in ("0.005", "0.01", "0.05")],
+                "min_hedge_interval_seconds": [0, 30, 60, 120, 300],
+                "default_leverage": [Decimal("1"), Decimal("3")],
+            }
+        )
+
+    config = Config(
+        rpc_url="",
+        eulerswap_pool="",
+        binance_api_key="",
+        binance_api_secret="",
+    )
+    settings = BacktestSettings(
+        taker_fee_percent=Decimal(args.taker_fee),
+        latency_ms=args.latency_ms,
+        slippage_bps=Decimal(args.slippage_bps),
+        initial_price=Decimal(args.initial_price),
+    )
+
+    print("\n" + "=" * 50)
+    print(f"Parameter sweep: {len(points)} sets")
+    print("=" * 50)
+
+    sweep = ParameterSweep(
+        config,
+        args.database_url,
+        settings,
+        start=args.start,
+        end=args.end,
+        error_weight=args.error_weight,
+    )
+    rows = sweep.run(points, n_workers=args.workers)
+
+    if args.out.endswith(".parquet"):
+        write_parquet(rows, args.out)
+    else:
+        write_csv(rows, args.out)
+
+    for row in rows[:10]:
+        print(row.to_dict())
+    print(f"\n✅ {len(rows)} results written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""Shadow strategies on the live feed for LPHedgeBot."""
+
+from .shadow_engine import DeltaErrorStats, ShadowRunner, ShadowStrategy
+from .shadow_exchange import ShadowExchange
+
+__all__ = ["DeltaErrorStats", "ShadowExchange", "ShadowRunner", "ShadowStrategy"]
@@ -0,0 +1,322 @@
+"""Shadow strategies evaluated on the live snapshot feed."""
+
+import asyncio
+import dataclasses
+import math
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Dict, Optional
+
+from config_manager import Config
+from database_manager import DatabaseManager
+from logger_manager import LoggerManager, LogTag
+from models import HedgeIntent, HedgeSnapshot, PositionSnapshot, Trade
+from models.hedge_snapshot import HedgeAction
+from risk_manager import RiskManager
+from strategy_engine import StrategyEngine
+from .shadow_exchange import ShadowExchange
+
+
+class DeltaErrorStats:
+    """Running statistics of the absolute delta carried into each snapshot."""
+
+    def __init__(self, threshold: Decimal):
+        """
+        Initialize the statistics.
+
+        Args:
+            threshold: Hedge threshold used for time-in-band
+        """
+        self.threshold = threshold
+        self.count = 0
+        self.within = 0
+        self.total = 0.0
+        self.total_squared = 0.0
+        self.max = 0.0
+
+    def add(self, delta: Decimal) -> None:
+        """Record the delta of one snapshot."""
+        error = float(abs(delta))
+        self.count += 1
+        self.within += abs(delta) <= self.threshold
+        self.total += error
+        self.total_squared += error * error
+        self.max = max(self.max, error)
+
+    def to_dict(self) -> dict:
+        """Convert the statistics to a dictionary."""
+        n = self.count or 1
+        return {
+            "mean_abs": self.total / n,
+            "rms": math.sqrt(self.total_squared / n),
+            "max_abs": self.max,
+            "within_threshold": self.within / n,
+        }
+
+
+class _ShadowRecorder:
+    """Database stand-in that records a shadow's hedges to its own table."""
+
+    def __init__(self, database_manager: DatabaseManager, strategy: str):
+        """Record to a database under a strategy name."""
+        self.database_manager = database_manager
+        self.strategy = strategy
+
+    def save_hedge_snapshot(self, hedge: HedgeSnapshot) -> int:
+        """Record a hedge decision of the shadow."""
+        return self.database_manager.save_shadow_hedge(self.strategy, hedge)
+
+    def save_trade(self, trade: Trade) -> int:
+        """Simulated fills stay on the shadow exchange."""
+        return 0
+
+    def save_hedge_intent(self, intent: HedgeIntent) -> None:
+        """Simulated orders never need recovery."""
+
+    def get_unresolved_hedge_intents(self) -> list:
+        """Simulated orders never need recovery."""
+        return []
+
+
+class ShadowStrategy:
+    """
+    One alternative strategy run against simulated fills.
+
+    It sees the reserves of every live snapshot with its own short position
+    from a ShadowExchange, so its hedges, fees and tracking error evolve as
+    if it had been trading live from the first snapshot it saw.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Config,
+        database_manager: Optional[DatabaseManager] = None,
+    ):
+        """
+        Initialize the shadow strategy.
+
+        Args:
+            name: Name its decisions are recorded under
+            config: Strategy configuration under test
+            database_manager: Optional database for its hedge decisions
+        """
+        # Maker orders need an order stream, and simulated fills have no
+        # latency to budget for
+        if config.execution_style == "maker":
+            config = dataclasses.replace(config, execution_style="twap")
+        config = dataclasses.replace(config, hedge_latency_budget_ms=0)
+
+        self.name = name
+        self.config = config
+        self.exchange = ShadowExchange()
+        self.engine = StrategyEngine(
+            config,
+            self.exchange,
+            RiskManager(config),
+            _ShadowRecorder(database_manager, name) if database_manager else None,
+        )
+        self.delta_errors = DeltaErrorStats(config.hedge_threshold_eth)
+        self.processing_ms: deque = deque(maxlen=100)
+        self._started = False
+
+    async def process(self, snapshot: PositionSnapshot, mark_price: Decimal) -> None:
+        """
+        Evaluate one live snapshot.
+
+        Args:
+            snapshot: Live snapshot (its short position is replaced)
+            mark_price: Live mark price simulated fills are made at
+        """
+        self.exchange.set_price(mark_price)
+        if not self._started:
+            # Start from the live position
+            self.exchange.short_size = snapshot.short_position_size
+            self.exchange.entry_price = mark_price
+            self._started = True
+
+        shadow = PositionSnapshot(
+            reserve_token0=snapshot.reserve_token0,
+            reserve_token1=snapshot.reserve_token1,
+            short_position_size=self.exchange.short_size,
+            timestamp=snapshot.timestamp,
+            block_number=snapshot.block_number,
+            pool_address=snapshot.pool_address,
+        )
+        self.delta_errors.add(shadow.delta)
+
+        started = time.perf_counter()
+        await self.engine.process_position_snapshot(shadow)
+        self.processing_ms.append((time.perf_counter() - started) * 1000)
+
+    def report(self) -> dict:
+        """
+        Summarize the shadow's performance.
+
+        Returns:
+            Dictionary of hedges, volume, fees, P&L and delta error
+        """
+        exchange = self.exchange
+        hedge_pnl = exchange.realized_pnl
+        if exchange.mark_price is not None:
+            hedge_pnl += exchange.unrealized_pnl()
+        processing = self.processing_ms
+        return {
+            "hedges": self.engine.total_hedges,
+            "fills": exchange.fill_count,
+            "volume_eth": str(exchange.volume),
+            "fees": f"{exchange.fees_paid:.2f}",
+            "hedge_pnl": f"{hedge_pnl:.2f}",
+            "delta_error_eth": self.delta_errors.to_dict(),
+            "processing_ms": {
+                "mean": (
+                    round(sum(processing) / len(processing), 3) if processing else None
+                ),
+                "max": round(max(processing), 3) if processing else None,
+            },
+        }
+
+
+class ShadowRunner:
+    """
+    Runs shadow strategies on the live strategy's snapshot feed.
+
+    Every snapshot the live StrategyEngine evaluates is handed to the
+    shadows in the background, together with the live mark price from the
+    live pre-trade cache, so shadows add no RPC or exchange requests. The
+    live path only stores the snapshot: while the shadows are busy, newer
+    snapshots replace older ones instead of queueing, which bounds the
+    cost of each shadow to one evaluation per round.
+    """
+
+    def __init__(
+        self,
+        live: StrategyEngine,
+        configs: Dict[str, Config],
+        database_manager: Optional[DatabaseManager] = None,
+        max_shadows: int = 8,
+    ):
+        """
+        Initialize the shadow runner.
+
+        Args:
+            live: Live strategy engine whose snapshots are mirrored
+            configs: Configuration per shadow strategy name
+            database_manager: Optional database for shadow decisions
+            max_shadows: Maximum number of shadow strategies
+        """
+        if len(configs) > max_shadows:
+            raise ValueError(
+                f"{len(configs)} shadow strategies configured, at most "
+                f"{max_shadows} allowed"
+            )
+
+        self.live = live
+        self.shadows = {
+            name: ShadowStrategy(name, config, database_manager)
+            for name, config in configs.items()
+        }
+        self.logger = LoggerManager()
+
+        # Live performance over the same snapshots
+        self.live_errors = DeltaErrorStats(live.config.hedge_threshold_eth)
+        self.live_fills = 0
+        self.live_volume = Decimal("0")
+        self.live_fees = Decimal("0")
+
+        self.rounds = 0
+        self.superseded = 0
+        self._latest: Optional[PositionSnapshot] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        live.snapshot_listeners.append(self.offer)
+        live.fill_listeners.append(self._on_live_fill)
+
+    def offer(self, snapshot: PositionSnapshot) -> None:
+        """
+        Queue a live snapshot for the shadows; the latest one wins.
+
+        Args:
+            snapshot: Snapshot evaluated by the live strategy
+        """
+        if self._latest is not None:
+            self.superseded += 1
+        self._latest = snapshot
+        self._wakeup.set()
+
+    def _on_live_fill(self, action: HedgeAction, trade: Trade) -> None:
+        """Account for a live fill."""
+        self.live_fills += 1
+        self.live_volume += trade.size
+        if trade.fee:
+            self.live_fees += trade.fee
+
+    async def start(self) -> None:
+        """Start evaluating shadows in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            self.logger.log_info(
+                f"Shadow strategies running: {', '.join(self.shadows)}",
+                LogTag.STRATEGY,
+            )
+
+    async def stop(self) -> None:
+        """Stop the background loop and the shadows' own background work."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+        for shadow in self.shadows.values():
+            await shadow.engine.stop()
+
+    async def _run(self) -> None:
+        """Evaluate the latest live snapshot whenever one arrives."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            snapshot, self._latest = self._latest, None
+            if snapshot is None:
+                continue
+            try:
+                await self.run_round(snapshot)
+            except Exception as e:
+                self.logger.log_error("Shadow round failed", e)
+
+    async def run_round(self, snapshot: PositionSnapshot) -> None:
+        """
+        Evaluate every shadow on one live snapshot.
+
+        Args:
+            snapshot: Snapshot evaluated by the live strategy
+        """
+        inputs = await self.live.pre_trade.get_inputs()
+        self.live_errors.add(snapshot.delta)
+        for shadow in self.shadows.values():
+            await shadow.process(snapshot, inputs.mark_price)
+        self.rounds += 1
+
+    def report(self) -> dict:
+        """
+        Compare the live strategy with each shadow over the same snapshots.
+
+        Returns:
+            Dictionary with live and per-shadow performance
+        """
+        return {
+            "rounds": self.rounds,
+            "superseded": self.superseded,
+            "live": {
+                "hedges": self.live.total_hedges,
+                "fills": self.live_fills,
+                "volume_eth": str(self.live_volume),
+                "fees": f"{self.live_fees:.2f}",
+                "delta_error_eth": self.live_errors.to_dict(),
+            },
+            "shadows": {name: shadow.report() for name, shadow in self.shadows.items()},
+        }
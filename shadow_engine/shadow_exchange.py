@@ -0,0 +1,79 @@
+"""Paper exchange filling shadow orders at the live mark price."""
+
+from decimal import Decimal
+from typing import Optional
+
+from backtest_engine import SimulatedExchange
+from models import SYSTEM_CLOCK, Trade
+from models.trade import OrderSide
+
+
+class ShadowExchange(SimulatedExchange):
+    """
+    Simulated venue for a shadow strategy in a live process.
+
+    Market orders fill at once, on the system clock, at the last live mark
+    price handed to ``set_price`` moved against the order by
+    ``slippage_bps``. No request ever leaves the process, and only the
+    latest ``max_fills`` fills are kept so a long-running shadow stays small.
+    """
+
+    def __init__(
+        self,
+        taker_fee_percent: Decimal = Decimal("0.05"),
+        slippage_bps: Decimal = Decimal("1"),
+        initial_balance: Decimal = Decimal("10000"),
+        max_fills: int = 500,
+    ):
+        """
+        Initialize the shadow exchange.
+
+        Args:
+            taker_fee_percent: Fee charged on each fill's notional
+            slippage_bps: Adverse price move applied to each fill
+            initial_balance: Starting USDT balance
+            max_fills: Fills kept for lookups
+        """
+        super().__init__(
+            SYSTEM_CLOCK,
+            price_times=[],
+            prices=[],
+            taker_fee_percent=taker_fee_percent,
+            latency_ms=0,
+            slippage_bps=slippage_bps,
+            initial_balance=initial_balance,
+        )
+        self.mark_price: Optional[Decimal] = None
+        self.max_fills = max_fills
+
+        # Totals over all fills, including those no longer kept
+        self.fill_count = 0
+        self.volume = Decimal("0")
+
+    def set_price(self, price: Decimal) -> None:
+        """Set the live mark price fills are made at."""
+        self.mark_price = price
+
+    def price_now(self) -> Decimal:
+        """Last live mark price."""
+        if self.mark_price is None:
+            raise RuntimeError("No live mark price yet")
+        return self.mark_price
+
+    def _fill(
+        self,
+        symbol: str,
+        side: OrderSide,
+        size: Decimal,
+        client_order_id: Optional[str] = None,
+    ) -> Trade:
+        """Fill a market order and drop the oldest fills beyond the cap."""
+        trade = super()._fill(symbol, side, size, client_order_id)
+        self.fill_count += 1
+        self.volume += size
+
+        if len(self.fills) > self.max_fills:
+            del self.fills[0]
+        while len(self._by_client_id) > self.max_fills:
+            del self._by_client_id[next(iter(self._by_client_id))]
+        return trade
@@ -1,5 +1,18 @@
 """Strategy engine for hedging logic."""
 
+from .checkpoint import load_checkpoint, save_checkpoint
+from .forecaster import ReserveForecaster
+from .pre_trade import PreTradeCache, PreTradeInputs
 from .strategy_engine import StrategyEngine
+from .portfolio import PoolAllocation, PortfolioHedger
 
-__all__ = ["StrategyEngine"]
+__all__ = [
+    "PoolAllocation",
+    "PortfolioHedger",
+    "PreTradeCache",
+    "PreTradeInputs",
+    "ReserveForecaster",
+    "StrategyEngine",
+    "load_checkpoint",
+    "save_checkpoint",
+]
@@ -0,0 +1,45 @@
+"""Compact checkpoint of strategy state for warm restarts."""
+
+import json
+import os
+from typing import Dict
+
+from logger_manager import LoggerManager
+
+
+def save_checkpoint(path: str, states: Dict[str, dict]) -> None:
+    """
+    Write strategy states atomically.
+
+    The checkpoint is written to a temporary file and renamed over the
+    previous one, so a crash mid-write never leaves a truncated file.
+
+    Args:
+        path: Checkpoint file
+        states: State per symbol from ``StrategyEngine.export_state``
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(states, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> Dict[str, dict]:
+    """
+    Read strategy states written by ``save_checkpoint``.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        State per symbol, or an empty dictionary if the file is missing
+        or unreadable
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        LoggerManager().log_error(f"Ignoring unreadable checkpoint {path}", e)
+        return {}
@@ -0,0 +1,133 @@
+"""Hedge coalescing window."""
+
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from models import Clock, PositionSnapshot, SYSTEM_CLOCK
+
+
+class HedgeCoalescer:
+    """
+    Collects hedge signals over a short window and releases one netted hedge.
+
+    The first snapshot that needs a hedge opens a window. Later snapshots
+    replace it, so the hedge that fires is sized to the net delta at the
+    end of the window. The window fires early when the delta crosses the
+    urgency threshold, and is dropped if the delta comes back within
+    threshold before it closes.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        urgency_threshold: Decimal,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            window_seconds: Coalescing horizon (0 disables coalescing)
+            urgency_threshold: Absolute delta that fires immediately
+            clock: Time source (virtual in backtests)
+        """
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self.urgency_threshold = urgency_threshold
+
+        self._snapshot: Optional[PositionSnapshot] = None
+        self._hedge_size = Decimal("0")
+        self._deadline: Optional[float] = None
+        self._offered_at: Optional[float] = None
+
+        # Time the hedge last taken waited for its window to close
+        self.held_seconds = 0.0
+
+        # Statistics
+        self.windows_opened = 0
+        self.windows_fired = 0
+        self.windows_dropped = 0
+        self.snapshots_coalesced = 0
+
+    @property
+    def pending(self) -> bool:
+        """Whether a window is open."""
+        return self._snapshot is not None
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """Monotonic time at which the open window closes."""
+        return self._deadline
+
+    def offer(
+        self, snapshot: PositionSnapshot, hedge_size: Decimal
+    ) -> Optional[Tuple[PositionSnapshot, Decimal]]:
+        """
+        Offer a snapshot that needs a hedge.
+
+        Args:
+            snapshot: Snapshot that passed the hedge checks
+            hedge_size: Hedge size for that snapshot
+
+        Returns:
+            (snapshot, hedge_size) to execute now, or None to keep waiting
+        """
+        now = self.clock.monotonic()
+        if self._snapshot is None:
+            self.windows_opened += 1
+            self._deadline = now + self.window_seconds
+        else:
+            self.snapshots_coalesced += 1
+
+        self._snapshot = snapshot
+        self._hedge_size = hedge_size
+        self._offered_at = now
+
+        if abs(hedge_size) >= self.urgency_threshold or now >= self._deadline:
+            return self.take()
+        return None
+
+    def take(self) -> Optional[Tuple[PositionSnapshot, Decimal]]:
+        """
+        Close the window and return the netted hedge.
+
+        Returns:
+            (snapshot, hedge_size) of the latest signal, or None if no window
+        """
+        if self._snapshot is None:
+            return None
+
+        result = (self._snapshot, self._hedge_size)
+        self.held_seconds = max(self.clock.monotonic() - self._offered_at, 0.0)
+        self._reset()
+        self.windows_fired += 1
+        return result
+
+    def drop(self) -> None:
+        """Discard the open window (delta is back within threshold)."""
+        if self._snapshot is not None:
+            self._reset()
+            self.windows_dropped += 1
+
+    def _reset(self) -> None:
+        """Clear window state."""
+        self._snapshot = None
+        self._hedge_size = Decimal("0")
+        self._deadline = None
+        self._offered_at = None
+
+    def get_stats(self) -> dict:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with window counts
+        """
+        return {
+            "window_seconds": self.window_seconds,
+            "urgency_threshold": str(self.urgency_threshold),
+            "windows_opened": self.windows_opened,
+            "windows_fired": self.windows_fired,
+            "windows_dropped": self.windows_dropped,
+            "snapshots_coalesced": self.snapshots_coalesced,
+        }
@@ -0,0 +1,123 @@
+"""Streaming short-horizon forecast of a pool's token1 reserve."""
+
+import math
+from datetime import datetime
+from typing import Optional
+
+
+class ReserveForecaster:
+    """
+    Online estimate of where the pool's token1 reserve is heading.
+
+    A two-state Kalman filter (level and drift per second, local linear
+    trend) tracks the reserve, and an EWMA of the sign of each reserve
+    change tracks the direction of swap flow. Both update in O(1) per
+    snapshot or Swap event. The expected change over a horizon is the
+    drift times the horizon, and only while the flow has kept a consistent
+    direction that agrees with the drift; choppy flow forecasts nothing.
+    """
+
+    def __init__(
+        self,
+        flow_alpha: float = 0.2,
+        min_flow_confidence: float = 0.5,
+        process_noise: float = 1e-6,
+        measurement_noise: float = 1e-4,
+    ):
+        """
+        Initialize the forecaster.
+
+        Args:
+            flow_alpha: EWMA weight of the latest swap direction
+            min_flow_confidence: |flow EWMA| needed to forecast at all
+            process_noise: Variance rate of the drift ((ETH/s)^2 per second)
+            measurement_noise: Variance of an observed reserve (ETH^2)
+        """
+        self.flow_alpha = flow_alpha
+        self.min_flow_confidence = min_flow_confidence
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+
+        # Filter state and covariance [[p00, p01], [p01, p11]]
+        self.level: Optional[float] = None
+        self.drift = 0.0
+        self._p00 = self._p01 = self._p11 = 0.0
+        self._last_time: Optional[datetime] = None
+        self._last_reserve = 0.0
+
+        # EWMA of swap direction in [-1, 1]: +1 = token1 flowing in
+        self.flow = 0.0
+        self.updates = 0
+
+    def observe(self, reserve1: float, timestamp: datetime) -> None:
+        """
+        Update with an observed token1 reserve.
+
+        Args:
+            reserve1: Token1 reserve (ETH)
+            timestamp: Time of the observation
+        """
+        self.updates += 1
+        if self.level is None:
+            self.level = reserve1
+            self._p00 = self.measurement_noise
+            self._p11 = self.measurement_noise
+            self._last_time = timestamp
+            self._last_reserve = reserve1
+            return
+
+        change = reserve1 - self._last_reserve
+        if change:
+            direction = 1.0 if change > 0 else -1.0
+            self.flow += self.flow_alpha * (direction - self.flow)
+        self._last_reserve = reserve1
+
+        # Predict: the level moves with the drift, which itself wanders
+        dt = max((timestamp - self._last_time).total_seconds(), 0.0)
+        self._last_time = max(timestamp, self._last_time)
+        q = self.process_noise
+        self.level += self.drift * dt
+        self._p00 += dt * (2 * self._p01 + dt * self._p11) + q * dt**3 / 3
+        self._p01 += dt * self._p11 + q * dt**2 / 2
+        self._p11 += q * dt
+
+        # Update with the observed level
+        innovation = reserve1 - self.level
+        s = self._p00 + self.measurement_noise
+        k0, k1 = self._p00 / s, self._p01 / s
+        self.level += k0 * innovation
+        self.drift += k1 * innovation
+        p01 = self._p01
+        self._p00 -= k0 * self._p00
+        self._p01 -= k0 * p01
+        self._p11 -= k1 * p01
+
+    def expected_change(self, horizon_seconds: float) -> float:
+        """
+        Expected change of the token1 reserve over a horizon.
+
+        Args:
+            horizon_seconds: Forecast horizon
+
+        Returns:
+            Change in ETH (0 when the flow direction is not persistent)
+        """
+        if abs(self.flow) < self.min_flow_confidence:
+            return 0.0
+        if math.copysign(1.0, self.flow) != math.copysign(1.0, self.drift):
+            return 0.0
+        return self.drift * horizon_seconds
+
+    def get_stats(self) -> dict:
+        """
+        Get forecaster statistics.
+
+        Returns:
+            Dictionary with the filter state and flow direction
+        """
+        return {
+            "level_eth": round(self.level, 6) if self.level is not None else None,
+            "drift_eth_per_min": round(self.drift * 60, 6),
+            "flow": round(self.flow, 3),
+            "updates": self.updates,
+        }
@@ -0,0 +1,287 @@
+"""Cross-pool delta netting above the per-perp strategy engines."""
+
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from models import HedgeSnapshot, PositionSnapshot, Trade
+from models.hedge_snapshot import HedgeAction
+from swap_monitor import SwapEvent
+from .strategy_engine import StrategyEngine
+
+
+@dataclass
+class PoolAllocation:
+    """
+    One pool's share of the hedge on its perp.
+
+    Attributes:
+        pool_address: EulerSwap pool
+        symbol: Perpetual the pool's underlying is hedged on
+        snapshot: Latest snapshot of the pool
+        allocated_short: Part of the perp short attributed to the pool
+        fills: Hedge fills allocated to the pool
+        volume: Size of those fills
+        fees: Fees of those fills
+    """
+
+    pool_address: str
+    symbol: str
+    snapshot: Optional[PositionSnapshot] = None
+    allocated_short: Decimal = Decimal("0")
+    fills: int = 0
+    volume: Decimal = Decimal("0")
+    fees: Decimal = Decimal("0")
+
+    @property
+    def reserve(self) -> Decimal:
+        """Underlying held by the pool."""
+        return self.snapshot.reserve_token1 if self.snapshot else Decimal("0")
+
+    @property
+    def delta(self) -> Decimal:
+        """Pool's underlying less its share of the short."""
+        return self.reserve - self.allocated_short
+
+    def to_dict(self) -> dict:
+        """Convert the allocation to a dictionary."""
+        return {
+            "symbol": self.symbol,
+            "reserve": str(self.reserve),
+            "allocated_short": str(self.allocated_short),
+            "delta": str(self.delta),
+            "fills": self.fills,
+            "volume": str(self.volume),
+            "fees": str(self.fees),
+        }
+
+
+class PortfolioHedger:
+    """
+    Nets the deltas of all monitored pools per perp before hedging.
+
+    Pools holding the same underlying are combined into one snapshot per
+    perp symbol and handed to that symbol's StrategyEngine, so opposite
+    pool deltas cancel instead of trading against each other. Each fill
+    is allocated back to the pools in proportion to the delta it hedges.
+    """
+
+    def __init__(self, engines: Dict[str, StrategyEngine]):
+        """
+        Initialize the portfolio hedger.
+
+        Args:
+            engines: Strategy engine per perp symbol
+        """
+        self.engines = engines
+        self.pools: Dict[str, PoolAllocation] = {}
+        self._readers: Dict[str, Callable[[], Awaitable[PositionSnapshot]]] = {}
+        self._last_swap_event: Dict[str, tuple] = {}
+
+        for symbol, engine in engines.items():
+            engine.fill_listeners.append(
+                lambda action, trade, symbol=symbol: self.allocate_fill(
+                    symbol, action, trade
+                )
+            )
+
+    def add_pool(
+        self,
+        pool_address: str,
+        symbol: str,
+        reader: Optional[Callable[[], Awaitable[PositionSnapshot]]] = None,
+    ) -> None:
+        """
+        Monitor a pool whose underlying is hedged on a perp.
+
+        Args:
+            pool_address: EulerSwap pool
+            symbol: Perp symbol (must have an engine)
+            reader: Optional reader of a fresh snapshot of the pool; with
+                readers for every pool, stale decisions are recomputed
+        """
+        if symbol not in self.engines:
+            raise ValueError(f"No strategy engine for {symbol}")
+        self.pools[pool_address] = PoolAllocation(pool_address, symbol)
+        if reader is not None:
+            self._readers[pool_address] = reader
+
+        engine = self.engines[symbol]
+        if all(pool in self._readers for pool in self._pools_of(symbol)):
+            engine.snapshot_source = lambda: self.read_net_snapshot(symbol)
+        else:
+            engine.snapshot_source = None
+
+    def _pools_of(self, symbol: str) -> List[str]:
+        """Pools hedged on a perp."""
+        return [pool for pool, a in self.pools.items() if a.symbol == symbol]
+
+    async def process_pool_snapshot(
+        self, pool_address: str, snapshot: PositionSnapshot
+    ) -> Optional[HedgeSnapshot]:
+        """
+        Update a pool and evaluate the netted hedge of its perp.
+
+        Args:
+            pool_address: Pool the snapshot is of
+            snapshot: Pool snapshot (short_position_size is the perp's)
+
+        Returns:
+            HedgeSnapshot if a hedge was executed, None otherwise
+        """
+        allocation = self.pools[pool_address]
+        allocation.snapshot = snapshot
+        net = self.net_snapshot(allocation.symbol, snapshot)
+        if net is None:
+            return None
+        return await self.engines[allocation.symbol].process_position_snapshot(net)
+
+    async def process_swap_event(
+        self, pool_address: str, event: SwapEvent
+    ) -> Optional[HedgeSnapshot]:
+        """
+        Update a pool from a decoded Swap event and evaluate its perp.
+
+        Args:
+            pool_address: Pool that emitted the event
+            event: Decoded Swap event
+
+        Returns:
+            HedgeSnapshot if a hedge was executed, None otherwise
+        """
+        key = (event.block_number, event.log_index)
+        last = self._last_swap_event.get(pool_address)
+        if last is not None and key <= last:
+            return None
+        self._last_swap_event[pool_address] = key
+
+        engine = self.engines[self.pools[pool_address].symbol]
+        short_size = engine.current_short_size
+        if short_size is None:
+            return None
+        return await self.process_pool_snapshot(
+            pool_address, event.to_snapshot(short_size, pool_address)
+        )
+
+    def net_snapshot(
+        self, symbol: str, trigger: PositionSnapshot
+    ) -> Optional[PositionSnapshot]:
+        """
+        Combine the latest snapshots of a perp's pools.
+
+        Args:
+            symbol: Perp symbol
+            trigger: Snapshot that prompted the evaluation; it supplies the
+                short position, source and observation time
+
+        Returns:
+            Netted snapshot, or None until every pool has been seen
+        """
+        allocations = [self.pools[pool] for pool in self._pools_of(symbol)]
+        if any(a.snapshot is None for a in allocations):
+            return None
+
+        self._allocate_unattributed(allocations, trigger.short_position_size)
+        blocks = [a.snapshot.block_number for a in allocations]
+        return PositionSnapshot(
+            reserve_token0=sum(
+                (a.snapshot.reserve_token0 for a in allocations), Decimal("0")
+            ),
+            reserve_token1=sum((a.reserve for a in allocations), Decimal("0")),
+            short_position_size=trigger.short_position_size,
+            timestamp=trigger.timestamp,
+            block_number=max((b for b in blocks if b is not None), default=None),
+            source=trigger.source,
+            observed_at=trigger.observed_at,
+            trace=trigger.trace,
+        )
+
+    async def read_net_snapshot(self, symbol: str) -> PositionSnapshot:
+        """
+        Read every pool of a perp afresh and net them.
+
+        Args:
+            symbol: Perp symbol
+
+        Returns:
+            Netted snapshot
+        """
+        pools = self._pools_of(symbol)
+        fresh = await asyncio.gather(*(self._readers[pool]() for pool in pools))
+        for pool, snapshot in zip(pools, fresh):
+            self.pools[pool].snapshot = snapshot
+
+        # The oldest read bounds the age of the netted view
+        oldest = min(fresh, key=lambda snapshot: snapshot.observed_at or 0)
+        return self.net_snapshot(symbol, oldest)
+
+    def _allocate_unattributed(
+        self, allocations: List[PoolAllocation], short_size: Decimal
+    ) -> None:
+        """Spread short not attributed by our fills pro rata to reserves."""
+        unattributed = short_size - sum(
+            (a.allocated_short for a in allocations), Decimal("0")
+        )
+        if unattributed:
+            self._spread(allocations, unattributed, [a.reserve for a in allocations])
+
+    def allocate_fill(self, symbol: str, action: HedgeAction, trade: Trade) -> None:
+        """
+        Allocate a perp fill to the pools whose delta it hedges.
+
+        Opening shorts go to pools with positive delta, closing to pools
+        with negative delta, in proportion to that delta; if no pool has
+        delta of that sign the fill is spread by reserves.
+
+        Args:
+            symbol: Perp symbol
+            action: Open or close short
+            trade: The fill
+        """
+        allocations = [self.pools[pool] for pool in self._pools_of(symbol)]
+        if not allocations:
+            return
+
+        sign = 1 if action == HedgeAction.OPEN_SHORT else -1
+        weights = [max(sign * a.delta, Decimal("0")) for a in allocations]
+        if not any(weights):
+            weights = [a.reserve for a in allocations]
+
+        shares = self._spread(allocations, sign * trade.size, weights)
+        for allocation, share in zip(allocations, shares):
+            if not share:
+                continue
+            allocation.fills += 1
+            allocation.volume += abs(share)
+            if trade.fee:
+                allocation.fees += trade.fee * abs(share) / trade.size
+
+    @staticmethod
+    def _spread(
+        allocations: List[PoolAllocation], amount: Decimal, weights: List[Decimal]
+    ) -> List[Decimal]:
+        """Add an amount of short to pools by weight; returns the shares."""
+        total = sum(weights, Decimal("0"))
+        if not total:
+            weights, total = [Decimal("1")] * len(allocations), Decimal(
+                len(allocations)
+            )
+
+        shares = [amount * weight / total for weight in weights]
+        # Rounding remainder to the largest share keeps the sum exact
+        largest = max(range(len(shares)), key=lambda i: abs(shares[i]))
+        shares[largest] += amount - sum(shares, Decimal("0"))
+
+        for allocation, share in zip(allocations, shares):
+            allocation.allocated_short += share
+        return shares
+
+    def get_stats(self) -> dict:
+        """
+        Get per-pool allocation statistics.
+
+        Returns:
+            Dictionary of allocations by pool address
+        """
+        return {pool: allocation.to_dict() for pool, allocation in self.pools.items()}
@@ -0,0 +1,203 @@
+"""Pre-trade input cache for the hedge critical path."""
+
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from exchange_manager import IExchange
+from logger_manager import LoggerManager, LogTag
+from models import Clock, SYSTEM_CLOCK
+
+
+@dataclass
+class PreTradeInputs:
+    """
+    Market and account inputs needed before placing a hedge order.
+
+    Attributes:
+        mark_price: Mark price of the perpetual
+        balance: Free balance of the margin currency
+        mark_price_age: Seconds since the mark price was fetched
+        balance_age: Seconds since the balance was fetched
+        round_trips: Exchange round-trips awaited to produce these inputs
+    """
+
+    mark_price: Decimal
+    balance: Decimal
+    mark_price_age: float
+    balance_age: float
+    round_trips: int
+
+
+class PreTradeCache:
+    """
+    Serves pre-trade inputs from fresh-enough cache entries.
+
+    Stale entries are refetched concurrently, with a single in-flight
+    request per input, so a hedge waits at most one round-trip for its
+    inputs. ``warm`` refreshes stale entries in the background so that a
+    hedge usually waits for none.
+    """
+
+    def __init__(
+        self,
+        exchange: IExchange,
+        symbol: str,
+        currency: str = "USDT",
+        price_max_age_seconds: float = 10.0,
+        balance_max_age_seconds: float = 30.0,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        """
+        Initialize the pre-trade cache.
+
+        Args:
+            exchange: Exchange to fetch inputs from
+            symbol: Perpetual symbol for the mark price
+            currency: Margin currency for the balance
+            price_max_age_seconds: Staleness bound for the mark price
+            balance_max_age_seconds: Staleness bound for the balance
+            clock: Time source (virtual in backtests)
+        """
+        self.exchange = exchange
+        self.clock = clock
+        self.symbol = symbol
+        self.currency = currency
+        self.logger = LoggerManager()
+
+        self._fetchers: Dict[str, Callable[[], Awaitable[Any]]] = {
+            "mark_price": lambda: self.exchange.get_mark_price(self.symbol),
+            "balance": lambda: self.exchange.get_balance(self.currency),
+        }
+        self._max_age = {
+            "mark_price": price_max_age_seconds,
+            "balance": balance_max_age_seconds,
+        }
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._warm_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.hits = 0
+        self.fetches = 0
+
+    def _fresh(self, name: str) -> Optional[Tuple[Any, float]]:
+        """Return the cache entry if it is within its staleness bound."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        if self.clock.monotonic() - entry[1] > self._max_age[name]:
+            return None
+        return entry
+
+    async def _fetch(self, name: str) -> Tuple[Any, float]:
+        """Fetch one input, joining an in-flight request if there is one."""
+        inflight = self._inflight.get(name)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[name] = future
+        try:
+            value = await self._fetchers[name]()
+            entry = (value, self.clock.monotonic())
+            self._entries[name] = entry
+            self.fetches += 1
+            future.set_result(entry)
+            return entry
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()  # Cancelled mid-fetch; release any joiners
+            del self._inflight[name]
+
+    async def get_inputs(self) -> PreTradeInputs:
+        """
+        Get pre-trade inputs, fetching only stale ones (concurrently).
+
+        Returns:
+            PreTradeInputs
+        """
+        entries: Dict[str, Tuple[Any, float]] = {}
+        stale = []
+        for name in self._fetchers:
+            entry = self._fresh(name)
+            if entry is None:
+                stale.append(name)
+            else:
+                entries[name] = entry
+                self.hits += 1
+
+        if stale:
+            fetched = await asyncio.gather(*(self._fetch(name) for name in stale))
+            entries.update(zip(stale, fetched))
+
+        now = self.clock.monotonic()
+        return PreTradeInputs(
+            mark_price=entries["mark_price"][0],
+            balance=entries["balance"][0],
+            mark_price_age=now - entries["mark_price"][1],
+            balance_age=now - entries["balance"][1],
+            round_trips=1 if stale else 0,
+        )
+
+    def warm(self) -> None:
+        """Refresh stale inputs in the background."""
+        if self._warm_task is not None and not self._warm_task.done():
+            return
+
+        stale = [name for name in self._fetchers if self._fresh(name) is None]
+        if stale:
+            self._warm_task = asyncio.create_task(self._refresh(stale))
+
+    async def _refresh(self, names: list) -> None:
+        """Background refresh; failures are retried on the critical path."""
+        results = await asyncio.gather(
+            *(self._fetch(name) for name in names), return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                self.logger.log_debug(
+                    f"Pre-trade refresh of {name} failed: {result}", LogTag.STRATEGY
+                )
+
+    async def close(self) -> None:
+        """Cancel any background refresh."""
+        if self._warm_task is not None and not self._warm_task.done():
+            self._warm_task.cancel()
+            try:
+                await self._warm_task
+            except asyncio.CancelledError:
+                pass
+        self._warm_task = None
+
+    def latest(self, name: str) -> Optional[Any]:
+        """
+        Last fetched value of an input, whatever its age.
+
+        Args:
+            name: Input name ("mark_price" or "balance")
+
+        Returns:
+            The value, or None if it was never fetched
+        """
+        entry = self._entries.get(name)
+        return entry[0] if entry is not None else None
+
+    def invalidate_balance(self) -> None:
+        """Drop the cached balance (e.g. after a fill changed it)."""
+        self._entries.pop("balance", None)
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/fetch counts
+        """
+        return {"hits": self.hits, "fetches": self.fetches}
@@ -1,17 +1,36 @@
 """Strategy engine for delta-neutral hedging decisions."""
 
 import asyncio
-from datetime import datetime
+import dataclasses
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
-from models import PositionSnapshot, HedgeSnapshot
+from models import (
+    AssetPair,
+    Clock,
+    PipelineStats,
+    PipelineTrace,
+    PositionSnapshot,
+    HedgeSnapshot,
+    SYSTEM_CLOCK,
+    Trade,
+)
 from models.hedge_snapshot import HedgeAction
-from exchange_manager import IExchange
+from models.trade import OrderSide
+from models.fixed_point import from_units
+from exchange_manager import IExchange, PositionBook
 from risk_manager import RiskManager
 from database_manager import DatabaseManager
 from logger_manager import LoggerManager, LogTag
 from config_manager import Config
+from execution_engine import ExecutionEngine, HedgeLedger, SlicedOrder
+from swap_monitor import SwapEvent
+from .coalescer import HedgeCoalescer
+from .forecaster import ReserveForecaster
+from .pre_trade import PreTradeCache
 
 
 class StrategyEngine:
@@ -28,6 +47,10 @@ class StrategyEngine:
         exchange: IExchange,
         risk_manager: RiskManager,
         database_manager: Optional[DatabaseManager] = None,
+        clock: Clock = SYSTEM_CLOCK,
+        position_book: Optional[PositionBook] = None,
+        snapshot_source: Optional[Callable[[], Awaitable[PositionSnapshot]]] = None,
+        asset: Optional[AssetPair] = None,
     ):
         """
         Initialize strategy engine.
@@ -37,20 +60,99 @@ class StrategyEngine:
             exchange: Exchange interface for trading
             risk_manager: Risk manager for validations
             database_manager: Optional database for persistence
+            clock: Time source (virtual in backtests)
+            position_book: Optional local position book updated from our fills
+            snapshot_source: Optional reader of a fresh snapshot, used to
+                recompute decisions that exceeded the latency budget
+            asset: Pool and perp traded, with the perp's order size
+                increment (default the configured pool and perp, any size)
         """
         self.config = config
+        self.clock = clock
         self.exchange = exchange
         self.risk_manager = risk_manager
         self.database_manager = database_manager
+        self.position_book = position_book
+        self.snapshot_source = snapshot_source
+        self.asset = asset or AssetPair(config.eulerswap_pool, config.symbol_perpetual)
         self.logger = LoggerManager()
 
         # Strategy state
-        self.last_hedge_time = datetime.utcnow()
-        self.min_hedge_interval = 30  # Minimum seconds between hedges
+        self.last_hedge_time = self.clock.utcnow()
+        self.min_hedge_interval = config.min_hedge_interval_seconds
         self.total_hedges = 0
         self.successful_hedges = 0
         self.failed_hedges = 0
 
+        # Pre-trade inputs and time-to-order of recent hedges (ms)
+        self.pre_trade = PreTradeCache(exchange, config.symbol_perpetual, clock=clock)
+        self.time_to_order_ms: deque = deque(maxlen=100)
+
+        # Every hedge order goes through the lifecycle ledger
+        self.ledger = HedgeLedger(
+            exchange,
+            database_manager,
+            ack_timeout_seconds=config.order_ack_timeout_seconds,
+            clock=clock,
+        )
+
+        # Large hedges run in slices in the background
+        self.execution_engine = ExecutionEngine(
+            config,
+            exchange,
+            on_fill=self._on_child_fill,
+            on_complete=self._on_sliced_hedge_complete,
+            clock=clock,
+            ledger=self.ledger,
+            asset=self.asset,
+        )
+
+        # Net hedge signals over a short window before trading
+        self.coalescer = HedgeCoalescer(
+            config.hedge_coalesce_window_seconds,
+            config.hedge_urgency_threshold_eth,
+            clock=clock,
+        )
+        self._window_task: Optional[asyncio.Task] = None
+        self._halt_task: Optional[asyncio.Task] = None  # Cancel sent on halt
+        self._hedge_lock = asyncio.Lock()
+
+        # Short position as of the last full snapshot, adjusted by our fills,
+        # for hedging straight from Swap events between snapshots
+        self._short_estimate: Optional[Decimal] = None
+        self._last_swap_event: Optional[tuple] = None
+        self.last_snapshot: Optional[PositionSnapshot] = None
+
+        # Newest snapshot of any source, for rebalancing on demand
+        self._latest_snapshot: Optional[PositionSnapshot] = None
+
+        # Optional reserve forecast to hedge part of the expected delta early
+        self.forecaster = (
+            ReserveForecaster() if config.forecast_hedging_enabled else None
+        )
+        self.forecast_lead = Decimal("0")
+
+        # Why hedging was halted (e.g. by the kill switch), if it was
+        self.halted: Optional[str] = None
+
+        # Called with every snapshot evaluated (e.g. to mirror it to shadows)
+        self.snapshot_listeners: List[Callable[[PositionSnapshot], None]] = []
+
+        # Called with every fill of ours (e.g. to allocate it across pools)
+        self.fill_listeners: List[Callable[[HedgeAction, Trade], None]] = []
+
+        # Observation-to-order latency (ms) per trigger source
+        self.trigger_to_order_ms: Dict[str, deque] = {}
+
+        # End-to-end latency budget from observation to order
+        self.latency_budget_ms = config.hedge_latency_budget_ms
+        self.budget_violations = {"decision": 0, "order": 0}
+        self.stale_recomputed = 0
+        self.stale_dropped = 0
+
+        # Stage timings of snapshots on their way to an order
+        self.pipeline = PipelineStats()
+
     async def process_position_snapshot(
         self, snapshot: PositionSnapshot
     ) -> Optional[HedgeSnapshot]:
@@ -63,6 +165,16 @@ class StrategyEngine:
         Returns:
             HedgeSnapshot if hedge was executed, None otherwise
         """
+        started = time.perf_counter()
+        if snapshot.trace is None:
+            snapshot.trace = PipelineTrace(self.pipeline, origin=started)
+
+        for listener in self.snapshot_listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                self.logger.log_error("Snapshot listener failed", e)
+
         try:
             # Log snapshot processing
             self.logger.log_info(
@@ -70,17 +182,65 @@ class StrategyEngine:
                 LogTag.STRATEGY,
             )
 
+            self._latest_snapshot = snapshot
+            if self.forecaster is not None:
+                self.forecaster.observe(
+                    float(snapshot.reserve_token1), snapshot.timestamp
+                )
+
+            # Full snapshots reconcile the event path's short estimate
+            if snapshot.source == "poll":
+                self._short_estimate = snapshot.short_position_size
+                self.last_snapshot = snapshot
+
+            if self.halted:
+                self.logger.log_debug(
+                    f"Skipping hedge - halted ({self.halted})", LogTag.STRATEGY
+                )
+                return None
+
+            # Keep pre-trade inputs fresh so a hedge does not wait for them
+            self.pre_trade.warm()
+
+            # A sliced hedge is running: steer it instead of adding another
+            if self.execution_engine.is_active:
+                self.execution_engine.retarget(snapshot.delta)
+                return None
+
+            # An order with an unknown outcome must settle before the next
+            if self.ledger.has_unresolved and not await self.resolve_hedges():
+                self.logger.log_debug(
+                    "Skipping hedge - earlier order unresolved", LogTag.STRATEGY
+                )
+                return None
+
+            # Look the hedge band up at the live mark price
+            mark_price = self.pre_trade.latest("mark_price")
+            if self.risk_manager.hedge_band is not None and mark_price is not None:
+                self.risk_manager.hedge_band.mark(mark_price)
+
             # Check if hedging is needed
-            should_hedge, hedge_size = self.risk_manager.should_hedge(snapshot)
+            should_hedge, hedge_size = self.risk_manager.should_hedge(
+                self._anticipated(snapshot)
+            )
+            snapshot.trace.record("risk_check", started)
 
             if not should_hedge:
+                if self.coalescer.pending:
+                    self.coalescer.drop()
+                    self.logger.log_debug(
+                        "Delta back within threshold - coalesced hedge dropped",
+                        LogTag.STRATEGY,
+                    )
                 self.logger.log_debug(
                     "No hedge required - within threshold", LogTag.STRATEGY
                 )
                 return None
 
             # Check minimum time between hedges
-            time_since_last = (datetime.utcnow() - self.last_hedge_time).total_seconds()
+            time_since_last = (
+                self.clock.utcnow() - self.last_hedge_time
+            ).total_seconds()
             if time_since_last < self.min_hedge_interval:
                 self.logger.log_debug(
                     f"Skipping hedge - too soon ({time_since_last:.1f}s < {self.min_hedge_interval}s)",
@@ -88,22 +248,253 @@ class StrategyEngine:
                 )
                 return None
 
+            # Net this signal with others in the window; fire when it closes
+            ready = self.coalescer.offer(snapshot, hedge_size)
+            if ready is None:
+                self._schedule_window_close()
+                return None
+
+            return await self._hedge(*ready)
+
+        except Exception as e:
+            self.logger.log_error("Error processing position snapshot", e)
+            return None
+
+    async def process_swap_event(self, event: SwapEvent) -> Optional[HedgeSnapshot]:
+        """
+        Evaluate a hedge straight from a decoded Swap event.
+
+        The post-swap reserves come from the log and the short position from
+        the position book (or the last full snapshot plus our own fills
+        since), so no RPC or exchange call sits between the log and the
+        hedge decision.
+
+        Args:
+            event: Decoded Swap event of the monitored pool
+
+        Returns:
+            HedgeSnapshot if a hedge was executed, None otherwise
+        """
+        key = (event.block_number, event.log_index)
+        if self._last_swap_event is not None and key <= self._last_swap_event:
+            return None
+        self._last_swap_event = key
+
+        short_size = self.current_short_size
+        if short_size is None:
+            self.logger.log_debug(
+                "Swap event before first snapshot - skipped", LogTag.STRATEGY
+            )
+            return None
+
+        snapshot = event.to_snapshot(short_size, self.asset.pool_address)
+        snapshot.trace = PipelineTrace(self.pipeline, origin=event.received_at)
+        reserve1_change = from_units(event.reserve1_change, snapshot.token1_decimals)
+        self.logger.log_debug(
+            f"Swap in block {event.block_number}: reserve1 {reserve1_change:+f} ETH",
+            LogTag.STRATEGY,
+        )
+
+        return await self.process_position_snapshot(snapshot)
+
+    @property
+    def current_short_size(self) -> Optional[Decimal]:
+        """Short position from the position book, else the fill-adjusted estimate."""
+        if self.position_book is not None and self.position_book.ready:
+            return self.position_book.short_size
+        return self._short_estimate
+
+    def _notify_fill(self, action: HedgeAction, trade: Trade) -> None:
+        """Pass one of our fills to the fill listeners."""
+        for listener in self.fill_listeners:
+            try:
+                listener(action, trade)
+            except Exception as e:
+                self.logger.log_error("Fill listener failed", e)
+
+    def _adjust_short_estimate(self, action: HedgeAction, size: Decimal) -> None:
+        """Apply one of our fills to the short estimate."""
+        if self._short_estimate is None:
+            return
+        if action == HedgeAction.OPEN_SHORT:
+            self._short_estimate += size
+        else:
+            self._short_estimate -= size
+
+    def _anticipated(self, snapshot: PositionSnapshot) -> PositionSnapshot:
+        """
+        The snapshot with part of the forecast reserve change added.
+
+        Hedge decisions are made on it, so an expected delta is partly
+        hedged before it happens; fills are still booked on the real one.
+        """
+        if self.forecaster is None:
+            return snapshot
+
+        expected = self.forecaster.expected_change(self.config.forecast_horizon_seconds)
+        lead = (
+            Decimal(f"{expected:.6f}") * self.config.forecast_hedge_fraction
+        ).quantize(Decimal("0.000001"))
+        self.forecast_lead = lead
+        if not lead:
+            return snapshot
+        return dataclasses.replace(
+            snapshot,
+            reserve_token1=snapshot.reserve_token1 + lead,
+            reserve_token1_units=None,
+        )
+
+    def _record_trigger_latency(self, snapshot: PositionSnapshot) -> None:
+        """Record time from observing the on-chain data to sending the order."""
+        if snapshot.observed_at is None:
+            return
+        latency_ms = (time.perf_counter() - snapshot.observed_at) * 1000
+        self.trigger_to_order_ms.setdefault(snapshot.source, deque(maxlen=100)).append(
+            latency_ms
+        )
+
+    async def _hedge(
+        self, snapshot: PositionSnapshot, hedge_size: Decimal
+    ) -> Optional[HedgeSnapshot]:
+        """
+        Execute a (netted) hedge and update statistics.
+
+        Args:
+            snapshot: Snapshot the hedge is sized from
+            hedge_size: Size of hedge to execute
+
+        Returns:
+            HedgeSnapshot if a single-order hedge was executed, None otherwise
+        """
+        async with self._hedge_lock:
+            snapshot, hedge_size = await self._refresh_if_stale(snapshot, hedge_size)
+            if snapshot is None:
+                return None
+
+            # Whole order-size increments of the perp
+            hedge_size = self.asset.round_size(hedge_size)
+            if abs(hedge_size) < self.config.min_hedge_size_eth:
+                return None
+
+            # Large hedges are sliced and maker hedges are worked in the
+            # background; the result is recorded on completion
+            if (
+                self.config.execution_style == "maker"
+                or abs(hedge_size) >= self.config.sliced_execution_threshold_eth
+            ):
+                await self.start_sliced_hedge(snapshot, hedge_size)
+                return None
+
             # Execute hedge
             hedge_snapshot = await self.execute_hedge(snapshot, hedge_size)
+            self._record_hedge_result(hedge_snapshot)
+            return hedge_snapshot
 
-            if hedge_snapshot and hedge_snapshot.success:
-                self.last_hedge_time = datetime.utcnow()
-                self.successful_hedges += 1
-            else:
-                self.failed_hedges += 1
+    def _record_hedge_result(self, hedge_snapshot: Optional[HedgeSnapshot]) -> None:
+        """Update statistics with the outcome of a single-order hedge."""
+        if hedge_snapshot and hedge_snapshot.success:
+            self.last_hedge_time = self.clock.utcnow()
+            self.successful_hedges += 1
+        else:
+            self.failed_hedges += 1
 
-            self.total_hedges += 1
+        self.total_hedges += 1
 
-            return hedge_snapshot
+    def _age_ms(self, snapshot: PositionSnapshot) -> Optional[float]:
+        """Time since the snapshot's on-chain data was observed, if known."""
+        if snapshot.observed_at is None:
+            return None
+        return (time.perf_counter() - snapshot.observed_at) * 1000
+
+    def _over_budget(self, snapshot: PositionSnapshot, stage: str) -> bool:
+        """Check a decision's age against the budget, counting violations."""
+        age_ms = self._age_ms(snapshot)
+        if not self.latency_budget_ms or age_ms is None:
+            return False
+        if age_ms <= self.latency_budget_ms:
+            return False
+
+        self.budget_violations[stage] += 1
+        self.logger.log_warning(
+            f"Hedge decision {age_ms:.0f}ms old at {stage} "
+            f"(budget {self.latency_budget_ms}ms)"
+        )
+        return True
 
+    async def _refresh_if_stale(
+        self, snapshot: PositionSnapshot, hedge_size: Decimal
+    ) -> Tuple[Optional[PositionSnapshot], Optional[Decimal]]:
+        """
+        Recompute a decision older than the latency budget, or drop it.
+
+        Args:
+            snapshot: Snapshot the hedge was decided from
+            hedge_size: Hedge size decided
+
+        Returns:
+            The snapshot and size to hedge, or (None, None) to skip
+        """
+        if not self._over_budget(snapshot, "decision"):
+            return snapshot, hedge_size
+
+        if self.snapshot_source is None:
+            self.stale_dropped += 1
+            return None, None
+
+        fresh = await self.snapshot_source()
+        self.stale_recomputed += 1
+        should_hedge, fresh_size = self.risk_manager.should_hedge(fresh)
+        if not should_hedge:
+            self.logger.log_debug(
+                "Stale hedge no longer needed on fresh snapshot", LogTag.STRATEGY
+            )
+            return None, None
+        return fresh, fresh_size
+
+    def _schedule_window_close(self) -> None:
+        """Make sure the open coalescing window fires at its deadline."""
+        if self._window_task is None or self._window_task.done():
+            self._window_task = asyncio.create_task(self._close_window())
+
+    async def _close_window(self) -> None:
+        """Fire the netted hedge when the coalescing window closes."""
+        try:
+            while self.coalescer.pending:
+                remaining = self.coalescer.deadline - self.clock.monotonic()
+                if remaining > 0:
+                    await self.clock.sleep(remaining)
+                    continue
+
+                ready = self.coalescer.take()
+                if ready and not self.execution_engine.is_active:
+                    await self._hedge(*self._discount_hold(*ready))
         except Exception as e:
-            self.logger.log_error("Error processing position snapshot", e)
-            return None
+            self.logger.log_error("Error firing coalesced hedge", e)
+
+    def _discount_hold(
+        self, snapshot: PositionSnapshot, hedge_size: Decimal
+    ) -> Tuple[PositionSnapshot, Decimal]:
+        """
+        Leave the intended wait for the window to close out of a hedge's age.
+
+        The latest snapshot of a window waits until the window closes on
+        purpose; only the time before it was offered and after the window
+        closed counts against the latency budget.
+
+        Args:
+            snapshot: Latest snapshot of the window
+            hedge_size: Netted hedge size
+
+        Returns:
+            The snapshot, aged from when it was offered, and the hedge size
+        """
+        held = self.coalescer.held_seconds
+        if snapshot.observed_at is None or not held:
+            return snapshot, hedge_size
+        return (
+            dataclasses.replace(snapshot, observed_at=snapshot.observed_at + held),
+            hedge_size,
+        )
 
     async def execute_hedge(
         self, snapshot: PositionSnapshot, hedge_size: Decimal
@@ -118,66 +509,93 @@ class StrategyEngine:
         Returns:
             HedgeSnapshot with execution details
         """
+        started = time.perf_counter()
         try:
             # Log calculated hedge
             action = "Open Short" if hedge_size > 0 else "Close Short"
             self.logger.log_calculated_hedge(str(hedge_size), action)
 
-            # Get current market price
-            mark_price = await self.exchange.get_mark_price(
-                self.config.symbol_perpetual
-            )
+            # Get mark price and balance (cached or fetched concurrently)
+            inputs = await self.pre_trade.get_inputs()
+            mark_price = inputs.mark_price
 
             # Check slippage
             if not self.risk_manager.check_slippage(mark_price, mark_price):
                 self.logger.log_warning("Slippage check failed")
                 return None
 
-            # Get account balance for leverage calculation
-            balance = await self.exchange.get_balance("USDT")
-
             # Calculate leverage
             leverage = self.risk_manager.calculate_leverage(
-                abs(hedge_size), balance, mark_price
+                abs(hedge_size), inputs.balance, mark_price
             )
 
-            # Execute trade based on delta
-            if hedge_size > 0:
-                # Need to open/increase short position
-                trade = await self.exchange.open_short_position(
-                    symbol=self.config.symbol_perpetual,
-                    size=abs(hedge_size),
-                    leverage=leverage,
-                )
-                hedge_action = HedgeAction.OPEN_SHORT
-            else:
-                # Need to close/reduce short position
-                trade = await self.exchange.close_short_position(
-                    symbol=self.config.symbol_perpetual, size=abs(hedge_size)
-                )
-                hedge_action = HedgeAction.CLOSE_SHORT
+            # Slow pre-trade inputs can age a fresh decision past the budget
+            if self._over_budget(snapshot, "order"):
+                self.stale_dropped += 1
+                return None
 
-            # Calculate new delta after hedge
+            time_to_order_ms = (time.perf_counter() - started) * 1000
+            self.time_to_order_ms.append(time_to_order_ms)
+            self._record_trigger_latency(snapshot)
+            self.logger.log_debug(
+                f"Time to order: {time_to_order_ms:.1f}ms "
+                f"({inputs.round_trips} pre-trade round-trip(s))",
+                LogTag.STRATEGY,
+            )
+
+            # Open/increase the short for positive delta, close/reduce it
+            # for negative; a lost response is resolved by client order ID
+            hedge_action = (
+                HedgeAction.OPEN_SHORT if hedge_size > 0 else HedgeAction.CLOSE_SHORT
+            )
+            intent = self.ledger.intent(
+                f"{self.config.symbol_perpetual}:{snapshot.block_number}:"
+                f"{snapshot.timestamp.isoformat()}:{hedge_size}",
+                self.config.symbol_perpetual,
+                hedge_action,
+                abs(hedge_size),
+                leverage,
+            )
+            trace = snapshot.trace
+            sent = time.perf_counter()
+            if trace is not None:
+                trace.record("pre_trade", trace.last, sent)
+            trade = await self.ledger.submit(intent)
+            if trace is not None:
+                acked = trace.record("order", sent)
+                trace.record("total", trace.origin, acked)
+
+            # The fill changed the balance; refresh it off the critical path
+            self.pre_trade.invalidate_balance()
+            self.pre_trade.warm()
+            self._adjust_short_estimate(hedge_action, trade.size)
+            if self.position_book is not None:
+                self.position_book.apply_fill(trade)
+            self._notify_fill(hedge_action, trade)
+
+            # Calculate new delta after hedge from what actually filled
             new_short_size = snapshot.short_position_size
             if hedge_size > 0:
-                new_short_size += abs(hedge_size)
+                new_short_size += trade.size
             else:
-                new_short_size -= abs(hedge_size)
+                new_short_size -= trade.size
 
             delta_after = snapshot.reserve_token1 - new_short_size
 
             # Create hedge snapshot
             hedge_snapshot = HedgeSnapshot(
                 action=hedge_action,
-                size=abs(hedge_size),
+                size=trade.size,
                 price=trade.price,
                 timestamp=trade.timestamp,
                 delta_before=snapshot.delta,
                 delta_after=delta_after,
                 leverage=leverage,
-                exchange="binance",
+                exchange=trade.exchange,
                 order_id=trade.order_id,
                 success=True,
+                time_to_order_ms=time_to_order_ms,
+                symbol=self.config.symbol_perpetual,
             )
 
             # Save to database
@@ -188,16 +606,14 @@ class StrategyEngine:
             # Record trade for rate limiting
             self.risk_manager.record_trade(
                 {
-                    "size": abs(hedge_size),
+                    "size": trade.size,
                     "price": trade.price,
                     "action": hedge_action.value,
                 }
             )
 
             # Log success
-            self.logger.log_trade(
-                hedge_action.value, str(abs(hedge_size)), str(trade.price)
-            )
+            self.logger.log_trade(hedge_action.value, str(trade.size), str(trade.price))
 
             return hedge_snapshot
 
@@ -213,11 +629,12 @@ class StrategyEngine:
                 ),
                 size=abs(hedge_size),
                 price=Decimal("0"),
-                timestamp=datetime.utcnow(),
+                timestamp=self.clock.utcnow(),
                 delta_before=snapshot.delta,
                 delta_after=snapshot.delta,
                 success=False,
                 error_message=str(e),
+                symbol=self.config.symbol_perpetual,
             )
 
             if self.database_manager:
@@ -225,38 +642,406 @@ class StrategyEngine:
 
             return hedge_snapshot
 
-    async def rebalance_position(self, target_delta: Decimal = Decimal("0")) -> bool:
+    async def start_sliced_hedge(
+        self, snapshot: PositionSnapshot, hedge_size: Decimal
+    ) -> Optional[SlicedOrder]:
         """
-        Rebalance position to target delta.
+        Start a hedge executed as child orders by the execution engine.
 
         Args:
-            target_delta: Target delta exposure (default 0 for neutral)
+            snapshot: Current position snapshot
+            hedge_size: Size of hedge to execute (positive = open short, negative = close short)
 
         Returns:
-            True if rebalancing was successful
+            The running SlicedOrder, or None if the hedge was not started
         """
         try:
-            # Get current position
-            position = await self.exchange.get_current_perpetual_position(
-                self.config.symbol_perpetual
+            inputs = await self.pre_trade.get_inputs()
+
+            if not self.risk_manager.check_slippage(
+                inputs.mark_price, inputs.mark_price
+            ):
+                self.logger.log_warning("Slippage check failed")
+                return None
+
+            leverage = self.risk_manager.calculate_leverage(
+                abs(hedge_size), inputs.balance, inputs.mark_price
+            )
+
+            if self._over_budget(snapshot, "order"):
+                self.stale_dropped += 1
+                return None
+
+            # Pace hedging off the start, not the end, of a sliced hedge
+            self.last_hedge_time = self.clock.utcnow()
+            self._record_trigger_latency(snapshot)
+            return self.execution_engine.start(hedge_size, snapshot.delta, leverage)
+
+        except Exception as e:
+            self.logger.log_error("Failed to start sliced hedge", e)
+            return None
+
+    def _on_child_fill(self, order: SlicedOrder, trade: Trade) -> None:
+        """Persist a child fill as it arrives."""
+        if self.database_manager:
+            self.database_manager.save_trade(trade)
+
+        self.pre_trade.invalidate_balance()
+        self.pre_trade.warm()
+        self._adjust_short_estimate(order.action, trade.size)
+        if self.position_book is not None:
+            self.position_book.apply_fill(trade)
+        self._notify_fill(order.action, trade)
+
+        self.logger.log_trade(order.action.value, str(trade.size), str(trade.price))
+
+    async def resolve_hedges(self) -> bool:
+        """
+        Settle hedge orders whose outcome is unknown, recording their fills.
+
+        Returns:
+            True if no order is left unresolved
+        """
+        for trade in await self.ledger.resolve_pending():
+            self._record_resolved_fill(trade)
+        return not self.ledger.has_unresolved
+
+    async def recover_hedges(self) -> bool:
+        """
+        Settle hedge orders left in flight by a previous run.
+
+        Returns:
+            True if no order is left unresolved
+        """
+        for trade in await self.ledger.recover():
+            self._record_resolved_fill(trade)
+        return not self.ledger.has_unresolved
+
+    def export_state(self) -> dict:
+        """
+        Export strategy and risk state for a checkpoint.
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        return {
+            "saved_at": self.clock.utcnow().isoformat(),
+            "last_hedge_time": self.last_hedge_time.isoformat(),
+            "total_hedges": self.total_hedges,
+            "successful_hedges": self.successful_hedges,
+            "failed_hedges": self.failed_hedges,
+            "last_snapshot": (
+                self.last_snapshot.to_dict() if self.last_snapshot else None
+            ),
+            "risk": self.risk_manager.export_state(),
+        }
+
+    def restore_state(self, state: dict) -> None:
+        """
+        Restore strategy and risk state from a checkpoint.
+
+        Args:
+            state: Dictionary from ``export_state``
+        """
+        self.last_hedge_time = datetime.fromisoformat(state["last_hedge_time"])
+        self.total_hedges = state["total_hedges"]
+        self.successful_hedges = state["successful_hedges"]
+        self.failed_hedges = state["failed_hedges"]
+        if state.get("last_snapshot"):
+            self._preload(PositionSnapshot.from_dict(state["last_snapshot"]))
+        self.risk_manager.restore_state(state.get("risk", {}))
+
+    def _preload(self, snapshot: PositionSnapshot) -> None:
+        """Take a persisted snapshot as the last one seen."""
+        self.last_snapshot = snapshot
+        self._short_estimate = snapshot.short_position_size
+
+    async def warm_start(
+        self, state: Optional[dict] = None, pool_address: Optional[str] = None
+    ) -> str:
+        """
+        Rebuild state after a restart instead of starting cold.
+
+        A checkpoint is restored first; the database then supplies what
+        the checkpoint misses (hedges after it was saved), or everything
+        without a checkpoint: hedge counters, the last hedge time, the
+        rate-limit window and the last snapshot. Pre-trade inputs are
+        fetched in the background so the first hedge does not wait.
+
+        Args:
+            state: Optional checkpoint from ``export_state``
+            pool_address: Pool whose last snapshot to preload
+
+        Returns:
+            Source of the state: "checkpoint", "database" or "cold"
+        """
+        started = time.perf_counter()
+        source = "cold"
+        since = None
+        if state:
+            self.restore_state(state)
+            since = datetime.fromisoformat(state["saved_at"])
+            source = "checkpoint"
+
+        if self.database_manager:
+            # The database holds every perp's hedges: restore this one's
+            symbol = self.config.symbol_perpetual
+            stats = self.database_manager.get_hedge_stats(
+                start_time=since, symbol=symbol
             )
+            if stats["total"] and source == "cold":
+                source = "database"
+            self.total_hedges += stats["total"]
+            self.successful_hedges += stats["successful"]
+            self.failed_hedges += stats["total"] - stats["successful"]
 
-            current_short = (
-                position["size"] if position["side"] == "short" else Decimal("0")
+            # Never hedged: nothing to wait for after the restart
+            last_hedge_time = stats["last_hedge_time"]
+            if last_hedge_time is None and source == "cold":
+                last_hedge_time = self.clock.utcnow() - timedelta(
+                    seconds=self.min_hedge_interval
+                )
+            if last_hedge_time is not None and (
+                source != "checkpoint" or last_hedge_time > self.last_hedge_time
+            ):
+                self.last_hedge_time = last_hedge_time
+
+            # Rate-limit window: hedges of the past hour not in the checkpoint
+            window_start = self.clock.utcnow() - timedelta(hours=1)
+            if since is not None and since > window_start:
+                window_start = since
+            for hedge in self.database_manager.get_hedge_snapshots(
+                start_time=window_start,
+                limit=self.risk_manager.max_trades_per_hour,
+                symbol=symbol,
+            ):
+                if hedge.success and hedge.timestamp > window_start:
+                    self.risk_manager.recent_trades.append(
+                        {
+                            "size": hedge.size,
+                            "price": hedge.price,
+                            "action": hedge.action.value,
+                            "timestamp": hedge.timestamp,
+                        }
+                    )
+
+            if self.last_snapshot is None:
+                snapshot = self.database_manager.get_latest_position_snapshot(
+                    pool_address
+                )
+                if snapshot is not None:
+                    self._preload(snapshot)
+                    if source == "cold":
+                        source = "database"
+
+        self.pre_trade.warm()
+        self.logger.log_info(
+            f"Warm start from {source} in "
+            f"{(time.perf_counter() - started) * 1000:.1f}ms: "
+            f"{self.total_hedges} hedges, "
+            f"{len(self.risk_manager.recent_trades)} in the rate-limit window",
+            LogTag.STRATEGY,
+        )
+        return source
+
+    def _record_resolved_fill(self, trade: Trade) -> None:
+        """Account for a fill found by client order ID lookup."""
+        if self.database_manager:
+            self.database_manager.save_trade(trade)
+        if self.position_book is not None:
+            self.position_book.apply_fill(trade)
+        action = (
+            HedgeAction.OPEN_SHORT
+            if trade.side == OrderSide.SELL
+            else HedgeAction.CLOSE_SHORT
+        )
+        self._adjust_short_estimate(action, trade.size)
+        self._notify_fill(action, trade)
+        self.pre_trade.invalidate_balance()
+
+    def _on_sliced_hedge_complete(self, order: SlicedOrder) -> None:
+        """Record a finished sliced hedge as one parent HedgeSnapshot."""
+        hedge_snapshot = order.to_hedge_snapshot(self.clock.utcnow())
+
+        if self.database_manager:
+            self.database_manager.save_hedge_snapshot(hedge_snapshot)
+
+        if order.children:
+            self.risk_manager.record_trade(
+                {
+                    "size": hedge_snapshot.size,
+                    "price": hedge_snapshot.price,
+                    "action": hedge_snapshot.action.value,
+                }
             )
 
-            # Calculate required adjustment
-            # This would need pool reserves to calculate properly
-            # For now, return false as we need a snapshot
+        if hedge_snapshot.success:
+            self.successful_hedges += 1
+        else:
+            self.failed_hedges += 1
+        self.total_hedges += 1
+
+    async def rebalance_position(
+        self,
+        target_delta: Decimal = Decimal("0"),
+        max_age_seconds: Optional[float] = None,
+    ) -> bool:
+        """
+        Rebalance position to target delta.
+
+        The adjustment is sized from the newest snapshot the strategy has
+        seen, with the short position from the position book (or the
+        fill-adjusted estimate), so with a fresh cache the rebalance costs
+        a single order round-trip. A snapshot older than max_age_seconds
+        is replaced by a fresh read when a snapshot source is available.
+        Thresholds and the minimum hedge interval do not apply; size
+        limits and the hourly rate limit do.
 
-            self.logger.log_warning("Rebalancing requires position snapshot")
+        Args:
+            target_delta: Target delta exposure (default 0 for neutral)
+            max_age_seconds: Oldest usable cached snapshot (default two
+                polling intervals)
 
+        Returns:
+            True if the position is at the target (or being worked there)
+        """
+        if max_age_seconds is None:
+            max_age_seconds = 2 * self.config.polling_interval_seconds
+
+        if self.halted:
+            self.logger.log_warning(
+                f"Cannot rebalance - hedging halted ({self.halted})"
+            )
             return False
 
+        try:
+            async with self._hedge_lock:
+                snapshot = self._latest_snapshot
+                age = (
+                    (self.clock.utcnow() - snapshot.timestamp).total_seconds()
+                    if snapshot is not None
+                    else None
+                )
+                if age is None or age > max_age_seconds:
+                    if self.snapshot_source is None:
+                        self.logger.log_warning(
+                            "Cannot rebalance - no fresh position snapshot"
+                        )
+                        return False
+                    snapshot = await self.snapshot_source()
+                    self.logger.log_debug(
+                        "Cached snapshot stale - rebalancing from a fresh read",
+                        LogTag.STRATEGY,
+                    )
+
+                # Our fills since the snapshot are in the book or estimate;
+                # the cached observation time no longer bounds the decision
+                short_size = self.current_short_size
+                snapshot = dataclasses.replace(
+                    snapshot,
+                    short_position_size=(
+                        short_size
+                        if short_size is not None
+                        else snapshot.short_position_size
+                    ),
+                    short_position_units=None,
+                    timestamp=self.clock.utcnow(),
+                    observed_at=None,
+                    trace=PipelineTrace(self.pipeline),
+                )
+                hedge_size = self.asset.round_size(snapshot.delta - target_delta)
+
+                self.logger.log_info(
+                    f"Rebalancing delta {snapshot.delta:.4f} to {target_delta} ETH",
+                    LogTag.STRATEGY,
+                )
+                if abs(hedge_size) < self.config.min_hedge_size_eth:
+                    return True
+                if self.execution_engine.is_active:
+                    self.logger.log_warning(
+                        "Cannot rebalance - a sliced hedge is running"
+                    )
+                    return False
+                if (
+                    not self.risk_manager.validate_hedge_size(hedge_size)
+                    or not self.risk_manager.check_rate_limits()
+                ):
+                    return False
+
+                # The rebalance supersedes any signal waiting in the window
+                self.coalescer.drop()
+
+                if (
+                    self.config.execution_style == "maker"
+                    or abs(hedge_size) >= self.config.sliced_execution_threshold_eth
+                ):
+                    return (
+                        await self.start_sliced_hedge(snapshot, hedge_size) is not None
+                    )
+
+                hedge_snapshot = await self.execute_hedge(snapshot, hedge_size)
+                self._record_hedge_result(hedge_snapshot)
+                return bool(hedge_snapshot and hedge_snapshot.success)
+
         except Exception as e:
             self.logger.log_error("Failed to rebalance position", e)
             return False
 
+    def halt(self, reason: str) -> None:
+        """
+        Stop hedging: drop waiting signals and cancel a sliced hedge.
+
+        Args:
+            reason: Why hedging is halted
+        """
+        self.halted = reason
+        self.coalescer.drop()
+        if self.execution_engine.is_active and (
+            self._halt_task is None or self._halt_task.done()
+        ):
+            self._halt_task = asyncio.create_task(self.execution_engine.cancel())
+            self._halt_task.add_done_callback(self._halt_cancel_done)
+        self.logger.log_warning(f"Hedging halted: {reason}")
+
+    def _halt_cancel_done(self, task: asyncio.Task) -> None:
+        """Log a failed cancel of the hedge in flight when hedging halted."""
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.log_error(
+                "Failed to cancel in-flight hedge on halt", task.exception()
+            )
+
+    async def stop(self) -> None:
+        """Stop background work: coalescing timer, sliced hedge, cache refresh."""
+        if self._window_task is not None and not self._window_task.done():
+            self._window_task.cancel()
+            try:
+                await self._window_task
+            except asyncio.CancelledError:
+                pass
+        self.coalescer.drop()
+
+        if self._halt_task is not None:
+            try:
+                await self._halt_task
+            except Exception:
+                pass  # Logged by _halt_cancel_done
+            self._halt_task = None
+        await self.execution_engine.cancel()
+        await self.execution_engine.maker.close()
+        await self.pre_trade.close()
+
+    @staticmethod
+    def _latency_summary(latencies: deque) -> Optional[dict]:
+        """Last / median / max of recent latencies in ms."""
+        if not latencies:
+            return None
+        ordered = sorted(latencies)
+        return {
+            "last_ms": round(latencies[-1], 2),
+            "p50_ms": round(ordered[len(ordered) // 2], 2),
+            "max_ms": round(ordered[-1], 2),
+        }
+
     def get_strategy_stats(self) -> dict:
         """
         Get strategy performance statistics.
@@ -277,6 +1062,33 @@ class StrategyEngine:
             "min_hedge_interval": self.min_hedge_interval,
             "hedge_threshold": str(self.config.hedge_threshold_eth),
             "min_hedge_size": str(self.config.min_hedge_size_eth),
+            "asset": self.asset.to_dict(),
+            "time_to_order": self._latency_summary(self.time_to_order_ms),
+            "pipeline": self.pipeline.summary(),
+            "trigger_to_order": {
+                source: self._latency_summary(latencies)
+                for source, latencies in self.trigger_to_order_ms.items()
+            },
+            "pre_trade_cache": self.pre_trade.get_stats(),
+            "coalescing": self.coalescer.get_stats(),
+            "sliced_hedge_active": self.execution_engine.is_active,
+            "halted": self.halted,
+            "forecast": (
+                {**self.forecaster.get_stats(), "lead_eth": str(self.forecast_lead)}
+                if self.forecaster is not None
+                else None
+            ),
+            "maker": self.execution_engine.maker.get_stats(),
+            "orders": self.ledger.get_stats(),
+            "latency_budget": {
+                "budget_ms": self.latency_budget_ms,
+                "violations": dict(self.budget_violations),
+                "recomputed": self.stale_recomputed,
+                "dropped": self.stale_dropped,
+            },
+            "position_book": (
+                self.position_book.get_stats() if self.position_book else None
+            ),
         }
 
     async def emergency_close_all(self) -> bool:
@@ -289,24 +1101,37 @@ class StrategyEngine:
         try:
             self.logger.log_warning("EMERGENCY: Closing all positions")
 
-            # Get current position
-            position = await self.exchange.get_current_perpetual_position(
-                self.config.symbol_perpetual
-            )
+            # Stop any sliced hedge before flattening, and hedging after
+            self.halted = "emergency close"
+            self.coalescer.drop()
+            await self.execution_engine.cancel()
 
-            if position["side"] == "short" and position["size"] > 0:
+            # Short from the position book, else from the exchange
+            if self.position_book is not None and self.position_book.ready:
+                short_size = self.position_book.short_size
+            else:
+                position = await self.exchange.get_current_perpetual_position(
+                    self.config.symbol_perpetual
+                )
+                short_size = (
+                    position["size"] if position["side"] == "short" else Decimal("0")
+                )
+
+            if short_size > 0:
                 # Close short position
                 trade = await self.exchange.close_short_position(
-                    symbol=self.config.symbol_perpetual, size=position["size"]
+                    symbol=self.config.symbol_perpetual,
+                    size=short_size,
+                    reduce_only=True,
                 )
+                if self.position_book is not None:
+                    self.position_book.apply_fill(trade)
 
                 self.logger.log_info(
-                    f"Emergency closed {position['size']} ETH short at {trade.price}",
+                    f"Emergency closed {short_size} ETH short at {trade.price}",
                     LogTag.STRATEGY,
                 )
 
-                return True
-
             return True
 
         except Exception as e:
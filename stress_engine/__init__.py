@@ -0,0 +1,20 @@
+"""Monte Carlo stress testing for LPHedgeBot."""
+
+from .hedge_band import HedgeBand, band_half_width
+from .stress_engine import (
+    HedgePolicy,
+    PoolCurve,
+    StressConfig,
+    StressEngine,
+    StressResult,
+)
+
+__all__ = [
+    "HedgeBand",
+    "HedgePolicy",
+    "PoolCurve",
+    "StressConfig",
+    "StressEngine",
+    "StressResult",
+    "band_half_width",
+]
@@ -0,0 +1,290 @@
+"""Utility-based no-trade hedging band from pool gamma, volatility and fees."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+import numpy as np
+
+from logger_manager import LoggerManager, LogTag
+from models import Clock, SYSTEM_CLOCK
+from .stress_engine import SECONDS_PER_YEAR, PoolCurve
+
+
+def band_half_width(
+    prices: np.ndarray,
+    gamma: np.ndarray,
+    sigma: float,
+    cost: float,
+    risk_aversion: float,
+    horizon_years: float,
+) -> np.ndarray:
+    """
+    Half-width of the no-trade band around the hedged delta.
+
+    Zakamouline's asymptotic utility-based band (Zakamouline 2006, eq. 24):
+    a Whalley–Wilmott style term growing with gamma and the trading cost,
+    plus a term that widens the band when volatility is low::
+
+        H0 = k / (risk_aversion * S * sigma^2 * T)
+        Hw = 1.12 * k^0.31 * T^0.05 * (1 / risk_aversion)^0.25 * (|gamma| / sigma)^0.5
+
+    Args:
+        prices: Prices S (token0 per token1)
+        gamma: Position gamma at those prices (token1 per unit of price)
+        sigma: Annualized volatility
+        cost: Proportional cost of a hedge k (fraction of notional)
+        risk_aversion: Absolute risk aversion (per unit of token0)
+        horizon_years: Hedging horizon T
+
+    Returns:
+        Band half-width in token1 per price
+    """
+    h0 = cost / (risk_aversion * prices * sigma**2 * horizon_years)
+    hw = (
+        1.12
+        * cost**0.31
+        * horizon_years**0.05
+        * (1 / risk_aversion) ** 0.25
+        * np.sqrt(np.abs(gamma) / sigma)
+    )
+    return h0 + hw
+
+
+class HedgeBand:
+    """
+    Hedge threshold from an optimal no-trade band, read in O(1).
+
+    On every refresh the band is evaluated with NumPy over a log-spaced
+    price grid around the last price, from the gamma of the pools' curves,
+    the realized volatility of the sampled prices and the taker fee. The
+    strategy then looks the band up at the live mark price by index
+    arithmetic, so the band moves with the price between refreshes.
+    Bands are clamped to [min_band, max_band].
+    """
+
+    def __init__(
+        self,
+        curves: Sequence[PoolCurve],
+        fee_percent: Decimal,
+        risk_aversion: float = 1.0,
+        min_band: Decimal = Decimal("0.005"),
+        max_band: Decimal = Decimal("1"),
+        horizon_hours: float = 24.0,
+        default_volatility: float = 0.8,
+        grid_points: int = 201,
+        grid_log_width: float = 0.2,
+        volatility_window: int = 120,
+        clock: Clock = SYSTEM_CLOCK,
+    ):
+        """
+        Initialize the hedge band.
+
+        Args:
+            curves: Curves of the pools hedged on the perp (gammas add up)
+            fee_percent: Taker fee of a hedge in percent
+            risk_aversion: Absolute risk aversion (per unit of token0)
+            min_band: Narrowest band (e.g. the minimum hedge size)
+            max_band: Widest band (e.g. the urgency threshold)
+            horizon_hours: Hedging horizon T
+            default_volatility: Annualized volatility until enough samples
+            grid_points: Prices in the grid
+            grid_log_width: Grid spans the price times exp(+-width)
+            volatility_window: Price samples kept for realized volatility
+            clock: Time source
+        """
+        self.curves = list(curves)
+        self.cost = float(fee_percent) / 100
+        self.risk_aversion = risk_aversion
+        self.min_band = min_band
+        self.max_band = max_band
+        self.horizon_years = horizon_hours * 3600 / SECONDS_PER_YEAR
+        self.default_volatility = default_volatility
+        self.grid_points = grid_points
+        self.grid_log_width = grid_log_width
+        self.clock = clock
+        self.logger = LoggerManager()
+
+        # (monotonic time, price) samples for realized volatility
+        self._samples: deque = deque(maxlen=volatility_window)
+        self.price: Optional[float] = None
+        self.mark_price: Optional[float] = None
+        self.volatility = default_volatility
+
+        # Band per grid price, and the grid's log-price origin and step
+        self._bands: List[Decimal] = []
+        self._log_low = 0.0
+        self._log_step = 1.0
+        self._task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.refreshes = 0
+        self.refresh_ms = 0.0
+
+    @property
+    def ready(self) -> bool:
+        """Whether a band has been computed."""
+        return bool(self._bands)
+
+    def observe(self, price: Decimal) -> None:
+        """
+        Record a mark price.
+
+        Args:
+            price: Mark price (token0 per token1)
+        """
+        self.price = float(price)
+        self._samples.append((self.clock.monotonic(), self.price))
+
+    def mark(self, price: Decimal) -> None:
+        """
+        Record the live mark price the band is looked up at.
+
+        Unlike observe(), this is cheap enough for every snapshot and does
+        not feed the volatility estimate.
+
+        Args:
+            price: Mark price (token0 per token1)
+        """
+        self.mark_price = float(price)
+
+    def realized_volatility(self) -> float:
+        """Annualized volatility of the sampled prices (default until 10)."""
+        if len(self._samples) < 10:
+            return self.default_volatility
+        samples = np.array(self._samples)
+        elapsed = samples[-1, 0] - samples[0, 0]
+        if elapsed <= 0:
+            return self.default_volatility
+        returns = np.diff(np.log(samples[:, 1]))
+        return float(np.sqrt(np.sum(returns**2) / elapsed * SECONDS_PER_YEAR))
+
+    def gamma(self, prices: np.ndarray) -> np.ndarray:
+        """Change of the pools' token1 reserves per unit of price."""
+        reserve1 = sum(curve.reserves_at(prices)[1] for curve in self.curves)
+        return np.gradient(reserve1, prices)
+
+    def refresh(self) -> None:
+        """Recompute the band over a price grid around the last price."""
+        if self.price is None:
+            return
+
+        started = time.perf_counter()
+        self.volatility = max(self.realized_volatility(), 1e-4)
+
+        log_center = math.log(self.price)
+        log_prices = np.linspace(
+            log_center - self.grid_log_width,
+            log_center + self.grid_log_width,
+            self.grid_points,
+        )
+        prices = np.exp(log_prices)
+        bands = band_half_width(
+            prices,
+            self.gamma(prices),
+            self.volatility,
+            self.cost,
+            self.risk_aversion,
+            self.horizon_years,
+        )
+        bands = np.clip(bands, float(self.min_band), float(self.max_band))
+
+        self._bands = [Decimal(f"{band:.6f}") for band in bands]
+        self._log_low = float(log_prices[0])
+        self._log_step = float(log_prices[1] - log_prices[0])
+        self.refreshes += 1
+        self.refresh_ms = (time.perf_counter() - started) * 1000
+
+    def band_at(self, price: float) -> Decimal:
+        """
+        Band at a price, by grid lookup (edges beyond the grid).
+
+        Args:
+            price: Price (token0 per token1)
+
+        Returns:
+            Band half-width in token1
+        """
+        index = round((math.log(price) - self._log_low) / self._log_step)
+        return self._bands[min(max(index, 0), len(self._bands) - 1)]
+
+    def current(self, price: Optional[Decimal] = None) -> Optional[Decimal]:
+        """
+        Band at the live price, or None before the first refresh.
+
+        Args:
+            price: Price to look up (defaults to the live mark price, then
+                the last sampled price)
+
+        Returns:
+            Band half-width in token1
+        """
+        if not self._bands:
+            return None
+        if price is not None:
+            return self.band_at(float(price))
+        return self.band_at(self.mark_price or self.price)
+
+    async def start(
+        self,
+        price_source: Callable[[], Awaitable[Decimal]],
+        refresh_seconds: float = 60.0,
+    ) -> None:
+        """
+        Sample the price and refresh the band on a timer.
+
+        Args:
+            price_source: Reader of the mark price
+            refresh_seconds: Time between refreshes
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self._refresh_loop(price_source, refresh_seconds)
+            )
+
+    async def stop(self) -> None:
+        """Stop refreshing."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _refresh_loop(
+        self, price_source: Callable[[], Awaitable[Decimal]], refresh_seconds: float
+    ) -> None:
+        """Sample, refresh, sleep."""
+        while True:
+            try:
+                self.observe(await price_source())
+                self.refresh()
+                self.logger.log_debug(
+                    f"Hedge band {self.current()} ETH "
+                    f"(vol {self.volatility:.2f}, {self.refresh_ms:.1f}ms)",
+                    LogTag.RISK,
+                )
+            except Exception as e:
+                self.logger.log_error("Hedge band refresh failed", e)
+            await self.clock.sleep(refresh_seconds)
+
+    def get_stats(self) -> dict:
+        """
+        Get hedge band statistics.
+
+        Returns:
+            Dictionary with the current band and its inputs
+        """
+        current = self.current()
+        return {
+            "band": str(current) if current is not None else None,
+            "price": self.price,
+            "mark_price": self.mark_price,
+            "volatility": round(self.volatility, 4),
+            "refreshes": self.refreshes,
+            "refresh_ms": round(self.refresh_ms, 3),
+        }
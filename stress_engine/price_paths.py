@@ -0,0 +1,86 @@
+"""Vectorized price path generators for stress testing."""
+
+import numpy as np
+
+
+def generate_gbm_paths(
+    rng: np.random.Generator,
+    n_paths: int,
+    n_steps: int,
+    s0: float,
+    dt: float,
+    mu: float,
+    sigma: float,
+) -> np.ndarray:
+    """
+    Generate geometric Brownian motion price paths.
+
+    Args:
+        rng: NumPy random generator
+        n_paths: Number of paths
+        n_steps: Number of time steps after the initial price
+        s0: Initial price
+        dt: Step length in years
+        mu: Annualized drift
+        sigma: Annualized volatility
+
+    Returns:
+        Array of shape (n_paths, n_steps + 1)
+    """
+    shocks = rng.standard_normal((n_paths, n_steps))
+    log_returns = (mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * shocks
+    return _to_prices(s0, log_returns)
+
+
+def generate_jump_paths(
+    rng: np.random.Generator,
+    n_paths: int,
+    n_steps: int,
+    s0: float,
+    dt: float,
+    mu: float,
+    sigma: float,
+    jump_intensity: float,
+    jump_mean: float,
+    jump_std: float,
+) -> np.ndarray:
+    """
+    Generate Merton jump-diffusion price paths.
+
+    Args:
+        rng: NumPy random generator
+        n_paths: Number of paths
+        n_steps: Number of time steps after the initial price
+        s0: Initial price
+        dt: Step length in years
+        mu: Annualized drift
+        sigma: Annualized diffusion volatility
+        jump_intensity: Expected jumps per year
+        jump_mean: Mean of the log jump size
+        jump_std: Standard deviation of the log jump size
+
+    Returns:
+        Array of shape (n_paths, n_steps + 1)
+    """
+    # Compensate drift so the expected price growth stays at mu
+    kappa = np.exp(jump_mean + 0.5 * jump_std**2) - 1
+    drift = (mu - 0.5 * sigma**2 - jump_intensity * kappa) * dt
+
+    shocks = rng.standard_normal((n_paths, n_steps))
+    jump_counts = rng.poisson(jump_intensity * dt, (n_paths, n_steps))
+    jump_sizes = jump_mean * jump_counts + jump_std * np.sqrt(
+        jump_counts
+    ) * rng.standard_normal((n_paths, n_steps))
+
+    log_returns = drift + sigma * np.sqrt(dt) * shocks + jump_sizes
+    return _to_prices(s0, log_returns)
+
+
+def _to_prices(s0: float, log_returns: np.ndarray) -> np.ndarray:
+    """Accumulate log returns into prices with s0 prepended."""
+    n_paths = log_returns.shape[0]
+    log_prices = np.empty((n_paths, log_returns.shape[1] + 1))
+    log_prices[:, 0] = np.log(s0)
+    np.cumsum(log_returns, axis=1, out=log_prices[:, 1:])
+    log_prices[:, 1:] += log_prices[:, :1]
+    return np.exp(log_prices)
@@ -0,0 +1,487 @@
+"""Monte Carlo stress engine for the LP position plus perp hedge."""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from euler_swap import PoolParams
+from logger_manager import LoggerManager, LogTag
+from risk_manager import RiskManager
+from .price_paths import generate_gbm_paths, generate_jump_paths
+
+SECONDS_PER_YEAR = 365 * 24 * 3600
+MAX_CONCENTRATION = 1 - 1e-12  # Keeps the closed-form inverse finite at c = 1
+
+
+@dataclass(frozen=True)
+class PoolCurve:
+    """
+    EulerSwap curve in token units, evaluated at an external price.
+
+    Prices are token0 per token1 (e.g. USDT per WETH), matching the
+    perpetual's mark price.
+
+    Attributes:
+        x0: Equilibrium reserve of token0
+        y0: Equilibrium reserve of token1
+        price0: Equilibrium price (token0 per token1)
+        cx: Concentration on the token0 side (0..1)
+        cy: Concentration on the token1 side (0..1)
+        fee: Swap fee (fraction)
+    """
+
+    x0: float
+    y0: float
+    price0: float
+    cx: float
+    cy: float
+    fee: float = 0.0
+
+    @classmethod
+    def from_pool_params(cls, params: PoolParams) -> "PoolCurve":
+        """
+        Create a PoolCurve from on-chain pool parameters.
+
+        Args:
+            params: Pool parameters (raw on-chain values, decimals set)
+
+        Returns:
+            PoolCurve in token units
+        """
+        scale0 = 10**params.token0_decimals
+        scale1 = 10**params.token1_decimals
+        # px/py is token1 raw units per token0 raw unit at equilibrium
+        token1_per_token0 = float(params.price_x / params.price_y) * scale0 / scale1
+        return cls(
+            x0=float(params.equilibrium_reserve0) / scale0,
+            y0=float(params.equilibrium_reserve1) / scale1,
+            price0=1.0 / token1_per_token0,
+            cx=min(float(params.concentration_x) / 1e18, MAX_CONCENTRATION),
+            cy=min(float(params.concentration_y) / 1e18, MAX_CONCENTRATION),
+            fee=float(params.fee),
+        )
+
+    def reserves_at(self, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pool reserves after arbitrage has moved the curve to a price.
+
+        Solves marginal price == external price on the relevant side of the
+        curve in closed form, for any array shape.
+
+        Args:
+            prices: External prices (token0 per token1)
+
+        Returns:
+            Tuple of (reserve0, reserve1) arrays with the shape of prices
+        """
+        prices = np.asarray(prices, dtype=float)
+        cx = min(self.cx, MAX_CONCENTRATION)
+        cy = min(self.cy, MAX_CONCENTRATION)
+        below = prices <= self.price0
+
+        # token1 cheap: pool sells token0, x <= x0, on f()
+        ratio_x = np.where(below, self.price0 / prices, 1.0)
+        x_low = self.x0 / np.sqrt((ratio_x - cx) / (1 - cx))
+        y_low = self.y0 + (self.x0 - x_low) / self.price0 * (
+            cx + (1 - cx) * self.x0 / x_low
+        )
+
+        # token1 expensive: pool sells token1, y <= y0, on g()
+        ratio_y = np.where(below, 1.0, prices / self.price0)
+        y_high = self.y0 / np.sqrt((ratio_y - cy) / (1 - cy))
+        x_high = self.x0 + (self.y0 - y_high) * self.price0 * (
+            cy + (1 - cy) * self.y0 / y_high
+        )
+
+        return np.where(below, x_low, x_high), np.where(below, y_low, y_high)
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Vectorized mirror of RiskManager.should_hedge plus the strategy interval.
+
+    Attributes:
+        hedge_threshold: Delta above which a hedge is considered
+        min_hedge_size: Minimum hedge size
+        max_hedge_size: Maximum hedge size (RiskManager.max_position_size)
+        max_trades_per_hour: Rate limit
+        min_hedge_interval_seconds: StrategyEngine minimum time between hedges
+    """
+
+    hedge_threshold: float
+    min_hedge_size: float
+    max_hedge_size: float
+    max_trades_per_hour: int
+    min_hedge_interval_seconds: float = 30.0
+
+    @classmethod
+    def from_risk_manager(
+        cls, risk_manager: RiskManager, min_hedge_interval_seconds: float = 30.0
+    ) -> "HedgePolicy":
+        """
+        Build a policy from a live RiskManager and its config.
+
+        Args:
+            risk_manager: Risk manager whose limits drive the policy
+            min_hedge_interval_seconds: Strategy engine hedge interval
+
+        Returns:
+            HedgePolicy instance
+        """
+        return cls(
+            hedge_threshold=float(risk_manager.config.hedge_threshold_eth),
+            min_hedge_size=float(risk_manager.config.min_hedge_size_eth),
+            max_hedge_size=float(risk_manager.max_position_size),
+            max_trades_per_hour=risk_manager.max_trades_per_hour,
+            min_hedge_interval_seconds=float(min_hedge_interval_seconds),
+        )
+
+    def decide(
+        self,
+        delta: np.ndarray,
+        seconds_since_hedge: np.ndarray,
+        rate_limited: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Decide which paths hedge at this step.
+
+        Args:
+            delta: Current delta per path
+            seconds_since_hedge: Seconds since the last hedge per path
+            rate_limited: True where the hourly trade limit is reached
+
+        Returns:
+            Boolean array, True where the full delta is hedged
+        """
+        size = np.abs(delta)
+        return (
+            (size > self.hedge_threshold)
+            & (size >= self.min_hedge_size)
+            & (size <= self.max_hedge_size)
+            & ~rate_limited
+            & (seconds_since_hedge >= self.min_hedge_interval_seconds)
+        )
+
+
+@dataclass(frozen=True)
+class StressConfig:
+    """
+    Stress run settings.
+
+    Attributes:
+        n_paths: Number of simulated price paths
+        horizon_hours: Simulated horizon
+        step_seconds: Time between simulated snapshots
+        model: "gbm" or "jump"
+        annual_drift: Annualized drift
+        annual_volatility: Annualized diffusion volatility
+        jump_intensity: Expected jumps per year (jump model)
+        jump_mean: Mean log jump size (jump model)
+        jump_std: Standard deviation of log jump size (jump model)
+        initial_price: Starting price, defaults to the pool equilibrium
+        taker_fee: Perp taker fee per hedge (fraction of notional)
+        collateral_usdt: Margin collateral posted for the short
+        leverage: Leverage used for margin requirements
+        seed: Random seed
+        n_workers: Worker processes, defaults to the CPU count
+    """
+
+    n_paths: int = 10000
+    horizon_hours: float = 24.0
+    step_seconds: float = 60.0
+    model: str = "gbm"
+    annual_drift: float = 0.0
+    annual_volatility: float = 0.8
+    jump_intensity: float = 20.0
+    jump_mean: float = -0.03
+    jump_std: float = 0.05
+    initial_price: Optional[float] = None
+    taker_fee: float = 0.0004
+    collateral_usdt: float = 100000.0
+    leverage: float = 1.0
+    seed: int = 0
+    n_workers: Optional[int] = None
+
+    @property
+    def n_steps(self) -> int:
+        """Number of simulated steps."""
+        return max(1, int(self.horizon_hours * 3600 / self.step_seconds))
+
+
+@dataclass
+class StressResult:
+    """
+    Per-path outcomes of a stress run.
+
+    Attributes:
+        total_pnl: LP P&L + fee income + hedge P&L - hedge fees (USDT)
+        lp_pnl: Mark-to-market change of the pool position (USDT)
+        fee_income: Estimated swap fees earned by the pool (USDT)
+        hedge_pnl: P&L of the perp short (USDT)
+        hedge_fees: Taker fees paid on hedges (USDT)
+        hedge_count: Number of hedges per path
+        max_margin_usage: Peak margin requirement / equity per path
+        mean_abs_delta: Time-averaged absolute delta per path
+        elapsed_seconds: Wall-clock duration of the run
+    """
+
+    total_pnl: np.ndarray
+    lp_pnl: np.ndarray
+    fee_income: np.ndarray
+    hedge_pnl: np.ndarray
+    hedge_fees: np.ndarray
+    hedge_count: np.ndarray
+    max_margin_usage: np.ndarray
+    mean_abs_delta: np.ndarray
+    elapsed_seconds: float = 0.0
+    config: Optional[StressConfig] = field(default=None, repr=False)
+
+    @staticmethod
+    def _distribution(values: np.ndarray) -> Dict[str, float]:
+        """Summary statistics of one per-path metric."""
+        p1, p5, p50, p95, p99 = np.percentile(values, [1, 5, 50, 95, 99])
+        return {
+            "mean": float(np.mean(values)),
+            "std": float(np.std(values)),
+            "p1": float(p1),
+            "p5": float(p5),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "min": float(np.min(values)),
+            "max": float(np.max(values)),
+        }
+
+    def summary(self) -> dict:
+        """
+        Get distribution summaries for all metrics.
+
+        Returns:
+            Dictionary of metric -> statistics, plus run metadata
+        """
+        return {
+            "paths": int(self.total_pnl.size),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "margin_call_probability": float(np.mean(self.max_margin_usage >= 1.0)),
+            "total_pnl": self._distribution(self.total_pnl),
+            "lp_pnl": self._distribution(self.lp_pnl),
+            "fee_income": self._distribution(self.fee_income),
+            "hedge_pnl": self._distribution(self.hedge_pnl),
+            "hedge_fees": self._distribution(self.hedge_fees),
+            "hedge_count": self._distribution(self.hedge_count),
+            "max_margin_usage": self._distribution(self.max_margin_usage),
+            "mean_abs_delta": self._distribution(self.mean_abs_delta),
+        }
+
+
+def simulate_paths(
+    curve: PoolCurve,
+    policy: HedgePolicy,
+    config: StressConfig,
+    n_paths: int,
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate one chunk of paths (runs inside a worker process).
+
+    Paths are vectorized; only the time dimension is looped because hedge
+    state is path-dependent.
+
+    Args:
+        curve: Pool curve
+        policy: Hedge policy
+        config: Stress settings
+        n_paths: Number of paths in this chunk
+        seed: Seed for this chunk
+
+    Returns:
+        Dictionary of per-path result arrays
+    """
+    rng = np.random.default_rng(seed)
+    n_steps = config.n_steps
+    dt = config.step_seconds / SECONDS_PER_YEAR
+    s0 = config.initial_price or curve.price0
+
+    if config.model == "jump":
+        prices = generate_jump_paths(
+            rng,
+            n_paths,
+            n_steps,
+            s0,
+            dt,
+            config.annual_drift,
+            config.annual_volatility,
+            config.jump_intensity,
+            config.jump_mean,
+            config.jump_std,
+        )
+    else:
+        prices = generate_gbm_paths(
+            rng,
+            n_paths,
+            n_steps,
+            s0,
+            dt,
+            config.annual_drift,
+            config.annual_volatility,
+        )
+
+    # Pool state for every path and step in one vectorized pass
+    reserve0, reserve1 = curve.reserves_at(prices)
+
+    # Swap fees: charged on the input side of each arbitrage move
+    input0 = np.clip(np.diff(reserve0, axis=1), 0, None)
+    input1 = np.clip(np.diff(reserve1, axis=1), 0, None)
+    fee_income = (curve.fee * (input0 + input1 * prices[:, 1:])).sum(axis=1)
+
+    lp_value = reserve0 + reserve1 * prices
+    lp_pnl = lp_value[:, -1] - lp_value[:, 0]
+
+    # Hedge state, starting delta-neutral
+    short = reserve1[:, 0].copy()
+    hedge_pnl = np.zeros(n_paths)
+    hedge_fees = np.zeros(n_paths)
+    hedge_count = np.zeros(n_paths, dtype=np.int64)
+    last_hedge = np.full(n_paths, -np.inf)
+    max_usage = np.zeros(n_paths)
+    abs_delta_sum = np.zeros(n_paths)
+
+    # Ring buffer of recent hedge times for the hourly rate limit
+    window = max(1, policy.max_trades_per_hour)
+    recent = np.full((n_paths, window), -np.inf)
+    rows = np.arange(n_paths)
+
+    for step in range(1, n_steps + 1):
+        now = step * config.step_seconds
+        price = prices[:, step]
+        hedge_pnl -= short * (price - prices[:, step - 1])
+
+        delta = reserve1[:, step] - short
+        slot = hedge_count % window
+        rate_limited = now - recent[rows, slot] < 3600
+        hedge = policy.decide(delta, now - last_hedge, rate_limited)
+
+        if hedge.any():
+            trade = np.where(hedge, delta, 0.0)
+            short += trade
+            hedge_fees += np.abs(trade) * price * config.taker_fee
+            recent[rows[hedge], slot[hedge]] = now
+            last_hedge = np.where(hedge, now, last_hedge)
+            hedge_count += hedge
+            delta = delta - trade
+
+        abs_delta_sum += np.abs(delta)
+
+        equity = config.collateral_usdt + hedge_pnl - hedge_fees
+        requirement = np.abs(short) * price / config.leverage
+        usage = np.where(equity > 0, requirement / np.maximum(equity, 1e-12), np.inf)
+        np.maximum(max_usage, usage, out=max_usage)
+
+    return {
+        "total_pnl": lp_pnl + fee_income + hedge_pnl - hedge_fees,
+        "lp_pnl": lp_pnl,
+        "fee_income": fee_income,
+        "hedge_pnl": hedge_pnl,
+        "hedge_fees": hedge_fees,
+        "hedge_count": hedge_count,
+        "max_margin_usage": max_usage,
+        "mean_abs_delta": abs_delta_sum / n_steps,
+    }
+
+
+def _simulate_chunk(args: tuple) -> Dict[str, np.ndarray]:
+    """Process pool entry point."""
+    return simulate_paths(*args)
+
+
+class StressEngine:
+    """
+    Simulates the LP position and perp short together under random paths.
+
+    Spreads paths across a process pool; each worker runs a vectorized
+    simulation of its chunk against the curve math and the hedge policy.
+    """
+
+    def __init__(self, curve: PoolCurve, policy: HedgePolicy):
+        """
+        Initialize the stress engine.
+
+        Args:
+            curve: Pool curve to simulate
+            policy: Hedge policy to simulate
+        """
+        self.curve = curve
+        self.policy = policy
+        self.logger = LoggerManager()
+
+    @classmethod
+    def from_risk_manager(
+        cls,
+        pool_params: PoolParams,
+        risk_manager: RiskManager,
+        min_hedge_interval_seconds: float = 30.0,
+    ) -> "StressEngine":
+        """
+        Build an engine from live pool params and the bot's risk manager.
+
+        Args:
+            pool_params: Pool parameters
+            risk_manager: Risk manager whose limits drive the hedge policy
+            min_hedge_interval_seconds: Strategy engine hedge interval
+
+        Returns:
+            StressEngine instance
+        """
+        return cls(
+            PoolCurve.from_pool_params(pool_params),
+            HedgePolicy.from_risk_manager(risk_manager, min_hedge_interval_seconds),
+        )
+
+    def run(self, config: StressConfig) -> StressResult:
+        """
+        Run a stress test.
+
+        Args:
+            config: Stress settings
+
+        Returns:
+            StressResult with per-path outcomes
+        """
+        started = time.perf_counter()
+        n_workers = config.n_workers or os.cpu_count() or 1
+        n_chunks = max(1, min(n_workers, config.n_paths))
+
+        sizes = [config.n_paths // n_chunks] * n_chunks
+        for i in range(config.n_paths % n_chunks):
+            sizes[i] += 1
+        seeds = np.random.SeedSequence(config.seed).spawn(n_chunks)
+        tasks = [
+            (self.curve, self.policy, config, size, seed)
+            for size, seed in zip(sizes, seeds)
+        ]
+
+        self.logger.log_info(
+            f"Stress run: {config.n_paths} {config.model} paths x "
+            f"{config.n_steps} steps on {n_chunks} worker(s)",
+            LogTag.RISK,
+        )
+
+        if n_chunks == 1:
+            chunks = [_simulate_chunk(tasks[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=n_chunks) as executor:
+                chunks = list(executor.map(_simulate_chunk, tasks))
+
+        merged = {
+            key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]
+        }
+        elapsed = time.perf_counter() - started
+
+        self.logger.log_info(f"Stress run finished in {elapsed:.2f}s", LogTag.RISK)
+
+        return StressResult(**merged, elapsed_seconds=elapsed, config=config)
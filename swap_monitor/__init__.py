@@ -1,5 +1,6 @@
 """Swap monitoring for on-chain data."""
 
+from .swap_events import SwapEvent, SwapEventListener
 from .swap_monitor import SwapMonitor
 
-__all__ = ["SwapMonitor"]
+__all__ = ["SwapEvent", "SwapEventListener", "SwapMonitor"]
@@ -0,0 +1,274 @@
+"""Swap event listener for same-block hedge triggers."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Awaitable, Callable, Optional
+
+from models import PositionSnapshot
+from models.fixed_point import to_units
+from logger_manager import LoggerManager, LogTag
+
+# Default token decimals (USDT/WETH pool)
+TOKEN0_DECIMALS = 6
+TOKEN1_DECIMALS = 18
+
+
+@dataclass(frozen=True)
+class SwapEvent:
+    """
+    Decoded EulerSwap ``Swap`` log.
+
+    Amounts and reserves are raw on-chain integers; reserves are the pool
+    reserves after the swap.
+
+    Attributes:
+        block_number: Block containing the swap
+        transaction_hash: Hash of the swap transaction
+        log_index: Position of the log in the block
+        sender: Swap sender
+        to: Swap recipient
+        amount0_in: token0 paid into the pool
+        amount1_in: token1 paid into the pool
+        amount0_out: token0 paid out of the pool
+        amount1_out: token1 paid out of the pool
+        reserve0: token0 reserve after the swap
+        reserve1: token1 reserve after the swap
+        received_at: perf_counter() time the log was received
+        token0_decimals: Decimals of the pool's token0
+        token1_decimals: Decimals of the pool's token1
+    """
+
+    block_number: int
+    transaction_hash: str
+    log_index: int
+    sender: str
+    to: str
+    amount0_in: int
+    amount1_in: int
+    amount0_out: int
+    amount1_out: int
+    reserve0: int
+    reserve1: int
+    received_at: float
+    token0_decimals: int = TOKEN0_DECIMALS
+    token1_decimals: int = TOKEN1_DECIMALS
+
+    @property
+    def reserve0_change(self) -> int:
+        """Change of the token0 reserve caused by this swap (raw units)."""
+        return self.amount0_in - self.amount0_out
+
+    @property
+    def reserve1_change(self) -> int:
+        """Change of the token1 reserve caused by this swap (raw units)."""
+        return self.amount1_in - self.amount1_out
+
+    @classmethod
+    def from_log(
+        cls,
+        log,
+        received_at: float,
+        token0_decimals: int = TOKEN0_DECIMALS,
+        token1_decimals: int = TOKEN1_DECIMALS,
+    ) -> "SwapEvent":
+        """
+        Create a SwapEvent from a web3-decoded log.
+
+        Args:
+            log: EventData from ``contract.events.Swap().process_log``
+            received_at: perf_counter() time the log was received
+            token0_decimals: Decimals of the pool's token0
+            token1_decimals: Decimals of the pool's token1
+
+        Returns:
+            SwapEvent instance
+        """
+        args = log["args"]
+        return cls(
+            block_number=log["blockNumber"],
+            transaction_hash=log["transactionHash"].hex(),
+            log_index=log["logIndex"],
+            sender=args["sender"],
+            to=args["to"],
+            amount0_in=args["amount0In"],
+            amount1_in=args["amount1In"],
+            amount0_out=args["amount0Out"],
+            amount1_out=args["amount1Out"],
+            reserve0=args["reserve0"],
+            reserve1=args["reserve1"],
+            received_at=received_at,
+            token0_decimals=token0_decimals,
+            token1_decimals=token1_decimals,
+        )
+
+    def to_snapshot(
+        self, short_position_size: Decimal, pool_address: Optional[str] = None
+    ) -> PositionSnapshot:
+        """
+        Build a position snapshot from the post-swap reserves.
+
+        Args:
+            short_position_size: Best current estimate of the short position
+            pool_address: Address of the pool
+
+        Returns:
+            PositionSnapshot with source "swap_event"
+        """
+        return PositionSnapshot.from_units(
+            reserve_token0_units=self.reserve0,
+            reserve_token1_units=self.reserve1,
+            short_position_units=to_units(short_position_size, self.token1_decimals),
+            timestamp=datetime.utcnow(),
+            token0_decimals=self.token0_decimals,
+            token1_decimals=self.token1_decimals,
+            block_number=self.block_number,
+            pool_address=pool_address,
+            source="swap_event",
+            observed_at=self.received_at,
+        )
+
+
+class SwapEventListener:
+    """
+    Streams decoded Swap logs of one pool to a callback.
+
+    Works over the HTTP provider the monitor already uses: the head block is
+    polled at a short interval and each new block range is fetched with a
+    single ``eth_getLogs`` filtered on the pool and the Swap topic.
+    """
+
+    def __init__(
+        self,
+        w3,
+        contract,
+        poll_interval: float = 0.25,
+        token0_decimals: int = TOKEN0_DECIMALS,
+        token1_decimals: int = TOKEN1_DECIMALS,
+    ):
+        """
+        Initialize the listener.
+
+        Args:
+            w3: AsyncWeb3 instance
+            contract: Pool contract (ABI must include the Swap event)
+            poll_interval: Seconds between head-block checks
+            token0_decimals: Decimals of the pool's token0
+            token1_decimals: Decimals of the pool's token1
+        """
+        self.w3 = w3
+        self.contract = contract
+        self.poll_interval = poll_interval
+        self.token0_decimals = token0_decimals
+        self.token1_decimals = token1_decimals
+        self.logger = LoggerManager()
+
+        self._swap = contract.events.Swap()
+        self._topic = self.w3.keccak(
+            text="Swap(address,uint256,uint256,uint256,uint256,uint112,uint112,address)"
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._last_block: Optional[int] = None
+        self.on_block: Optional[Callable[[int], None]] = None
+
+        # Statistics
+        self.events_received = 0
+        self.errors = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self, callback: Callable[[SwapEvent], Awaitable[None]]) -> None:
+        """
+        Start streaming Swap events.
+
+        Args:
+            callback: Awaited for each event, in chain order
+        """
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._listen(callback))
+        self.logger.log_info("Listening for Swap events", LogTag.RPC)
+
+    async def stop(self) -> None:
+        """Stop streaming."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def poll(self) -> list:
+        """
+        Fetch Swap events in blocks not seen yet.
+
+        Returns:
+            List of SwapEvents in chain order
+        """
+        head = await self.w3.eth.block_number
+        if self._last_block is None:
+            # Start from the current head; history is covered by snapshots
+            self._last_block = head
+            return []
+        if head <= self._last_block:
+            return []
+
+        logs = await self.w3.eth.get_logs(
+            {
+                "address": self.contract.address,
+                "topics": [self._topic],
+                "fromBlock": self._last_block + 1,
+                "toBlock": head,
+            }
+        )
+        received_at = time.perf_counter()
+        self._last_block = head
+        if self.on_block:
+            self.on_block(head)
+
+        events = [
+            SwapEvent.from_log(
+                self._swap.process_log(log),
+                received_at,
+                self.token0_decimals,
+                self.token1_decimals,
+            )
+            for log in logs
+        ]
+        events.sort(key=lambda event: (event.block_number, event.log_index))
+        self.events_received += len(events)
+        return events
+
+    async def _listen(self, callback: Callable[[SwapEvent], Awaitable[None]]) -> None:
+        """Polling loop."""
+        while True:
+            try:
+                for event in await self.poll():
+                    await callback(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                self.logger.log_error("Error polling Swap events", e)
+
+            await asyncio.sleep(self.poll_interval)
+
+    def get_stats(self) -> dict:
+        """
+        Get listener statistics.
+
+        Returns:
+            Dictionary with event and error counts
+        """
+        return {
+            "events_received": self.events_received,
+            "last_block": self._last_block,
+            "errors": self.errors,
+        }
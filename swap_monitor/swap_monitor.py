@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
@@ -9,11 +10,13 @@ from typing import Optional, Callable, Dict, Any
 from web3 import Web3, AsyncHTTPProvider
 from web3.eth import AsyncEth
 
-from models import PositionSnapshot
-from exchange_manager import IExchange
+from models import PipelineStats, PipelineTrace, PositionSnapshot
+from models.fixed_point import from_units, to_units
+from exchange_manager import IExchange, PositionBook
 from database_manager import DatabaseManager
 from logger_manager import LoggerManager, LogTag
 from euler_swap import EulerPoolManager
+from .swap_events import TOKEN0_DECIMALS, TOKEN1_DECIMALS, SwapEvent, SwapEventListener
 
 
 class SwapMonitor:
@@ -32,6 +35,10 @@ class SwapMonitor:
         exchange: IExchange,
         symbol_perpetual: str = "ETH/USDT:USDT",
         database_manager: Optional[DatabaseManager] = None,
+        position_book: Optional[PositionBook] = None,
+        token0_decimals: int = TOKEN0_DECIMALS,
+        token1_decimals: int = TOKEN1_DECIMALS,
+        pipeline_stats: Optional[PipelineStats] = None,
     ):
         """
         Initialize the swap monitor.
@@ -43,6 +50,10 @@ class SwapMonitor:
             exchange: Exchange instance for position data
             symbol_perpetual: Perpetual trading symbol
             database_manager: Optional database manager for persistence
+            position_book: Optional local position book (read instead of REST)
+            token0_decimals: Decimals of the pool's token0 (quote)
+            token1_decimals: Decimals of the pool's token1 (hedged asset)
+            pipeline_stats: Optional stats fed with each snapshot's stage timings
         """
         self.rpc_url = rpc_url
         self.pool_address = Web3.to_checksum_address(pool_address)
@@ -50,6 +61,10 @@ class SwapMonitor:
         self.exchange = exchange
         self.symbol_perpetual = symbol_perpetual
         self.database_manager = database_manager
+        self.position_book = position_book
+        self.token0_decimals = token0_decimals
+        self.token1_decimals = token1_decimals
+        self.pipeline_stats = pipeline_stats
         self.logger = LoggerManager()
 
         # Web3 setup
@@ -69,7 +84,21 @@ class SwapMonitor:
         self._last_snapshot: Optional[PositionSnapshot] = None
 
         # EulerSwap pool manager
-        self.pool_manager = EulerPoolManager(self.w3, self.pool_address, self.contract)
+        self.pool_manager = EulerPoolManager(
+            self.w3,
+            self.pool_address,
+            self.contract,
+            token_decimals=(token0_decimals, token1_decimals),
+        )
+
+        # Swap event stream (same-block trigger); snapshots stay the reconciliation path
+        self.event_listener = SwapEventListener(
+            self.w3,
+            self.contract,
+            token0_decimals=token0_decimals,
+            token1_decimals=token1_decimals,
+        )
+        self.event_listener.on_block = self.pool_manager.note_block
 
     def _load_abi(self) -> list:
         """
@@ -105,22 +134,19 @@ class SwapMonitor:
         with open(abi_path, "r") as f:
             return json.load(f)
 
-    async def fetch_reserves(self) -> tuple[Decimal, Decimal, int]:
+    async def fetch_reserves_raw(self) -> tuple[int, int, int]:
         """
-        Fetch current reserves from the pool contract.
+        Fetch current reserves from the pool contract in raw token units.
 
         Returns:
-            Tuple of (reserve0, reserve1, status)
+            Tuple of (reserve0_units, reserve1_units, status)
         """
         try:
             # Call getReserves function - returns (reserve0, reserve1, status)
             reserves = await self.contract.functions.getReserves().call()
 
             # EulerSwap reserves are already in uint112 format
-            # Check decimals for each token - USDT typically has 6, WETH has 18
-            # For now assume USDT (6 decimals) and WETH (18 decimals)
-            reserve0 = Decimal(reserves[0]) / Decimal(10**6)  # USDT with 6 decimals
-            reserve1 = Decimal(reserves[1]) / Decimal(10**18)  # WETH with 18 decimals
+            reserve0, reserve1 = int(reserves[0]), int(reserves[1])
             status = reserves[2]  # Pool status: 0=unactivated, 1=unlocked, 2=locked
 
             # Check if pool is active and unlocked
@@ -130,7 +156,7 @@ class SwapMonitor:
                 self.logger.log_warning("Pool is locked (reentrancy)")
 
             self.logger.log_debug(
-                f"Fetched reserves: USDT={reserve0}, WETH={reserve1}, Status={status}",
+                f"Fetched raw reserves: {reserve0}/{reserve1}, Status={status}",
                 LogTag.RPC,
             )
 
@@ -140,13 +166,34 @@ class SwapMonitor:
             self.logger.log_error("Failed to fetch reserves", e)
             raise
 
+    async def fetch_reserves(self) -> tuple[Decimal, Decimal, int]:
+        """
+        Fetch current reserves from the pool contract.
+
+        Returns:
+            Tuple of (reserve0, reserve1, status)
+        """
+        reserve0, reserve1, status = await self.fetch_reserves_raw()
+
+        return (
+            from_units(reserve0, self.token0_decimals),
+            from_units(reserve1, self.token1_decimals),
+            status,
+        )
+
     async def fetch_short_position(self) -> Decimal:
         """
-        Fetch current short position from exchange.
+        Fetch current short position.
+
+        Reads the local position book when it is seeded, otherwise asks
+        the exchange.
 
         Returns:
             Current short position size
         """
+        if self.position_book is not None and self.position_book.ready:
+            return self.position_book.short_size
+
         try:
             position = await self.exchange.get_current_perpetual_position(
                 self.symbol_perpetual
@@ -162,6 +209,46 @@ class SwapMonitor:
             self.logger.log_error("Failed to fetch short position", e)
             return Decimal("0")
 
+    async def read_snapshot(self) -> PositionSnapshot:
+        """
+        Read reserves and the short position into a snapshot.
+
+        Unlike fetch_snapshot, nothing is persisted, logged or called back,
+        so the strategy can use it to refresh a stale decision.
+
+        Returns:
+            PositionSnapshot with current data
+        """
+        trace = PipelineTrace(self.pipeline_stats)
+
+        # Get on-chain reserves in raw units
+        reserve0_units, reserve1_units, status = await self.fetch_reserves_raw()
+        observed_at = time.perf_counter()
+
+        # Get current block number
+        block_number = await self.w3.eth.block_number
+        self.pool_manager.note_block(block_number)
+        rpc_received = trace.record("rpc", trace.origin)
+
+        # Get off-chain position
+        short_position = await self.fetch_short_position()
+        trace.record("exchange", rpc_received)
+
+        # Create snapshot; raw units feed the hot path, Decimals the edges
+        return PositionSnapshot(
+            reserve_token0=from_units(reserve0_units, self.token0_decimals),
+            reserve_token1=from_units(reserve1_units, self.token1_decimals),
+            short_position_size=short_position,
+            timestamp=datetime.utcnow(),
+            block_number=block_number,
+            pool_address=self.pool_address,
+            reserve_token1_units=reserve1_units,
+            short_position_units=to_units(short_position, self.token1_decimals),
+            token1_decimals=self.token1_decimals,
+            observed_at=observed_at,
+            trace=trace,
+        )
+
     async def fetch_snapshot(self) -> PositionSnapshot:
         """
         Fetch a complete position snapshot.
@@ -170,46 +257,32 @@ class SwapMonitor:
             PositionSnapshot with current data
         """
         try:
-            # Get on-chain reserves
-            reserve0, reserve1, block_timestamp = await self.fetch_reserves()
-
-            # Get current block number
-            block_number = await self.w3.eth.block_number
-
-            # Get off-chain position
-            short_position = await self.fetch_short_position()
-
-            # Create snapshot
-            snapshot = PositionSnapshot(
-                reserve_token0=reserve0,
-                reserve_token1=reserve1,
-                short_position_size=short_position,
-                timestamp=datetime.utcnow(),
-                block_number=block_number,
-                pool_address=self.pool_address,
-            )
+            snapshot = await self.read_snapshot()
+
+            # Update last snapshot
+            self._last_snapshot = snapshot
+
+            # A hedge decision goes first; persistence and logging can wait
+            if self._snapshot_callback:
+                await self._snapshot_callback(snapshot)
 
             # Save to database if available
             if self.database_manager:
+                started = time.perf_counter()
                 self.database_manager.save_position_snapshot(snapshot)
+                if snapshot.trace is not None:
+                    snapshot.trace.record("db_write", started)
 
             # Log snapshot
             self.logger.log_position_polling(
                 {
-                    "reserve_token0": str(reserve0),
-                    "reserve_token1": str(reserve1),
-                    "short_position_size": str(short_position),
+                    "reserve_token0": str(snapshot.reserve_token0),
+                    "reserve_token1": str(snapshot.reserve_token1),
+                    "short_position_size": str(snapshot.short_position_size),
                     "delta": str(snapshot.delta),
                 }
             )
 
-            # Update last snapshot
-            self._last_snapshot = snapshot
-
-            # Trigger callback if set
-            if self._snapshot_callback:
-                await self._snapshot_callback(snapshot)
-
             return snapshot
 
         except Exception as e:
@@ -238,8 +311,31 @@ class SwapMonitor:
         # Start monitoring task
         self._monitor_task = asyncio.create_task(self._monitor_loop(polling_interval))
 
+    def start_event_listener(
+        self,
+        callback: Callable[[SwapEvent], Any],
+        poll_interval: Optional[float] = None,
+    ) -> None:
+        """
+        Stream decoded Swap events of the pool to a callback.
+
+        Args:
+            callback: Awaited with each SwapEvent
+            poll_interval: Seconds between head-block checks
+        """
+        if poll_interval is not None:
+            self.event_listener.poll_interval = poll_interval
+        # The listener pushes each new head within a poll; past that, look the
+        # head up rather than serve memoized reads of an older block
+        self.pool_manager.block_ttl_seconds = min(
+            self.pool_manager.block_ttl_seconds, self.event_listener.poll_interval
+        )
+        self.event_listener.start(callback)
+
     async def stop_monitoring(self) -> None:
         """Stop monitoring pool reserves."""
+        await self.event_listener.stop()
+
         if not self._monitoring:
             return
 
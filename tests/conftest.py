@@ -17,6 +17,11 @@ def event_loop():
     """Create an event loop for async tests."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
+    # Unwind tasks a test left running (e.g. it failed before stop())
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
     loop.close()
 
 
@@ -109,6 +114,7 @@ def mock_exchange():
         }
     )
     exchange.set_leverage = AsyncMock(return_value=True)
+    exchange.get_order_by_client_id = AsyncMock(return_value=None)
     return exchange
 
 
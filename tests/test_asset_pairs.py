@@ -0,0 +1,131 @@
+"""Tests for hedging several underlyings from one deployment."""
+
+import dataclasses
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from config_manager import ConfigManager
+from models import AssetPair, Trade
+from models.trade import OrderSide, OrderStatus, OrderType
+from risk_manager import RiskManager
+from strategy_engine import StrategyEngine
+from swap_monitor import SwapEvent
+
+ETH_POOL = "0x" + "a" * 40
+BTC_POOL = "0x" + "b" * 40
+STETH_POOL = "0x" + "c" * 40
+BTC = "BTC/USDT:USDT"
+
+
+def _swap_event(reserve1: int, token1_decimals: int) -> SwapEvent:
+    return SwapEvent(
+        block_number=1,
+        transaction_hash="0x01",
+        log_index=0,
+        sender="0x",
+        to="0x",
+        amount0_in=0,
+        amount1_in=reserve1,
+        amount0_out=0,
+        amount1_out=0,
+        reserve0=10_000 * 10**6,
+        reserve1=reserve1,
+        received_at=time.perf_counter(),
+        token1_decimals=token1_decimals,
+    )
+
+
+def test_asset_specs_configure_each_perp(monkeypatch):
+    """Pools map to perps with their own decimals, size step and settings."""
+    monkeypatch.setenv("RPC_URL", "http://localhost:8545")
+    monkeypatch.setenv("EULERSWAP_POOL", ETH_POOL)
+    monkeypatch.setenv("BINANCE_API_KEY", "key")
+    monkeypatch.setenv("BINANCE_API_SECRET", "secret")
+    monkeypatch.setenv("EULERSWAP_POOLS", f"{BTC_POOL}={BTC},{STETH_POOL}")
+    monkeypatch.setenv(
+        "ASSET_SPECS",
+        f"{BTC}:token1_decimals=8,amount_step=0.001,"
+        "min_hedge_size_eth=0.001,hedge_threshold_eth=0.002,"
+        "kill_switch_enabled=false",
+    )
+    monkeypatch.setenv("KILL_SWITCH_ENABLED", "true")
+
+    manager = ConfigManager()
+    eth, btc, steth = manager.get_asset_pairs()
+    assert (eth.pool_address, eth.symbol) == (ETH_POOL, "ETH/USDT:USDT")
+    assert (eth.token1_decimals, eth.size_increment) == (18, Decimal("0"))
+    assert (btc.symbol, btc.token1_decimals) == (BTC, 8)
+    assert btc.round_size(Decimal("-0.12345")) == Decimal("-0.123")
+    # stETH is hedged on the ETH perp and nets with the main pool
+    assert steth.symbol == "ETH/USDT:USDT"
+
+    btc_config = manager.get_asset_config(BTC)
+    assert btc_config.symbol_perpetual == BTC
+    assert btc_config.hedge_threshold_eth == Decimal("0.002")
+    assert btc_config.kill_switch_enabled is False
+    eth_config = manager.get_asset_config("ETH/USDT:USDT")
+    assert eth_config.hedge_threshold_eth == manager.config.hedge_threshold_eth
+
+    # Deployment-wide settings cannot be overridden per perp
+    monkeypatch.setenv("ASSET_SPECS", f"{BTC}:database_url=sqlite://")
+    with pytest.raises(ValueError):
+        ConfigManager()
+
+
+@pytest.mark.asyncio
+async def test_engines_share_exchange_with_per_asset_sizing(mock_config, mock_exchange):
+    """Each engine decodes its pool's decimals and trades its perp's increments."""
+
+    def fill(symbol, size, **kwargs):
+        return Trade(
+            symbol=symbol,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id=kwargs.get("client_order_id"),
+            status=OrderStatus.FILLED,
+        )
+
+    mock_exchange.open_short_position = AsyncMock(side_effect=fill)
+    config = dataclasses.replace(mock_config, hedge_threshold_eth=Decimal("1"))
+    pairs = [
+        AssetPair(ETH_POOL, "ETH/USDT:USDT"),
+        AssetPair(BTC_POOL, BTC, token1_decimals=8, amount_step=Decimal("0.001")),
+    ]
+    engines = {}
+    for pair in pairs:
+        engine_config = dataclasses.replace(config, symbol_perpetual=pair.symbol)
+        engines[pair.symbol] = StrategyEngine(
+            engine_config,
+            mock_exchange,
+            RiskManager(engine_config),
+            asset=pair,
+        )
+        engines[pair.symbol]._short_estimate = Decimal("0")
+
+    await engines["ETH/USDT:USDT"].process_swap_event(_swap_event(3 * 10**17, 18))
+    await engines[BTC].process_swap_event(_swap_event(12_345_678, 8))
+    assert engines[BTC]._latest_snapshot.reserve_token1 == Decimal("0.12345678")
+    assert engines[BTC]._latest_snapshot.pool_address == BTC_POOL
+    mock_exchange.open_short_position.assert_not_called()
+
+    assert await engines["ETH/USDT:USDT"].rebalance_position() is True
+    assert await engines[BTC].rebalance_position() is True
+    orders = [
+        (call.kwargs["symbol"], call.kwargs["size"])
+        for call in mock_exchange.open_short_position.call_args_list
+    ]
+    assert orders == [
+        ("ETH/USDT:USDT", Decimal("0.3")),
+        (BTC, Decimal("0.123")),
+    ]
+    assert engines[BTC].get_strategy_stats()["asset"]["amount_step"] == "0.001"
+
+    for engine in engines.values():
+        await engine.stop()
@@ -0,0 +1,92 @@
+"""Tests for the event-driven backtester."""
+
+import asyncio
+import dataclasses
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from backtest_engine import BacktestEngine, BacktestSettings, VirtualClock
+from models import PositionSnapshot
+
+START = datetime(2024, 1, 1)
+
+
+def _history(steps: int, step_eth: Decimal) -> list:
+    """Snapshots every 5s of a pool selling ``step_eth`` per step at 2000."""
+    snapshots = []
+    reserve0, reserve1 = Decimal("1000000"), Decimal("500")
+    for i in range(steps):
+        snapshots.append(
+            PositionSnapshot(
+                reserve_token0=reserve0,
+                reserve_token1=reserve1,
+                short_position_size=Decimal("0"),
+                timestamp=START + timedelta(seconds=5 * i),
+            )
+        )
+        reserve1 += step_eth
+        reserve0 -= step_eth * 2000
+    return snapshots
+
+
+@pytest.mark.asyncio
+async def test_virtual_clock_wakes_sleepers_in_order():
+    """Sleepers wake when the clock passes them, never in real time."""
+    clock = VirtualClock(START)
+    woken = []
+
+    async def sleeper(seconds):
+        await clock.sleep(seconds)
+        woken.append((seconds, clock.monotonic()))
+
+    tasks = [asyncio.create_task(sleeper(s)) for s in (30, 10)]
+    await asyncio.sleep(0)
+
+    await clock.advance_to(START + timedelta(seconds=20))
+    assert woken == [(10, 10)]
+    await clock.advance_to(START + timedelta(seconds=60))
+    assert woken == [(10, 10), (30, 30)]
+    assert clock.utcnow() == START + timedelta(seconds=60)
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_backtest_replays_history_through_strategy(mock_config):
+    """Hedges follow the strategy's interval and keep delta bounded."""
+    # An interval that stays under the risk manager's 20 trades per hour
+    config = dataclasses.replace(
+        mock_config,
+        hedge_threshold_eth=Decimal("0.5"),
+        min_hedge_interval_seconds=200,
+        hedge_coalesce_window_seconds=10,
+    )
+    settings = BacktestSettings(
+        taker_fee_percent=Decimal("0.1"), latency_ms=100, slippage_bps=Decimal("0")
+    )
+
+    # One hour of snapshots, pool buys 0.02 ETH every 5s
+    snapshots = _history(720, Decimal("0.02"))
+    result = await BacktestEngine(config, settings).run(
+        snapshots, prices=[Decimal("2000")] * len(snapshots)
+    )
+
+    assert result.snapshots == 720
+    assert result.simulated_seconds >= 3595
+    assert 10 <= result.hedges <= 18  # Paced by the hedge interval
+    gaps = [
+        (b.timestamp - a.timestamp).total_seconds()
+        for a, b in zip(result.fills, result.fills[1:])
+    ]
+    assert min(gaps) >= 200
+
+    # Flat price: hedging only costs fees
+    assert result.hedge_pnl == 0
+    assert result.lp_pnl == 0
+    volume = sum(trade.size for trade in result.fills)
+    assert result.fees == volume * 2000 * Decimal("0.001")
+
+    summary = result.summary()
+    assert summary["hedges"] == result.hedges
+    assert summary["delta_error_eth"]["max_abs"] < 2
@@ -1,11 +1,24 @@
 """Tests for EulerSwap protocol integration."""
 
+import asyncio
+import json
+import random
 import pytest
 from decimal import Decimal
-from unittest.mock import Mock, AsyncMock, MagicMock
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock, MagicMock, PropertyMock
 from web3 import Web3
 
-from euler_swap import EulerPoolManager, PoolParams
+from euler_swap import EulerPoolManager, PoolParams, curve
+from euler_swap.curve import CurveError, CurveParams
+from euler_swap.limits import (
+    VaultState,
+    calc_limits,
+    compute_quote_with_limits,
+    decode_cap,
+)
+
+QUOTE_LIB_VECTORS = Path(__file__).parent / "fixtures" / "quote_lib_vectors.json"
 from swap_monitor import SwapMonitor
 
 
@@ -304,3 +317,282 @@ def test_pool_params_calculations():
     assert params_dict["is_concentrated"] is True
     assert params_dict["token0_decimals"] == 6
     assert params_dict["token1_decimals"] == 18
+
+
+def _limits_manager(block_number: int = 18000000):
+    """Build a pool manager whose contract serves fixed getLimits answers."""
+    mock_w3 = MagicMock()
+    mock_w3.eth.block_number = block_number
+    mock_contract = MagicMock()
+    mock_contract.functions.getLimits.return_value.call = AsyncMock(
+        return_value=(5000000000, 2400000000000000000)
+    )
+
+    manager = EulerPoolManager(mock_w3, "0xPoolAddress", mock_contract)
+    manager._assets = ("0xUSDT", "0xWETH")
+    manager._pool_params = PoolParams(
+        vault0="0xVault0",
+        vault1="0xVault1",
+        euler_account="0xEulerAccount",
+        equilibrium_reserve0=Decimal("10000000000"),
+        equilibrium_reserve1=Decimal("5000000000000000000"),
+        price_x=Decimal("2000"),
+        price_y=Decimal("1000"),
+        concentration_x=Decimal("0"),
+        concentration_y=Decimal("0"),
+        fee=Decimal("0.003"),
+        protocol_fee=Decimal("0"),
+        protocol_fee_recipient="0xFeeRecipient",
+        token0_decimals=6,
+        token1_decimals=18,
+    )
+    return manager, mock_contract
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_memoizes_within_block():
+    """Repeated questions in the same block hit the contract only once."""
+    manager, mock_contract = _limits_manager()
+    manager.note_block(18000000)
+
+    for _ in range(5):
+        assert await manager.get_swap_limits(True) == (Decimal("5000"), Decimal("2.4"))
+
+    assert mock_contract.functions.getLimits.return_value.call.await_count == 1
+    stats = manager.get_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 4
+
+    # A new block invalidates the entry
+    manager.note_block(18000001)
+    await manager.get_swap_limits(True)
+    assert mock_contract.functions.getLimits.return_value.call.await_count == 2
+    assert manager.get_cache_stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_looks_up_head_after_block_ttl():
+    """A block number past its TTL is looked up again, not reused."""
+    manager, mock_contract = _limits_manager()
+    heads = iter([18000001])
+
+    async def block_number():
+        return next(heads)
+
+    type(manager.w3.eth).block_number = PropertyMock(side_effect=lambda: block_number())
+    manager.note_block(18000000)
+    await manager.get_swap_limits(True)
+
+    # A new block lands: once the TTL lapses the fresh head invalidates the entry
+    manager._block_seen_at -= manager.block_ttl_seconds
+    await manager.get_swap_limits(True)
+    assert manager._block_number == 18000001
+    assert mock_contract.functions.getLimits.return_value.call.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_are_pinned_to_their_block():
+    """Memoized reads ask the node for the block they are cached under."""
+    manager, mock_contract = _limits_manager()
+    manager.note_block(18000000)
+    mock_contract.functions.getReserves.return_value.call = AsyncMock(
+        return_value=(10000000000, 5000000000000000000, 1)
+    )
+    mock_contract.functions.computeQuote.return_value.call = AsyncMock(
+        return_value=49000000000000000
+    )
+
+    await manager.get_swap_limits(True)
+    await manager.fetch_reserves()
+    await manager.get_quote(Decimal("100"), True)
+    for function in ("getLimits", "getReserves", "computeQuote"):
+        call = getattr(mock_contract.functions, function).return_value.call
+        call.assert_awaited_once_with(block_identifier=18000000)
+
+    # An explicit block is read at that block, even behind the memoized one
+    await manager.fetch_reserves(17999999)
+    mock_contract.functions.getReserves.return_value.call.assert_awaited_with(
+        block_identifier=17999999
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_single_flight():
+    """Concurrent identical requests are merged into one in-flight call."""
+    manager, mock_contract = _limits_manager()
+    manager.note_block(18000000)
+    release = asyncio.Event()
+
+    async def slow_limits(block_identifier=None):
+        assert block_identifier == 18000000
+        await release.wait()
+        return (5000000000, 2400000000000000000)
+
+    mock_contract.functions.getLimits.return_value.call = AsyncMock(
+        side_effect=slow_limits
+    )
+
+    tasks = [asyncio.create_task(manager.get_swap_limits(True)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert all(result == (Decimal("5000"), Decimal("2.4")) for result in results)
+    assert mock_contract.functions.getLimits.return_value.call.await_count == 1
+    assert manager.get_cache_stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_price_impact_surface_computed_locally():
+    """Price impact surface uses local curve math and one reserves read per block."""
+    manager, mock_contract = _limits_manager()
+    # 0.0005 WETH per USDT = 5e8 raw WETH units per raw USDT unit
+    manager._pool_params.price_x = Decimal("500000000000000000")
+    manager._pool_params.price_y = Decimal("1000000000")
+    manager._pool_params.concentration_x = Decimal("500000000000000000")
+    manager._pool_params.concentration_y = Decimal("500000000000000000")
+    # Pool sits at equilibrium: 10000 USDT / 5 WETH
+    mock_contract.functions.getReserves.return_value.call = AsyncMock(
+        return_value=(10000000000, 5000000000000000000, 1)
+    )
+    manager.note_block(18000000)
+
+    sizes_usdt = [Decimal("1"), Decimal("100"), Decimal("1000")]
+    sizes_weth = [Decimal("0.001"), Decimal("0.05"), Decimal("0.5")]
+    surface = await manager.get_price_impact_surface(sizes_usdt, sizes_weth)
+    again = await manager.get_price_impact_surface(sizes_usdt, sizes_weth)
+
+    assert again is surface
+    assert mock_contract.functions.getReserves.return_value.call.await_count == 1
+    mock_contract.functions.computeQuote.assert_not_called()
+
+    # At equilibrium the marginal price is px/py: 0.0005 WETH per USDT
+    assert surface.marginal_price == Decimal("0.0005")
+
+    for token_in_is_token0 in (True, False):
+        impacts = [p.price_impact for p in surface.points(token_in_is_token0)]
+        # Smallest trade pays about the 0.3% fee, larger trades pay more
+        assert Decimal("0.29") < impacts[0] < Decimal("0.32")
+        assert impacts == sorted(impacts)
+        assert all(p.within_reserves for p in surface.points(token_in_is_token0))
+
+    assert surface.max_size_for_impact(Decimal("1"), True) == Decimal("100")
+    assert surface.impact_for(Decimal("50"), True) is not None
+    assert surface.impact_for(Decimal("5000"), True) is None
+
+
+def test_curve_inverse_matches_forward_curve():
+    """Local fInverse stays on the curve (port of CurveLib fuzz test)."""
+    rng = random.Random(42)
+    for _ in range(500):
+        px = 1
+        py = rng.randint(1, 10**25)
+        x0 = rng.randint(1, 10**28)
+        y0 = rng.randint(0, 10**28)
+        cx = rng.randint(0, 10**18)
+        x = rng.randint(1, x0)
+        params = CurveParams(x0, y0, px, py, cx, 0, 0)
+
+        y = curve.f(x, px, py, x0, y0, cx)
+        x_calc = curve.f_inverse(y, px, py, x0, y0, cx)
+        y_calc = curve.f(x_calc, px, py, x0, y0, cx)
+
+        if x < curve.MAX_UINT112 and y < curve.MAX_UINT112:
+            assert curve.verify(params, x_calc, y)
+            assert x_calc - x <= 3 or y - y_calc <= 3
+
+    # Equilibrium maps onto itself
+    assert curve.f(10**6, 3, 7, 10**6, 5 * 10**18, 5 * 10**17) == 5 * 10**18
+
+
+def test_decode_cap_and_calc_limits():
+    """Local calcLimits reproduces QuoteLib for caps, cash and reserves."""
+    assert decode_cap(0) == 2**256 - 1
+    # mantissa 100, exponent 12: 1e12 raw units (1M USDT)
+    assert decode_cap((100 << 6) | 12) == 10**12
+    assert decode_cap((250 << 6) | 20) == 25 * 10**19
+
+    vault_usdt = VaultState("0xVault0", 10**13, 0, 0, 0, 10**12, 0)
+    vault_weth = VaultState(
+        "0xVault1",
+        cash=3 * 10**18,
+        total_borrows=9 * 10**18,
+        borrow_cap=(100 << 6) | 19,  # 10 WETH
+        account_debt=0,
+        account_max_deposit=2**255,
+        account_assets=5 * 10**17,
+    )
+
+    # USDT in: deposit cap 1M USDT; WETH out capped by borrow headroom + assets
+    assert calc_limits(vault_usdt, vault_weth, 10**10, 5 * 10**18, True) == (
+        10**12,
+        15 * 10**17,
+    )
+    # WETH in: uint112 max input; USDT out capped by reserves
+    assert calc_limits(vault_usdt, vault_weth, 10**10, 5 * 10**18, False) == (
+        2**112 - 1,
+        10**10,
+    )
+
+
+def test_limits_reproduce_recorded_contract_vectors():
+    """calcLimits, decodeCap and computeQuote match recorded contract outputs."""
+    vectors = json.loads(QUOTE_LIB_VECTORS.read_text())
+
+    for case in vectors["caps"]:
+        assert decode_cap(case["cap"]) == case["decoded"], case["source"]
+
+    for case in vectors["vectors"]:
+        params = CurveParams(**case["curve"])
+        vault0 = VaultState(**case["vault0"])
+        vault1 = VaultState(**case["vault1"])
+        args = (vault0, vault1, case["reserve0"], case["reserve1"])
+        direction = case["asset0_is_input"]
+
+        limits = calc_limits(*args, direction)
+        assert list(limits) == case["limits"], case["source"]
+
+        for quote in case["quotes"]:
+            if quote["quote"] is None:
+                with pytest.raises(CurveError):
+                    compute_quote_with_limits(
+                        params, *args, quote["amount"], quote["exact_in"], direction
+                    )
+            else:
+                assert (
+                    compute_quote_with_limits(
+                        params, *args, quote["amount"], quote["exact_in"], direction
+                    )
+                    == quote["quote"]
+                ), case["source"]
+
+
+@pytest.mark.asyncio
+async def test_local_limits_engine_reads_vaults_once_per_block():
+    """Local limits engine fetches vault state once per block for all sizes."""
+    manager, mock_contract = _limits_manager()
+    mock_contract.functions.getReserves.return_value.call = AsyncMock(
+        return_value=(10000000000, 5000000000000000000, 1)
+    )
+
+    vault = MagicMock()
+    vault.functions.cash.return_value.call = AsyncMock(return_value=10**24)
+    vault.functions.totalBorrows.return_value.call = AsyncMock(return_value=0)
+    vault.functions.caps.return_value.call = AsyncMock(return_value=(0, 0))
+    vault.functions.debtOf.return_value.call = AsyncMock(return_value=0)
+    vault.functions.maxDeposit.return_value.call = AsyncMock(return_value=10**9)
+    vault.functions.balanceOf.return_value.call = AsyncMock(return_value=0)
+    manager.w3.eth.contract = Mock(return_value=vault)
+    manager.note_block(18000000)
+
+    limit_in, limit_out = await manager.get_local_swap_limits(True)
+    quotes = await manager.get_local_quotes(
+        [Decimal("1"), Decimal("500"), Decimal("5000")], True
+    )
+
+    assert limit_in == Decimal("1000")  # maxDeposit of 1000 USDT
+    assert limit_out == Decimal("5")  # WETH reserve
+    assert quotes[0] is not None and quotes[1] is not None
+    assert quotes[2] is None  # Above deposit limit, contract would revert
+    assert vault.functions.cash.return_value.call.await_count == 2  # One per vault
+    mock_contract.functions.getLimits.assert_not_called()
@@ -0,0 +1,142 @@
+"""Tests for the multi-venue exchange router."""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from exchange_manager import ExchangeRouter
+from models import PositionSnapshot, Trade
+from models.trade import OrderSide, OrderStatus, OrderType
+from risk_manager import RiskManager
+from strategy_engine import StrategyEngine
+
+SYMBOL = "ETH/USDT:USDT"
+
+
+def _venue(bid, depth, short=Decimal("0")):
+    """Venue stub with a one-level book that fills at its bid/ask."""
+    venue = AsyncMock()
+    venue.get_order_book = AsyncMock(
+        return_value={
+            "bids": [(bid, depth)],
+            "asks": [(bid + 1, depth)],
+        }
+    )
+
+    def fill(side, price):
+        async def place(
+            symbol, size, leverage=None, client_order_id=None, reduce_only=False
+        ):
+            return Trade(
+                symbol=symbol,
+                side=side,
+                order_type=OrderType.MARKET,
+                size=size,
+                price=price,
+                timestamp=datetime.utcnow(),
+                order_id=f"{side.value}-{price}",
+                status=OrderStatus.FILLED,
+            )
+
+        return place
+
+    venue.open_short_position = AsyncMock(side_effect=fill(OrderSide.SELL, bid))
+    venue.close_short_position = AsyncMock(side_effect=fill(OrderSide.BUY, bid + 1))
+    venue.get_current_perpetual_position = AsyncMock(
+        return_value={
+            "symbol": SYMBOL,
+            "size": short,
+            "side": "short" if short else None,
+            "entry_price": Decimal("2000") if short else None,
+            "mark_price": Decimal("2000"),
+            "unrealized_pnl": Decimal("1"),
+            "realized_pnl": Decimal("0"),
+            "margin": Decimal("100"),
+            "leverage": Decimal("1"),
+        }
+    )
+    return venue
+
+
+@pytest.mark.asyncio
+async def test_open_short_splits_across_cheapest_venues():
+    """The best fee-adjusted venue fills up to its depth, the next the rest."""
+    cheap = _venue(Decimal("2000"), Decimal("3"))
+    # Higher bid, but the fee makes it the worse venue
+    pricey = _venue(Decimal("2000.5"), Decimal("10"))
+    router = ExchangeRouter(
+        {"a": cheap, "b": pricey},
+        taker_fees={"a": Decimal("0.02"), "b": Decimal("0.1")},
+    )
+
+    trade = await router.open_short_position(SYMBOL, Decimal("5"), Decimal("1"))
+
+    cheap.open_short_position.assert_awaited_once_with(
+        SYMBOL, Decimal("3"), Decimal("1"), client_order_id=None
+    )
+    pricey.open_short_position.assert_awaited_once_with(
+        SYMBOL, Decimal("2"), Decimal("1"), client_order_id=None
+    )
+    assert trade.size == Decimal("5")
+    assert trade.exchange == "a+b"
+    assert trade.price == (3 * Decimal("2000") + 2 * Decimal("2000.5")) / 5
+    assert router.get_stats()["a"]["filled"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_failover_and_aggregated_position():
+    """A failing venue's share is re-routed; positions are netted."""
+    flaky = _venue(Decimal("2001"), Decimal("10"), short=Decimal("4"))
+    flaky.close_short_position = AsyncMock(side_effect=ConnectionError("down"))
+    backup = _venue(Decimal("2000"), Decimal("10"), short=Decimal("1"))
+    router = ExchangeRouter(
+        {"flaky": flaky, "backup": backup}, max_consecutive_errors=1
+    )
+
+    position = await router.get_current_perpetual_position(SYMBOL)
+    assert position["size"] == Decimal("5")
+    assert position["side"] == "short"
+    assert position["unrealized_pnl"] == Decimal("2")
+    assert set(position["venues"]) == {"flaky", "backup"}
+
+    # Backup only holds 1 ETH short, so only that much can be closed there
+    trade = await router.close_short_position(SYMBOL, Decimal("3"))
+    assert trade.exchange == "backup"
+    assert trade.size == Decimal("1")
+    assert not router.stats["flaky"].healthy
+
+    # No venue holds a short: a clear error, not an empty merge
+    flat = ExchangeRouter({"a": _venue(Decimal("2000"), Decimal("10"))})
+    with pytest.raises(RuntimeError, match="no venue holds a short"):
+        await flat.close_short_position(SYMBOL, Decimal("1"))
+
+
+@pytest.mark.asyncio
+async def test_partial_close_hedge_records_filled_size(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """A close the venues can only partly take is recorded at its fill."""
+    router = ExchangeRouter(
+        {"a": _venue(Decimal("2000"), Decimal("10"), short=Decimal("0.4"))}
+    )
+    mock_exchange.close_short_position = AsyncMock(
+        side_effect=router.close_short_position
+    )
+    engine = StrategyEngine(
+        mock_config, mock_exchange, RiskManager(mock_config), mock_database_manager
+    )
+    snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("0"),
+        short_position_size=Decimal("1"),
+        timestamp=datetime.utcnow(),
+    )
+
+    hedge = await engine.execute_hedge(snapshot, Decimal("-1"))
+
+    assert hedge.success and hedge.size == Decimal("0.4")
+    assert hedge.delta_after == Decimal("-0.6")
+    assert engine.risk_manager.recent_trades[-1]["size"] == Decimal("0.4")
+    await engine.stop()
@@ -0,0 +1,137 @@
+"""Tests for the sliced execution engine."""
+
+import asyncio
+import dataclasses
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from database_manager import DatabaseManager
+from execution_engine import ExecutionEngine, ExecutionStatus
+from models import Trade
+from models.hedge_snapshot import HedgeAction
+from models.trade import OrderSide, OrderType, OrderStatus
+
+
+def _fill(symbol, size, leverage=None, client_order_id=None):
+    """Exchange stub filling each child at 2000."""
+    return Trade(
+        symbol=symbol,
+        side=OrderSide.SELL,
+        order_type=OrderType.MARKET,
+        size=size,
+        price=Decimal("2000"),
+        timestamp=datetime.utcnow(),
+        order_id=f"child-{size}-{datetime.utcnow().timestamp()}",
+        status=OrderStatus.FILLED,
+    )
+
+
+@pytest.mark.asyncio
+async def test_twap_splits_hedge_into_linked_children(mock_config, mock_exchange):
+    """A TWAP hedge fills in equal slices that link back to the parent."""
+    config = dataclasses.replace(mock_config, twap_slices=4, twap_duration_seconds=0)
+    mock_exchange.open_short_position = AsyncMock(side_effect=_fill)
+    completed = Mock()
+
+    engine = ExecutionEngine(config, mock_exchange, on_complete=completed)
+    order = engine.start(Decimal("8"), Decimal("8"), Decimal("1"))
+    await engine.wait()
+
+    assert order.status == ExecutionStatus.COMPLETED
+    assert [trade.size for trade in order.children] == [Decimal("2")] * 4
+    assert all(trade.parent_order_id == order.parent_id for trade in order.children)
+    completed.assert_called_once_with(order)
+
+    hedge = order.to_hedge_snapshot()
+    assert hedge.order_id == order.parent_id
+    assert hedge.size == Decimal("8")
+    assert hedge.price == Decimal("2000")
+    assert hedge.delta_after == Decimal("0")
+    assert len(hedge.child_trades) == 4
+
+
+@pytest.mark.asyncio
+async def test_depth_slices_follow_visible_liquidity(mock_config, mock_exchange):
+    """Depth slicing takes a fraction of the bids within the slippage band."""
+    config = dataclasses.replace(
+        mock_config,
+        execution_style="depth",
+        depth_participation=Decimal("0.5"),
+        twap_duration_seconds=0,
+    )
+    mock_exchange.get_order_book = AsyncMock(
+        return_value={
+            "bids": [
+                (Decimal("2000"), Decimal("1")),
+                (Decimal("1999"), Decimal("1")),
+                (Decimal("1900"), Decimal("50")),  # Outside 0.5% slippage
+            ],
+            "asks": [],
+        }
+    )
+    mock_exchange.open_short_position = AsyncMock(side_effect=_fill)
+
+    engine = ExecutionEngine(config, mock_exchange)
+    order = engine.start(Decimal("2.5"), Decimal("2.5"), Decimal("1"))
+    await engine.wait()
+
+    assert [trade.size for trade in order.children] == [
+        Decimal("1"),
+        Decimal("1"),
+        Decimal("0.5"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_retarget_and_cancel(mock_config, mock_exchange):
+    """New snapshots shrink the target; cancel stops between slices."""
+    config = dataclasses.replace(mock_config, twap_slices=4, twap_duration_seconds=40)
+    mock_exchange.open_short_position = AsyncMock(side_effect=_fill)
+
+    engine = ExecutionEngine(config, mock_exchange)
+    order = engine.start(Decimal("8"), Decimal("8"), Decimal("1"))
+    while not order.children:
+        await asyncio.sleep(0)
+
+    # Snapshot after the first fill: delta dropped more than the fill
+    engine.retarget(Decimal("3"))
+    assert order.target_size == Decimal("5")
+
+    # Delta flipped sign: nothing left to do in this direction
+    engine.retarget(Decimal("-1"))
+    assert order.remaining_size == 0
+
+    cancelled = await engine.cancel()
+    assert cancelled is order
+    assert order.status == ExecutionStatus.CANCELLED
+    assert order.action == HedgeAction.OPEN_SHORT
+    assert len(order.children) == 1
+    assert not engine.is_active
+
+
+def test_child_trades_saved_to_database_from_before_parent_links(tmp_path):
+    """A trades table created before parent_order_id existed is migrated."""
+    path = tmp_path / "old.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE trades (id INTEGER PRIMARY KEY, symbol VARCHAR(20), "
+            "side VARCHAR(4), order_type VARCHAR(6), size NUMERIC, price NUMERIC, "
+            "timestamp DATETIME, order_id VARCHAR(100) UNIQUE, status VARCHAR(9), "
+            "fee NUMERIC, fee_currency VARCHAR(10), exchange VARCHAR(50), "
+            "created_at DATETIME)"
+        )
+
+    # Idempotent: opening the database again adds nothing
+    DatabaseManager(f"sqlite:///{path}")
+    database = DatabaseManager(f"sqlite:///{path}")
+    child = _fill("ETH/USDT:USDT", Decimal("1"))
+    child.parent_order_id = "parent"
+    database.save_trade(child)
+
+    with sqlite3.connect(path) as connection:
+        saved = connection.execute("SELECT parent_order_id FROM trades").fetchall()
+    assert saved == [("parent",)]
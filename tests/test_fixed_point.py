@@ -0,0 +1,63 @@
+"""Tests for the integer fixed-point hot path."""
+
+from decimal import Decimal
+from datetime import datetime
+
+from models import PositionSnapshot
+from models.fixed_point import from_units, rescale, to_units
+from risk_manager import RiskManager
+
+
+def test_unit_conversions_round_trip():
+    """Test Decimal <-> raw unit conversions."""
+    assert to_units(Decimal("1.5")) == 1500000000000000000
+    assert to_units(Decimal("1000"), 6) == 1000000000
+    assert to_units("0.005") == 5000000000000000
+    assert to_units(2, 6) == 2000000
+    assert to_units(Decimal("-0.0000000000000000019")) == -1  # Truncates to zero
+    assert from_units(1500000000000000000) == Decimal("1.5")
+    assert from_units(1000000000, 6) == Decimal("1000")
+    assert rescale(1500000, 6, 18) == 1500000000000000000
+    assert rescale(-1999999999999, 18, 6) == -1
+
+
+def test_snapshot_delta_units_matches_decimal_delta():
+    """Test integer delta agrees with the Decimal delta."""
+    snapshot = PositionSnapshot.from_units(
+        reserve_token0_units=10000000000,
+        reserve_token1_units=5500000000000000000,
+        short_position_units=5000000000000000000,
+        timestamp=datetime.utcnow(),
+    )
+    assert snapshot.reserve_token0 == Decimal("10000")
+    assert snapshot.delta_units == 500000000000000000
+    assert from_units(snapshot.delta_units) == snapshot.delta
+
+    # Snapshots built from Decimals derive their units lazily
+    decimal_snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("4.5"),
+        short_position_size=Decimal("5"),
+        timestamp=datetime.utcnow(),
+    )
+    assert decimal_snapshot.delta_units == -500000000000000000
+
+
+def test_should_hedge_uses_integer_thresholds(mock_config):
+    """Test threshold decisions on raw units, including config updates."""
+    risk_manager = RiskManager(mock_config)
+    snapshot = PositionSnapshot.from_units(
+        reserve_token0_units=0,
+        reserve_token1_units=5010000000000000000,
+        short_position_units=5000000000000000000,
+        timestamp=datetime.utcnow(),
+    )
+
+    # Delta exactly at threshold (0.01) does not hedge
+    assert risk_manager.should_hedge(snapshot) == (False, Decimal("0"))
+
+    # Lowering the threshold takes effect immediately
+    mock_config.hedge_threshold_eth = Decimal("0.009")
+    should_hedge, hedge_size = risk_manager.should_hedge(snapshot)
+    assert should_hedge is True
+    assert hedge_size == Decimal("0.01")
@@ -0,0 +1,70 @@
+"""Tests for forecast (anticipatory) hedging."""
+
+import dataclasses
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from backtest_engine import BacktestEngine, BacktestSettings
+from models import PositionSnapshot
+from strategy_engine import ReserveForecaster
+
+START = datetime(2024, 1, 1)
+
+
+def _history(steps: int, step_eth: Decimal) -> list:
+    """Snapshots every 5s of a pool taking in ``step_eth`` per step at 2000."""
+    return [
+        PositionSnapshot(
+            reserve_token0=Decimal("1000000") - step_eth * 2000 * i,
+            reserve_token1=Decimal("500") + step_eth * i,
+            short_position_size=Decimal("0"),
+            timestamp=START + timedelta(seconds=5 * i),
+        )
+        for i in range(steps)
+    ]
+
+
+def test_forecast_follows_persistent_flow_only():
+    """Steady inflow forecasts its drift; choppy flow forecasts nothing."""
+    steady = ReserveForecaster()
+    for i in range(40):
+        steady.observe(500 + 0.01 * i, START + timedelta(seconds=5 * i))
+    assert steady.flow > 0.9
+    assert steady.expected_change(60) == pytest.approx(0.12, rel=0.05)
+
+    choppy = ReserveForecaster()
+    for i in range(40):
+        choppy.observe(500 + 0.05 * (i % 2), START + timedelta(seconds=5 * i))
+    assert abs(choppy.flow) < 0.5
+    assert choppy.expected_change(60) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_backtest_compares_forecast_with_reactive_hedging(mock_config):
+    """On a trending pool, hedging ahead of the flow tracks delta closer."""
+    config = dataclasses.replace(
+        mock_config,
+        hedge_threshold_eth=Decimal("0.5"),
+        min_hedge_interval_seconds=200,
+        hedge_coalesce_window_seconds=10,
+        forecast_horizon_seconds=200,
+        forecast_hedge_fraction=Decimal("1"),
+    )
+    settings = BacktestSettings(
+        taker_fee_percent=Decimal("0.1"), latency_ms=100, slippage_bps=Decimal("0")
+    )
+    snapshots = _history(720, Decimal("0.02"))
+    prices = [Decimal("2000")] * len(snapshots)
+
+    reactive = await BacktestEngine(config, settings).run(snapshots, prices)
+    forecast = await BacktestEngine(
+        dataclasses.replace(config, forecast_hedging_enabled=True), settings
+    ).run(snapshots, prices)
+
+    reactive_error = reactive.summary()["delta_error_eth"]
+    forecast_error = forecast.summary()["delta_error_eth"]
+    assert forecast_error["mean_abs"] < reactive_error["mean_abs"]
+    assert forecast_error["max_abs"] < reactive_error["max_abs"]
+    assert forecast.hedges <= reactive.hedges
@@ -0,0 +1,123 @@
+"""Tests for the optimal hedging band."""
+
+import asyncio
+import functools
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import ccxt
+import numpy as np
+import pytest
+
+from exchange_manager import BinanceExchange
+from models import PositionSnapshot
+from risk_manager import RiskManager
+from stress_engine import HedgeBand, PoolCurve, band_half_width
+
+
+def _curve(concentration=0.9):
+    return PoolCurve(
+        x0=1_000_000, y0=500, price0=2000, cx=concentration, cy=concentration
+    )
+
+
+def _band(volatility, curve=None):
+    band = HedgeBand(
+        [curve or _curve()],
+        Decimal("0.05"),
+        default_volatility=volatility,
+        min_band=Decimal("0.001"),
+        max_band=Decimal("10"),
+    )
+    band.observe(Decimal("2000"))
+    band.refresh()
+    return band
+
+
+def test_band_follows_gamma_volatility_and_fees():
+    """Calm markets widen the band; higher gamma and fees widen it in delta."""
+    prices = np.array([2000.0])
+    base = band_half_width(prices, np.array([0.5]), 0.8, 0.0005, 1.0, 1 / 365)
+    assert band_half_width(prices, np.array([0.5]), 0.2, 0.0005, 1.0, 1 / 365) > base
+    assert band_half_width(prices, np.array([2.0]), 0.8, 0.0005, 1.0, 1 / 365) > base
+    assert band_half_width(prices, np.array([0.5]), 0.8, 0.001, 1.0, 1 / 365) > base
+
+    calm, volatile = _band(0.2), _band(2.0)
+    assert calm.current() > volatile.current()
+    assert _band(0.8, _curve(0.5)).current() < _band(0.8, _curve(0.95)).current()
+
+    # Lookups beyond the grid use its edges
+    assert calm.band_at(1.0) == calm.band_at(1500)
+    assert calm.band_at(10**6) == calm.band_at(2600)
+
+
+def test_risk_manager_uses_band_over_fixed_threshold(mock_config):
+    """A delta inside the band is not hedged even above the fixed threshold."""
+    band = HedgeBand(
+        [_curve()],
+        Decimal("0.05"),
+        min_band=Decimal("0.05"),
+        max_band=Decimal("0.05"),
+    )
+    risk_manager = RiskManager(mock_config, hedge_band=band)
+    snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("5.03"),
+        short_position_size=Decimal("5"),
+        timestamp=datetime.utcnow(),
+    )
+
+    # No band computed yet: the fixed 0.01 ETH threshold applies
+    assert risk_manager.should_hedge(snapshot)[0]
+
+    band.observe(Decimal("2000"))
+    band.refresh()
+    assert band.current() == Decimal("0.05")
+    assert not risk_manager.should_hedge(snapshot)[0]
+    assert risk_manager.get_risk_summary()["hedge_band"]["band"] == "0.050000"
+
+
+def test_band_is_looked_up_at_the_live_price(mock_config):
+    """Between refreshes the band follows the mark price, not the grid centre."""
+    band = _band(0.8)
+    assert band.current() == band.band_at(2000)
+    # Gamma is highest at the curve's equilibrium and falls off away from it
+    assert band.current(Decimal("2100")) == band.band_at(2100)
+    assert band.current(Decimal("2100")) < band.current()
+
+    risk_manager = RiskManager(mock_config, hedge_band=band)
+    delta = (band.current(Decimal("2100")) + band.current()) / 2
+    snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("5") + delta,
+        short_position_size=Decimal("5"),
+        timestamp=datetime.utcnow(),
+    )
+    assert not risk_manager.should_hedge(snapshot)[0]
+    band.mark(Decimal("2100"))
+    assert risk_manager.should_hedge(snapshot)[0]
+    assert band.get_stats()["mark_price"] == 2100.0
+
+
+@pytest.mark.asyncio
+async def test_band_refreshes_from_binance_mark_price():
+    """The refresh loop reads the mark price from a CCXT-shaped Binance ticker."""
+    exchange = BinanceExchange("key", "secret")
+    exchange.exchange = MagicMock()
+    exchange.exchange.fetch_ticker = AsyncMock(
+        return_value=ccxt.binance().safe_ticker(
+            {"symbol": "ETH/USDT:USDT", "last": 2090, "markPrice": 2100}
+        )
+    )
+    exchange._connected = True
+
+    band = HedgeBand([_curve()], Decimal("0.05"))
+    # As LPHedgeBot._start_hedge_bands wires it
+    await band.start(functools.partial(exchange.get_mark_price, "ETH/USDT:USDT"))
+    await asyncio.sleep(0)
+    await band.stop()
+
+    assert band.refreshes == 1
+    assert band.price == 2100.0
+    assert band.current() == band.band_at(2100)
@@ -0,0 +1,150 @@
+"""Tests for the idempotent hedge order lifecycle."""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from database_manager import DatabaseManager
+from execution_engine import HedgeLedger
+from models import PositionSnapshot, Trade
+from models.hedge_intent import HedgeState
+from models.hedge_snapshot import HedgeAction
+from models.trade import OrderSide, OrderStatus, OrderType
+from risk_manager import RiskManager
+from strategy_engine import StrategyEngine
+
+SYMBOL = "ETH/USDT:USDT"
+
+
+def _order(client_order_id, filled, status="closed"):
+    return {
+        "id": "42",
+        "side": "sell",
+        "filled": Decimal(filled),
+        "status": status,
+        "price": None,
+        "average": Decimal("2000"),
+        "fee": Decimal("0.4"),
+        "fee_currency": "USDT",
+        "client_order_id": client_order_id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_timed_out_order_is_resolved_not_resent(mock_exchange):
+    """An order accepted before its response was lost is found, not doubled."""
+
+    async def slow_accept(**kwargs):
+        await asyncio.sleep(1)
+
+    mock_exchange.open_short_position = AsyncMock(side_effect=slow_accept)
+    mock_exchange.get_order_by_client_id = AsyncMock(
+        side_effect=lambda cid, symbol: _order(cid, "1.5")
+    )
+    ledger = HedgeLedger(
+        mock_exchange, ack_timeout_seconds=0.01, resolve_delay_seconds=0
+    )
+
+    intent = ledger.intent("snapshot-1", SYMBOL, HedgeAction.OPEN_SHORT, Decimal("1.5"))
+    trade = await ledger.submit(intent)
+
+    assert trade.size == Decimal("1.5") and trade.order_id == "42"
+    assert intent.state == HedgeState.FILLED
+    assert ledger.timeouts == 1 and ledger.resolved_by_lookup == 1
+    sent_id = mock_exchange.open_short_position.call_args.kwargs["client_order_id"]
+    assert sent_id == intent.client_order_id
+
+    # Deciding the same hedge again does not send a second order
+    again = ledger.intent("snapshot-1", SYMBOL, HedgeAction.OPEN_SHORT, Decimal("1.5"))
+    assert again is intent
+    with pytest.raises(RuntimeError, match="already filled"):
+        await ledger.submit(again)
+    assert mock_exchange.open_short_position.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_in_flight_hedges_recovered_after_restart(mock_exchange):
+    """Intents persisted as submitted are settled by lookup on restart."""
+    database = DatabaseManager("sqlite:///:memory:")
+    mock_exchange.open_short_position = AsyncMock(side_effect=ConnectionError("reset"))
+    mock_exchange.get_order_by_client_id = AsyncMock(side_effect=ConnectionError)
+    ledger = HedgeLedger(
+        mock_exchange, database, resolve_attempts=2, resolve_delay_seconds=0
+    )
+
+    # Neither the order nor the lookups get an answer: outcome unknown
+    intent = ledger.intent("snapshot-2", SYMBOL, HedgeAction.OPEN_SHORT, Decimal("2"))
+    with pytest.raises(ConnectionError):
+        await ledger.submit(intent)
+    assert ledger.has_unresolved
+    assert intent.state == HedgeState.SUBMITTED
+
+    # A new process finds the order filled
+    mock_exchange.get_order_by_client_id = AsyncMock(
+        side_effect=lambda cid, symbol: _order(cid, "2")
+    )
+    restarted = HedgeLedger(mock_exchange, database)
+    trades = await restarted.recover()
+
+    assert [trade.size for trade in trades] == [Decimal("2")]
+    assert not restarted.has_unresolved
+    assert database.get_unresolved_hedge_intents() == []
+
+    # An order the exchange never saw is failed, not left pending
+    mock_exchange.get_order_by_client_id = AsyncMock(return_value=None)
+    intent = restarted.intent(
+        "snapshot-3", SYMBOL, HedgeAction.OPEN_SHORT, Decimal("1")
+    )
+    with pytest.raises(ConnectionError):
+        await restarted.submit(intent)
+    assert intent.state == HedgeState.FAILED
+    assert not restarted.has_unresolved
+
+
+@pytest.mark.asyncio
+async def test_acked_order_fill_is_booked_once(mock_config, mock_exchange):
+    """An order acked before it filled is booked when it settles, not twice."""
+    mock_exchange.open_short_position = AsyncMock(
+        side_effect=lambda **kwargs: Trade(
+            symbol=SYMBOL,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=Decimal("1"),
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id="42",
+            status=OrderStatus.OPEN,
+        )
+    )
+    mock_exchange.get_order_by_client_id = AsyncMock(
+        side_effect=lambda cid, symbol: _order(cid, "0", status="open")
+    )
+    engine = StrategyEngine(mock_config, mock_exchange, RiskManager(mock_config))
+    engine.ledger.resolve_attempts = 1
+    engine.ledger.resolve_delay_seconds = 0
+    engine._short_estimate = Decimal("5")
+    snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("6"),
+        short_position_size=Decimal("5"),
+        timestamp=datetime.utcnow(),
+    )
+
+    # Still open after the ack: nothing is booked yet
+    hedge = await engine.execute_hedge(snapshot, Decimal("1"))
+    assert hedge is not None and not hedge.success
+    assert engine._short_estimate == Decimal("5")
+    assert engine.ledger.has_unresolved
+
+    # It fills: booked once when resolved, and only once
+    mock_exchange.get_order_by_client_id = AsyncMock(
+        side_effect=lambda cid, symbol: _order(cid, "1")
+    )
+    assert await engine.resolve_hedges()
+    assert await engine.resolve_hedges()
+    assert engine._short_estimate == Decimal("6")
+    assert mock_exchange.open_short_position.await_count == 1
+    await engine.stop()
@@ -0,0 +1,191 @@
+"""Tests for the tick-driven kill switch."""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import ccxt
+import pytest
+
+from backtest_engine import SimulatedExchange, VirtualClock
+from exchange_manager import BinanceExchange
+from models import PositionSnapshot, Trade
+from models.hedge_snapshot import HedgeAction
+from models.trade import OrderSide, OrderStatus, OrderType
+from risk_manager import KillSwitch, RiskManager
+from strategy_engine import StrategyEngine
+
+START = datetime(2024, 1, 1)
+SYMBOL = "ETH/USDT:USDT"
+
+
+@pytest.mark.asyncio
+async def test_price_crash_flattens_in_one_request(mock_config):
+    """An injected crash trips the switch, which closes the short at once."""
+    clock = VirtualClock(START)
+    prices = [Decimal("2000")] * 8 + [Decimal("1780"), Decimal("1700")]
+    exchange = SimulatedExchange(
+        clock, price_times=list(range(1, 11)), prices=prices, latency_ms=0
+    )
+    await exchange.open_short_position(SYMBOL, Decimal("5"))
+    exchange.get_current_perpetual_position = AsyncMock(
+        wraps=exchange.get_current_perpetual_position
+    )
+
+    engine = StrategyEngine(mock_config, exchange, RiskManager(mock_config))
+    switch = KillSwitch(exchange, SYMBOL, RiskManager(mock_config), clock=clock)
+    switch.trip_listeners.append(engine.halt)
+    await switch.start()
+    await asyncio.sleep(0)
+    assert switch.exit_order["size"] == Decimal("5")
+
+    await clock.advance_to(START + timedelta(seconds=10))
+
+    assert switch.tripped.startswith("price moved 11.0%")
+    assert exchange.short_size == 0
+    assert [fill.side for fill in exchange.fills] == [OrderSide.SELL, OrderSide.BUY]
+    # Armed once at start; no position fetch when flattening
+    assert exchange.get_current_perpetual_position.await_count == 1
+    assert switch.exit_order is None
+
+    # Hedging stays off after the switch trips
+    assert engine.halted == switch.tripped
+    snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("5"),
+        short_position_size=Decimal("0"),
+        timestamp=datetime.utcnow(),
+    )
+    assert await engine.process_position_snapshot(snapshot) is None
+
+    stats = switch.get_stats()
+    assert stats["ticks"] == 10
+    assert stats["check_us"]["max"] > 0
+    await switch.stop()
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_loss_limit_rearms_on_fills_and_retries_exit(mock_config, mock_exchange):
+    """The exit tracks our fills and is resent on the next tick if it fails."""
+
+    def fill(side, size, price):
+        return Trade(
+            symbol=SYMBOL,
+            side=side,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=price,
+            timestamp=datetime.utcnow(),
+            order_id="kill",
+            status=OrderStatus.FILLED,
+        )
+
+    mock_exchange.close_short_position = AsyncMock(
+        side_effect=[
+            Exception("timeout"),
+            fill(OrderSide.BUY, Decimal("6"), Decimal("2300")),
+        ]
+    )
+    switch = KillSwitch(
+        mock_exchange,
+        SYMBOL,
+        RiskManager(mock_config),
+        max_move_percent=Decimal("50"),
+        max_loss=Decimal("1000"),
+    )
+    switch.arm(Decimal("5"), Decimal("2000"))
+    switch.on_fill(
+        HedgeAction.OPEN_SHORT, fill(OrderSide.SELL, Decimal("1"), Decimal("2600"))
+    )
+    assert (switch.short_size, switch.entry_price) == (Decimal("6"), Decimal("2100"))
+
+    assert not switch.on_tick(2200.0)  # Loss 600
+    assert switch.on_tick(2300.0)  # Loss 1200
+    assert switch.tripped.startswith("short loss")
+    await switch._exit_task
+    assert switch.exit_attempts == 1 and switch.exit_trade is None
+
+    switch.on_tick(2310.0)
+    await switch._exit_task
+    assert switch.exit_attempts == 2
+    assert switch.short_size == 0
+    kwargs = mock_exchange.close_short_position.call_args.kwargs
+    assert kwargs["size"] == Decimal("6") and kwargs["reduce_only"] is True
+    assert kwargs["client_order_id"].startswith("lpk")
+
+
+@pytest.mark.asyncio
+async def test_binance_ticker_stream_trips_switch(mock_config):
+    """Ticks in CCXT's unified ticker shape reach the switch from Binance."""
+    shaper = ccxt.binance()
+    ticks = asyncio.Queue()
+    for mark in (2000, 2010, 1700):
+        ticks.put_nowait(
+            shaper.safe_ticker({"symbol": SYMBOL, "last": 2000, "markPrice": mark})
+        )
+
+    exchange = BinanceExchange("key", "secret")
+    exchange.exchange = MagicMock()
+    exchange.stream = MagicMock()
+
+    async def watch_ticker(symbol):
+        return await ticks.get()
+
+    exchange.stream.watch_ticker = watch_ticker
+    exchange._connected = True
+    exchange.get_current_perpetual_position = AsyncMock(
+        return_value={
+            "side": "short",
+            "size": Decimal("5"),
+            "entry_price": Decimal("2000"),
+        }
+    )
+    exchange.close_short_position = AsyncMock(
+        return_value=Trade(
+            symbol=SYMBOL,
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            size=Decimal("5"),
+            price=Decimal("1700"),
+            timestamp=datetime.utcnow(),
+            order_id="kill",
+            status=OrderStatus.FILLED,
+        )
+    )
+
+    switch = KillSwitch(exchange, SYMBOL, RiskManager(mock_config))
+    await switch.start()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    await switch.stop()
+
+    assert switch.ticks == 3
+    assert switch.tripped.startswith("price moved 15.4%")
+    exchange.close_short_position.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_cancel_on_halt_is_logged_and_awaited(mock_config, mock_exchange):
+    """The cancel sent when hedging halts is kept, checked and awaited."""
+    engine = StrategyEngine(mock_config, mock_exchange, RiskManager(mock_config))
+    engine.execution_engine = Mock(
+        is_active=True,
+        cancel=AsyncMock(side_effect=[RuntimeError("venue down"), None]),
+        maker=Mock(close=AsyncMock()),
+    )
+    engine.logger.log_error = Mock()
+
+    engine.halt("price moved 11.0% within 60s")
+    assert engine._halt_task is not None
+    await asyncio.wait([engine._halt_task])
+    await asyncio.sleep(0)  # Done-callbacks run on the next loop pass
+
+    message, error = engine.logger.log_error.call_args.args
+    assert message == "Failed to cancel in-flight hedge on halt"
+    assert str(error) == "venue down"
+
+    await engine.stop()
+    assert engine._halt_task is None
+    assert engine.execution_engine.cancel.await_count == 2
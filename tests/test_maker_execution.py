@@ -0,0 +1,182 @@
+"""Tests for post-only maker execution."""
+
+import asyncio
+import dataclasses
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from execution_engine import MakerExecutor
+from models import Trade
+from models.hedge_snapshot import HedgeAction
+from models.trade import OrderSide, OrderStatus, OrderType
+
+
+class _OrderStream:
+    """Fake exchange order stream driven by placements and cancels."""
+
+    def __init__(self, exchange, fills):
+        self.events = asyncio.Queue()
+        self.fills = fills  # order_id -> (size filled on placement, status)
+        self.placed = []
+        self.client_ids = []
+        self.orders = {}
+        exchange.watch_orders = AsyncMock(side_effect=self.watch)
+        exchange.place_limit_order = AsyncMock(side_effect=self.place)
+        exchange.cancel_order = AsyncMock(side_effect=self.cancel)
+
+    async def watch(self, symbol):
+        return [await self.events.get()]
+
+    def push(self, order_id, status):
+        self.events.put_nowait({**self.orders[order_id], "status": status})
+
+    async def place(self, symbol, side, size, price, post_only=True, **kwargs):
+        order_id = f"o{len(self.placed) + 1}"
+        self.placed.append((size, price, post_only))
+        self.client_ids.append(kwargs["client_order_id"])
+        filled, status = self.fills.get(order_id, (Decimal("0"), "open"))
+        self.orders[order_id] = {
+            "id": order_id,
+            "type": "limit",
+            "price": price,
+            "amount": size,
+            "filled": filled,
+            "average": price,
+        }
+        self.push(order_id, status)
+        return Trade(
+            symbol=symbol,
+            side=side,
+            order_type=OrderType.LIMIT,
+            size=size,
+            price=price,
+            timestamp=datetime.utcnow(),
+            order_id=order_id,
+            status=OrderStatus.OPEN,
+        )
+
+    async def cancel(self, order_id, symbol):
+        self.push(order_id, "canceled")
+        return True
+
+
+def _book(*asks):
+    """Order book stub returning the given best asks, then the last one."""
+    asks = list(asks)
+
+    async def get_order_book(symbol, limit=20):
+        ask = asks.pop(0) if len(asks) > 1 else asks[0]
+        return {"bids": [(ask - 1, Decimal("5"))], "asks": [(ask, Decimal("5"))]}
+
+    return get_order_book
+
+
+@pytest.mark.asyncio
+async def test_maker_chases_book_from_order_events(mock_config, mock_exchange):
+    """A partially filled order is repriced and the rest fills as maker."""
+    config = dataclasses.replace(mock_config, maker_chase_interval_ms=10)
+    mock_exchange.get_order_book = AsyncMock(
+        side_effect=_book(Decimal("2001"), Decimal("2000.5"))
+    )
+    stream = _OrderStream(
+        mock_exchange,
+        {"o1": (Decimal("1"), "open"), "o2": (Decimal("1"), "closed")},
+    )
+
+    maker = MakerExecutor(config, mock_exchange)
+    trades = await maker.execute(HedgeAction.OPEN_SHORT, Decimal("2"), Decimal("1"))
+    await maker.close()
+
+    assert stream.placed == [
+        (Decimal("2"), Decimal("2001"), True),
+        (Decimal("1"), Decimal("2000.5"), True),
+    ]
+    mock_exchange.cancel_order.assert_awaited_once_with("o1", config.symbol_perpetual)
+    assert [(t.order_id, t.size, t.price) for t in trades] == [
+        ("o1", Decimal("1"), Decimal("2001")),
+        ("o2", Decimal("1"), Decimal("2000.5")),
+    ]
+    assert all(t.order_type == OrderType.LIMIT for t in trades)
+    # Each post has its own client ID and is settled in the ledger
+    assert len(set(stream.client_ids)) == 2
+    assert maker.ledger.filled == 2 and not maker.ledger.has_unresolved
+    mock_exchange.open_short_position.assert_not_called()
+    mock_exchange.get_order_status.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_maker_falls_back_to_market_at_deadline(mock_config, mock_exchange):
+    """The chase stays in the slippage budget; the rest goes at market."""
+    config = dataclasses.replace(
+        mock_config, maker_chase_interval_ms=10, maker_deadline_seconds=0.05
+    )
+    mock_exchange.get_order_book = AsyncMock(
+        side_effect=_book(Decimal("2000"), Decimal("1900"))
+    )
+    mock_exchange.open_short_position = AsyncMock(
+        return_value=Trade(
+            symbol=config.symbol_perpetual,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=Decimal("2"),
+            price=Decimal("1990"),
+            timestamp=datetime.utcnow(),
+            order_id="market",
+            status=OrderStatus.FILLED,
+        )
+    )
+    stream = _OrderStream(mock_exchange, {})
+
+    maker = MakerExecutor(config, mock_exchange)
+    trades = await maker.execute(HedgeAction.OPEN_SHORT, Decimal("2"), Decimal("1"))
+    await maker.close()
+
+    # 0.5% below the first quote, never down to 1900
+    assert {price for _, price, _ in stream.placed} == {
+        Decimal("2000"),
+        Decimal("1990"),
+    }
+    mock_exchange.open_short_position.assert_awaited_once()
+    market = mock_exchange.open_short_position.call_args.kwargs
+    assert (market["size"], market["leverage"]) == (Decimal("2"), Decimal("1"))
+    assert market["client_order_id"] not in stream.client_ids
+    assert [t.order_id for t in trades] == ["market"]
+    assert maker.ledger.failed == 2 and not maker.ledger.has_unresolved
+    assert maker.get_stats()["taker_filled"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_maker_confirms_cancel_before_reposting(mock_config, mock_exchange):
+    """A cancel the stream does not report is polled until the order is final."""
+    config = dataclasses.replace(mock_config, maker_chase_interval_ms=10)
+    mock_exchange.get_order_book = AsyncMock(
+        side_effect=_book(Decimal("2001"), Decimal("2000.5"))
+    )
+    stream = _OrderStream(
+        mock_exchange,
+        {"o1": (Decimal("0.5"), "open"), "o2": (Decimal("0.8"), "closed")},
+    )
+    # The cancel is sent but never shows up on the stream; more fills
+    # land on the order before the cancel takes effect
+    mock_exchange.cancel_order = AsyncMock(return_value=True)
+    mock_exchange.get_order_status = AsyncMock(
+        side_effect=[
+            {"id": "o1", "filled": Decimal("0.5"), "status": "open"},
+            {"id": "o1", "filled": Decimal("1.2"), "status": "canceled"},
+        ]
+    )
+
+    maker = MakerExecutor(config, mock_exchange)
+    trades = await maker.execute(HedgeAction.OPEN_SHORT, Decimal("2"), Decimal("1"))
+    await maker.close()
+
+    assert mock_exchange.get_order_status.await_count == 2
+    # The repost covers only what the confirmed cancel left
+    assert stream.placed[1][0] == Decimal("0.8")
+    assert [(t.order_id, t.size) for t in trades] == [
+        ("o1", Decimal("1.2")),
+        ("o2", Decimal("0.8")),
+    ]
@@ -0,0 +1,93 @@
+"""Tests for the parallel parameter sweep."""
+
+import csv
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from backtest_engine import ParameterSweep, BacktestSettings, grid_points, write_csv
+from backtest_engine.sweep import SweepRow, rank
+from config_manager import Config
+from database_manager import DatabaseManager
+from models import PositionSnapshot
+
+
+def _row(cost, error):
+    """Sweep row with only cost and error set."""
+    return SweepRow({}, 0, Decimal("0"), Decimal("0"), -cost, cost, error, error, 1.0)
+
+
+def test_rank_scores_and_marks_pareto_front():
+    """Rows sort by weighted score; dominated rows are off the front."""
+    cheap, balanced, tight, dominated = (
+        _row(Decimal("10"), 0.5),
+        _row(Decimal("20"), 0.1),
+        _row(Decimal("50"), 0.01),
+        _row(Decimal("60"), 0.2),
+    )
+    ranked = rank([dominated, tight, cheap, balanced], error_weight=100)
+
+    assert ranked == [balanced, tight, cheap, dominated]
+    assert [row.pareto for row in (cheap, balanced, tight, dominated)] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_sweep_runs_grid_in_worker_processes(tmp_path):
+    """Each parameter set is backtested on the stored history."""
+    database_url = f"sqlite:///{tmp_path / 'history.db'}"
+    database_manager = DatabaseManager(database_url)
+    reserve0, reserve1 = Decimal("1000000"), Decimal("500")
+    for i in range(240):
+        database_manager.save_position_snapshot(
+            PositionSnapshot(
+                reserve_token0=reserve0,
+                reserve_token1=reserve1,
+                short_position_size=Decimal("0"),
+                timestamp=datetime(2024, 1, 1) + timedelta(seconds=5 * i),
+            )
+        )
+        reserve1 += Decimal("0.01")
+        reserve0 -= Decimal("20")
+
+    config = Config(
+        rpc_url="", eulerswap_pool="", binance_api_key="", binance_api_secret=""
+    )
+    points = grid_points(
+        {
+            "hedge_threshold_eth": [Decimal("0.05"), Decimal("0.5")],
+            "min_hedge_interval_seconds": [30, 120],
+        }
+    )
+    sweep = ParameterSweep(
+        config, database_url, BacktestSettings(slippage_bps=Decimal("0"))
+    )
+    rows = sweep.run(points, n_workers=2)
+
+    assert len(rows) == 4
+    assert sorted(rows, key=lambda row: row.score) == rows
+    by_params = {
+        (
+            row.params["hedge_threshold_eth"],
+            row.params["min_hedge_interval_seconds"],
+        ): row
+        for row in rows
+    }
+    # Tighter settings hedge more and track delta better
+    assert (
+        by_params[(Decimal("0.05"), 30)].hedges
+        > by_params[(Decimal("0.5"), 120)].hedges
+    )
+    assert (
+        by_params[(Decimal("0.05"), 30)].rms_error
+        < by_params[(Decimal("0.5"), 120)].rms_error
+    )
+
+    path = tmp_path / "sweep.csv"
+    write_csv(rows, str(path))
+    with open(path) as f:
+        records = list(csv.DictReader(f))
+    assert len(records) == 4
+    assert {"hedge_threshold_eth", "cost", "rms_error", "pareto"} <= set(records[0])
@@ -0,0 +1,112 @@
+"""Tests for per-snapshot pipeline stage timing."""
+
+import asyncio
+import dataclasses
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from models import PipelineStats, PipelineTrace, PositionSnapshot, Trade
+from models.trade import OrderSide, OrderStatus, OrderType
+from risk_manager import RiskManager
+from strategy_engine import StrategyEngine
+
+
+def test_stats_keep_a_rolling_histogram_per_stage():
+    """Stages are summarized in pipeline order over the latest samples."""
+    stats = PipelineStats(window=4)
+    trace = PipelineTrace(stats, origin=10.0)
+    trace.record("exchange", 10.010, 10.012)
+    trace.record("rpc", 10.0, 10.010)
+    assert trace.last == 10.012
+    assert trace.durations_ms() == pytest.approx({"exchange": 2.0, "rpc": 10.0})
+
+    for seconds in (0.001, 0.001, 0.003, 0.2, 0.4):
+        stats.observe("order", seconds)
+
+    summary = stats.summary()
+    assert list(summary) == ["rpc", "exchange", "order"]
+    order = summary["order"]
+    assert order["count"] == 4  # The oldest sample rolled out
+    assert (order["p50_ms"], order["max_ms"]) == (200.0, 400.0)
+    assert order["histogram"]["1"] == 1
+    assert order["histogram"]["5"] == 1
+    assert order["histogram"]["250"] == 1
+    assert order["histogram"]["500"] == 1
+    assert sum(order["histogram"].values()) == 4
+    assert stats.format_summary().startswith("rpc p50 10.0ms p95 10.0ms | ")
+
+
+@pytest.mark.asyncio
+async def test_hedge_records_each_stage_of_its_snapshot(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """RPC to order ack is timed per stage and exposed in the strategy stats."""
+
+    async def open_short(symbol, size, **kwargs):
+        await asyncio.sleep(0.02)
+        return Trade(
+            symbol=symbol,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id="timed",
+            status=OrderStatus.FILLED,
+        )
+
+    mock_exchange.open_short_position = AsyncMock(side_effect=open_short)
+    config = dataclasses.replace(mock_config, hedge_coalesce_window_seconds=0)
+    engine = StrategyEngine(
+        config, mock_exchange, RiskManager(config), mock_database_manager
+    )
+    engine.last_hedge_time = datetime.utcnow() - timedelta(hours=1)
+
+    # A monitor read: RPC and exchange legs already timed
+    trace = PipelineTrace(engine.pipeline)
+    exchange_sent = trace.record("rpc", trace.origin)
+    trace.record("exchange", exchange_sent)
+    snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("5.5"),
+        short_position_size=Decimal("5"),
+        timestamp=datetime.utcnow(),
+        trace=trace,
+    )
+
+    hedge = await engine.process_position_snapshot(snapshot)
+    assert hedge is not None and hedge.success
+
+    durations = trace.durations_ms()
+    assert list(durations) == [
+        "rpc",
+        "exchange",
+        "risk_check",
+        "pre_trade",
+        "order",
+        "total",
+    ]
+    assert durations["order"] >= 20
+    assert durations["total"] >= sum(
+        durations[stage] for stage in ("rpc", "exchange", "order")
+    )
+
+    pipeline = engine.get_strategy_stats()["pipeline"]
+    assert list(pipeline) == list(durations)
+    assert pipeline["order"]["count"] == 1
+    assert pipeline["order"]["p50_ms"] >= 20
+
+    # Snapshots without a trace (e.g. from tests or replays) get one
+    await engine.process_position_snapshot(
+        PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal("5.5"),
+            short_position_size=Decimal("5.5"),
+            timestamp=datetime.utcnow(),
+        )
+    )
+    assert engine.get_strategy_stats()["pipeline"]["risk_check"]["count"] == 2
+    await engine.stop()
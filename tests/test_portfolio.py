@@ -0,0 +1,113 @@
+"""Tests for cross-pool delta netting."""
+
+import dataclasses
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from models import PositionSnapshot, Trade
+from models.trade import OrderSide, OrderStatus, OrderType
+from risk_manager import RiskManager
+from strategy_engine import PortfolioHedger, StrategyEngine
+
+SYMBOL = "ETH/USDT:USDT"
+POOL_A = "0x" + "a" * 40
+POOL_B = "0x" + "b" * 40
+
+
+def _snapshot(reserve, short):
+    return PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal(reserve),
+        short_position_size=Decimal(short),
+        timestamp=datetime.utcnow(),
+    )
+
+
+def _portfolio(config, exchange, database, **overrides):
+    config = dataclasses.replace(config, **overrides)
+    engine = StrategyEngine(
+        config=config,
+        exchange=exchange,
+        risk_manager=RiskManager(config),
+        database_manager=database,
+    )
+    portfolio = PortfolioHedger({SYMBOL: engine})
+    portfolio.add_pool(POOL_A, SYMBOL)
+    portfolio.add_pool(POOL_B, SYMBOL)
+    return portfolio
+
+
+@pytest.mark.asyncio
+async def test_opposite_pool_deltas_net_out(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """Pools drifting in opposite directions do not trade against each other."""
+    # The default coalescing window holds A's move until B's offsets it
+    mock_exchange.open_short_position = AsyncMock()
+    mock_exchange.close_short_position = AsyncMock()
+    portfolio = _portfolio(
+        mock_config, mock_exchange, mock_database_manager, min_hedge_interval_seconds=0
+    )
+
+    # Nothing is hedged until every pool has been seen
+    assert await portfolio.process_pool_snapshot(POOL_A, _snapshot("5", "8")) is None
+
+    # Balanced books, then A gains the ETH that B lost
+    await portfolio.process_pool_snapshot(POOL_B, _snapshot("3", "8"))
+    await portfolio.process_pool_snapshot(POOL_A, _snapshot("5.5", "8"))
+    await portfolio.process_pool_snapshot(POOL_B, _snapshot("2.5", "8"))
+
+    mock_exchange.open_short_position.assert_not_called()
+    mock_exchange.close_short_position.assert_not_called()
+    stats = portfolio.get_stats()
+    assert Decimal(stats[POOL_A]["delta"]) == -Decimal(stats[POOL_B]["delta"])
+    for engine in portfolio.engines.values():
+        await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_fill_allocated_to_pools_by_delta(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """One netted order is sent and its fill split across the pools."""
+    mock_exchange.open_short_position = AsyncMock(
+        side_effect=lambda symbol, size, **kwargs: Trade(
+            symbol=symbol,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id="1",
+            status=OrderStatus.FILLED,
+            fee=Decimal("0.6"),
+        )
+    )
+    portfolio = _portfolio(
+        mock_config,
+        mock_exchange,
+        mock_database_manager,
+        hedge_threshold_eth=Decimal("0.5"),
+        min_hedge_interval_seconds=0,
+        hedge_coalesce_window_seconds=0,
+    )
+
+    await portfolio.process_pool_snapshot(POOL_A, _snapshot("4", "6"))
+    await portfolio.process_pool_snapshot(POOL_B, _snapshot("2", "6"))
+
+    # A gains 0.2 ETH, B gains 0.4: neither alone crosses the threshold
+    assert await portfolio.process_pool_snapshot(POOL_A, _snapshot("4.2", "6")) is None
+    hedge = await portfolio.process_pool_snapshot(POOL_B, _snapshot("2.4", "6"))
+
+    assert hedge is not None and hedge.size == Decimal("0.6")
+    mock_exchange.open_short_position.assert_awaited_once()
+    stats = portfolio.get_stats()
+    assert Decimal(stats[POOL_A]["allocated_short"]) == Decimal("4.2")
+    assert Decimal(stats[POOL_B]["allocated_short"]) == Decimal("2.4")
+    assert Decimal(stats[POOL_A]["fees"]) == Decimal("0.2")
+    assert Decimal(stats[POOL_B]["fees"]) == Decimal("0.4")
+    for engine in portfolio.engines.values():
+        await engine.stop()
@@ -0,0 +1,107 @@
+"""Tests for the local position book."""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from exchange_manager import ExchangeRouter, PositionBook
+from models import Trade
+from models.trade import OrderSide, OrderStatus, OrderType
+
+SYMBOL = "ETH/USDT:USDT"
+
+
+def _trade(order_id, side, size):
+    return Trade(
+        symbol=SYMBOL,
+        side=side,
+        order_type=OrderType.MARKET,
+        size=Decimal(size),
+        price=Decimal("2000"),
+        timestamp=datetime.utcnow(),
+        order_id=order_id,
+        status=OrderStatus.FILLED,
+    )
+
+
+def _position(size):
+    return {"size": Decimal(size), "side": "short" if Decimal(size) else None}
+
+
+@pytest.mark.asyncio
+async def test_fills_counted_once_across_paths(mock_exchange):
+    """A fill seen in the order response and on the stream is applied once."""
+    mock_exchange.get_current_perpetual_position.return_value = _position("1")
+    book = PositionBook(mock_exchange, SYMBOL)
+    await book.reconcile(force=True)
+
+    book.apply_fill(_trade("1", OrderSide.SELL, "0.5"))
+    book.apply_order_update(
+        {"id": "1", "symbol": SYMBOL, "side": "sell", "filled": Decimal("0.5")}
+    )
+    assert book.short_size == Decimal("1.5")
+
+    # Partial fills of a resting order arrive as cumulative sizes
+    for filled in ("0.2", "0.2", "0.6"):
+        book.apply_order_update(
+            {"id": "2", "symbol": SYMBOL, "side": "buy", "filled": Decimal(filled)}
+        )
+    assert book.short_size == Decimal("0.9")
+    assert book.fills_applied == 3
+    mock_exchange.get_current_perpetual_position.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_adopts_exchange_position_on_drift(mock_exchange):
+    """Drift beyond tolerance is counted and the exchange's figure adopted."""
+    mock_exchange.get_current_perpetual_position.return_value = _position("1")
+    book = PositionBook(
+        mock_exchange, SYMBOL, drift_tolerance=Decimal("0.01"), settle_seconds=60
+    )
+    await book.reconcile(force=True)
+    assert book.ready and book.drift_alerts == 0
+
+    # Just after a fill, REST may lag: reconciliation waits
+    book.apply_fill(_trade("1", OrderSide.SELL, "0.5"))
+    assert await book.reconcile() is False
+
+    mock_exchange.get_current_perpetual_position.return_value = _position("1.2")
+    assert await book.reconcile(force=True) is True
+    assert book.short_size == Decimal("1.2")
+    assert book.drift_alerts == 1
+    assert book.last_drift == Decimal("0.3")  # Exchange is 0.3 less short
+
+    # A fill landing while REST is asked is not overwritten by its answer
+    async def position_then_fill(symbol):
+        book.apply_fill(_trade("2", OrderSide.SELL, "0.4"))
+        return _position("1.2")
+
+    mock_exchange.get_current_perpetual_position.side_effect = position_then_fill
+    assert await book.reconcile(force=True) is False
+    assert book.short_size == Decimal("1.6")
+    assert book.reconciliations == 2
+
+
+@pytest.mark.asyncio
+async def test_router_order_stream_reaches_every_consumer():
+    """Each task watching the router's orders gets every update."""
+    updates = asyncio.Queue()
+    venue = AsyncMock()
+
+    async def watch(symbol):
+        return [await updates.get()]
+
+    venue.watch_orders = watch
+    router = ExchangeRouter({"a": venue})
+
+    consumers = [asyncio.create_task(router.watch_orders(SYMBOL)) for _ in range(2)]
+    await asyncio.sleep(0)
+    updates.put_nowait({"id": "1", "filled": Decimal("1")})
+    received = await asyncio.gather(*consumers)
+
+    assert received == [[{"id": "1", "filled": Decimal("1"), "exchange": "a"}]] * 2
+    for task in router._watch_tasks:
+        task.cancel()
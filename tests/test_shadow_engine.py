@@ -0,0 +1,97 @@
+"""Tests for shadow strategies on the live feed."""
+
+import dataclasses
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from config_manager import ConfigManager
+from database_manager import DatabaseManager
+from models import PositionSnapshot
+from shadow_engine import ShadowRunner
+from strategy_engine import StrategyEngine
+
+
+def _snapshot(reserve, short):
+    return PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal(reserve),
+        short_position_size=Decimal(short),
+        timestamp=datetime.utcnow(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_shadow_trades_simulated_and_records_decisions(
+    mock_config, mock_exchange
+):
+    """A shadow hedges on the live feed without touching the live venue."""
+    live_risk = Mock()
+    live_risk.should_hedge = Mock(return_value=(False, Decimal("0")))
+    mock_exchange.open_short_position = AsyncMock()
+    live = StrategyEngine(mock_config, mock_exchange, live_risk)
+
+    database = DatabaseManager("sqlite:///:memory:")
+    tight = dataclasses.replace(
+        mock_config,
+        hedge_threshold_eth=Decimal("0.1"),
+        min_hedge_interval_seconds=0,
+        hedge_coalesce_window_seconds=0,
+    )
+    runner = ShadowRunner(live, {"tight": tight}, database)
+
+    # The live engine hands every snapshot it evaluates to the runner
+    await live.process_position_snapshot(_snapshot("5", "5"))
+    await live.process_position_snapshot(_snapshot("5.5", "5"))
+    assert runner.superseded == 1
+
+    await runner.run_round(_snapshot("5", "5"))
+    price_fetches = mock_exchange.get_mark_price.await_count
+    await runner.run_round(_snapshot("5.5", "5"))
+
+    # Shadows use the live cached price and never reach the live venue
+    assert mock_exchange.get_mark_price.await_count == price_fetches
+    mock_exchange.open_short_position.assert_not_called()
+
+    shadow = runner.shadows["tight"]
+    assert shadow.exchange.short_size == Decimal("5.5")
+    assert [h.size for h in database.get_shadow_hedges("tight")] == [Decimal("0.5")]
+    assert database.get_hedge_snapshots() == []
+
+    report = runner.report()
+    assert report["rounds"] == 2
+    assert report["live"]["hedges"] == 0
+    assert report["shadows"]["tight"]["hedges"] == 1
+    assert report["shadows"]["tight"]["volume_eth"] == "0.5"
+    await runner.stop()
+    await live.stop()
+
+
+def test_shadow_count_is_bounded(mock_config, mock_exchange):
+    """More shadows than allowed are rejected up front."""
+    live = StrategyEngine(mock_config, mock_exchange, Mock())
+    configs = {f"s{i}": mock_config for i in range(3)}
+    with pytest.raises(ValueError):
+        ShadowRunner(live, configs, max_shadows=2)
+
+
+def test_shadow_overrides_parse_false_flags(monkeypatch):
+    """ "false" and "0" switch a feature off in a shadow strategy."""
+    monkeypatch.setenv("RPC_URL", "http://localhost:8545")
+    monkeypatch.setenv("EULERSWAP_POOL", "0x" + "a" * 40)
+    monkeypatch.setenv("BINANCE_API_KEY", "key")
+    monkeypatch.setenv("BINANCE_API_SECRET", "secret")
+    monkeypatch.setenv("FORECAST_HEDGING_ENABLED", "true")
+    monkeypatch.setenv(
+        "SHADOW_STRATEGIES",
+        "off:forecast_hedging_enabled=false;zero:forecast_hedging_enabled=0;"
+        "on:forecast_hedging_enabled=yes,hedge_band_enabled=On",
+    )
+
+    shadows = ConfigManager().get_shadow_configs()
+    assert shadows["off"].forecast_hedging_enabled is False
+    assert shadows["zero"].forecast_hedging_enabled is False
+    assert shadows["on"].forecast_hedging_enabled is True
+    assert shadows["on"].hedge_band_enabled is True
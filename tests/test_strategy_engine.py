@@ -1,10 +1,14 @@
 """Tests for the strategy engine."""
 
+import asyncio
+import time
+import dataclasses
 import pytest
 from decimal import Decimal
-from datetime import datetime
-from unittest.mock import Mock, AsyncMock, patch
+from datetime import datetime, timedelta
+from unittest.mock import ANY, Mock, AsyncMock, patch
 
+from backtest_engine import VirtualClock
 from strategy_engine import StrategyEngine
 from models import PositionSnapshot, Trade
 from models.trade import OrderSide, OrderType, OrderStatus
@@ -42,6 +46,7 @@ async def test_process_position_snapshot_no_hedge_needed(
     # Verify no hedge was executed
     assert result is None
     risk_manager.should_hedge.assert_called_once_with(snapshot)
+    await engine.stop()
 
 
 @pytest.mark.asyncio
@@ -101,6 +106,7 @@ async def test_process_position_snapshot_hedge_executed(
     mock_exchange.open_short_position.assert_called_once()
     mock_database_manager.save_hedge_snapshot.assert_called_once()
     mock_database_manager.save_trade.assert_called_once()
+    await engine.stop()
 
 
 @pytest.mark.asyncio
@@ -158,8 +164,12 @@ async def test_execute_hedge_open_short(
 
     # Verify leverage was set
     mock_exchange.open_short_position.assert_called_once_with(
-        symbol=mock_config.symbol_perpetual, size=Decimal("1"), leverage=Decimal("2")
+        symbol=mock_config.symbol_perpetual,
+        size=Decimal("1"),
+        leverage=Decimal("2"),
+        client_order_id=ANY,
     )
+    await engine.stop()
 
 
 @pytest.mark.asyncio
@@ -217,8 +227,9 @@ async def test_execute_hedge_close_short(
 
     # Verify close was called
     mock_exchange.close_short_position.assert_called_once_with(
-        symbol=mock_config.symbol_perpetual, size=Decimal("0.5")
+        symbol=mock_config.symbol_perpetual, size=Decimal("0.5"), client_order_id=ANY
     )
+    await engine.stop()
 
 
 @pytest.mark.asyncio
@@ -303,8 +314,9 @@ async def test_emergency_close_all(mock_config, mock_exchange, mock_database_man
     # Verify position was closed
     assert result is True
     mock_exchange.close_short_position.assert_called_once_with(
-        symbol=mock_config.symbol_perpetual, size=Decimal("10")
+        symbol=mock_config.symbol_perpetual, size=Decimal("10"), reduce_only=True
     )
+    assert engine.halted == "emergency close"
 
 
 def test_get_strategy_stats(mock_config, mock_exchange, mock_database_manager):
@@ -332,3 +344,332 @@ def test_get_strategy_stats(mock_config, mock_exchange, mock_database_manager):
     assert stats["success_rate"] == "80.0%"
     assert "last_hedge_time" in stats
     assert stats["hedge_threshold"] == str(mock_config.hedge_threshold_eth)
+
+
+@pytest.mark.asyncio
+async def test_execute_hedge_reuses_fresh_pre_trade_inputs(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """Pre-trade inputs are fetched once and reused while fresh."""
+    risk_manager = Mock()
+    risk_manager.check_slippage = Mock(return_value=True)
+    risk_manager.calculate_leverage = Mock(return_value=Decimal("1"))
+    risk_manager.record_trade = Mock()
+
+    mock_trade = Trade(
+        symbol="ETH/USDT:USDT",
+        side=OrderSide.SELL,
+        order_type=OrderType.MARKET,
+        size=Decimal("1"),
+        price=Decimal("2000"),
+        timestamp=datetime.utcnow(),
+        order_id="12345",
+        status=OrderStatus.FILLED,
+    )
+    mock_exchange.open_short_position = AsyncMock(return_value=mock_trade)
+
+    engine = StrategyEngine(
+        config=mock_config,
+        exchange=mock_exchange,
+        risk_manager=risk_manager,
+        database_manager=mock_database_manager,
+    )
+    snapshot = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("6"),
+        short_position_size=Decimal("5"),
+        timestamp=datetime.utcnow(),
+    )
+
+    first = await engine.execute_hedge(snapshot, Decimal("1"))
+    await engine.pre_trade._warm_task  # Balance refresh after the fill
+    later = PositionSnapshot(
+        reserve_token0=Decimal("10000"),
+        reserve_token1=Decimal("7"),
+        short_position_size=Decimal("6"),
+        timestamp=snapshot.timestamp + timedelta(seconds=5),
+    )
+    second = await engine.execute_hedge(later, Decimal("1"))
+
+    # Mark price served from cache; balance refreshed off the critical path
+    mock_exchange.get_mark_price.assert_called_once()
+    assert mock_exchange.get_balance.call_count == 2
+    assert first.time_to_order_ms is not None
+    assert second.time_to_order_ms is not None
+
+    stats = engine.get_strategy_stats()
+    assert stats["pre_trade_cache"]["hits"] == 2
+    assert stats["time_to_order"]["max_ms"] >= stats["time_to_order"]["p50_ms"]
+
+    # Stopping mid-refresh leaves no fetch behind
+    engine.pre_trade.invalidate_balance()
+    engine.pre_trade.warm()
+    await asyncio.sleep(0)
+    await engine.stop()
+    assert not engine.pre_trade._inflight
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_coalescing_window_nets_and_drops_hedges(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """Signals within a window net into one order; a reverted delta trades nothing."""
+    config = dataclasses.replace(
+        mock_config,
+        hedge_coalesce_window_seconds=0.05,
+        hedge_urgency_threshold_eth=Decimal("2"),
+    )
+    risk_manager = Mock()
+    risk_manager.check_slippage = Mock(return_value=True)
+    risk_manager.calculate_leverage = Mock(return_value=Decimal("1"))
+    risk_manager.record_trade = Mock()
+    risk_manager.should_hedge = Mock(
+        side_effect=lambda s: (abs(s.delta) > Decimal("0.01"), s.delta)
+    )
+    mock_exchange.open_short_position = AsyncMock(
+        side_effect=lambda symbol, size, leverage, client_order_id=None: Trade(
+            symbol=symbol,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id="coalesced",
+            status=OrderStatus.FILLED,
+        )
+    )
+
+    engine = StrategyEngine(
+        config=config,
+        exchange=mock_exchange,
+        risk_manager=risk_manager,
+        database_manager=mock_database_manager,
+    )
+    engine.last_hedge_time = datetime.utcnow() - timedelta(hours=1)
+
+    def snapshot(reserve1):
+        return PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal(reserve1),
+            short_position_size=Decimal("5"),
+            timestamp=datetime.utcnow(),
+        )
+
+    # Choppy flow: +0.3, +0.5 then back to flat -> no order
+    assert await engine.process_position_snapshot(snapshot("5.3")) is None
+    assert await engine.process_position_snapshot(snapshot("5.5")) is None
+    assert await engine.process_position_snapshot(snapshot("5")) is None
+    await asyncio.sleep(0.1)
+    mock_exchange.open_short_position.assert_not_called()
+
+    # Two signals in one window -> one order for the net delta
+    await engine.process_position_snapshot(snapshot("5.2"))
+    await engine.process_position_snapshot(snapshot("5.4"))
+    await engine._window_task
+    mock_exchange.open_short_position.assert_called_once()
+    assert mock_exchange.open_short_position.call_args.kwargs["size"] == Decimal("0.4")
+
+    # Urgent delta fires immediately
+    engine.last_hedge_time = datetime.utcnow() - timedelta(hours=1)
+    result = await engine.process_position_snapshot(snapshot("7.5"))
+    assert result is not None and result.size == Decimal("2.5")
+
+    stats = engine.get_strategy_stats()["coalescing"]
+    assert stats["windows_dropped"] == 1
+    assert stats["windows_fired"] == 2
+    assert stats["snapshots_coalesced"] == 2
+
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_stale_decision_recomputed_or_dropped(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """A decision older than the latency budget is redone on fresh data."""
+    config = dataclasses.replace(
+        mock_config, hedge_coalesce_window_seconds=0, hedge_latency_budget_ms=500
+    )
+    risk_manager = Mock()
+    risk_manager.check_slippage = Mock(return_value=True)
+    risk_manager.calculate_leverage = Mock(return_value=Decimal("1"))
+    risk_manager.record_trade = Mock()
+    risk_manager.should_hedge = Mock(
+        side_effect=lambda s: (abs(s.delta) > Decimal("0.01"), s.delta)
+    )
+    mock_exchange.open_short_position = AsyncMock(
+        side_effect=lambda symbol, size, leverage, client_order_id=None: Trade(
+            symbol=symbol,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id=client_order_id,
+            status=OrderStatus.FILLED,
+        )
+    )
+
+    def snapshot(reserve1, age_seconds):
+        return PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal(reserve1),
+            short_position_size=Decimal("5"),
+            timestamp=datetime.utcnow(),
+            observed_at=time.perf_counter() - age_seconds,
+        )
+
+    # Without a way to refresh, a stale decision is dropped
+    engine = StrategyEngine(config, mock_exchange, risk_manager)
+    engine.last_hedge_time = datetime.utcnow() - timedelta(hours=1)
+    assert await engine.process_position_snapshot(snapshot("6", 8)) is None
+    mock_exchange.open_short_position.assert_not_called()
+
+    # With one, the hedge is sized from the fresh snapshot
+    source = AsyncMock(return_value=snapshot("5.5", 0))
+    engine = StrategyEngine(config, mock_exchange, risk_manager, snapshot_source=source)
+    engine.last_hedge_time = datetime.utcnow() - timedelta(hours=1)
+    result = await engine.process_position_snapshot(snapshot("6", 8))
+    assert result.success and result.size == Decimal("0.5")
+
+    budget = engine.get_strategy_stats()["latency_budget"]
+    assert budget["violations"] == {"decision": 1, "order": 0}
+    assert budget["recomputed"] == 1
+
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_coalescing_wait_not_counted_against_budget(
+    mock_config, mock_exchange, monkeypatch
+):
+    """With the default budget a netted hedge fires, for short and long windows."""
+    clock = VirtualClock(datetime.utcnow())
+    monkeypatch.setattr(time, "perf_counter", clock.monotonic)
+    risk_manager = Mock()
+    risk_manager.check_slippage = Mock(return_value=True)
+    risk_manager.calculate_leverage = Mock(return_value=Decimal("1"))
+    risk_manager.record_trade = Mock()
+    risk_manager.should_hedge = Mock(
+        side_effect=lambda s: (abs(s.delta) > Decimal("0.01"), s.delta)
+    )
+    mock_exchange.open_short_position = AsyncMock(
+        side_effect=lambda symbol, size, leverage, client_order_id=None: Trade(
+            symbol=symbol,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=clock.utcnow(),
+            order_id=client_order_id,
+            status=OrderStatus.FILLED,
+        )
+    )
+
+    def poll(reserve1):
+        return PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal(reserve1),
+            short_position_size=Decimal("5"),
+            timestamp=clock.utcnow(),
+            observed_at=time.perf_counter(),
+        )
+
+    # The default window, and one spanning two polls at the default interval
+    long_window = dataclasses.replace(
+        mock_config,
+        hedge_coalesce_window_seconds=2 * mock_config.polling_interval_seconds,
+    )
+    for config in (mock_config, long_window):
+        mock_exchange.open_short_position.reset_mock()
+        engine = StrategyEngine(config, mock_exchange, risk_manager, clock=clock)
+        engine.last_hedge_time = clock.utcnow() - timedelta(hours=1)
+
+        # Two signals land in the window, the second halfway through it
+        window = config.hedge_coalesce_window_seconds
+        for reserve1 in ("5.3", "5.4"):
+            assert await engine.process_position_snapshot(poll(reserve1)) is None
+            await clock.advance_to(clock.utcnow() + timedelta(seconds=window / 2))
+        await clock.advance_to(clock.utcnow() + timedelta(seconds=window))
+        await engine._window_task
+
+        # The latest signal waited for the window on purpose: it is not stale
+        mock_exchange.open_short_position.assert_called_once()
+        order = mock_exchange.open_short_position.call_args.kwargs
+        assert order["size"] == Decimal("0.4")
+        budget = engine.get_strategy_stats()["latency_budget"]
+        assert budget["violations"] == {"decision": 0, "order": 0}
+        assert budget["dropped"] == 0
+        await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_rebalance_position_from_cached_snapshot(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """A rebalance sizes one order from the cached snapshot and our fills."""
+    config = dataclasses.replace(mock_config, hedge_coalesce_window_seconds=0)
+    risk_manager = Mock()
+    risk_manager.should_hedge = Mock(return_value=(False, Decimal("0")))
+    risk_manager.validate_hedge_size = Mock(return_value=True)
+    risk_manager.check_rate_limits = Mock(return_value=True)
+    risk_manager.check_slippage = Mock(return_value=True)
+    risk_manager.calculate_leverage = Mock(return_value=Decimal("1"))
+
+    def fill(side):
+        return lambda symbol, size, **kwargs: Trade(
+            symbol=symbol,
+            side=side,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id=kwargs.get("client_order_id"),
+            status=OrderStatus.FILLED,
+        )
+
+    mock_exchange.open_short_position = AsyncMock(side_effect=fill(OrderSide.SELL))
+    mock_exchange.close_short_position = AsyncMock(side_effect=fill(OrderSide.BUY))
+    source = AsyncMock(
+        return_value=PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal("5.2"),
+            short_position_size=Decimal("5.2"),
+            timestamp=datetime.utcnow(),
+        )
+    )
+    engine = StrategyEngine(
+        config,
+        mock_exchange,
+        risk_manager,
+        mock_database_manager,
+        snapshot_source=source,
+    )
+
+    # Nothing seen yet: the snapshot is read fresh
+    assert await engine.rebalance_position() is True
+    source.assert_awaited_once()
+    mock_exchange.open_short_position.assert_not_called()
+
+    await engine.process_position_snapshot(
+        PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal("5.3"),
+            short_position_size=Decimal("5"),
+            timestamp=datetime.utcnow(),
+        )
+    )
+
+    # Fresh cache: a single order, no snapshot read
+    assert await engine.rebalance_position() is True
+    assert mock_exchange.open_short_position.call_args.kwargs["size"] == Decimal("0.3")
+    source.assert_awaited_once()
+
+    # The fill is accounted for: a 0.1 ETH long target closes 0.1 of the short
+    assert await engine.rebalance_position(Decimal("0.1")) is True
+    assert mock_exchange.close_short_position.call_args.kwargs["size"] == Decimal("0.1")
+    assert engine.successful_hedges == 2
+    assert source.await_count == 1
+
+    await engine.stop()
@@ -0,0 +1,101 @@
+"""Tests for the Monte Carlo stress engine."""
+
+import random
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+
+from euler_swap import PoolParams
+from euler_swap.curve import CurveParams, marginal_price
+from models import PositionSnapshot
+from risk_manager import RiskManager
+from stress_engine import HedgePolicy, PoolCurve, StressConfig, StressEngine
+
+
+def _pool_params() -> PoolParams:
+    """USDT (6 decimals) / WETH (18 decimals) pool at 2000 USDT per WETH."""
+    return PoolParams(
+        vault0="0x0",
+        vault1="0x0",
+        euler_account="0x0",
+        equilibrium_reserve0=Decimal(1_000_000 * 10**6),
+        equilibrium_reserve1=Decimal(500 * 10**18),
+        price_x=Decimal(5 * 10**17),
+        price_y=Decimal(10**9),
+        concentration_x=Decimal(9 * 10**17),
+        concentration_y=Decimal(9 * 10**17),
+        fee=Decimal("0.0005"),
+        protocol_fee=Decimal("0"),
+        protocol_fee_recipient="0x0",
+        token0_decimals=6,
+        token1_decimals=18,
+    )
+
+
+def test_reserves_match_curve_marginal_price():
+    """Reserves at a price sit on the curve with that marginal price."""
+    params = _pool_params()
+    curve = PoolCurve.from_pool_params(params)
+    assert abs(curve.price0 - 2000) < 1e-9
+
+    prices = np.array([1200.0, 1800.0, 2000.0, 2300.0, 3500.0])
+    reserve0, reserve1 = curve.reserves_at(prices)
+    curve_params = CurveParams.from_pool_params(params)
+
+    for price, r0, r1 in zip(prices, reserve0, reserve1):
+        raw0, raw1 = int(r0 * 10**6), int(r1 * 10**18)
+        # marginal_price is raw WETH per raw USDT
+        weth_per_usdt = marginal_price(curve_params, raw0, raw1).scaleb(6 - 18)
+        assert abs(float(1 / weth_per_usdt) / price - 1) < 1e-6
+
+    # Falling ETH price: pool accumulates WETH
+    assert reserve1[0] > reserve1[1] > reserve1[2] > reserve1[3] > reserve1[4]
+
+
+def test_policy_matches_risk_manager(mock_config):
+    """The vectorized policy agrees with RiskManager.should_hedge."""
+    risk_manager = RiskManager(mock_config)
+    policy = HedgePolicy.from_risk_manager(risk_manager)
+    rng = random.Random(7)
+
+    deltas = [rng.uniform(-0.05, 0.05) for _ in range(100)]
+    deltas += [rng.uniform(-150, 150) for _ in range(20)]
+    for delta in deltas:
+        snapshot = PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal(str(round(delta, 6))) + Decimal("5"),
+            short_position_size=Decimal("5"),
+            timestamp=datetime.utcnow(),
+            block_number=1,
+            pool_address="0x0",
+        )
+        expected, _ = risk_manager.should_hedge(snapshot)
+        decided = policy.decide(
+            np.array([float(snapshot.delta)]),
+            np.array([np.inf]),
+            np.array([False]),
+        )[0]
+        assert bool(decided) == expected
+
+
+def test_stress_run_reports_distributions(mock_config):
+    """A small run hedges, respects the rate limit and summarises results."""
+    engine = StressEngine.from_risk_manager(_pool_params(), RiskManager(mock_config))
+    config = StressConfig(
+        n_paths=200, horizon_hours=2, step_seconds=60, model="jump", n_workers=1
+    )
+
+    result = engine.run(config)
+    summary = result.summary()
+
+    assert summary["paths"] == 200
+    assert result.hedge_count.max() <= 2 * engine.policy.max_trades_per_hour
+    assert result.hedge_count.min() > 0
+    assert np.all(result.hedge_fees >= 0)
+    assert summary["total_pnl"]["p1"] <= summary["total_pnl"]["p99"]
+    assert 0 <= summary["margin_call_probability"] <= 1
+
+    # Same seed, same paths
+    again = engine.run(config)
+    assert np.array_equal(result.total_pnl, again.total_pnl)
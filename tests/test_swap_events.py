@@ -0,0 +1,150 @@
+"""Tests for the Swap event trigger."""
+
+import dataclasses
+import time
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from models import PositionSnapshot, Trade
+from models.trade import OrderSide, OrderType, OrderStatus
+from strategy_engine import StrategyEngine
+from swap_monitor import SwapEvent, SwapEventListener
+
+POOL = Web3.to_checksum_address("0x55dcf9455eee8fd3f5eed17606291272cde428a8")
+SENDER = "0x1111111111111111111111111111111111111111"
+
+
+def _swap_log(block_number, log_index, amount1_in, reserve1):
+    """Raw Swap log as returned by eth_getLogs."""
+    topic = Web3.keccak(
+        text="Swap(address,uint256,uint256,uint256,uint256,uint112,uint112,address)"
+    )
+    address_topic = HexBytes(bytes(12) + bytes.fromhex(SENDER[2:]))
+    data = encode(
+        ["uint256"] * 4 + ["uint112"] * 2,
+        [0, amount1_in, 2000 * 10**6, 0, 1_000_000 * 10**6, reserve1],
+    )
+    return {
+        "address": POOL,
+        "topics": [topic, address_topic, address_topic],
+        "data": HexBytes(data),
+        "blockNumber": block_number,
+        "blockHash": HexBytes(bytes(32)),
+        "transactionHash": HexBytes(bytes([log_index]) * 32),
+        "transactionIndex": 0,
+        "logIndex": log_index,
+        "removed": False,
+    }
+
+
+async def _head(block_number):
+    """Awaitable head block, like AsyncEth.block_number."""
+    return block_number
+
+
+@pytest.mark.asyncio
+async def test_listener_decodes_new_swap_logs():
+    """Logs in new blocks are decoded in chain order; the head is noted."""
+    with open(Path(__file__).parent.parent / "abi" / "eulerswap_pool.json") as f:
+        abi = json.load(f)
+    w3 = Mock()
+    w3.keccak = Web3.keccak
+    contract = Web3().eth.contract(address=POOL, abi=abi)
+
+    listener = SwapEventListener(w3, contract)
+    listener.on_block = Mock()
+    w3.eth.block_number = _head(100)
+    w3.eth.get_logs = AsyncMock()
+    assert await listener.poll() == []  # First poll sets the cursor
+
+    w3.eth.block_number = _head(101)
+    w3.eth.get_logs = AsyncMock(
+        return_value=[
+            _swap_log(101, 3, 10**18, 501 * 10**18),
+            _swap_log(101, 1, 10**18, 500 * 10**18),
+        ]
+    )
+    events = await listener.poll()
+
+    assert [event.log_index for event in events] == [1, 3]
+    assert events[0].reserve1_change == 10**18
+    assert events[1].reserve1 == 501 * 10**18
+    assert events[0].sender == SENDER
+    assert w3.eth.get_logs.call_args.args[0]["fromBlock"] == 101
+    listener.on_block.assert_called_once_with(101)
+
+
+@pytest.mark.asyncio
+async def test_swap_event_hedges_without_waiting_for_snapshot(
+    mock_config, mock_exchange, mock_database_manager
+):
+    """An urgent swap hedges from the event; our fill updates the estimate."""
+    config = dataclasses.replace(mock_config, hedge_urgency_threshold_eth=Decimal("1"))
+    risk_manager = Mock()
+    risk_manager.should_hedge = Mock(
+        side_effect=lambda s: (abs(s.delta) > Decimal("0.01"), s.delta)
+    )
+    risk_manager.check_slippage = Mock(return_value=True)
+    risk_manager.calculate_leverage = Mock(return_value=Decimal("1"))
+    mock_exchange.open_short_position = AsyncMock(
+        side_effect=lambda symbol, size, leverage, client_order_id=None: Trade(
+            symbol=symbol,
+            side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            size=size,
+            price=Decimal("2000"),
+            timestamp=datetime.utcnow(),
+            order_id="event-hedge",
+            status=OrderStatus.FILLED,
+        )
+    )
+    engine = StrategyEngine(config, mock_exchange, risk_manager, mock_database_manager)
+    engine.last_hedge_time = datetime.utcnow() - timedelta(hours=1)
+
+    # Reconciliation snapshot: delta neutral at 500 WETH
+    await engine.process_position_snapshot(
+        PositionSnapshot(
+            reserve_token0=Decimal("1000000"),
+            reserve_token1=Decimal("500"),
+            short_position_size=Decimal("500"),
+            timestamp=datetime.utcnow(),
+        )
+    )
+
+    def event(log_index, reserve1):
+        return SwapEvent(
+            block_number=101,
+            transaction_hash="0x",
+            log_index=log_index,
+            sender=SENDER,
+            to=SENDER,
+            amount0_in=0,
+            amount1_in=reserve1 - 500 * 10**18,
+            amount0_out=0,
+            amount1_out=0,
+            reserve0=10**12,
+            reserve1=reserve1,
+            received_at=time.perf_counter(),
+        )
+
+    result = await engine.process_swap_event(event(1, 502 * 10**18))
+    assert result is not None and result.size == Decimal("2")
+
+    # Same reserves again: the fill is already in the estimate, no new hedge
+    engine.last_hedge_time = datetime.utcnow() - timedelta(hours=1)
+    assert await engine.process_swap_event(event(2, 502 * 10**18)) is None
+    assert await engine.process_swap_event(event(1, 510 * 10**18)) is None  # Stale
+    mock_exchange.open_short_position.assert_called_once()
+
+    stats = engine.get_strategy_stats()
+    assert stats["trigger_to_order"]["swap_event"]["max_ms"] < 1000
+
+    await engine.stop()
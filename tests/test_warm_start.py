@@ -0,0 +1,100 @@
+"""Tests for warm restarts from the database and checkpoints."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from database_manager import DatabaseManager
+from models import HedgeSnapshot, PositionSnapshot
+from models.hedge_snapshot import HedgeAction
+from risk_manager import RiskManager
+from strategy_engine import StrategyEngine, load_checkpoint, save_checkpoint
+
+POOL = "0x" + "a" * 40
+ETH = "ETH/USDT:USDT"
+
+
+def _hedge(minutes_ago, success=True, symbol=ETH):
+    return HedgeSnapshot(
+        action=HedgeAction.ADJUST_SHORT,
+        size=Decimal("0.5"),
+        price=Decimal("2000"),
+        timestamp=datetime.utcnow() - timedelta(minutes=minutes_ago),
+        delta_before=Decimal("0.5"),
+        delta_after=Decimal("0"),
+        success=success,
+        symbol=symbol,
+    )
+
+
+def _engine(config, exchange, database):
+    return StrategyEngine(config, exchange, RiskManager(config), database)
+
+
+@pytest.mark.asyncio
+async def test_warm_start_from_database(mock_config, mock_exchange):
+    """Counters, rate-limit window and last snapshot come back from the DB."""
+    database = DatabaseManager("sqlite:///:memory:")
+
+    engine = _engine(mock_config, mock_exchange, database)
+    assert await engine.warm_start(pool_address=POOL) == "cold"
+    # Nothing hedged before: the first hedge does not wait out the interval
+    assert (datetime.utcnow() - engine.last_hedge_time).total_seconds() >= 30
+    await engine.stop()
+
+    database.save_hedge_snapshot(_hedge(90))
+    database.save_hedge_snapshot(_hedge(10))
+    database.save_hedge_snapshot(_hedge(5, success=False))
+    # Another perp's hedges stay with that perp's engine
+    database.save_hedge_snapshot(_hedge(1, symbol="BTC/USDT:USDT"))
+    database.save_hedge_snapshot(_hedge(2, symbol="BTC/USDT:USDT"))
+    database.save_position_snapshot(
+        PositionSnapshot(
+            reserve_token0=Decimal("10000"),
+            reserve_token1=Decimal("5.2"),
+            short_position_size=Decimal("5"),
+            timestamp=datetime.utcnow(),
+            pool_address=POOL,
+        )
+    )
+
+    engine = _engine(mock_config, mock_exchange, database)
+    assert await engine.warm_start(pool_address=POOL) == "database"
+    assert (engine.total_hedges, engine.successful_hedges) == (3, 2)
+    assert engine.failed_hedges == 1
+    assert abs(engine.last_hedge_time - _hedge(10).timestamp) < timedelta(seconds=1)
+    # Only the successful hedge of the past hour counts against the rate limit
+    assert len(engine.risk_manager.recent_trades) == 1
+    assert engine.last_snapshot.pool_address == POOL
+    assert round(engine.last_snapshot.delta, 6) == Decimal("0.2")
+    await engine.stop()
+
+
+@pytest.mark.asyncio
+async def test_warm_start_from_checkpoint(mock_config, mock_exchange, tmp_path):
+    """A checkpoint is restored and topped up with hedges saved after it."""
+    database = DatabaseManager("sqlite:///:memory:")
+    path = str(tmp_path / "state.json")
+    assert load_checkpoint(path) == {}
+
+    engine = _engine(mock_config, mock_exchange, database)
+    engine.total_hedges = engine.successful_hedges = 4
+    engine.risk_manager.record_trade(
+        {"size": Decimal("0.5"), "price": Decimal("2000"), "action": "adjust_short"}
+    )
+    save_checkpoint(path, {"ETH": engine.export_state()})
+    await engine.stop()
+
+    database.save_hedge_snapshot(_hedge(-1))
+
+    restarted = _engine(mock_config, mock_exchange, database)
+    state = load_checkpoint(path)["ETH"]
+    assert await restarted.warm_start(state) == "checkpoint"
+    assert (restarted.total_hedges, restarted.successful_hedges) == (5, 5)
+    assert len(restarted.risk_manager.recent_trades) == 2
+    assert restarted.risk_manager.recent_trades[0]["size"] == Decimal("0.5")
+    await restarted.stop()
+
+    (tmp_path / "state.json").write_text("{truncated")
+    assert load_checkpoint(path) == {}